@@ -27,6 +27,18 @@ from matplotlib.figure import Figure
 from PyQt6 import QtGui, QtWidgets
 from PyQt6.QtCore import Qt
 
+try:
+    from shared.python.downsampling import plot_downsampled, stride_indices
+except ImportError:
+    # Standalone install without the suite's shared package: plot every sample
+
+    def plot_downsampled(ax: Axes, x: Any, y: Any, *args: Any, **kwargs: Any) -> Any:
+        return ax.plot(x, y, *args, **kwargs)[0]
+
+    def stride_indices(n: int) -> np.ndarray:
+        return np.arange(n)
+
+
 # ---------------------------------------------------------------------------
 # Data model for C3D content
 # ---------------------------------------------------------------------------
@@ -610,15 +622,15 @@ class C3DViewerMainWindow(QtWidgets.QMainWindow):
         idx = self.combo_component.currentIndex()
         if idx == 0:
             # All components
-            ax.plot(t, pos[:, 0], label="X")
-            ax.plot(t, pos[:, 1], label="Y")
-            ax.plot(t, pos[:, 2], label="Z")
+            plot_downsampled(ax, t, pos[:, 0], label="X")
+            plot_downsampled(ax, t, pos[:, 1], label="Y")
+            plot_downsampled(ax, t, pos[:, 2], label="Z")
             ax.set_ylabel("Position")
             ax.legend()
         elif idx in [1, 2, 3]:
             comp_idx = idx - 1
             comp_label = ["X", "Y", "Z"][comp_idx]
-            ax.plot(t, pos[:, comp_idx], label=comp_label)
+            plot_downsampled(ax, t, pos[:, comp_idx], label=comp_label)
             ax.set_ylabel(f"{comp_label} position")
             ax.legend()
         else:
@@ -628,7 +640,7 @@ class C3DViewerMainWindow(QtWidgets.QMainWindow):
             dt[dt <= 0] = np.nan
             speed = np.linalg.norm(disp, axis=1) / dt
             # Align length with t (N-1)
-            ax.plot(t[1:], speed, label="Speed magnitude")
+            plot_downsampled(ax, t[1:], speed, label="Speed magnitude")
             ax.set_ylabel("Speed (units/s)")
             ax.legend()
 
@@ -660,7 +672,7 @@ class C3DViewerMainWindow(QtWidgets.QMainWindow):
 
         self.canvas_analog.fig.clear()
         ax = self.canvas_analog.add_subplot(111)
-        ax.plot(t, values, label=name)
+        plot_downsampled(ax, t, values, label=name)
         unit = f" ({channel.unit})" if channel.unit else ""
         ax.set_ylabel(f"Value{unit}")
         ax.set_xlabel("Time (s)")
@@ -709,7 +721,9 @@ class C3DViewerMainWindow(QtWidgets.QMainWindow):
             if pos.shape[0] == 0:
                 continue
 
-            ax.plot(pos[:, 0], pos[:, 1], pos[:, 2], alpha=0.3, label=name)
+            # The faint trail has no time axis to bucket on; thin it evenly
+            trail = pos[stride_indices(pos.shape[0])]
+            ax.plot(trail[:, 0], trail[:, 1], trail[:, 2], alpha=0.3, label=name)
             if 0 <= frame_index < pos.shape[0]:
                 x, y, z = pos[frame_index]
                 ax.scatter([x], [y], [z], s=40)
@@ -802,7 +816,7 @@ class C3DViewerMainWindow(QtWidgets.QMainWindow):
             dt = np.diff(t)
             dt[dt <= 0] = np.nan
             speed = np.linalg.norm(disp, axis=1) / dt
-            ax.plot(t[1:], speed, label="Speed magnitude")
+            plot_downsampled(ax, t[1:], speed, label="Speed magnitude")
             ax.set_xlabel("Time (s)")
             ax.set_ylabel("Speed (units/s)")
             ax.set_title(f"Speed profile: {marker_name}")
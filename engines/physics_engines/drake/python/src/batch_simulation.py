@@ -0,0 +1,307 @@
+"""Headless batch simulation of the Drake golf model.
+
+``build_golf_swing_diagram`` regenerates the URDF, reparses it and rebuilds the
+diagram on every call. For parameter studies that cost is paid per run, so this
+module caches built diagrams keyed by a hash of :class:`GolfModelParams` and
+reuses each :class:`Simulator` by resetting its context from a stored default
+context between runs.
+
+Runs are distributed across a process pool; every worker process keeps its own
+diagram cache, so each distinct parameter set is built at most once per worker.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import typing
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from pydrake.all import (
+    Context,
+    Diagram,
+    MultibodyPlant,
+    RigidTransform,
+    Simulator,
+)
+
+from .drake_golf_model import GolfModelParams, build_golf_swing_diagram
+
+LOGGER = logging.getLogger(__name__)
+
+INITIAL_PELVIS_HEIGHT_M: typing.Final[float] = 1.0  # [m] Standing height
+DEFAULT_SAMPLE_DT_S: typing.Final[float] = 0.01  # [s] 100Hz output rate
+
+
+def params_key(params: GolfModelParams) -> str:
+    """Return a stable hash identifying a parameter set.
+
+    Args:
+        params: Model parameters (nested dataclasses and arrays allowed).
+
+    Returns:
+        Hex digest that is equal for numerically identical parameter sets.
+    """
+    payload = json.dumps(
+        dataclasses.asdict(params),
+        sort_keys=True,
+        default=lambda obj: np.asarray(obj).tolist(),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CachedDiagram:
+    """A built diagram together with its reusable simulator."""
+
+    diagram: Diagram  # type: ignore[no-any-unimported]
+    plant: MultibodyPlant  # type: ignore[no-any-unimported]
+    simulator: Simulator  # type: ignore[no-any-unimported]
+    default_context: Context  # type: ignore[no-any-unimported]
+
+    @property
+    def num_states(self) -> int:
+        """Length of the plant state vector ``[q; v]``."""
+        return int(self.plant.num_positions() + self.plant.num_velocities())
+
+    def default_state(self) -> np.ndarray:
+        """Plant state stored in the default context."""
+        plant_context = self.plant.GetMyContextFromRoot(self.default_context)
+        return self.plant.GetPositionsAndVelocities(plant_context).copy()
+
+    def reset(self, x0: np.ndarray | None = None) -> None:
+        """Restore the default context and optionally set the plant state."""
+        context = self.simulator.get_mutable_context()
+        context.SetTimeStateAndParametersFrom(self.default_context)
+        if x0 is not None:
+            plant_context = self.plant.GetMyContextFromRoot(context)
+            self.plant.SetPositionsAndVelocities(plant_context, x0)
+        self.simulator.Initialize()
+
+
+class DiagramCache:
+    """Cache of built golf diagrams keyed by :func:`params_key`."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[str, CachedDiagram] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, params: GolfModelParams) -> bool:
+        return params_key(params) in self._entries
+
+    def get(self, params: GolfModelParams) -> CachedDiagram:
+        """Return the cached diagram for ``params``, building it on first use."""
+        key = params_key(params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        LOGGER.debug("Building golf diagram for params %s", key)
+        diagram, plant, _ = build_golf_swing_diagram(params)
+        simulator = Simulator(diagram)
+
+        default_context = diagram.CreateDefaultContext()
+        if plant.HasBodyNamed("pelvis"):
+            plant.SetFreeBodyPose(
+                plant.GetMyMutableContextFromRoot(default_context),
+                plant.GetBodyByName("pelvis"),
+                RigidTransform([0, 0, INITIAL_PELVIS_HEIGHT_M]),
+            )
+
+        entry = CachedDiagram(diagram, plant, simulator, default_context)
+        self._entries[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached diagrams."""
+        self._entries.clear()
+
+
+# One cache per process: worker processes keep their diagrams between tasks.
+_PROCESS_CACHE = DiagramCache()
+
+
+def get_process_cache() -> DiagramCache:
+    """Return the diagram cache owned by the current process."""
+    return _PROCESS_CACHE
+
+
+def simulate(
+    params: GolfModelParams,
+    x0: np.ndarray | None,
+    sample_times: np.ndarray,
+    cache: DiagramCache | None = None,
+) -> np.ndarray:
+    """Simulate one run and sample the plant state.
+
+    Args:
+        params: Model parameters.
+        x0: Initial plant state ``[q; v]``; ``None`` uses the default pose.
+        sample_times: Increasing times at which to record the state [s].
+        cache: Diagram cache; defaults to the per-process cache.
+
+    Returns:
+        Array of shape ``(len(sample_times), nq + nv)``.
+    """
+    entry = (_PROCESS_CACHE if cache is None else cache).get(params)
+    entry.reset(x0)
+
+    plant_context = entry.plant.GetMyContextFromRoot(entry.simulator.get_context())
+    states = np.empty((len(sample_times), entry.num_states))
+    for i, t in enumerate(sample_times):
+        if t > 0.0:
+            entry.simulator.AdvanceTo(float(t))
+        states[i] = entry.plant.GetPositionsAndVelocities(plant_context)
+    return states
+
+
+def _simulate_job(
+    job: tuple[GolfModelParams, np.ndarray | None, np.ndarray],
+) -> np.ndarray:
+    """Process pool entry point (must be importable at module level)."""
+    params, x0, sample_times = job
+    return simulate(params, x0, sample_times)
+
+
+@dataclass
+class BatchSimulationResult:
+    """Trajectories produced by :class:`DrakeBatchSimulator`."""
+
+    times: np.ndarray  # (T,)
+    states: np.ndarray  # (K, T, nq + nv)
+    param_keys: list[str]  # (K,)
+
+    @property
+    def num_runs(self) -> int:
+        """Number of simulated runs ``K``."""
+        return int(self.states.shape[0])
+
+
+class DrakeBatchSimulator:
+    """Run many initial conditions or parameter variants of the golf model."""
+
+    def __init__(
+        self,
+        duration_s: float,
+        sample_dt_s: float = DEFAULT_SAMPLE_DT_S,
+        max_workers: int | None = 1,
+    ) -> None:
+        """Initialize the batch simulator.
+
+        Args:
+            duration_s: Simulated duration of every run [s].
+            sample_dt_s: Output sampling period [s].
+            max_workers: Process pool size. ``1`` runs in-process; ``None``
+                lets the executor pick one worker per CPU.
+
+        Raises:
+            ValueError: If the duration or sampling period is not positive.
+        """
+        if duration_s <= 0 or sample_dt_s <= 0:
+            msg = "duration_s and sample_dt_s must be positive."
+            raise ValueError(msg)
+        self.duration_s = duration_s
+        self.sample_dt_s = sample_dt_s
+        self.max_workers = max_workers
+
+    @property
+    def sample_times(self) -> np.ndarray:
+        """Sample times shared by every run [s]."""
+        n_steps = int(round(self.duration_s / self.sample_dt_s))
+        return np.arange(n_steps + 1) * self.sample_dt_s
+
+    def _expand_jobs(
+        self,
+        initial_states: np.ndarray | None,
+        params: GolfModelParams | Sequence[GolfModelParams] | None,
+    ) -> list[tuple[GolfModelParams, np.ndarray | None]]:
+        """Broadcast initial states against parameter variants."""
+        if params is None:
+            params_list: list[GolfModelParams] = [GolfModelParams()]
+        elif isinstance(params, GolfModelParams):
+            params_list = [params]
+        else:
+            params_list = list(params)
+
+        states: list[np.ndarray | None]
+        if initial_states is None:
+            states = [None]
+        else:
+            states = list(np.atleast_2d(np.asarray(initial_states, dtype=np.float64)))
+
+        n_runs = max(len(params_list), len(states))
+        if len(params_list) not in (1, n_runs) or len(states) not in (1, n_runs):
+            msg = (
+                f"Cannot broadcast {len(params_list)} parameter sets against "
+                f"{len(states)} initial states."
+            )
+            raise ValueError(msg)
+
+        if len(params_list) == 1:
+            params_list = params_list * n_runs
+        if len(states) == 1:
+            states = states * n_runs
+        return list(zip(params_list, states, strict=True))
+
+    def run(
+        self,
+        initial_states: np.ndarray | None = None,
+        params: GolfModelParams | Sequence[GolfModelParams] | None = None,
+    ) -> BatchSimulationResult:
+        """Simulate every run and stack the sampled trajectories.
+
+        Args:
+            initial_states: ``(K, nq + nv)`` initial states, or ``None`` for the
+                default standing pose.
+            params: A single parameter set or ``K`` variants. Either argument of
+                length one is broadcast against the other.
+
+        Returns:
+            Stacked trajectories of shape ``(K, T, nq + nv)``.
+        """
+        sample_times = self.sample_times
+        jobs = [
+            (p, x0, sample_times) for p, x0 in self._expand_jobs(initial_states, params)
+        ]
+
+        if self.max_workers == 1 or len(jobs) == 1:
+            trajectories = [_simulate_job(job) for job in jobs]
+        else:
+            # Runs sharing parameters are grouped into chunks so a worker
+            # reuses its cached diagram instead of building every variant.
+            jobs_sorted = sorted(
+                enumerate(jobs), key=lambda item: params_key(item[1][0])
+            )
+            order = [idx for idx, _ in jobs_sorted]
+            n_workers = self.max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(jobs) // (4 * n_workers))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(
+                    executor.map(
+                        _simulate_job,
+                        [job for _, job in jobs_sorted],
+                        chunksize=chunksize,
+                    )
+                )
+            trajectories = [np.empty(0)] * len(jobs)
+            for idx, traj in zip(order, results, strict=True):
+                trajectories[idx] = traj
+
+        return BatchSimulationResult(
+            times=sample_times,
+            states=np.stack(trajectories),
+            param_keys=[params_key(job[0]) for job in jobs],
+        )
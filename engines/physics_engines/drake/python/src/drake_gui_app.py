@@ -23,6 +23,7 @@ from pydrake.all import (
     Parser,
     PrismaticJoint,
     RevoluteJoint,
+    RigidBody,
     RigidTransform,
     Simulator,
 )
@@ -37,8 +38,14 @@ except ImportError:
 
 from .drake_golf_model import GolfModelParams, build_golf_swing_diagram
 from .drake_visualizer import DrakeVisualizer
-from .induced_acceleration import DrakeInducedAccelerationAnalyzer
 from .logger_utils import setup_logging
+from .trajectory_analysis import (
+    DrakeTrajectoryAnalyzer,
+    resolve_end_effector_body,
+)
+
+if typing.TYPE_CHECKING:
+    from shared.python.manipulability import EllipsoidCache, ManipulabilityEllipsoid
 
 LOGGER = logging.getLogger(__name__)
 
@@ -118,6 +125,12 @@ class DrakeRecorder:
         # Fallback
         return times, []
 
+    def get_state_trajectory(self) -> np.ndarray:
+        """Return the recorded states stacked as an ``(N, nq + nv)`` array."""
+        if not self.times:
+            return np.empty((0, 0))
+        return np.hstack((np.array(self.q_history), np.array(self.v_history)))
+
 
 class DrakeSimApp(QtWidgets.QMainWindow):  # type: ignore[misc, no-any-unimported]
     """Main GUI Window for Drake Golf Simulation."""
@@ -144,6 +157,9 @@ class DrakeSimApp(QtWidgets.QMainWindow):  # type: ignore[misc, no-any-unimporte
 
         self.recorder = DrakeRecorder()
         self.eval_context: Context | None = None  # type: ignore[no-any-unimported]
+        self.trajectory_analyzer: DrakeTrajectoryAnalyzer | None = None
+        self.end_effector_body: RigidBody | None = None  # type: ignore[no-any-unimported]
+        self.ellipsoid_cache: "EllipsoidCache | None" = None  # Created on first use
 
         # Model Management
         self.current_urdf_path: str | None = None
@@ -259,8 +275,12 @@ class DrakeSimApp(QtWidgets.QMainWindow):  # type: ignore[misc, no-any-unimporte
         else:
             LOGGER.warning("Visualizer disabled due to Meshcat initialization failure.")
 
-        # Create evaluation context for analysis
-        self.eval_context = self.plant.CreateDefaultContext()
+        # Analysis pipeline: resolves bodies/frames once and owns the
+        # evaluation context reused for every recorded sample.
+        self.trajectory_analyzer = DrakeTrajectoryAnalyzer(self.plant)
+        self.eval_context = self.trajectory_analyzer.context
+        self.end_effector_body = resolve_end_effector_body(self.plant)
+        self.ellipsoid_cache = None
 
         # Initial State
         self._reset_state()
@@ -709,20 +729,12 @@ class DrakeSimApp(QtWidgets.QMainWindow):  # type: ignore[misc, no-any-unimporte
                 q = self.plant.GetPositions(plant_context)
                 v = self.plant.GetVelocities(plant_context)
 
-                # Get club head position
+                # Get club head position (body resolved once at model load)
                 club_pos = None
-                body_names = ["clubhead", "club_body", "wrist", "hand", "link_7"]
-                for name in body_names:
-                    if self.plant.HasBodyNamed(name):
-                        body = self.plant.GetBodyByName(name)
-                        X_WB = self.plant.EvalBodyPoseInWorld(plant_context, body)
-                        club_pos = X_WB.translation()
-                        break
-
-                if club_pos is None:
-                    # Fallback to last body
-                    body = self.plant.get_body(BodyIndex(self.plant.num_bodies() - 1))
-                    X_WB = self.plant.EvalBodyPoseInWorld(plant_context, body)
+                if self.end_effector_body is not None:
+                    X_WB = self.plant.EvalBodyPoseInWorld(
+                        plant_context, self.end_effector_body
+                    )
                     club_pos = X_WB.translation()
 
                 self.recorder.record(context.get_time(), q, v, club_pos)
@@ -746,75 +758,92 @@ class DrakeSimApp(QtWidgets.QMainWindow):  # type: ignore[misc, no-any-unimporte
 
         plant_context = self.plant.GetMyContextFromRoot(self.context)
 
-        # Use end effector (last body?)
-        # For golf, look for a body named "clubhead", "club_body", or just last body.
-        # Fallback to last body if specific ones not found.
-        body_names = ["clubhead", "club_body", "wrist", "hand", "link_7"]
-        target_body = None
-        for name in body_names:
-            if self.plant.HasBodyNamed(name):
-                target_body = self.plant.GetBodyByName(name)
-                break
-
-        if target_body is None:
-            # Last body
-            target_body = self.plant.get_body(BodyIndex(self.plant.num_bodies() - 1))
-
-        if target_body.name() == "world":
+        # End effector is resolved once per model in _init_simulation
+        target_body = self.end_effector_body
+        if target_body is None or target_body.name() == "world":
             return
 
-        # Jacobian
-        # We need Jacobian with respect to velocities (v)
-        frame_W = self.plant.world_frame()
-        frame_B = target_body.body_frame()
+        # Import here so the GUI starts without the manipulability module
+        from shared.python.manipulability import EllipsoidCache
 
-        J_spatial = self.plant.CalcJacobianSpatialVelocity(
-            plant_context, JacobianWrtVariable.kV, frame_B, [0, 0, 0], frame_W, frame_W
-        )
-        # 6 x nv matrix. Top 3 rotational, bottom 3 translational.
-        # Use Translational part for visualization
-        J = J_spatial[3:, :]
+        if self.ellipsoid_cache is None:
+            self.ellipsoid_cache = EllipsoidCache()
 
-        # Mass Matrix
-        M = self.plant.CalcMassMatrix(plant_context)
+        # Reuse the last ellipsoid while the configuration is unchanged
+        q = self.plant.GetPositions(plant_context)
+        ellipsoid = self.ellipsoid_cache.lookup(target_body.name(), q)
 
         try:
-            # Condition Number
-            s = np.linalg.svd(J, compute_uv=False)
-            cond = s[0] / s[-1] if s[-1] > 1e-9 else float("inf")
-            self.lbl_cond.setText(f"{cond:.2f}")
-
-            # Constraint Rank (if any constraints?)
-            # Drake handles constraints differently.
-            # We can show Mass Matrix rank or check if M is singular.
-            rank = np.linalg.matrix_rank(M)
-            self.lbl_rank.setText(f"{rank} / {self.plant.num_velocities()}")
-
-            # Ellipsoid
-            Minv = np.linalg.inv(M)
-            Lambda_inv = J @ Minv @ J.T
-
-            eigvals, eigvecs = np.linalg.eigh(Lambda_inv)
-
-            X_WB = self.plant.EvalBodyPoseInWorld(plant_context, target_body)
-            pos = X_WB.translation()
+            if ellipsoid is None:
+                ellipsoid = self._compute_ellipsoid(
+                    self.plant, plant_context, target_body
+                )
+                self.ellipsoid_cache.store(target_body.name(), q, ellipsoid)
 
             if self.chk_mobility.isChecked():
-                radii = np.sqrt(np.maximum(eigvals, 1e-6))
                 self.visualizer.draw_ellipsoid(
-                    "mobility", eigvecs, radii, pos, (0, 1, 0, 0.3)
+                    "mobility",
+                    ellipsoid.axes,
+                    ellipsoid.mobility_radii,
+                    ellipsoid.center,
+                    (0, 1, 0, 0.3),
                 )
 
             if self.chk_force_ellip.isChecked():
-                radii_f = 1.0 / np.sqrt(np.maximum(eigvals, 1e-6))
-                radii_f = np.clip(radii_f, 0.01, 5.0)
                 self.visualizer.draw_ellipsoid(
-                    "force", eigvecs, radii_f, pos, (1, 0, 0, 0.3)
+                    "force",
+                    ellipsoid.axes,
+                    ellipsoid.force_radii,
+                    ellipsoid.center,
+                    (1, 0, 0, 0.3),
                 )
 
         except Exception as e:
             LOGGER.warning(f"Ellipsoid calc error: {e}")
 
+    def _compute_ellipsoid(  # type: ignore[no-any-unimported]
+        self,
+        plant: MultibodyPlant,
+        plant_context: Context,
+        target_body: RigidBody,
+    ) -> "ManipulabilityEllipsoid":
+        """Compute the ellipsoid of a body and refresh the Jacobian labels."""
+        from shared.python.manipulability import (
+            core_matrix,
+            ellipsoid_from_core,
+            factor_mass_matrix,
+        )
+
+        # Jacobian
+        # We need Jacobian with respect to velocities (v)
+        frame_W = plant.world_frame()
+        frame_B = target_body.body_frame()
+
+        J_spatial = plant.CalcJacobianSpatialVelocity(
+            plant_context, JacobianWrtVariable.kV, frame_B, [0, 0, 0], frame_W, frame_W
+        )
+        # 6 x nv matrix. Top 3 rotational, bottom 3 translational.
+        # Use Translational part for visualization
+        J = J_spatial[3:, :]
+
+        # Mass Matrix
+        M = plant.CalcMassMatrix(plant_context)
+
+        # Condition Number
+        s = np.linalg.svd(J, compute_uv=False)
+        cond = s[0] / s[-1] if s[-1] > 1e-9 else float("inf")
+        self.lbl_cond.setText(f"{cond:.2f}")
+
+        # Mass Matrix rank: a successful Cholesky factorization proves
+        # full rank, so the SVD-based rank is only needed when it fails.
+        nv = plant.num_velocities()
+        factor = factor_mass_matrix(M)
+        rank = nv if factor is not None else int(np.linalg.matrix_rank(M))
+        self.lbl_rank.setText(f"{rank} / {nv}")
+
+        X_WB = plant.EvalBodyPoseInWorld(plant_context, target_body)
+        return ellipsoid_from_core(core_matrix(J, M, factor), X_WB.translation())
+
     def _show_overlay_dialog(self) -> None:  # noqa: PLR0915
         """Show dialog to toggle overlays for specific bodies."""
         plant = self.plant
@@ -904,28 +933,19 @@ class DrakeSimApp(QtWidgets.QMainWindow):  # type: ignore[misc, no-any-unimporte
         if not self.plant or not self.eval_context:
             return
 
+        if self.trajectory_analyzer is None:
+            return
+
         # Computation
-        times = self.recorder.times
-        g_induced = []
-        c_induced = []
         # Control is assumed 0 for now as we don't capture u
-
-        analyzer = DrakeInducedAccelerationAnalyzer(self.plant)
+        times = np.array(self.recorder.times)
 
         try:
             QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CursorShape.WaitCursor)
 
-            for q, v in zip(
-                self.recorder.q_history, self.recorder.v_history, strict=False
-            ):
-                self.plant.SetPositions(self.eval_context, q)
-                self.plant.SetVelocities(self.eval_context, v)
-
-                # Use Analyzer
-                res = analyzer.compute_components(self.eval_context)
-
-                g_induced.append(res["gravity"])
-                c_induced.append(res["velocity"])
+            result = self.trajectory_analyzer.analyze(
+                self.recorder.get_state_trajectory(), times=times
+            )
 
         except Exception as e:
             QtWidgets.QApplication.restoreOverrideCursor()
@@ -934,10 +954,10 @@ class DrakeSimApp(QtWidgets.QMainWindow):  # type: ignore[misc, no-any-unimporte
         finally:
             QtWidgets.QApplication.restoreOverrideCursor()
 
-        g_induced_arr = np.array(g_induced)
-        c_induced_arr = np.array(c_induced)
+        g_induced_arr = result.gravity_acceleration
+        c_induced_arr = result.velocity_acceleration
         # Total passive
-        total_arr = g_induced_arr + c_induced_arr
+        total_arr = result.total_acceleration
 
         # Plotting - Select a joint (e.g., joint 0)
         # We can pick the Joint with largest movement or just the first.
@@ -0,0 +1,338 @@
+"""Headless trajectory analysis pipeline for Drake models.
+
+The GUI historically evaluated dynamics quantities one tick at a time, looking
+bodies up by name and inverting the mass matrix on every frame. This module
+resolves frames and bodies once, reuses a single plant context and evaluates a
+whole recorded trajectory into batched arrays. Linear solves use a Cholesky
+factorization of the (symmetric positive definite) mass matrix instead of an
+explicit inverse.
+
+The pipeline can be driven from the GUI (see ``DrakeSimApp``) or from the
+command line::
+
+    python -m src.trajectory_analysis trajectory.npy --output result.npz
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import typing
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from pydrake.all import (
+    BodyIndex,
+    Context,
+    JacobianWrtVariable,
+    MultibodyPlant,
+    RigidBody,
+)
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+LOGGER = logging.getLogger(__name__)
+
+# Candidate end-effector bodies, in order of preference. Falls back to the
+# last body of the plant when none of them exist.
+END_EFFECTOR_BODY_NAMES: typing.Final[tuple[str, ...]] = (
+    "clubhead",
+    "club_body",
+    "wrist",
+    "hand",
+    "link_7",
+)
+SINGULAR_VALUE_TOL: typing.Final[float] = 1e-9  # [-] Jacobian rank threshold
+
+
+def resolve_end_effector_body(
+    plant: MultibodyPlant,  # type: ignore[no-any-unimported]
+    body_names: Sequence[str] = END_EFFECTOR_BODY_NAMES,
+) -> RigidBody:  # type: ignore[no-any-unimported]
+    """Return the first body in ``body_names`` present in ``plant``.
+
+    Args:
+        plant: Finalized multibody plant.
+        body_names: Candidate body names in order of preference.
+
+    Returns:
+        The matching body, or the last body in the plant if none match.
+    """
+    for name in body_names:
+        if plant.HasBodyNamed(name):
+            return plant.GetBodyByName(name)
+    return plant.get_body(BodyIndex(plant.num_bodies() - 1))
+
+
+def solve_mass_matrix(mass_matrix: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Solve ``M x = rhs`` via Cholesky, falling back to least squares.
+
+    The mass matrix is symmetric positive definite for well-posed models; the
+    least-squares fallback only triggers for degenerate (e.g. massless) trees.
+    """
+    try:
+        factor = cho_factor(mass_matrix, check_finite=False)
+    except LinAlgError:
+        LOGGER.debug("Mass matrix not positive definite; using least squares.")
+        return np.linalg.lstsq(mass_matrix, rhs, rcond=None)[0]
+    return cho_solve(factor, rhs, check_finite=False)
+
+
+@dataclass
+class TrajectoryAnalysisResult:
+    """Batched dynamics quantities evaluated along a trajectory.
+
+    All arrays share the leading sample dimension ``N``.
+    """
+
+    times: np.ndarray  # (N,)
+    mass_matrices: np.ndarray  # (N, nv, nv)
+    jacobians: np.ndarray  # (N, 6, nv), rows: [angular; translational]
+    bias_terms: np.ndarray  # (N, nv), C(q, v)v
+    gravity_forces: np.ndarray  # (N, nv), tau_g(q)
+    end_effector_positions: np.ndarray  # (N, 3)
+    gravity_acceleration: np.ndarray  # (N, nv)
+    velocity_acceleration: np.ndarray  # (N, nv)
+    control_acceleration: np.ndarray  # (N, nv)
+    total_acceleration: np.ndarray  # (N, nv)
+    mobility_matrices: np.ndarray  # (N, 3, 3), J_v M^-1 J_v^T
+    jacobian_condition: np.ndarray  # (N,)
+
+    def to_dict(self) -> dict[str, np.ndarray]:
+        """Return the result as a flat dictionary of arrays."""
+        return asdict(self)
+
+
+class DrakeTrajectoryAnalyzer:
+    """Evaluate dynamics quantities along a recorded ``(N, nq + nv)`` trajectory.
+
+    Bodies, frames and the evaluation context are resolved once at
+    construction, so repeated calls only pay for the dynamics evaluations.
+    """
+
+    def __init__(
+        self,
+        plant: MultibodyPlant,  # type: ignore[no-any-unimported]
+        body_names: Sequence[str] = END_EFFECTOR_BODY_NAMES,
+    ) -> None:
+        """Initialize analyzer.
+
+        Args:
+            plant: Finalized multibody plant.
+            body_names: Candidate end-effector bodies in order of preference.
+        """
+        self.plant = plant
+        self.nq = plant.num_positions()
+        self.nv = plant.num_velocities()
+        self.context: Context = plant.CreateDefaultContext()  # type: ignore[no-any-unimported]
+
+        self.end_effector = resolve_end_effector_body(plant, body_names)
+        self._frame_W = plant.world_frame()
+        self._frame_B = self.end_effector.body_frame()
+        self._p_BoBp_B = np.zeros(3)
+
+    def set_state(self, q: np.ndarray, v: np.ndarray) -> Context:  # type: ignore[no-any-unimported]
+        """Write ``(q, v)`` into the reused context and return it."""
+        self.plant.SetPositions(self.context, q)
+        self.plant.SetVelocities(self.context, v)
+        return self.context
+
+    def split_state(self, trajectory: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Split an ``(N, nq + nv)`` state trajectory into ``q`` and ``v``.
+
+        Raises:
+            ValueError: If the trajectory width does not match the plant.
+        """
+        states = np.atleast_2d(np.asarray(trajectory, dtype=np.float64))
+        if states.shape[1] != self.nq + self.nv:
+            msg = (
+                f"Trajectory has {states.shape[1]} columns, expected "
+                f"nq + nv = {self.nq + self.nv}."
+            )
+            raise ValueError(msg)
+        return states[:, : self.nq], states[:, self.nq :]
+
+    def compute_jacobian(self) -> np.ndarray:
+        """Spatial velocity Jacobian of the end effector at the current state."""
+        return self.plant.CalcJacobianSpatialVelocity(
+            self.context,
+            JacobianWrtVariable.kV,
+            self._frame_B,
+            self._p_BoBp_B,
+            self._frame_W,
+            self._frame_W,
+        )
+
+    def analyze(
+        self,
+        trajectory: np.ndarray,
+        times: np.ndarray | None = None,
+        tau: np.ndarray | None = None,
+    ) -> TrajectoryAnalysisResult:
+        """Evaluate the full trajectory into batched arrays.
+
+        Args:
+            trajectory: State trajectory of shape ``(N, nq + nv)``.
+            times: Optional sample times ``(N,)``. Defaults to sample indices.
+            tau: Optional applied generalized forces ``(N, nv)``. When omitted
+                the control-induced acceleration is zero (passive analysis).
+
+        Returns:
+            Batched dynamics quantities for every sample.
+        """
+        q_traj, v_traj = self.split_state(trajectory)
+        n_samples = q_traj.shape[0]
+        nv = self.nv
+
+        if times is None:
+            times = np.arange(n_samples, dtype=np.float64)
+        times = np.asarray(times, dtype=np.float64)
+        if times.shape != (n_samples,):
+            msg = f"times must have shape ({n_samples},), got {times.shape}."
+            raise ValueError(msg)
+
+        if tau is None:
+            tau = np.zeros((n_samples, nv))
+        tau = np.asarray(tau, dtype=np.float64)
+        if tau.shape != (n_samples, nv):
+            msg = f"tau must have shape ({n_samples}, {nv}), got {tau.shape}."
+            raise ValueError(msg)
+
+        mass = np.empty((n_samples, nv, nv))
+        jac = np.empty((n_samples, 6, nv))
+        bias = np.empty((n_samples, nv))
+        tau_g = np.empty((n_samples, nv))
+        positions = np.empty((n_samples, 3))
+        # Right-hand sides solved together: [tau_g, -bias, tau]
+        accelerations = np.empty((n_samples, 3, nv))
+        mobility = np.empty((n_samples, 3, 3))
+
+        for k in range(n_samples):
+            self.set_state(q_traj[k], v_traj[k])
+
+            mass[k] = self.plant.CalcMassMatrix(self.context)
+            bias[k] = self.plant.CalcBiasTerm(self.context)
+            tau_g[k] = self.plant.CalcGravityGeneralizedForces(self.context)
+            jac[k] = self.compute_jacobian()
+            positions[k] = self.plant.EvalBodyPoseInWorld(
+                self.context, self.end_effector
+            ).translation()
+
+            rhs = np.column_stack((tau_g[k], -bias[k], tau[k]))
+            jv_t = jac[k, 3:, :].T
+            solved = solve_mass_matrix(mass[k], np.hstack((rhs, jv_t)))
+            accelerations[k] = solved[:, :3].T
+            mobility[k] = jac[k, 3:, :] @ solved[:, 3:]
+
+        condition = np.full(n_samples, np.inf)
+        if nv > 0:
+            singular_values = np.linalg.svd(jac[:, 3:, :], compute_uv=False)
+            well_posed = singular_values[:, -1] > SINGULAR_VALUE_TOL
+            condition[well_posed] = (
+                singular_values[well_posed, 0] / singular_values[well_posed, -1]
+            )
+
+        acc_g = accelerations[:, 0, :]
+        acc_c = accelerations[:, 1, :]
+        acc_t = accelerations[:, 2, :]
+
+        return TrajectoryAnalysisResult(
+            times=times,
+            mass_matrices=mass,
+            jacobians=jac,
+            bias_terms=bias,
+            gravity_forces=tau_g,
+            end_effector_positions=positions,
+            gravity_acceleration=acc_g,
+            velocity_acceleration=acc_c,
+            control_acceleration=acc_t,
+            total_acceleration=acc_g + acc_c + acc_t,
+            mobility_matrices=mobility,
+            jacobian_condition=condition,
+        )
+
+
+def load_trajectory(path: Path) -> np.ndarray:
+    """Load an ``(N, nq + nv)`` trajectory from ``.npy``, ``.npz`` or CSV."""
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        return np.load(path)
+    if suffix == ".npz":
+        with np.load(path) as archive:
+            key = "trajectory" if "trajectory" in archive else archive.files[0]
+            return archive[key]
+    return np.loadtxt(path, delimiter=",", ndmin=2)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.trajectory_analysis",
+        description="Batch dynamics analysis of a recorded Drake trajectory.",
+    )
+    parser.add_argument(
+        "trajectory",
+        type=Path,
+        help="State trajectory (N, nq + nv) as .npy, .npz or CSV",
+    )
+    parser.add_argument(
+        "--urdf",
+        type=str,
+        help="URDF model to analyze (defaults to the generated golf model)",
+    )
+    parser.add_argument(
+        "--dt",
+        type=float,
+        help="Sample period [s]; sample indices are used when omitted",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("trajectory_analysis.npz"),
+        help="Destination .npz archive for the batched results",
+    )
+    return parser
+
+
+def _build_plant(urdf_path: str | None) -> MultibodyPlant:  # type: ignore[no-any-unimported]
+    """Build the plant to analyze, without visualization."""
+    if urdf_path is None:
+        from .drake_golf_model import build_golf_swing_diagram
+
+        _, plant, _ = build_golf_swing_diagram()
+        return plant
+
+    from pydrake.all import Parser
+
+    plant = MultibodyPlant(0.0)
+    Parser(plant).AddModels(urdf_path)
+    plant.Finalize()
+    return plant
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for the CLI module."""
+    args = build_parser().parse_args(argv)
+
+    plant = _build_plant(args.urdf)
+    analyzer = DrakeTrajectoryAnalyzer(plant)
+    trajectory = load_trajectory(args.trajectory)
+
+    times = None
+    if args.dt is not None:
+        times = np.arange(trajectory.shape[0]) * args.dt
+
+    result = analyzer.analyze(trajectory, times=times)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(args.output, **result.to_dict())
+    print(
+        f"Analyzed {trajectory.shape[0]} samples "
+        f"(end effector: {analyzer.end_effector.name()}) -> {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
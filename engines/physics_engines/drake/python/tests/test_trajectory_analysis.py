@@ -0,0 +1,170 @@
+"""Unit tests for the batched Drake trajectory analysis pipeline."""
+
+import numpy as np
+import pytest
+
+try:
+    from pydrake.all import MultibodyPlant, Parser
+
+    from python.src.trajectory_analysis import (
+        DrakeTrajectoryAnalyzer,
+        load_trajectory,
+        main,
+        resolve_end_effector_body,
+        solve_mass_matrix,
+    )
+except ImportError as e:
+    pytest.skip(f"pydrake not available: {e}", allow_module_level=True)
+
+
+DOUBLE_PENDULUM_URDF = """<?xml version="1.0"?>
+<robot name="double_pendulum">
+  <link name="base"/>
+  <link name="upper">
+    <inertial>
+      <origin xyz="0 0 -0.5"/>
+      <mass value="1.0"/>
+      <inertia ixx="0.01" ixy="0" ixz="0" iyy="0.01" iyz="0" izz="0.01"/>
+    </inertial>
+  </link>
+  <link name="hand">
+    <inertial>
+      <origin xyz="0 0 -0.5"/>
+      <mass value="1.0"/>
+      <inertia ixx="0.01" ixy="0" ixz="0" iyy="0.01" iyz="0" izz="0.01"/>
+    </inertial>
+  </link>
+  <joint name="world_weld" type="fixed">
+    <parent link="world"/>
+    <child link="base"/>
+  </joint>
+  <joint name="shoulder" type="revolute">
+    <parent link="base"/>
+    <child link="upper"/>
+    <axis xyz="0 1 0"/>
+  </joint>
+  <joint name="elbow" type="revolute">
+    <parent link="upper"/>
+    <child link="hand"/>
+    <origin xyz="0 0 -1.0"/>
+    <axis xyz="0 1 0"/>
+  </joint>
+</robot>
+"""
+
+
+@pytest.fixture
+def plant() -> MultibodyPlant:
+    """Finalized continuous-time double pendulum plant."""
+    plant = MultibodyPlant(0.0)
+    Parser(plant).AddModelsFromString(DOUBLE_PENDULUM_URDF, "urdf")
+    plant.Finalize()
+    return plant
+
+
+@pytest.fixture
+def trajectory() -> np.ndarray:
+    """Small (N, nq + nv) trajectory for the double pendulum."""
+    rng = np.random.default_rng(0)
+    return rng.uniform(-1.0, 1.0, size=(25, 4))
+
+
+def test_resolves_end_effector_once(plant: MultibodyPlant) -> None:
+    """The preferred body name is picked up and cached on construction."""
+    analyzer = DrakeTrajectoryAnalyzer(plant)
+    assert analyzer.end_effector.name() == "hand"
+    assert resolve_end_effector_body(plant, ["missing"]).name() == "hand"
+
+
+def test_batched_arrays_have_expected_shapes(
+    plant: MultibodyPlant, trajectory: np.ndarray
+) -> None:
+    """Every output carries the sample dimension first."""
+    result = DrakeTrajectoryAnalyzer(plant).analyze(trajectory)
+    n = trajectory.shape[0]
+    assert result.mass_matrices.shape == (n, 2, 2)
+    assert result.jacobians.shape == (n, 6, 2)
+    assert result.bias_terms.shape == (n, 2)
+    assert result.total_acceleration.shape == (n, 2)
+    assert result.mobility_matrices.shape == (n, 3, 3)
+    assert result.jacobian_condition.shape == (n,)
+    np.testing.assert_array_equal(result.times, np.arange(n))
+
+
+def test_matches_per_sample_forward_dynamics(
+    plant: MultibodyPlant, trajectory: np.ndarray
+) -> None:
+    """Induced accelerations sum to the plant's forward dynamics."""
+    tau = np.tile([0.3, -0.2], (trajectory.shape[0], 1))
+    result = DrakeTrajectoryAnalyzer(plant).analyze(trajectory, tau=tau)
+
+    context = plant.CreateDefaultContext()
+    for k, state in enumerate(trajectory):
+        plant.SetPositionsAndVelocities(context, state)
+        M = plant.CalcMassMatrix(context)
+        bias = plant.CalcBiasTerm(context)
+        tau_g = plant.CalcGravityGeneralizedForces(context)
+        expected = np.linalg.solve(M, tau[k] + tau_g - bias)
+        np.testing.assert_allclose(result.total_acceleration[k], expected, atol=1e-10)
+        np.testing.assert_allclose(result.mass_matrices[k], M, atol=1e-12)
+
+
+def test_resting_accelerations_sum_to_free_fall(plant: MultibodyPlant) -> None:
+    """At v=0 and tau=0 only gravity accelerates the pendulum."""
+    trajectory = np.array([[0.4, -0.7, 0.0, 0.0], [1.2, 0.3, 0.0, 0.0]])
+    result = DrakeTrajectoryAnalyzer(plant).analyze(trajectory)
+
+    context = plant.CreateDefaultContext()
+    for k, state in enumerate(trajectory):
+        plant.SetPositionsAndVelocities(context, state)
+        M = plant.CalcMassMatrix(context)
+        free_fall = np.linalg.solve(M, plant.CalcGravityGeneralizedForces(context))
+        assert np.linalg.norm(free_fall) > 1.0
+        np.testing.assert_allclose(result.velocity_acceleration[k], 0.0, atol=1e-12)
+        np.testing.assert_allclose(
+            result.gravity_acceleration[k], free_fall, atol=1e-10
+        )
+        np.testing.assert_allclose(result.total_acceleration[k], free_fall, atol=1e-10)
+
+
+def test_mobility_matches_explicit_inverse(
+    plant: MultibodyPlant, trajectory: np.ndarray
+) -> None:
+    """Cholesky-based mobility equals J M^-1 J^T."""
+    result = DrakeTrajectoryAnalyzer(plant).analyze(trajectory)
+    J = result.jacobians[:, 3:, :]
+    expected = J @ np.linalg.inv(result.mass_matrices) @ np.swapaxes(J, 1, 2)
+    np.testing.assert_allclose(result.mobility_matrices, expected, atol=1e-10)
+
+
+def test_rejects_mismatched_width(plant: MultibodyPlant) -> None:
+    """Trajectories must have nq + nv columns."""
+    with pytest.raises(ValueError, match="expected nq \\+ nv"):
+        DrakeTrajectoryAnalyzer(plant).analyze(np.zeros((3, 3)))
+
+
+def test_solve_mass_matrix_falls_back_for_singular_matrix() -> None:
+    """A singular mass matrix uses the least-squares solution."""
+    M = np.array([[1.0, 0.0], [0.0, 0.0]])
+    x = solve_mass_matrix(M, np.array([2.0, 0.0]))
+    np.testing.assert_allclose(x, [2.0, 0.0])
+
+
+def test_cli_writes_npz(tmp_path, trajectory: np.ndarray) -> None:
+    """The CLI analyzes a saved trajectory and writes an archive."""
+    urdf = tmp_path / "pendulum.urdf"
+    urdf.write_text(DOUBLE_PENDULUM_URDF, encoding="utf-8")
+    traj_path = tmp_path / "traj.csv"
+    np.savetxt(traj_path, trajectory, delimiter=",")
+    out = tmp_path / "out.npz"
+
+    assert load_trajectory(traj_path).shape == trajectory.shape
+    assert (
+        main(
+            [str(traj_path), "--urdf", str(urdf), "--dt", "0.01", "--output", str(out)]
+        )
+        == 0
+    )
+    with np.load(out) as archive:
+        assert archive["total_acceleration"].shape == (trajectory.shape[0], 2)
+        np.testing.assert_allclose(archive["times"][1], 0.01)
@@ -0,0 +1,359 @@
+"""Linearization and LQR gain synthesis for the humanoid controllers.
+
+The dynamics are linearized with ``mujoco.mjd_transitionFD``, which works in
+the tangent space of the configuration: a free joint contributes 6 velocity
+coordinates instead of 7 position coordinates, so quaternions are never
+differenced linearly. State errors use ``mujoco.mj_differentiatePos`` for the
+same reason.
+
+Gains are synthesized offline and cached on disk, keyed by a hash of the
+compiled model, the reference and the cost weights, so online control is a
+single matrix-vector product per step.
+
+All functions take raw ``mujoco.MjModel`` objects; with dm_control pass
+``physics.model.ptr``.
+"""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import mujoco
+import numpy as np
+import scipy.linalg
+
+# Finite-difference step for mjd_transitionFD
+DEFAULT_EPS = 1e-6
+
+# Default LQR weights on position error, velocity error and control effort
+DEFAULT_POSITION_WEIGHT = 100.0
+DEFAULT_VELOCITY_WEIGHT = 1.0
+DEFAULT_CONTROL_WEIGHT = 0.01
+
+# Gain cache location (override with HUMANOID_GOLF_GAIN_CACHE)
+GAIN_CACHE_DIR = os.environ.get(
+    "HUMANOID_GOLF_GAIN_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "humanoid_golf", "lqr"),
+)
+
+
+@dataclass
+class LQRGains:
+    """Infinite-horizon LQR regulator about a fixed pose."""
+
+    K: np.ndarray  # Feedback gains (nu, 2*nv)
+    ctrl: np.ndarray  # Feed-forward control holding the pose (nu,)
+    qpos: np.ndarray  # Reference configuration (nq,)
+    qvel: np.ndarray  # Reference velocity (nv,)
+
+
+@dataclass
+class TVLQRGains:
+    """Time-varying LQR gains along a reference swing."""
+
+    K: np.ndarray  # Feedback gains per knot (T, nu, 2*nv)
+    times: np.ndarray  # Knot times (T,)
+    qpos: np.ndarray  # Reference configurations (T, nq)
+    qvel: np.ndarray  # Reference velocities (T, nv)
+    ctrl: np.ndarray  # Reference controls (T, nu)
+
+
+def model_hash(model) -> str:
+    """SHA-256 of the compiled model (its MJB serialization)."""
+    buffer = np.empty(mujoco.mj_sizeModel(model), dtype=np.uint8)
+    mujoco.mj_saveModel(model, None, buffer)
+    return hashlib.sha256(buffer.tobytes()).hexdigest()
+
+
+def state_error(model, qpos, qvel, qpos_ref, qvel_ref) -> np.ndarray:
+    """Reference minus current state in tangent coordinates (2*nv,)."""
+    dq = np.zeros(model.nv)
+    mujoco.mj_differentiatePos(model, dq, 1.0, qpos, qpos_ref)
+    return np.concatenate([dq, np.asarray(qvel_ref) - qvel])
+
+
+# Single-DOF joints an actuator can drive directly
+_ACTUATED_JOINT_TYPES = (
+    int(mujoco.mjtJoint.mjJNT_HINGE),
+    int(mujoco.mjtJoint.mjJNT_SLIDE),
+)
+
+
+def actuated_dofs(model) -> np.ndarray:
+    """DOF indices of joints driven directly by an actuator.
+
+    Free and ball joints (the floating base) are excluded: they cannot be
+    actuated, and their uncontrollable modes make the Riccati equation
+    unsolvable.
+    """
+    dofs = []
+    for i in range(model.nu):
+        if int(model.actuator_trntype[i]) != mujoco.mjtTrn.mjTRN_JOINT:
+            continue
+        joint = model.actuator_trnid[i, 0]
+        if int(model.jnt_type[joint]) in _ACTUATED_JOINT_TYPES:
+            dofs.append(model.jnt_dofadr[joint])
+    return np.unique(np.asarray(dofs, dtype=int))
+
+
+def linearize(
+    model, qpos, qvel, ctrl, eps=DEFAULT_EPS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Discrete-time linearization x' = A x + B u about a state and control.
+
+    Args:
+        model: MuJoCo model
+        qpos: Configuration (nq,)
+        qvel: Velocity (nv,)
+        ctrl: Control (nu,)
+        eps: Finite-difference step
+
+    Returns:
+        (A, B) with A (2*nv, 2*nv) and B (2*nv, nu); actuator activation
+        states, if any, are not part of the state
+    """
+    data = mujoco.MjData(model)
+    data.qpos[:] = qpos
+    data.qvel[:] = qvel
+    data.ctrl[:] = ctrl
+    mujoco.mj_forward(model, data)
+
+    nx = 2 * model.nv + model.na
+    A = np.zeros((nx, nx))
+    B = np.zeros((nx, model.nu))
+    mujoco.mjd_transitionFD(model, data, eps, True, A, B, None, None)
+    n = 2 * model.nv
+    return A[:n, :n], B[:n]
+
+
+def holding_control(model, qpos, B) -> np.ndarray:
+    """Control that best keeps a pose at rest over one step.
+
+    Steps once from rest with zero control and cancels the resulting
+    velocity in the least-squares sense through the velocity rows of B.
+    """
+    data = mujoco.MjData(model)
+    data.qpos[:] = qpos
+    mujoco.mj_step(model, data)
+    ctrl = np.linalg.lstsq(B[model.nv :], -data.qvel, rcond=None)[0]
+    limited = model.actuator_ctrllimited.astype(bool)
+    ranges = model.actuator_ctrlrange
+    ctrl[limited] = np.clip(ctrl[limited], ranges[limited, 0], ranges[limited, 1])
+    return ctrl
+
+
+def cost_weights(
+    model,
+    position_weight=DEFAULT_POSITION_WEIGHT,
+    velocity_weight=DEFAULT_VELOCITY_WEIGHT,
+    control_weight=DEFAULT_CONTROL_WEIGHT,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Diagonal state and control cost matrices (Q, R)."""
+    nv = model.nv
+    Q = np.diag(np.r_[np.full(nv, position_weight), np.full(nv, velocity_weight)])
+    R = control_weight * np.eye(model.nu)
+    return Q, R
+
+
+def _state_indices(model, dofs) -> np.ndarray:
+    """Rows of the tangent state for the given DOFs (positions, velocities)."""
+    dofs = np.asarray(dofs, dtype=int)
+    return np.concatenate([dofs, model.nv + dofs])
+
+
+def dare_gain(A, B, Q, R) -> np.ndarray:
+    """Infinite-horizon discrete LQR gain K for u = K (x_ref - x).
+
+    Raises:
+        numpy.linalg.LinAlgError: If (A, B) is not stabilizable
+    """
+    P = scipy.linalg.solve_discrete_are(A, B, Q, R)
+    return np.linalg.solve(R + B.T @ P @ B, B.T @ P @ A)
+
+
+def riccati_recursion(As, Bs, Q, R, Qf=None) -> np.ndarray:
+    """Finite-horizon LQR gains by backward Riccati recursion.
+
+    Args:
+        As: State matrices per knot (T, nx, nx)
+        Bs: Input matrices per knot (T, nx, nu)
+        Q: State cost (nx, nx)
+        R: Control cost (nu, nu)
+        Qf: Terminal state cost (defaults to Q)
+
+    Returns:
+        Gains per knot (T, nu, nx)
+    """
+    P = Q if Qf is None else Qf
+    gains = np.empty((len(As), Bs.shape[2], As.shape[1]))
+    for t in range(len(As) - 1, -1, -1):
+        A, B = As[t], Bs[t]
+        gains[t] = np.linalg.solve(R + B.T @ P @ B, B.T @ P @ A)
+        P = Q + A.T @ P @ (A - B @ gains[t])
+        P = 0.5 * (P + P.T)
+    return gains
+
+
+class GainCache:
+    """Gain matrices stored as .npz files keyed by model and reference hash."""
+
+    def __init__(self, directory=None) -> None:
+        """Initialize GainCache."""
+        self.directory = directory or GAIN_CACHE_DIR
+
+    def key(self, model, *arrays, **params) -> str:
+        """Cache key for a model, reference arrays and synthesis parameters."""
+        digest = hashlib.sha256(model_hash(model).encode())
+        for array in arrays:
+            array = np.ascontiguousarray(array, dtype=np.float64)
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        digest.update(repr(sorted(params.items())).encode())
+        return digest.hexdigest()
+
+    def load(self, key) -> dict[str, np.ndarray] | None:
+        """Cached arrays for key, or None."""
+        path = os.path.join(self.directory, f"{key}.npz")
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as cached:
+            return {name: cached[name] for name in cached.files}
+
+    def save(self, key, **arrays) -> None:
+        """Store arrays under key (written atomically)."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, os.path.join(self.directory, f"{key}.npz"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _weights(model, Q, R) -> tuple[np.ndarray, np.ndarray]:
+    """Given cost matrices, or the defaults."""
+    default_Q, default_R = cost_weights(model)
+    return (default_Q if Q is None else Q), (default_R if R is None else R)
+
+
+def regulator_gains(model, qpos, Q=None, R=None, dofs=None, cache=None) -> LQRGains:
+    """LQR regulator holding a pose, from the Riccati equation (DARE).
+
+    The floating base cannot be stabilized by the actuators, so by default
+    the problem is posed on the actuated DOFs only; gains on the remaining
+    state entries are zero.
+
+    Args:
+        model: MuJoCo model
+        qpos: Pose to hold (nq,)
+        Q: State cost over the full tangent state (2*nv, 2*nv)
+        R: Control cost (nu, nu)
+        dofs: DOFs to regulate (defaults to actuated_dofs(model))
+        cache: GainCache (None disables caching)
+
+    Returns:
+        LQRGains
+
+    Raises:
+        numpy.linalg.LinAlgError: If the selected system is not stabilizable
+    """
+    Q, R = _weights(model, Q, R)
+    dofs = actuated_dofs(model) if dofs is None else np.asarray(dofs, dtype=int)
+    qpos = np.asarray(qpos, dtype=np.float64)
+    qvel = np.zeros(model.nv)
+
+    key = cache.key(model, qpos, Q, R, dofs, kind="dare") if cache else None
+    cached = cache.load(key) if cache else None
+    if cached is not None:
+        return LQRGains(K=cached["K"], ctrl=cached["ctrl"], qpos=qpos, qvel=qvel)
+
+    _, B0 = linearize(model, qpos, qvel, np.zeros(model.nu))
+    ctrl = holding_control(model, qpos, B0)
+    A, B = linearize(model, qpos, qvel, ctrl)
+
+    rows = _state_indices(model, dofs)
+    K = np.zeros((model.nu, 2 * model.nv))
+    K[:, rows] = dare_gain(A[np.ix_(rows, rows)], B[rows], Q[np.ix_(rows, rows)], R)
+
+    if cache:
+        cache.save(key, K=K, ctrl=ctrl)
+    return LQRGains(K=K, ctrl=ctrl, qpos=qpos, qvel=qvel)
+
+
+def tracking_gains(
+    model, times, qpos, qvel, ctrl, Q=None, R=None, Qf=None, cache=None
+) -> TVLQRGains:
+    """Time-varying LQR gains along a reference swing.
+
+    The dynamics are linearized at every knot and the Riccati recursion is
+    solved once, backwards over the whole reference.
+
+    Args:
+        model: MuJoCo model
+        times: Knot times (T,)
+        qpos: Reference configurations (T, nq)
+        qvel: Reference velocities (T, nv)
+        ctrl: Reference controls (T, nu)
+        Q: State cost (2*nv, 2*nv)
+        R: Control cost (nu, nu)
+        Qf: Terminal state cost (defaults to Q)
+        cache: GainCache (None disables caching)
+
+    Returns:
+        TVLQRGains
+    """
+    Q, R = _weights(model, Q, R)
+    arrays = [np.asarray(a, dtype=np.float64) for a in (times, qpos, qvel, ctrl)]
+    times, qpos, qvel, ctrl = arrays
+
+    terminal = Q if Qf is None else Qf
+    key = cache.key(model, *arrays, Q, R, terminal, kind="tvlqr") if cache else None
+    cached = cache.load(key) if cache else None
+    if cached is None:
+        linearized = [
+            linearize(model, *knot) for knot in zip(qpos, qvel, ctrl, strict=True)
+        ]
+        As = np.array([A for A, _ in linearized])
+        Bs = np.array([B for _, B in linearized])
+        K = riccati_recursion(As, Bs, Q, R, terminal)
+        if cache:
+            cache.save(key, K=K)
+    else:
+        K = cached["K"]
+
+    return TVLQRGains(K=K, times=times, qpos=qpos, qvel=qvel, ctrl=ctrl)
+
+
+def _tracking_gains_job(args) -> TVLQRGains:
+    """Process pool entry point for tracking_gains."""
+    model, reference, Q, R, Qf, cache_dir = args
+    cache = GainCache(cache_dir) if cache_dir else None
+    return tracking_gains(model, *reference, Q=Q, R=R, Qf=Qf, cache=cache)
+
+
+def synthesize_gain_library(
+    model, references, Q=None, R=None, Qf=None, cache=None, max_workers=None
+) -> dict[str, TVLQRGains]:
+    """Time-varying gains for a library of reference swings, in parallel.
+
+    Args:
+        model: MuJoCo model (pickled to the worker processes)
+        references: Mapping of name to (times, qpos, qvel, ctrl)
+        Q: State cost (2*nv, 2*nv)
+        R: Control cost (nu, nu)
+        Qf: Terminal state cost (defaults to Q)
+        cache: GainCache shared by the workers (None disables caching)
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        Mapping of name to TVLQRGains
+    """
+    cache_dir = cache.directory if cache else None
+    jobs = [(model, ref, Q, R, Qf, cache_dir) for ref in references.values()]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_tracking_gains_job, jobs))
+    return dict(zip(references, results, strict=True))
@@ -7,7 +7,7 @@ import typing
 import imageio
 import numpy as np
 
-from . import iaa_helper, utils
+from . import iaa_helper, linearization, utils
 
 # Check for viewer support
 try:
@@ -110,11 +110,14 @@ class PolynomialController(BaseController):
 
 
 class LQRController(BaseController):
-    def __init__(self, physics, target_pose, actuators, height_scale=1.0) -> None:
+    def __init__(
+        self, physics, target_pose, actuators, height_scale=1.0, cache_dir=None
+    ) -> None:
         """Initialize LQR Controller."""
         self.actuators = actuators
         self.target_pose = target_pose
         self.K = None
+        self.model = physics.model.ptr
 
         # Store vector targets for LQR regulation
         # We need to temporarily set the pose to capture the full qpos vector
@@ -132,22 +135,30 @@ class LQRController(BaseController):
             self.qpos_targ = physics.data.qpos.copy()
             self.qvel_targ = np.zeros(physics.model.nv)
 
+        self.ctrl_targ = np.zeros(physics.model.nu)
+
         print("Computing LQR Gains...")
-        # Note: Full-body linearization for Humanoid with Quaternions (root)
-        # is complex and prone to singularity without careful handling.
-        # We use a robust fallback (High-Gain Matrix) that satisfies the LQR structure
-        # (u = Kx) but is computed via decoupling assumption.
-        self.K = self._compute_gains(physics, fallback=True)
-        print("LQR Gains initialized.")
-
-    def _compute_gains(self, physics, fallback=False) -> np.ndarray:
-        """Compute LQR gain matrix."""
-        # Fallback: Diagonal PD matrix embedded in K
+        # Gains come from the Riccati equation on the linearized dynamics
+        # (cached on disk per model and pose); the PD matrix is only used if
+        # that system turns out not to be stabilizable.
+        try:
+            gains = linearization.regulator_gains(
+                self.model,
+                self.qpos_targ,
+                cache=linearization.GainCache(cache_dir),
+            )
+            self.K = gains.K
+            self.ctrl_targ = gains.ctrl
+            print("LQR Gains initialized.")
+        except (np.linalg.LinAlgError, ValueError) as e:
+            print(f"WARNING: LQR synthesis failed ({e}); using PD gains instead.")
+            self.K = self._compute_gains(physics)
+
+    def _compute_gains(self, physics) -> np.ndarray:
+        """Diagonal PD gain matrix on the tangent state [dq, dv]."""
         nu = physics.model.nu
-        nq = physics.model.nq
         nv = physics.model.nv
-        nx = nq + nv
-        K = np.zeros((nu, nx))
+        K = np.zeros((nu, 2 * nv))
 
         kp = 100.0
         kd = 10.0
@@ -156,13 +167,12 @@ class LQRController(BaseController):
             try:
                 # Map actuator to joint
                 joint_id = physics.model.actuator_trnid[i, 0]
-                qpos_adr = physics.model.jnt_qposadr[joint_id]
                 dof_adr = physics.model.jnt_dofadr[joint_id]
 
                 # P gain (on position error)
-                K[i, qpos_adr] = kp
+                K[i, dof_adr] = kp
                 # D gain (on velocity error)
-                K[i, nq + dof_adr] = kd
+                K[i, nv + dof_adr] = kd
             except Exception:
                 pass
         return K
@@ -172,23 +182,54 @@ class LQRController(BaseController):
         if self.K is None:
             return np.zeros(physics.model.nu)
 
-        x_curr = np.concatenate([physics.data.qpos, physics.data.qvel])
-        x_targ = np.concatenate([self.qpos_targ, self.qvel_targ])
-
-        # Simple error
-        # WARNING: Quaternion subtraction (x_targ - x_curr) is not
-        # mathematically correct for 3D rotations
-        # (orientation differences should be computed via quaternion
-        # multiplication/inverse).
-        # This linear approximation is only stable for small deviations
-        # near the target pose.
-        # For large deviations, this approach may cause instability or
-        # incorrect behavior.
-        # NOTE: Implement proper quaternion error computation
-        # (e.g. via scipy.spatial.transform.Rotation).
-        err = x_targ - x_curr
+        # Orientation error of the free joint is taken on the rotation
+        # manifold, not by subtracting quaternions
+        err = linearization.state_error(
+            self.model,
+            physics.data.qpos,
+            physics.data.qvel,
+            self.qpos_targ,
+            self.qvel_targ,
+        )
+        return self.ctrl_targ + self.K @ err
+
+
+class TVLQRController(BaseController):
+    """Time-varying LQR tracking of a reference swing."""
+
+    def __init__(self, physics, reference, cache_dir=None) -> None:
+        """Initialize TVLQR Controller.
+
+        Args:
+            physics: dm_control physics
+            reference: Mapping with "times", "qpos", "qvel" and "ctrl" arrays
+            cache_dir: Gain cache directory (defaults to GAIN_CACHE_DIR)
+        """
+        self.model = physics.model.ptr
+        print("Computing TVLQR Gains...")
+        self.gains = linearization.tracking_gains(
+            self.model,
+            reference["times"],
+            reference["qpos"],
+            reference["qvel"],
+            reference["ctrl"],
+            cache=linearization.GainCache(cache_dir),
+        )
+        print("TVLQR Gains initialized.")
 
-        return self.K @ err
+    def get_action(self, physics) -> np.ndarray:
+        """Calculate TVLQR control action at the current reference knot."""
+        gains = self.gains
+        k = int(np.searchsorted(gains.times, physics.data.time, side="right")) - 1
+        k = min(max(k, 0), len(gains.times) - 1)
+        err = linearization.state_error(
+            self.model,
+            physics.data.qpos,
+            physics.data.qvel,
+            gains.qpos[k],
+            gains.qvel[k],
+        )
+        return gains.ctrl[k] + gains.K[k] @ err
 
 
 class TimeStep:
@@ -376,6 +417,11 @@ def run_simulation(
         controller = LQRController(
             physics, TARGET_POSE, actuators, height_scale=h_scale
         )
+    elif control_mode == "tvlqr" and config.get("reference_swing_path"):
+        # Reference swing saved with np.savez (times, qpos, qvel, ctrl)
+        with np.load(config["reference_swing_path"], allow_pickle=False) as ref:
+            reference = {name: ref[name] for name in ref.files}
+        controller = TVLQRController(physics, reference)
     elif control_mode == "poly":
         controller = PolynomialController(physics)
     else:
@@ -5,8 +5,11 @@ simulation and optimization, including:
 
 - Biomechanical analysis with force/torque extraction
 - Advanced kinematics (Jacobians, manipulability, IK)
+- Workspace and singularity atlases over sampled joint configurations
 - Multiple control schemes (impedance, admittance, hybrid)
+- Sampling-based model predictive control with parallel rollouts
 - Trajectory optimization
+- Chaos analysis of the driven pendulum (bifurcation, Lyapunov, basins)
 - Parallel mechanism analysis (constraint Jacobians)
 - Motion primitive libraries
 - Motion capture integration and retargeting
@@ -24,6 +27,7 @@ try:
         advanced_control,
         advanced_kinematics,
         biomechanics,
+        chaos_analysis,
         control_system,
         inverse_dynamics,
         kinematic_forces,
@@ -31,7 +35,9 @@ try:
         motion_capture,
         motion_optimization,
         plotting,
+        predictive_control,
         urdf_io,
+        workspace_atlas,
     )
     from .control_system import ActuatorControl, ControlSystem, ControlType
 except (ImportError, OSError):
@@ -41,6 +47,7 @@ except (ImportError, OSError):
         "advanced_control",
         "advanced_kinematics",
         "biomechanics",
+        "chaos_analysis",
         "control_system",
         "inverse_dynamics",
         "kinematic_forces",
@@ -48,7 +55,9 @@ except (ImportError, OSError):
         "motion_capture",
         "motion_optimization",
         "plotting",
+        "predictive_control",
         "urdf_io",
+        "workspace_atlas",
         "ActuatorControl",
         "ControlSystem",
         "ControlType",
@@ -82,6 +91,7 @@ __all__ = [
     "advanced_control",
     "advanced_kinematics",
     "biomechanics",
+    "chaos_analysis",
     "control_system",
     "inverse_dynamics",
     "kinematic_forces",
@@ -89,7 +99,9 @@ __all__ = [
     "motion_capture",
     "motion_optimization",
     "plotting",
+    "predictive_control",
     "urdf_io",
+    "workspace_atlas",
 ]
 
 # Only include GUI modules in __all__ if they're available
@@ -7,6 +7,7 @@ This module implements state-of-the-art control strategies including:
 - Computed torque control (inverse dynamics)
 - Task-space control with nullspace projection
 - Operational space control
+- Sampling-based model predictive control
 """
 
 from __future__ import annotations
@@ -17,6 +18,9 @@ from enum import Enum
 import mujoco
 import numpy as np
 
+from .body_lookup import find_body_id
+from .predictive_control import SamplingMPC
+
 
 class ControlMode(Enum):
     """Control mode enumeration."""
@@ -27,6 +31,7 @@ class ControlMode(Enum):
     HYBRID = "hybrid"  # Hybrid force-position
     COMPUTED_TORQUE = "computed_torque"  # Computed torque
     TASK_SPACE = "task_space"  # Task-space control
+    PREDICTIVE = "predictive"  # Sampling-based MPC
 
 
 @dataclass
@@ -126,23 +131,100 @@ class AdvancedController:
         # Gravity compensation flag
         self.enable_gravity_compensation = True
 
+        # Receding-horizon planner, created on first use
+        self.predictive_controller: SamplingMPC | None = None
+        self._owns_predictive_controller = False
+
         # Find important body IDs
-        self.club_head_id = self._find_body_id("club_head")
+        self.club_head_id = find_body_id(model, "club_head")
+
+        # Persistent workspaces for the per-step task-space solves
+        self._jacp, self._jacr, self._jac_args = self._allocate_jacobians()
+        self._jac_m_inv = np.zeros((3, model.nv))
+        self._tau = np.zeros(model.nv)
+        self._posture = np.zeros(model.nv)
 
     def _find_body_id(self, name_pattern: str) -> int | None:
-        """Find body ID by name pattern."""
-        for i in range(self.model.nbody):
-            body_name = mujoco.mj_id2name(self.model, mujoco.mjtObj.mjOBJ_BODY, i)
-            if body_name and name_pattern.lower() in body_name.lower():
-                return i
-        return None
+        """Find body ID by name pattern (see :func:`find_body_id`)."""
+        return find_body_id(self.model, name_pattern)
+
+    def _allocate_jacobians(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray]]:
+        """Allocate body Jacobian buffers in the layout MuJoCo accepts.
+
+        Newer bindings take (3, nv) arrays and older ones flat 3*nv
+        buffers. The layout is probed once here so the control loop calls
+        mj_jacBody directly.
+
+        Returns:
+            Tuple of (jacp, jacr, args) where jacp and jacr are (3, nv)
+            views sharing memory with the buffers in args
+        """
+        jacp = np.zeros((3, self.model.nv))
+        jacr = np.zeros((3, self.model.nv))
+        try:
+            mujoco.mj_jacBody(self.model, self.data, jacp, jacr, 0)
+        except TypeError:
+            # Older MuJoCo versions expect flat arrays
+            return jacp, jacr, (jacp.reshape(-1), jacr.reshape(-1))
+        return jacp, jacr, (jacp, jacr)
+
+    def _task_space_terms(self, body_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the translational Jacobian and task-space inertia of a body.
+
+        Λ = (J M^{-1} J^T)^{-1}, with J M^{-1} obtained from mj_solveM.
+        That back-substitutes through the L^T D L factorization of M that
+        mj_forward already computed, so M is never formed or inverted.
+        J M^{-1} is kept in a workspace for the nullspace projection.
+
+        Args:
+            body_id: Body ID for end-effector
+
+        Returns:
+            Tuple of (jacp [3 x nv], lambda_matrix [3 x 3]). Both arrays
+            are overwritten on the next call.
+        """
+        mujoco.mj_jacBody(self.model, self.data, *self._jac_args, body_id)
+        jacp = self._jacp
+        mujoco.mj_solveM(self.model, self.data, self._jac_m_inv, jacp)
+        lambda_matrix = np.linalg.pinv(self._jac_m_inv @ jacp.T, hermitian=True)
+        return jacp, lambda_matrix
+
+    def _project_nullspace(
+        self,
+        torque: np.ndarray,
+        jacp: np.ndarray,
+        lambda_matrix: np.ndarray,
+    ) -> np.ndarray:
+        """Apply the dynamically consistent nullspace projector in place.
+
+        N^T τ = τ - J^T J_bar^T τ with J_bar^T = Λ J M^{-1}, evaluated as
+        matrix-vector products so the nv x nv projector is never built.
+        Requires the J M^{-1} workspace from _task_space_terms.
+
+        Args:
+            torque: Joint torque to project [nv], overwritten
+            jacp: Task Jacobian [3 x nv]
+            lambda_matrix: Task-space inertia [3 x 3]
+
+        Returns:
+            The projected torque (same array as torque)
+        """
+        torque -= (lambda_matrix @ (self._jac_m_inv @ torque)) @ jacp
+        return torque
 
     def set_control_mode(self, mode: ControlMode) -> None:
         """Set control mode.
 
+        Leaving predictive mode shuts down the worker threads of a planner
+        that was created on demand; it is recreated when needed again.
+
         Args:
             mode: Desired control mode
         """
+        if mode != ControlMode.PREDICTIVE and self._owns_predictive_controller:
+            self.close()
         self.mode = mode
 
     def set_impedance_parameters(self, params: ImpedanceParameters) -> None:
@@ -161,6 +243,23 @@ class AdvancedController:
         """
         self.hybrid_mask = mask
 
+    def set_predictive_controller(self, controller: SamplingMPC) -> None:
+        """Set the sampling-based MPC used in predictive mode.
+
+        Args:
+            controller: Predictive controller planning on this model and data
+        """
+        if self._owns_predictive_controller:
+            self.close()
+        self.predictive_controller = controller
+
+    def close(self) -> None:
+        """Shut down the predictive controller's rollout workers, if any."""
+        if self.predictive_controller is not None:
+            self.predictive_controller.close()
+        self.predictive_controller = None
+        self._owns_predictive_controller = False
+
     def compute_control(  # noqa: PLR0911 - Multiple return paths for different control modes
         self,
         target_position: np.ndarray | None = None,
@@ -208,6 +307,12 @@ class AdvancedController:
         if self.mode == ControlMode.TASK_SPACE:
             return self._compute_task_space_control(target_position, target_velocity)
 
+        if self.mode == ControlMode.PREDICTIVE:
+            if self.predictive_controller is None:
+                self.predictive_controller = SamplingMPC(self.model, self.data)
+                self._owns_predictive_controller = True
+            return self.predictive_controller.compute_control()
+
         return np.zeros(self.model.nu)
 
     def _compute_impedance_control(
@@ -422,27 +527,15 @@ class AdvancedController:
             # Fall back to joint-space control
             return self._compute_impedance_control(target_position, target_velocity)
 
+        current_pos = self.data.xpos[self.club_head_id]
         if target_position is None:
-            target_position = self.data.xpos[self.club_head_id].copy()
+            target_position = current_pos
         if target_velocity is None:
             target_velocity = np.zeros(3)
 
-        # Compute Jacobian - fixed for MuJoCo 3.x API
-        try:
-            jacp = np.zeros((3, self.model.nv))
-            jacr = np.zeros((3, self.model.nv))
-            mujoco.mj_jacBody(self.model, self.data, jacp, jacr, self.club_head_id)
-        except TypeError:
-            # Fallback to flat array approach for older MuJoCo versions
-            jacp_flat = np.zeros(3 * self.model.nv)
-            jacr_flat = np.zeros(3 * self.model.nv)
-            mujoco.mj_jacBody(
-                self.model, self.data, jacp_flat, jacr_flat, self.club_head_id
-            )
-            jacp = jacp_flat.reshape(3, self.model.nv)
+        jacp, lambda_matrix = self._task_space_terms(self.club_head_id)
 
-        # Current end-effector state
-        current_pos = self.data.xpos[self.club_head_id].copy()
+        # Current end-effector velocity
         current_vel = jacp @ self.data.qvel
 
         # Task-space errors
@@ -456,26 +549,24 @@ class AdvancedController:
         desired_force = k_p * pos_error + k_d * vel_error
 
         # Map to joint torques
-        tau_task = jacp.T @ desired_force
-
-        # Nullspace objective: joint centering
-        joint_center = np.zeros(self.model.nv)  # Could use mid-range
-        nullspace_error = joint_center - self.data.qpos
+        tau = np.matmul(desired_force, jacp, out=self._tau)
 
-        # Nullspace projection
-        j_pinv = np.linalg.pinv(jacp)
-        nullspace_proj = np.eye(self.model.nv) - j_pinv @ jacp
-
-        tau_null = nullspace_proj @ (10.0 * nullspace_error)  # Low gain
+        # Nullspace objective: joint centering about the reference pose
+        # (tangent-space difference, so free and ball joints are handled)
+        nullspace_error = self._posture
+        mujoco.mj_differentiatePos(
+            self.model, nullspace_error, 1.0, self.data.qpos, self.model.qpos0
+        )
+        nullspace_error *= 10.0  # Low gain
 
-        # Combined control
-        tau = tau_task + tau_null
+        # Dynamically consistent nullspace projection
+        tau += self._project_nullspace(nullspace_error, jacp, lambda_matrix)
 
         # Add gravity compensation
         if self.enable_gravity_compensation:
-            tau += self._compute_gravity_compensation()
+            tau += self.data.qfrc_bias
 
-        return tau[: self.model.nu]
+        return tau[: self.model.nu].copy()
 
     def _compute_gravity_compensation(self) -> np.ndarray:
         """Compute gravity compensation torques.
@@ -487,12 +578,9 @@ class AdvancedController:
         # We can extract it by computing with and without gravity
         # For now, use a simple approximation
 
-        # Save current state
-        qfrc_bias = self.data.qfrc_bias.copy()
-
         # Gravity compensation is the bias force without velocity terms
         # In quasi-static case: g(q) ≈ qfrc_bias
-        return qfrc_bias.copy()
+        return self.data.qfrc_bias.copy()
 
     def compute_operational_space_control(
         self,
@@ -520,43 +608,17 @@ class AdvancedController:
         Returns:
             Control torques [nu]
         """
-        # Compute Jacobian
-        # MuJoCo 3.3+ may require reshaped arrays - try both approaches
-        try:
-            jacp = np.zeros((3, self.model.nv))
-            jacr = np.zeros((3, self.model.nv))
-            mujoco.mj_jacBody(self.model, self.data, jacp, jacr, body_id)
-        except TypeError:
-            # Fallback to flat array approach
-            jacp_flat = np.zeros(3 * self.model.nv)
-            jacr_flat = np.zeros(3 * self.model.nv)
-            mujoco.mj_jacBody(self.model, self.data, jacp_flat, jacr_flat, body_id)
-            jacp = jacp_flat.reshape(3, self.model.nv)
+        # Jacobian and task-space inertia Λ = (J M^{-1} J^T)^{-1}
+        jacp, lambda_matrix = self._task_space_terms(body_id)
 
         # Current state
-        current_pos = self.data.xpos[body_id].copy()
+        current_pos = self.data.xpos[body_id]
         current_vel = jacp @ self.data.qvel
 
         # Errors
         pos_error = target_position - current_pos
         vel_error = target_velocity - current_vel
 
-        # Compute task-space inertia matrix
-        # Λ = (J M^{-1} J^T)^{-1}
-
-        # Calculate J M^{-1} efficiently using sparse factorization
-        # mj_solveM solves M x = y. We pass J as y (shape 3 x nv)
-        # Output will be J M^{-1}
-        jac_m_inv = np.zeros((3, self.model.nv))
-        mujoco.mj_solveM(self.model, self.data, jac_m_inv, jacp)
-
-        lambda_matrix = np.linalg.inv(jac_m_inv @ jacp.T)
-
-        # Compute dynamically consistent pseudoinverse
-        # J_bar = M^{-1} J^T Λ
-        # jac_m_inv.T is M^{-1} J^T (since M is symmetric)
-        j_bar = jac_m_inv.T @ lambda_matrix
-
         # Task-space control law
         k_p = 100.0
         k_d = 20.0
@@ -569,15 +631,15 @@ class AdvancedController:
         # For now, simplified version
 
         # Map to joint torques
-        tau_task = jacp.T @ f_task
+        tau = np.matmul(f_task, jacp, out=self._tau)
 
-        # Nullspace control
-        nullspace_proj = np.eye(self.model.nv) - jacp.T @ j_bar.T
-        tau_null = nullspace_proj @ (-10.0 * self.data.qvel)  # Damping
+        # Nullspace control: N^T = I - J^T J_bar^T, J_bar = M^{-1} J^T Λ
+        tau_null = np.multiply(self.data.qvel, -10.0, out=self._posture)  # Damping
+        tau += self._project_nullspace(tau_null, jacp, lambda_matrix)
 
-        tau = tau_task + tau_null + self.data.qfrc_bias
+        tau += self.data.qfrc_bias
 
-        return tau[: self.model.nu]
+        return tau[: self.model.nu].copy()
 
 
 class TrajectoryGenerator:
@@ -16,6 +16,14 @@ import mujoco
 import numpy as np
 from scipy.linalg import null_space, pinv, svd
 
+from .workspace_atlas import (
+    DEFAULT_VOXEL_SIZE,
+    WorkspaceAtlas,
+    build_workspace_atlas,
+    evaluate_configurations,
+    sample_configurations,
+)
+
 
 @dataclass
 class ManipulabilityMetrics:
@@ -463,6 +471,9 @@ class AdvancedKinematicsAnalyzer:
     ) -> tuple[list[np.ndarray], list[float]]:
         """Analyze workspace for singularities.
 
+        Samples are evaluated in one batch on scratch data, so the state of
+        ``self.data`` is left untouched.
+
         Args:
             body_id: Body to analyze
             q_samples: Joint configurations to sample (default: random)
@@ -471,37 +482,17 @@ class AdvancedKinematicsAnalyzer:
         Returns:
             Tuple of (singular_configs, condition_numbers)
         """
-        singular_configs = []
-        condition_numbers = []
-
         # Generate samples if not provided
         if q_samples is None:
             q_samples = self._generate_random_configs(num_samples)
+        q_samples = np.atleast_2d(np.asarray(q_samples, dtype=float))
 
-        # Store original configuration
-        q_original = self.data.qpos.copy()
-
-        for q in q_samples:
-            # Set configuration
-            self.data.qpos[:] = q
-            mujoco.mj_forward(self.model, self.data)
-
-            # Compute Jacobian
-            jacp, _ = self.compute_body_jacobian(body_id)
-
-            # Compute manipulability
-            metrics = self.compute_manipulability(jacp)
-            condition_numbers.append(metrics.condition_number)
-
-            # Check if singular
-            if metrics.is_near_singularity:
-                singular_configs.append(q.copy())
-
-        # Restore original configuration
-        self.data.qpos[:] = q_original
-        mujoco.mj_forward(self.model, self.data)
+        samples = evaluate_configurations(
+            self.model, mujoco.MjData(self.model), q_samples, body_id
+        )
+        singular = samples.near_singular(self.singularity_threshold)
 
-        return singular_configs, condition_numbers
+        return list(q_samples[singular]), samples.condition_numbers.tolist()
 
     def _generate_random_configs(self, num_samples: int) -> np.ndarray:
         """Generate random joint configurations within joint limits.
@@ -510,23 +501,44 @@ class AdvancedKinematicsAnalyzer:
             num_samples: Number of configurations to generate
 
         Returns:
-            Array of configurations [num_samples x nv]
+            Array of configurations [num_samples x nq]
         """
-        configs = []
+        return sample_configurations(self.model, num_samples)
 
-        for _ in range(num_samples):
-            q = np.zeros(self.model.nq)
+    def build_workspace_atlas(
+        self,
+        body_id: int,
+        num_samples: int = 100_000,
+        method: str = "sobol",
+        voxel_size: float = DEFAULT_VOXEL_SIZE,
+        seed: int | None = None,
+        max_workers: int | None = None,
+    ) -> WorkspaceAtlas:
+        """Voxelized reachability and singularity atlas of a body.
 
-            for i in range(self.model.njnt):
-                if self.model.jnt_limited[i]:
-                    q_min = self.model.jnt_range[i, 0]
-                    q_max = self.model.jnt_range[i, 1]
-                    qpos_addr = self.model.jnt_qposadr[i]
-                    q[qpos_addr] = np.random.uniform(q_min, q_max)
+        See :func:`workspace_atlas.build_workspace_atlas`.
 
-            configs.append(q)
+        Args:
+            body_id: Body to analyze (e.g. ``self.club_head_id``)
+            num_samples: Number of joint configurations
+            method: "uniform", "sobol" or "latin_hypercube"
+            voxel_size: Edge length of a voxel [m]
+            seed: Random seed
+            max_workers: Worker processes (defaults to the CPU count)
 
-        return np.array(configs)
+        Returns:
+            The workspace atlas
+        """
+        return build_workspace_atlas(
+            self.model,
+            body_id,
+            num_samples=num_samples,
+            method=method,
+            seed=seed,
+            voxel_size=voxel_size,
+            singularity_threshold=self.singularity_threshold,
+            max_workers=max_workers,
+        )
 
     def compute_nullspace_projection(self, jacobian: np.ndarray) -> np.ndarray:
         """Compute nullspace projection matrix.
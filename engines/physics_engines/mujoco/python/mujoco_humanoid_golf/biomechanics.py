@@ -304,17 +304,22 @@ class SwingRecorder:
 
     def __init__(self) -> None:
         """Initialize empty recorder."""
+        # Incremented whenever the recorded data changes, so analyses of a
+        # finished recording can be reused
+        self.version = 0
         self.reset()
 
     def reset(self) -> None:
         """Clear all recorded data."""
         self.frames: list[BiomechanicalData] = []
         self.is_recording = False
+        self.version += 1
 
     def start_recording(self) -> None:
         """Start recording data."""
         self.is_recording = True
         self.frames = []
+        self.version += 1
 
     def stop_recording(self) -> None:
         """Stop recording data."""
@@ -328,6 +333,7 @@ class SwingRecorder:
         """
         if self.is_recording:
             self.frames.append(data)
+            self.version += 1
 
     def get_time_series(self, field_name: str) -> tuple[np.ndarray, np.ndarray | list]:
         """Extract time series for a specific field.
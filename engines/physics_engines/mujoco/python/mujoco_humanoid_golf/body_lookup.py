@@ -0,0 +1,26 @@
+"""Lookup of model bodies by loose name patterns."""
+
+from __future__ import annotations
+
+import mujoco
+
+
+def find_body_id(model: mujoco.MjModel, name_pattern: str) -> int | None:
+    """Find the first body whose name contains a pattern.
+
+    Matching ignores case and underscores, so "club_head" also finds a body
+    named "clubhead".
+
+    Args:
+        model: MuJoCo model
+        name_pattern: Part of the body name
+
+    Returns:
+        Body ID, or None if no body matches
+    """
+    pattern = name_pattern.lower().replace("_", "")
+    for i in range(model.nbody):
+        body_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_BODY, i)
+        if body_name and pattern in body_name.lower().replace("_", ""):
+            return i
+    return None
@@ -0,0 +1,478 @@
+"""Chaos analysis for the driven pendulum model.
+
+This module provides the standard tools for studying the forced pendulum in
+``CHAOTIC_PENDULUM_XML``:
+- Poincaré (stroboscopic) sections sampled once per forcing period
+- Bifurcation diagrams over a forcing frequency or amplitude sweep
+- Largest Lyapunov exponents by two-trajectory renormalization
+- Basin-of-attraction maps over a grid of initial conditions
+
+Sweep points are distributed across a process pool. Each worker compiles the
+model once and reuses it for every point it receives.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any
+
+import mujoco
+import numpy as np
+from mujoco import rollout
+
+from .models import CHAOTIC_PENDULUM_XML
+
+BASE_JOINT = 0  # Index of the driven base slider in qpos/qvel/ctrl
+PENDULUM_JOINT = 1  # Index of the pendulum hinge in qpos/qvel
+
+SWEEP_PARAMETERS = ("frequency", "amplitude")
+
+# Full physical state, so rollouts continue exactly where they stopped
+STATE_SPEC = mujoco.mjtState.mjSTATE_FULLPHYSICS
+
+
+@dataclass(frozen=True)
+class ForcingParameters:
+    """Sinusoidal base forcing ``ctrl = amplitude * sin(2 pi frequency t)``."""
+
+    frequency: float = 2.0  # Forcing frequency [Hz]
+    amplitude: float = 20.0  # Base motor control amplitude (clipped to ctrlrange)
+
+
+@dataclass
+class BifurcationResult:
+    """Poincaré sections for each value of a swept forcing parameter."""
+
+    parameter: str
+    values: np.ndarray  # (N,)
+    sections: np.ndarray  # (N, num_periods, 2) pendulum angle and velocity
+
+
+@dataclass
+class BasinResult:
+    """Attractor labels over a grid of initial pendulum states."""
+
+    theta_values: np.ndarray  # (W,)
+    omega_values: np.ndarray  # (H,)
+    labels: np.ndarray  # (H, W) attractor index per initial state
+    attractors: list[np.ndarray]  # Poincaré points of each attractor
+
+
+class DrivenPendulum:
+    """Driven pendulum simulation aligned with the forcing period.
+
+    The physics timestep is adjusted for each forcing frequency so that one
+    period is an exact number of steps, which makes the stroboscopic samples
+    land on the same forcing phase. Since the forcing is open loop, whole
+    periods are simulated with ``mujoco.rollout`` from a precomputed control
+    table instead of stepping from Python.
+    """
+
+    def __init__(self, model: mujoco.MjModel) -> None:
+        """Initialize simulation.
+
+        Args:
+            model: Compiled chaotic pendulum model (its timestep is modified)
+        """
+        self.model = model
+        self.data = mujoco.MjData(model)
+        self._base_timestep = float(model.opt.timestep)
+        self._steps_per_period = 1
+        self._controls = np.zeros((1, model.nu))
+
+        # Offsets of qpos and qvel in the full physics state vector
+        self._qpos_start = mujoco.mj_stateSize(model, mujoco.mjtState.mjSTATE_TIME)
+        self._qvel_start = self._qpos_start + model.nq
+        self._qvel_end = self._qvel_start + model.nv
+
+    @property
+    def period(self) -> float:
+        """Forcing period [s]."""
+        return self._steps_per_period * self.model.opt.timestep
+
+    def set_forcing(self, forcing: ForcingParameters) -> None:
+        """Set the forcing and align the timestep with its period."""
+        if forcing.frequency <= 0:
+            msg = "Forcing frequency must be positive"
+            raise ValueError(msg)
+        period = 1.0 / forcing.frequency
+        steps = max(1, round(period / self._base_timestep))
+        self._steps_per_period = steps
+        self.model.opt.timestep = period / steps
+
+        # Base control at the start of each step of one period
+        self._controls = np.zeros((steps, self.model.nu))
+        self._controls[:, BASE_JOINT] = forcing.amplitude * np.sin(
+            2.0 * np.pi * np.arange(steps) / steps
+        )
+
+    def initial_state(self, theta: float, omega: float) -> np.ndarray:
+        """Full physics state with the given pendulum state and the base at rest."""
+        mujoco.mj_resetData(self.model, self.data)
+        self.data.qpos[PENDULUM_JOINT] = theta
+        self.data.qvel[PENDULUM_JOINT] = omega
+        state = np.empty(mujoco.mj_stateSize(self.model, STATE_SPEC))
+        mujoco.mj_getState(self.model, self.data, state, STATE_SPEC)
+        return state
+
+    def advance(self, states: np.ndarray, periods: int) -> np.ndarray:
+        """Simulate whole forcing periods from a batch of states.
+
+        Args:
+            states: Full physics states (B, nstate), starting at a period boundary
+            periods: Number of forcing periods (at least one)
+
+        Returns:
+            States at the end of each period (B, periods, nstate)
+        """
+        controls = np.tile(self._controls, (periods, 1))
+        trajectory, _ = rollout.rollout(
+            self.model, self.data, np.atleast_2d(states), controls
+        )
+        return trajectory[:, self._steps_per_period - 1 :: self._steps_per_period]
+
+    def section_points(self, states: np.ndarray) -> np.ndarray:
+        """Pendulum angle wrapped to [-pi, pi) and angular velocity."""
+        theta = states[..., self._qpos_start + PENDULUM_JOINT]
+        omega = states[..., self._qvel_start + PENDULUM_JOINT]
+        return np.stack([(theta + np.pi) % (2.0 * np.pi) - np.pi, omega], axis=-1)
+
+    def poincare_section(
+        self,
+        forcing: ForcingParameters,
+        initial_state: tuple[float, float],
+        transient_periods: int,
+        num_periods: int,
+    ) -> np.ndarray:
+        """Sample the pendulum once per forcing period after a transient.
+
+        Args:
+            forcing: Forcing parameters
+            initial_state: Initial pendulum angle [rad] and velocity [rad/s]
+            transient_periods: Periods discarded before sampling
+            num_periods: Number of samples
+
+        Returns:
+            Section points (num_periods, 2)
+        """
+        self.set_forcing(forcing)
+        state = self.initial_state(*initial_state)
+        if transient_periods > 0:
+            state = self.advance(state, transient_periods)[:, -1]
+        return self.section_points(self.advance(state, num_periods)[0])
+
+    def largest_lyapunov_exponent(
+        self,
+        forcing: ForcingParameters,
+        initial_state: tuple[float, float],
+        transient_periods: int = 20,
+        num_periods: int = 100,
+        perturbation: float = 1e-8,
+    ) -> float:
+        """Largest Lyapunov exponent by two-trajectory renormalization.
+
+        A shadow trajectory starts ``perturbation`` away in pendulum angle.
+        After every forcing period the log growth of the separation is
+        accumulated and the shadow is pulled back along the separation to its
+        original distance. The separation covers the pendulum angle and all
+        velocities; the base position is left out since the dynamics do not
+        depend on it, and its drift would otherwise mask contraction.
+
+        Args:
+            forcing: Forcing parameters
+            initial_state: Initial pendulum angle [rad] and velocity [rad/s]
+            transient_periods: Periods simulated before measuring
+            num_periods: Periods averaged over
+            perturbation: Separation of the shadow trajectory
+
+        Returns:
+            Largest Lyapunov exponent [1/s]
+        """
+        self.set_forcing(forcing)
+        state = self.initial_state(*initial_state)
+        if transient_periods > 0:
+            state = self.advance(state, transient_periods)[0, -1]
+
+        # Reference and shadow trajectories advance together as a batch
+        states = np.stack([state, state])
+        states[1, self._qpos_start + PENDULUM_JOINT] += perturbation
+        base = self._qpos_start + BASE_JOINT
+        physics = np.r_[
+            self._qpos_start + PENDULUM_JOINT, self._qvel_start : self._qvel_end
+        ]
+        log_growth = 0.0
+        for _ in range(num_periods):
+            states = self.advance(states, 1)[:, -1]
+            delta = states[1, physics] - states[0, physics]
+            distance = float(np.linalg.norm(delta))
+            if distance == 0.0:
+                # Trajectories merged to machine precision: stable orbit
+                return -np.inf
+            log_growth += np.log(distance / perturbation)
+            states[1, physics] = states[0, physics] + delta * (perturbation / distance)
+            states[1, base] = states[0, base]
+
+        return log_growth / (num_periods * self.period)
+
+
+# ---------------------------------------------------------------------------
+# Process pool workers
+# ---------------------------------------------------------------------------
+
+_WORKER_PENDULUM: DrivenPendulum | None = None
+
+
+def _init_worker(xml: str) -> None:
+    """Compile the model once per worker process."""
+    global _WORKER_PENDULUM  # noqa: PLW0603
+    _WORKER_PENDULUM = DrivenPendulum(mujoco.MjModel.from_xml_string(xml))
+
+
+def _worker() -> DrivenPendulum:
+    if _WORKER_PENDULUM is None:
+        msg = "Worker model is not initialized"
+        raise RuntimeError(msg)
+    return _WORKER_PENDULUM
+
+
+def _section_job(args) -> np.ndarray:
+    forcing, initial_state, transient_periods, num_periods = args
+    return _worker().poincare_section(
+        forcing, initial_state, transient_periods, num_periods
+    )
+
+
+def _lyapunov_job(args) -> float:
+    forcing, initial_state, transient_periods, num_periods, perturbation = args
+    return _worker().largest_lyapunov_exponent(
+        forcing, initial_state, transient_periods, num_periods, perturbation
+    )
+
+
+def _run_jobs(
+    job: Callable[[Any], Any],
+    jobs: Sequence[Any],
+    on_result: Callable[[int, Any], None],
+    xml: str,
+    max_workers: int | None,
+) -> None:
+    """Run jobs in a process pool, reporting each result as it completes."""
+    if not jobs:
+        return
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        _init_worker(xml)
+        for index, args in enumerate(jobs):
+            on_result(index, job(args))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(xml,)
+    ) as executor:
+        futures = {executor.submit(job, args): i for i, args in enumerate(jobs)}
+        for future in as_completed(futures):
+            on_result(futures[future], future.result())
+
+
+def _sweep_forcing(
+    forcing: ForcingParameters, parameter: str, values: np.ndarray
+) -> list[ForcingParameters]:
+    if parameter not in SWEEP_PARAMETERS:
+        msg = f"parameter must be one of {SWEEP_PARAMETERS}, got '{parameter}'"
+        raise ValueError(msg)
+    return [replace(forcing, **{parameter: float(value)}) for value in values]
+
+
+# ---------------------------------------------------------------------------
+# Sweeps
+# ---------------------------------------------------------------------------
+
+
+def bifurcation_diagram(
+    values: Sequence[float] | np.ndarray,
+    parameter: str = "frequency",
+    forcing: ForcingParameters | None = None,
+    initial_state: tuple[float, float] = (0.5, 0.0),
+    transient_periods: int = 100,
+    num_periods: int = 50,
+    max_workers: int | None = None,
+    output_path: str | Path | None = None,
+    xml: str = CHAOTIC_PENDULUM_XML,
+) -> BifurcationResult:
+    """Poincaré sections over a sweep of one forcing parameter.
+
+    With ``output_path``, sections are streamed into a ``.npy`` file of
+    shape (N, num_periods, 2) as each sweep point completes. Rows that are
+    still NaN have not finished, so ``np.load(path, mmap_mode="r")`` shows
+    the partial diagram while the sweep runs. The sweep definition is kept
+    in a ``.json`` file beside it; rerunning the same sweep only computes
+    the missing rows, while a different sweep starts over.
+
+    Args:
+        values: Values of the swept parameter
+        parameter: "frequency" [Hz] or "amplitude"
+        forcing: Values of the parameters that are not swept
+        initial_state: Initial pendulum angle [rad] and velocity [rad/s]
+        transient_periods: Periods discarded before sampling
+        num_periods: Samples per sweep point
+        max_workers: Worker processes (defaults to the CPU count)
+        output_path: Optional ``.npy`` file for partial results
+        xml: Model XML compiled by each worker
+
+    Returns:
+        Sections for every sweep value
+    """
+    values = np.asarray(values, dtype=float)
+    forcing = forcing or ForcingParameters()
+    sweep = _sweep_forcing(forcing, parameter, values)
+    shape = (len(values), num_periods, 2)
+
+    if output_path is None:
+        sections = np.full(shape, np.nan)
+    else:
+        output_path = Path(output_path)
+        sidecar = output_path.with_suffix(".json")
+        definition = {
+            "parameter": parameter,
+            "values": values.tolist(),
+            "forcing": asdict(forcing),
+            "initial_state": [float(x) for x in initial_state],
+            "transient_periods": transient_periods,
+            "num_periods": num_periods,
+            "xml_sha256": hashlib.sha256(xml.encode()).hexdigest(),
+        }
+        existing = None
+        if output_path.exists() and sidecar.exists():
+            if json.loads(sidecar.read_text()) == definition:
+                existing = np.load(output_path, mmap_mode="r+")
+        if existing is not None and existing.shape == shape:
+            sections = existing
+        else:
+            del existing
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            sidecar.write_text(json.dumps(definition, indent=2))
+            sections = np.lib.format.open_memmap(
+                output_path, mode="w+", dtype=float, shape=shape
+            )
+            sections[:] = np.nan
+
+    pending = [i for i in range(len(values)) if np.isnan(sections[i]).any()]
+    jobs = [(sweep[i], initial_state, transient_periods, num_periods) for i in pending]
+
+    def store(job_index: int, points: np.ndarray) -> None:
+        sections[pending[job_index]] = points
+        if isinstance(sections, np.memmap):
+            sections.flush()
+
+    _run_jobs(_section_job, jobs, store, xml, max_workers)
+    return BifurcationResult(parameter, values, np.array(sections))
+
+
+def lyapunov_sweep(
+    values: Sequence[float] | np.ndarray,
+    parameter: str = "frequency",
+    forcing: ForcingParameters | None = None,
+    initial_state: tuple[float, float] = (0.5, 0.0),
+    transient_periods: int = 20,
+    num_periods: int = 100,
+    perturbation: float = 1e-8,
+    max_workers: int | None = None,
+    xml: str = CHAOTIC_PENDULUM_XML,
+) -> np.ndarray:
+    """Largest Lyapunov exponent over a sweep of one forcing parameter.
+
+    Args:
+        values: Values of the swept parameter
+        parameter: "frequency" [Hz] or "amplitude"
+        forcing: Values of the parameters that are not swept
+        initial_state: Initial pendulum angle [rad] and velocity [rad/s]
+        transient_periods: Periods simulated before measuring
+        num_periods: Periods averaged over
+        perturbation: Separation of the shadow trajectory
+        max_workers: Worker processes (defaults to the CPU count)
+        xml: Model XML compiled by each worker
+
+    Returns:
+        Exponents [1/s], one per sweep value
+    """
+    values = np.asarray(values, dtype=float)
+    sweep = _sweep_forcing(forcing or ForcingParameters(), parameter, values)
+    exponents = np.empty(len(values))
+    jobs = [
+        (f, initial_state, transient_periods, num_periods, perturbation) for f in sweep
+    ]
+
+    def store(index: int, exponent: float) -> None:
+        exponents[index] = exponent
+
+    _run_jobs(_lyapunov_job, jobs, store, xml, max_workers)
+    return exponents
+
+
+def basin_of_attraction(
+    theta_values: Sequence[float] | np.ndarray,
+    omega_values: Sequence[float] | np.ndarray,
+    forcing: ForcingParameters | None = None,
+    transient_periods: int = 50,
+    num_periods: int = 8,
+    tolerance: float = 0.05,
+    max_workers: int | None = None,
+    xml: str = CHAOTIC_PENDULUM_XML,
+) -> BasinResult:
+    """Label each initial pendulum state by the attractor it settles on.
+
+    After the transient, each initial state is sampled for ``num_periods``
+    forcing periods. Its first sample is matched to a known attractor when
+    it lies within ``tolerance`` of one of that attractor's points (angles
+    compared on the circle); otherwise its samples define a new attractor.
+
+    Args:
+        theta_values: Initial angles [rad] (grid columns)
+        omega_values: Initial angular velocities [rad/s] (grid rows)
+        forcing: Forcing parameters
+        transient_periods: Periods discarded before sampling
+        num_periods: Samples per initial state (covers periodic orbits)
+        tolerance: Matching distance in the Poincaré plane
+        max_workers: Worker processes (defaults to the CPU count)
+        xml: Model XML compiled by each worker
+
+    Returns:
+        Attractor labels and the points of each attractor
+    """
+    theta_values = np.asarray(theta_values, dtype=float)
+    omega_values = np.asarray(omega_values, dtype=float)
+    forcing = forcing or ForcingParameters()
+    grid = [(theta, omega) for omega in omega_values for theta in theta_values]
+    sections = np.empty((len(grid), num_periods, 2))
+    jobs = [(forcing, state, transient_periods, num_periods) for state in grid]
+
+    def store(index: int, points: np.ndarray) -> None:
+        sections[index] = points
+
+    _run_jobs(_section_job, jobs, store, xml, max_workers)
+
+    labels = np.empty(len(grid), dtype=int)
+    attractors: list[np.ndarray] = []
+    for index, points in enumerate(sections):
+        for label, attractor in enumerate(attractors):
+            difference = attractor - points[0]
+            difference[:, 0] = (difference[:, 0] + np.pi) % (2.0 * np.pi) - np.pi
+            if np.min(np.linalg.norm(difference, axis=1)) <= tolerance:
+                labels[index] = label
+                break
+        else:
+            labels[index] = len(attractors)
+            attractors.append(points.copy())
+
+    return BasinResult(
+        theta_values,
+        omega_values,
+        labels.reshape(len(omega_values), len(theta_values)),
+        attractors,
+    )
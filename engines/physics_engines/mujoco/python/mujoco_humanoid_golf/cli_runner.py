@@ -25,6 +25,7 @@ from .models import (
     TRIPLE_PENDULUM_XML,
     UPPER_BODY_GOLF_SWING_XML,
 )
+from .predictive_control import SamplingMPC
 
 MODEL_SPECS: Mapping[str, Mapping[str, str]] = {
     "chaotic_pendulum": {"mode": "xml_string", "value": CHAOTIC_PENDULUM_XML},
@@ -116,17 +117,24 @@ def run_simulation(
     *,
     duration_s: float,
     control_system: ControlSystem,
+    predictive_controller: SamplingMPC | None = None,
 ) -> SwingRecorder:
-    """Simulate the provided model for the requested duration."""
+    """Simulate the provided model for the requested duration.
+
+    When a predictive controller is given it replaces the control system.
+    """
     analyzer = BiomechanicalAnalyzer(model, data)
     recorder = SwingRecorder()
     recorder.start_recording()
 
     steps = max(1, int(duration_s / model.opt.timestep))
     for _ in range(steps):
-        control_system.update_time(data.time)
-        velocities = data.qvel[: model.nu] if model.nu <= len(data.qvel) else None
-        data.ctrl[:] = control_system.compute_control_vector(velocities)
+        if predictive_controller is not None:
+            data.ctrl[:] = predictive_controller.compute_control()
+        else:
+            control_system.update_time(data.time)
+            velocities = data.qvel[: model.nu] if model.nu <= len(data.qvel) else None
+            data.ctrl[:] = control_system.compute_control_vector(velocities)
         mujoco.mj_step(model, data)
         recorder.record_frame(analyzer.extract_full_state())
 
@@ -186,6 +194,7 @@ def execute_run(
     output_json: Path | None,
     output_csv: Path | None,
     show_summary: bool,
+    mpc: bool = False,
 ) -> MutableMapping[str, float] | None:
     """Execute a single run and optionally emit telemetry."""
     model_obj, data = load_model(model)
@@ -197,12 +206,18 @@ def execute_run(
         preset_payload = json.loads(control_config.read_text(encoding="utf-8"))
         apply_control_preset(control_system, preset_payload)
 
-    recorder = run_simulation(
-        model_obj,
-        data,
-        duration_s=duration,
-        control_system=control_system,
-    )
+    predictive_controller = SamplingMPC(model_obj, data) if mpc else None
+    try:
+        recorder = run_simulation(
+            model_obj,
+            data,
+            duration_s=duration,
+            control_system=control_system,
+            predictive_controller=predictive_controller,
+        )
+    finally:
+        if predictive_controller is not None:
+            predictive_controller.close()
 
     export_payload = recorder.export_to_dict()
     if output_json:
@@ -212,6 +227,8 @@ def execute_run(
 
     if show_summary:
         summary = summarize_run(recorder)
+        if predictive_controller is not None:
+            summary["planning_rate_hz"] = predictive_controller.planning_rate
         return summary
 
     return None
@@ -240,6 +257,7 @@ def run_batch(batch_path: Path, base_args: argparse.Namespace) -> None:
             output_json=Path(entry["output_json"]) if "output_json" in entry else None,
             output_csv=Path(entry["output_csv"]) if "output_csv" in entry else None,
             show_summary=entry.get("summary", base_args.summary),
+            mpc=entry.get("mpc", base_args.mpc),
         )
         if summary is not None:
             print(f"[{name}] Summary:")
@@ -282,6 +300,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print summary metrics (max club speed, energy, duration)",
     )
+    parser.add_argument(
+        "--mpc",
+        action="store_true",
+        help="Drive the actuators with the sampling-based predictive controller",
+    )
     return parser
 
 
@@ -305,6 +328,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         output_json=args.output_json,
         output_csv=args.output_csv,
         show_summary=args.summary,
+        mpc=args.mpc,
     )
 
     if summary is not None:
@@ -6,6 +6,8 @@ This script demonstrates various control scenarios including:
 3. PID control for stabilization
 4. Energy-based swing-up control
 5. Chaos exploration with phase portraits
+6. Sensitivity to initial conditions
+7. Bifurcation diagram and Lyapunov exponents over forcing frequency
 
 Run this script to see interactive demonstrations of control principles
 using the chaotic pendulum model.
@@ -18,6 +20,7 @@ import mujoco
 import numpy as np
 from shared.python import constants
 
+from . import chaos_analysis
 from .models import CHAOTIC_PENDULUM_XML
 
 
@@ -448,21 +451,21 @@ def example_5_chaos_exploration() -> None:
 def example_6_sensitivity_to_initial_conditions() -> None:
     """Example 6: Demonstrate sensitivity to initial conditions (hallmark of chaos)."""
 
-    model1 = mujoco.MjModel.from_xml_string(CHAOTIC_PENDULUM_XML)
-    data1 = mujoco.MjData(model1)
-    model2 = mujoco.MjModel.from_xml_string(CHAOTIC_PENDULUM_XML)
-    data2 = mujoco.MjData(model2)
+    # One compiled model shared by both trajectories
+    model = mujoco.MjModel.from_xml_string(CHAOTIC_PENDULUM_XML)
+    data1 = mujoco.MjData(model)
+    data2 = mujoco.MjData(model)
 
     # Two controllers with slightly different initial angles
     controller1 = ChaosExplorationDemo(
-        model1,
+        model,
         data1,
         forcing_freq=2.0,
         forcing_amp=20.0,
         initial_angle=0.500,
     )
     controller2 = ChaosExplorationDemo(
-        model2,
+        model,
         data2,
         forcing_freq=2.0,
         forcing_amp=20.0,
@@ -551,6 +554,42 @@ def example_6_sensitivity_to_initial_conditions() -> None:
     plt.show()
 
 
+def example_7_bifurcation_diagram() -> None:
+    """Example 7: Bifurcation diagram and Lyapunov exponents vs forcing frequency."""
+
+    frequencies = np.linspace(0.5, 3.0, 200)
+    bifurcation = chaos_analysis.bifurcation_diagram(frequencies, "frequency")
+    exponents = chaos_analysis.lyapunov_sweep(frequencies, "frequency")
+
+    _fig, axes = plt.subplots(2, 1, figsize=(12, 9), sharex=True)
+
+    num_periods = bifurcation.sections.shape[1]
+    axes[0].plot(
+        np.repeat(frequencies, num_periods),
+        bifurcation.sections[:, :, 0].ravel(),
+        ",k",
+        alpha=0.5,
+    )
+    axes[0].set_ylabel("Poincaré Angle (rad)")
+    axes[0].grid(True)
+    axes[0].set_title("Bifurcation Diagram")
+
+    axes[1].plot(frequencies, exponents, linewidth=1.5)
+    axes[1].axhline(0.0, color="r", linestyle="--", linewidth=1)
+    axes[1].set_xlabel("Forcing Frequency (Hz)")
+    axes[1].set_ylabel("Largest Lyapunov Exponent (1/s)")
+    axes[1].grid(True)
+    axes[1].set_title("Positive Exponent Indicates Chaos")
+
+    plt.suptitle(
+        "Example 7: Route to Chaos",
+        fontsize=14,
+        fontweight="bold",
+    )
+    plt.tight_layout()
+    plt.show()
+
+
 def run_all_examples() -> None:
     """Run all example demonstrations."""
 
@@ -560,6 +599,7 @@ def run_all_examples() -> None:
     example_4_swing_up()
     example_5_chaos_exploration()
     example_6_sensitivity_to_initial_conditions()
+    example_7_bifurcation_diagram()
 
 
 if __name__ == "__main__":
@@ -573,3 +613,4 @@ if __name__ == "__main__":
     # example_4_swing_up()
     # example_5_chaos_exploration()
     # example_6_sensitivity_to_initial_conditions()
+    # example_7_bifurcation_diagram()
@@ -98,6 +98,23 @@ class ControlsTab(QtWidgets.QWidget):
         self.recording_label.setStyleSheet("font-weight: bold; padding: 5px;")
         main_layout.addWidget(self.recording_label)
 
+        # Replay of the recording with timeline scrubbing
+        replay_group = QtWidgets.QGroupBox("Replay Recording")
+        replay_layout = QtWidgets.QHBoxLayout(replay_group)
+
+        self.replay_btn = QtWidgets.QPushButton("Replay")
+        self.replay_btn.setCheckable(True)
+        self.replay_btn.toggled.connect(self.on_replay_toggled)
+        self.replay_btn.setToolTip("Play back the recording; drag the slider to scrub")
+
+        self.timeline_slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
+        self.timeline_slider.setEnabled(False)
+        self.timeline_slider.valueChanged.connect(self.sim_widget.seek_playback)
+
+        replay_layout.addWidget(self.replay_btn)
+        replay_layout.addWidget(self.timeline_slider)
+        main_layout.addWidget(replay_group)
+
         # 4. Container for Dynamic Mode Controls (Actuators)
         self.dynamic_controls_widget = QtWidgets.QWidget()
         dynamic_layout = QtWidgets.QVBoxLayout(self.dynamic_controls_widget)
@@ -525,12 +542,41 @@ class ControlsTab(QtWidgets.QWidget):
     def on_record_toggled(self, checked: bool) -> None:
         recorder = self.sim_widget.get_recorder()
         if checked:
+            self.replay_btn.setChecked(False)
             self.record_btn.setText("Stop Recording")
             recorder.start_recording()
         else:
             self.record_btn.setText("Start Recording")
             recorder.stop_recording()
 
+    def on_replay_toggled(self, checked: bool) -> None:
+        if not checked:
+            self.sim_widget.stop_playback()
+            self.timeline_slider.setEnabled(False)
+            self.replay_btn.setText("Replay")
+            return
+
+        self.record_btn.setChecked(False)
+        playback = self.sim_widget.start_playback()
+        if playback is None:
+            self.replay_btn.setChecked(False)
+            if self.main_window.statusBar():
+                self.main_window.statusBar().showMessage("Nothing recorded yet", 3000)
+            return
+
+        self.timeline_slider.setRange(0, playback.num_frames - 1)
+        self.timeline_slider.setValue(0)
+        self.timeline_slider.setEnabled(True)
+        playback.on_frame_changed = self._on_playback_frame_changed
+        playback.play()
+        self.replay_btn.setText("Stop Replay")
+
+    def _on_playback_frame_changed(self, frame: int) -> None:
+        # Follow playback without seeking again
+        self.timeline_slider.blockSignals(True)
+        self.timeline_slider.setValue(frame)
+        self.timeline_slider.blockSignals(False)
+
     def on_take_screenshot(self) -> None:
         pixmap = self.sim_widget.label.pixmap()
         if not pixmap or pixmap.isNull():
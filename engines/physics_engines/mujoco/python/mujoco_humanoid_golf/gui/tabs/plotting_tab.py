@@ -5,6 +5,7 @@ import typing
 
 from PyQt6 import QtCore, QtWidgets
 
+from ...live_plotting import LIVE_PLOT_INTERVAL_MS, LIVE_PLOT_SPECS, LivePlot
 from ...plotting import GolfSwingPlotter, MplCanvas
 from ...sim_widget import MuJoCoSimWidget
 
@@ -28,6 +29,12 @@ class PlottingTab(QtWidgets.QWidget):
         self.main_window = main_window
 
         self.current_plot_canvas: MplCanvas | None = None
+        self.live_plot: LivePlot | None = None
+
+        # Live plots poll the recorder at ~30 fps while enabled
+        self.live_timer = QtCore.QTimer(self)
+        self.live_timer.setInterval(LIVE_PLOT_INTERVAL_MS)
+        self.live_timer.timeout.connect(self.on_live_tick)
 
         self._setup_ui()
         self.update_joint_list()
@@ -87,6 +94,15 @@ class PlottingTab(QtWidgets.QWidget):
         )
         plot_layout.addWidget(self.generate_plot_btn)
 
+        self.live_plot_btn = QtWidgets.QPushButton("Live Plot")
+        self.live_plot_btn.setCheckable(True)
+        self.live_plot_btn.setToolTip(
+            "Continuously plot the selected quantity while recording"
+        )
+        self.live_plot_btn.toggled.connect(self.on_live_plot_toggled)
+        self.live_plot_btn.setEnabled(self.plot_combo.currentText() in LIVE_PLOT_SPECS)
+        plot_layout.addWidget(self.live_plot_btn)
+
         layout.addWidget(plot_group)
 
         # Plot canvas container
@@ -126,9 +142,69 @@ class PlottingTab(QtWidgets.QWidget):
         if plot_type == "Phase Diagram" and self.joint_select_combo.count() == 0:
             self.update_joint_list()
 
+        self.live_plot_btn.setEnabled(plot_type in LIVE_PLOT_SPECS)
+        if self.live_plot_btn.isChecked():
+            if plot_type in LIVE_PLOT_SPECS:
+                self.start_live_plot()
+            else:
+                self.live_plot_btn.setChecked(False)
+
+    def _set_canvas(self, canvas: MplCanvas | None) -> None:
+        """Replace the displayed plot canvas."""
+        if self.current_plot_canvas is not None:
+            self.plot_container_layout.removeWidget(self.current_plot_canvas)
+            self.current_plot_canvas.deleteLater()
+            self.current_plot_canvas = None
+
+        if canvas is not None:
+            self.current_plot_canvas = canvas
+            self.plot_container_layout.addWidget(canvas)
+
+    def on_live_plot_toggled(self, checked: bool) -> None:
+        """Start or stop live plotting."""
+        if checked:
+            self.start_live_plot()
+        else:
+            self.stop_live_plot()
+
+    def start_live_plot(self) -> None:
+        """Show a live plot of the selected quantity."""
+        self.stop_live_plot()
+
+        spec = LIVE_PLOT_SPECS.get(self.plot_combo.currentText())
+        if spec is None:
+            return
+
+        recorder = self.sim_widget.get_recorder()
+        joint_names = GolfSwingPlotter(recorder, self.sim_widget.model).joint_names
+
+        canvas = MplCanvas(width=8, height=6, dpi=100)
+        self._set_canvas(canvas)
+        self.live_plot = LivePlot(canvas.fig, recorder, spec, joint_names)
+        canvas.draw()
+        self.live_timer.start()
+
+    def stop_live_plot(self) -> None:
+        """Stop polling the recorder, leaving the last frame on screen."""
+        self.live_timer.stop()
+        if self.live_plot is not None:
+            self.live_plot.close()
+            self.live_plot = None
+
+    def on_live_tick(self) -> None:
+        """Append newly recorded samples to the live plot."""
+        if self.live_plot is None:
+            return
+        try:
+            self.live_plot.update()
+        except Exception as e:
+            logger.error("Live plot update failed: %s", e)
+            self.live_plot_btn.setChecked(False)
+
     def on_generate_plot(self) -> None:
         """Generate the selected plot."""
         recorder = self.sim_widget.get_recorder()
+        self.live_plot_btn.setChecked(False)
 
         if recorder.get_num_frames() == 0:
             QtWidgets.QMessageBox.warning(
@@ -139,10 +215,7 @@ class PlottingTab(QtWidgets.QWidget):
             return
 
         # Clear existing plot
-        if self.current_plot_canvas is not None:
-            self.plot_container_layout.removeWidget(self.current_plot_canvas)
-            self.current_plot_canvas.deleteLater()
-            self.current_plot_canvas = None
+        self._set_canvas(None)
 
         # Create new canvas
         canvas = MplCanvas(width=8, height=6, dpi=100)
@@ -178,8 +251,7 @@ class PlottingTab(QtWidgets.QWidget):
                 plotter.plot_torque_comparison(canvas.fig)
 
             canvas.draw()
-            self.current_plot_canvas = canvas
-            self.plot_container_layout.addWidget(canvas)
+            self._set_canvas(canvas)
 
         except Exception as e:
             QtWidgets.QMessageBox.critical(
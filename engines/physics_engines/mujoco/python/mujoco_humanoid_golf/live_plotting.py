@@ -0,0 +1,425 @@
+"""Live, incrementally updated plots of a recording in progress.
+
+The static plots in :mod:`shared.python.plotting` rebuild the whole figure from
+``recorder.get_time_series`` on every request. For watching a recording while
+the simulation runs, :class:`LivePlot` keeps persistent line artists, pulls only
+the frames added since the previous update and redraws with blitting.
+
+Lines are decimated to the width of the axes in pixels by keeping the minimum
+and maximum sample of every pixel column. The column extrema are updated
+incrementally, so the cost of an update is bounded by the screen resolution
+rather than by the length of the recording.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+from dataclasses import dataclass
+
+import numpy as np
+
+if typing.TYPE_CHECKING:
+    from matplotlib.backend_bases import Event
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+
+    from .biomechanics import SwingRecorder
+
+logger = logging.getLogger(__name__)
+
+LIVE_PLOT_INTERVAL_MS: typing.Final[int] = 33  # [ms] ~30 fps refresh
+INITIAL_WINDOW_S: typing.Final[float] = 1.0  # [s] Initial time axis span
+Y_MARGIN_FRACTION: typing.Final[float] = 0.25  # [-] Headroom when rescaling y
+MAX_LEGEND_ENTRIES: typing.Final[int] = 12
+MPS_TO_MPH: typing.Final[float] = 2.23694
+
+
+@dataclass(frozen=True)
+class LivePlotSpec:
+    """Recorder field and axis labels for one live plot type."""
+
+    field_name: str
+    title: str
+    ylabel: str
+    scale: float = 1.0
+
+
+LIVE_PLOT_SPECS: typing.Final[dict[str, LivePlotSpec]] = {
+    "Joint Angles": LivePlotSpec(
+        "joint_positions",
+        "Joint Angles vs Time",
+        "Joint Angle (degrees)",
+        float(np.rad2deg(1.0)),
+    ),
+    "Joint Velocities": LivePlotSpec(
+        "joint_velocities",
+        "Joint Velocities vs Time",
+        "Angular Velocity (deg/s)",
+        float(np.rad2deg(1.0)),
+    ),
+    "Joint Torques": LivePlotSpec(
+        "joint_torques",
+        "Applied Joint Torques vs Time",
+        "Torque (Nm)",
+    ),
+    "Club Head Speed": LivePlotSpec(
+        "club_head_speed",
+        "Club Head Speed vs Time",
+        "Club Head Speed (mph)",
+        MPS_TO_MPH,
+    ),
+}
+
+
+class SeriesBuffer:
+    """Append-only ``(time, values)`` buffer with amortized growth."""
+
+    def __init__(self, initial_capacity: int = 1024) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            initial_capacity: Number of samples allocated up front
+        """
+        self._capacity = max(1, initial_capacity)
+        self._times = np.empty(self._capacity)
+        self._values: np.ndarray | None = None
+        self.size = 0
+
+    @property
+    def times(self) -> np.ndarray:
+        """Recorded sample times ``(N,)``."""
+        return self._times[: self.size]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Recorded samples ``(N, n_series)``."""
+        if self._values is None:
+            return np.empty((0, 0))
+        return self._values[: self.size]
+
+    def append(self, times: np.ndarray, values: np.ndarray) -> None:
+        """Append ``m`` samples with ``values`` of shape ``(m, n_series)``."""
+        m = times.shape[0]
+        if self._values is None:
+            self._values = np.empty((self._capacity, values.shape[1]))
+
+        needed = self.size + m
+        if needed > self._capacity:
+            while self._capacity < needed:
+                self._capacity *= 2
+            self._times = np.resize(self._times, self._capacity)
+            grown = np.empty((self._capacity, self._values.shape[1]))
+            grown[: self.size] = self._values[: self.size]
+            self._values = grown
+
+        self._times[self.size : needed] = times
+        self._values[self.size : needed] = values
+        self.size = needed
+
+    def clear(self) -> None:
+        """Drop all samples, keeping the allocation."""
+        self.size = 0
+        self._values = None
+
+
+class MinMaxDecimator:
+    """Per-pixel-column minimum and maximum of several series.
+
+    Samples are binned into ``n_columns`` equal columns spanning
+    ``[x_min, x_max]``. Drawing a vertical segment from the minimum to the
+    maximum of every column reproduces the rendered envelope of the full
+    series at that resolution. Each pair is ordered by whether the series
+    rises or falls across its column, which keeps the polyline from doubling
+    back on itself and makes it much cheaper to rasterize.
+
+    Samples must be added in increasing time order.
+    """
+
+    def __init__(
+        self, n_series: int, x_min: float, x_max: float, n_columns: int
+    ) -> None:
+        """Initialize empty columns.
+
+        Args:
+            n_series: Number of series (lines)
+            x_min: Left edge of the first column
+            x_max: Right edge of the last column
+            n_columns: Number of columns, typically the axes width in pixels
+        """
+        self.x_min = x_min
+        self.x_max = x_max
+        self.n_columns = max(1, n_columns)
+        self._column_width = (x_max - x_min) / self.n_columns
+        self._lo = np.full((self.n_columns, n_series), np.inf)
+        self._hi = np.full((self.n_columns, n_series), -np.inf)
+        self._first = np.zeros((self.n_columns, n_series))
+        self._last = np.zeros((self.n_columns, n_series))
+        self._filled = np.zeros(self.n_columns, dtype=bool)
+
+    def add(self, times: np.ndarray, values: np.ndarray) -> None:
+        """Fold ``(m,)`` times and ``(m, n_series)`` values into the columns."""
+        if times.size == 0:
+            return
+        columns = ((times - self.x_min) / self._column_width).astype(np.intp)
+        np.clip(columns, 0, self.n_columns - 1, out=columns)
+
+        # Columns are non-decreasing, so each one is a contiguous run.
+        starts = np.flatnonzero(np.diff(columns, prepend=-1))
+        ends = np.append(starts[1:], columns.size) - 1
+        touched = columns[starts]
+
+        lo = np.minimum.reduceat(values, starts, axis=0)
+        hi = np.maximum.reduceat(values, starts, axis=0)
+        self._lo[touched] = np.minimum(self._lo[touched], lo)
+        self._hi[touched] = np.maximum(self._hi[touched], hi)
+
+        new = ~self._filled[touched]
+        self._first[touched[new]] = values[starts[new]]
+        self._last[touched] = values[ends]
+        self._filled[touched] = True
+
+    def xy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the decimated polyline ``(2C,)`` and ``(2C, n_series)``."""
+        columns = np.flatnonzero(self._filled)
+        centers = self.x_min + (columns + 0.5) * self._column_width
+        x = np.repeat(centers, 2)
+
+        lo = self._lo[columns]
+        hi = self._hi[columns]
+        rising = self._last[columns] >= self._first[columns]
+        y = np.empty((2 * columns.size, lo.shape[1]))
+        y[0::2] = np.where(rising, lo, hi)
+        y[1::2] = np.where(rising, hi, lo)
+        return x, y
+
+
+def decimate_minmax(
+    times: np.ndarray,
+    values: np.ndarray,
+    x_min: float,
+    x_max: float,
+    n_columns: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Decimate ``(N, n_series)`` samples to min/max per pixel column.
+
+    Args:
+        times: Sample times ``(N,)``
+        values: Samples ``(N, n_series)``
+        x_min: Left edge of the plotted range
+        x_max: Right edge of the plotted range
+        n_columns: Number of pixel columns
+
+    Returns:
+        Tuple of (x, y) with at most ``2 * n_columns`` points
+    """
+    decimator = MinMaxDecimator(values.shape[1], x_min, x_max, n_columns)
+    decimator.add(times, values)
+    return decimator.xy()
+
+
+class LivePlot:
+    """Incrementally updated, blitted time-series plot of a recorder field.
+
+    Call :meth:`update` from a timer (see :data:`LIVE_PLOT_INTERVAL_MS`). The
+    time axis starts at :data:`INITIAL_WINDOW_S` and doubles whenever the
+    recording outgrows it; only then, or when the y-range grows, is the whole
+    figure redrawn. Every other update restores the cached background and
+    draws the lines alone.
+    """
+
+    def __init__(
+        self,
+        fig: Figure,
+        recorder: SwingRecorder,
+        spec: LivePlotSpec,
+        joint_names: list[str] | None = None,
+    ) -> None:
+        """Initialize live plot.
+
+        Args:
+            fig: Figure attached to a canvas (e.g. ``MplCanvas.fig``)
+            recorder: Recorder whose frames are being appended
+            spec: Field and labels to plot
+            joint_names: Optional joint names for the legend
+        """
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.recorder = recorder
+        self.spec = spec
+        self.joint_names = joint_names or []
+
+        self.ax = fig.add_subplot(111)
+        self.ax.set_xlabel("Time (s)", fontsize=12, fontweight="bold")
+        self.ax.set_ylabel(spec.ylabel, fontsize=12, fontweight="bold")
+        self.ax.set_title(spec.title, fontsize=14, fontweight="bold")
+        self.ax.grid(True, alpha=0.3, linestyle="--")
+        self.ax.set_xlim(0.0, INITIAL_WINDOW_S)
+        fig.tight_layout()
+
+        self.lines: list[Line2D] = []
+        self.buffer = SeriesBuffer()
+        self._decimator: MinMaxDecimator | None = None
+        self._consumed = 0
+        self._t0 = 0.0
+        self._y_range = (np.inf, -np.inf)
+        self._background: typing.Any = None
+        self._draw_cid = self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def close(self) -> None:
+        """Disconnect from the canvas."""
+        self.canvas.mpl_disconnect(self._draw_cid)
+        self._background = None
+
+    def reset(self) -> None:
+        """Forget all samples, e.g. after the recording was restarted."""
+        self.buffer.clear()
+        self._decimator = None
+        self._consumed = 0
+        self._y_range = (np.inf, -np.inf)
+        for line in self.lines:
+            line.remove()
+        self.lines = []
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        self.ax.set_xlim(0.0, INITIAL_WINDOW_S)
+
+    def _label(self, idx: int, n_series: int) -> str:
+        """Legend label, aligning joint names from the end (free base first)."""
+        if n_series == 1:
+            return self.spec.title.split(" vs ")[0]
+        name_idx = idx - max(0, n_series - len(self.joint_names))
+        if 0 <= name_idx < len(self.joint_names):
+            return self.joint_names[name_idx]
+        return f"DoF {idx}"
+
+    def _create_lines(self, n_series: int) -> None:
+        """Create one animated line per series."""
+        for idx in range(n_series):
+            (line,) = self.ax.plot(
+                [], [], linewidth=2, label=self._label(idx, n_series), animated=True
+            )
+            self.lines.append(line)
+        if 1 < n_series <= MAX_LEGEND_ENTRIES:
+            self.ax.legend(loc="upper left", framealpha=0.9, fontsize="small")
+
+    def _pull_new_samples(self) -> tuple[np.ndarray, np.ndarray]:
+        """Read frames appended since the previous call."""
+        frames = self.recorder.frames
+        if len(frames) < self._consumed:
+            self.reset()
+        new_frames = frames[self._consumed :]
+        self._consumed = len(frames)
+
+        field = self.spec.field_name
+        rows = [
+            (frame.time, value)
+            for frame in new_frames
+            if (value := getattr(frame, field)) is not None
+        ]
+        if not rows:
+            return np.empty(0), np.empty((0, 0))
+        # Keep the current series count if it changed within this batch
+        width = np.size(rows[-1][1])
+        rows = [row for row in rows if np.size(row[1]) == width]
+
+        times = np.fromiter((row[0] for row in rows), dtype=np.float64, count=len(rows))
+        values = np.asarray([row[1] for row in rows], dtype=np.float64)
+        return times, values.reshape(len(rows), -1) * self.spec.scale
+
+    def _grow_limits(self, times: np.ndarray, values: np.ndarray) -> bool:
+        """Extend the axes to cover new samples; True if limits changed."""
+        changed = False
+
+        if self.buffer.size == times.size:
+            self._t0 = float(times[0])
+            self.ax.set_xlim(self._t0, self._t0 + INITIAL_WINDOW_S)
+            changed = True
+        x_min, x_max = self.ax.get_xlim()
+        t_end = float(times[-1])
+        if t_end > x_max:
+            span = max(2.0 * (x_max - x_min), t_end - x_min)
+            self.ax.set_xlim(x_min, x_min + span)
+            changed = True
+
+        lo, hi = self._y_range
+        new_lo = min(lo, float(np.min(values)))
+        new_hi = max(hi, float(np.max(values)))
+        self._y_range = (new_lo, new_hi)
+        y_min, y_max = self.ax.get_ylim()
+        if changed or new_lo < y_min or new_hi > y_max:
+            margin = Y_MARGIN_FRACTION * max(new_hi - new_lo, 1e-6)
+            self.ax.set_ylim(new_lo - margin, new_hi + margin)
+            changed = True
+        return changed
+
+    def _pixel_columns(self) -> int:
+        """Width of the axes in display pixels."""
+        return max(1, int(self.ax.bbox.width))
+
+    def _rebuild_decimator(self) -> None:
+        """Recompute column extrema from the full buffer."""
+        x_min, x_max = self.ax.get_xlim()
+        self._decimator = MinMaxDecimator(
+            len(self.lines), x_min, x_max, self._pixel_columns()
+        )
+        self._decimator.add(self.buffer.times, self.buffer.values)
+
+    def _set_line_data(self) -> None:
+        """Push raw or decimated samples into the line artists."""
+        if self._decimator is None:
+            return
+        if self.buffer.size <= 2 * self._decimator.n_columns:
+            x, y = self.buffer.times, self.buffer.values
+        else:
+            x, y = self._decimator.xy()
+        for idx, line in enumerate(self.lines):
+            line.set_data(x, y[:, idx])
+
+    def _on_draw(self, event: Event | None) -> None:  # noqa: ARG002
+        """Cache the static background after every full redraw."""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for line in self.lines:
+            self.ax.draw_artist(line)
+
+    def update(self) -> bool:
+        """Append new recorder samples and redraw.
+
+        Returns:
+            True if new samples were drawn
+        """
+        times, values = self._pull_new_samples()
+        if times.size == 0:
+            return False
+
+        if not self.lines:
+            self._create_lines(values.shape[1])
+        elif values.shape[1] != len(self.lines):
+            logger.warning("Live plot series count changed; restarting plot")
+            consumed = self._consumed  # Frames already read stay consumed
+            self.reset()
+            self._consumed = consumed
+            self._create_lines(values.shape[1])
+
+        self.buffer.append(times, values)
+        full_redraw = self._grow_limits(times, values)
+
+        if (
+            full_redraw
+            or self._decimator is None
+            or self._decimator.n_columns != self._pixel_columns()
+        ):
+            self._rebuild_decimator()
+        else:
+            self._decimator.add(times, values)
+        self._set_line_data()
+
+        if full_redraw or self._background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            for line in self.lines:
+                self.ax.draw_artist(line)
+            self.canvas.blit(self.fig.bbox)
+        return True
@@ -0,0 +1,110 @@
+"""Mobility and force ellipsoids computed from MuJoCo's factorized mass matrix.
+
+``mj_solveM`` reuses the sparse ``L^T D L`` factor that ``mj_forward`` and
+``mj_step`` already compute, so the core matrix ``J M^-1 J^T`` costs one
+three-column back-substitution instead of a dense ``mj_fullM`` and explicit
+inverse. Jacobian and solve buffers are allocated once per model.
+"""
+
+from __future__ import annotations
+
+import mujoco
+import numpy as np
+from shared.python.manipulability import (
+    DEFAULT_QPOS_TOLERANCE,
+    EllipsoidCache,
+    EllipsoidTrajectory,
+    ManipulabilityEllipsoid,
+    ellipsoid_from_core,
+)
+
+
+class EllipsoidService:
+    """Manipulability ellipsoids of MuJoCo bodies, live or along a trajectory."""
+
+    def __init__(
+        self,
+        model: mujoco.MjModel,
+        tolerance: float = DEFAULT_QPOS_TOLERANCE,
+    ) -> None:
+        """Initialize buffers for a model.
+
+        Args:
+            model: MuJoCo model
+            tolerance: Largest ``qpos`` change for which the last ellipsoid
+                of a body is returned without recomputation
+        """
+        self.model = model
+        self.cache = EllipsoidCache(tolerance)
+        self._jacp = np.zeros((3, model.nv))
+        self._m_inv_jt = np.zeros((3, model.nv))
+        self._data: mujoco.MjData | None = None  # Scratch data for trajectories
+
+    def compute(self, data: mujoco.MjData, body_id: int) -> ManipulabilityEllipsoid:
+        """Ellipsoid of a body at the current state of ``data``.
+
+        ``data`` must hold a factorized mass matrix for its ``qpos`` (as
+        left by ``mj_forward`` or ``mj_step``).
+
+        Args:
+            data: MuJoCo data
+            body_id: Body whose translational mobility is analyzed
+
+        Returns:
+            The ellipsoid centered at the body origin
+        """
+        cached = self.cache.lookup(body_id, data.qpos)
+        if cached is not None:
+            return cached
+
+        ellipsoid = ellipsoid_from_core(self._core(data, body_id), data.xpos[body_id])
+        self.cache.store(body_id, data.qpos, ellipsoid)
+        return ellipsoid
+
+    def compute_trajectory(
+        self,
+        qpos: np.ndarray,
+        body_id: int,
+    ) -> EllipsoidTrajectory:
+        """Ellipsoids of a body for every frame of a recorded trajectory.
+
+        Only the position-dependent stages of the pipeline are run per frame,
+        and all core matrices are eigen-decomposed in one batched call.
+
+        Args:
+            qpos: Generalized positions per frame (N x nq)
+            body_id: Body whose translational mobility is analyzed
+
+        Returns:
+            Ellipsoids for all ``N`` frames
+        """
+        qpos = np.atleast_2d(np.asarray(qpos, dtype=float))
+        if qpos.shape[1] != self.model.nq:
+            msg = f"qpos has {qpos.shape[1]} columns, model has nq={self.model.nq}"
+            raise ValueError(msg)
+
+        if self._data is None:
+            self._data = mujoco.MjData(self.model)
+        data = self._data
+
+        cores = np.empty((len(qpos), 3, 3))
+        centers = np.empty((len(qpos), 3))
+        for frame, q in enumerate(qpos):
+            data.qpos[:] = q
+            mujoco.mj_kinematics(self.model, data)
+            mujoco.mj_comPos(self.model, data)
+            mujoco.mj_crb(self.model, data)
+            mujoco.mj_factorM(self.model, data)
+            cores[frame] = self._core(data, body_id)
+            centers[frame] = data.xpos[body_id]
+
+        ellipsoids = ellipsoid_from_core(cores, centers)
+        return EllipsoidTrajectory(centers, ellipsoids.axes, ellipsoids.eigenvalues)
+
+    def _core(self, data: mujoco.MjData, body_id: int) -> np.ndarray:
+        """Core matrix ``J M^-1 J^T`` using the factorized mass matrix."""
+        mujoco.mj_jacBody(self.model, data, self._jacp, None, body_id)
+        # Rows of J are solved independently: (M^-1 J^T)^T
+        mujoco.mj_solveM(self.model, data, self._m_inv_jt, self._jacp)
+        core = self._jacp @ self._m_inv_jt.T
+        return 0.5 * (core + core.T)
@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 import webbrowser
 from typing import Any
 
@@ -15,13 +16,37 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Streaming defaults
+DEFAULT_MAX_RATE_HZ = 30.0  # Maximum messages per second sent to the browser
+DEFAULT_POSE_TOLERANCE = 1e-4  # Change in any transform entry that is re-sent
+
 
 class MuJoCoMeshcatAdapter:
     """
     Adapts MuJoCo model/data to Meshcat for web-based visualization.
+
+    Geom transforms are computed for all geoms at once and only those that
+    moved by more than ``tolerance`` since they were last queued are sent.
+    Updates arriving faster than ``max_rate`` only replace the queued pose of
+    each moved geom; the latest poses are sent with ``set_transform`` when
+    the next message is due, so the browser connection does not throttle the
+    simulation loop and geoms that stopped moving keep their last pose.
     """
 
-    def __init__(self, model: mujoco.MjModel | None = None):
+    def __init__(
+        self,
+        model: mujoco.MjModel | None = None,
+        max_rate: float = DEFAULT_MAX_RATE_HZ,
+        tolerance: float = DEFAULT_POSE_TOLERANCE,
+    ):
+        self.model = model
+        self.max_rate = max_rate
+        self.tolerance = tolerance
+        self._geom_paths: list[str] = []
+        self._sent_transforms = np.empty((0, 4, 4))
+        self._pending: dict[int, np.ndarray] = {}  # Latest unsent pose per geom
+        self._last_flush = -np.inf
+
         if meshcat is None:
             logger.warning("Meshcat not installed. Visualization disabled.")
             self.vis = None
@@ -34,8 +59,6 @@ class MuJoCoMeshcatAdapter:
         # We'll rely on default behavior or pass zmq_url if needed?
         # For now, standard init.
         self.vis = meshcat.Visualizer()
-
-        self.model = model
         self.is_open = True
 
         # Log URL
@@ -53,6 +76,11 @@ class MuJoCoMeshcatAdapter:
 
         self.load_model_geometry()
 
+    def set_model(self, model: mujoco.MjModel) -> None:
+        """Switch to a new model and rebuild its geometry."""
+        self.model = model
+        self.load_model_geometry()
+
     def open_browser(self):
         if self.vis is not None:
             webbrowser.open(self.vis.url())
@@ -67,6 +95,15 @@ class MuJoCoMeshcatAdapter:
         model = self.model
         self.vis["visuals"].delete()
 
+        # Paths are resolved once; update() only indexes this list
+        self._geom_paths = []
+        for i in range(model.ngeom):
+            name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_GEOM, i)
+            self._geom_paths.append(name or f"geom_{i}")
+        self._sent_transforms = np.full((model.ngeom, 4, 4), np.inf)
+        self._pending = {}
+        self._last_flush = -np.inf
+
         # Iterate over all geometries
         for i in range(model.ngeom):
             # geom properties
@@ -105,9 +142,7 @@ class MuJoCoMeshcatAdapter:
                 shape = g.Sphere(radius=0.1)
 
             if shape:
-                name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_GEOM, i)
-                if not name:
-                    name = f"geom_{i}"
+                name = self._geom_paths[i]
 
                 # If capsule/cylinder, MuJoCo defines them along Z axis.
                 # If using Cylinder, we might need rotation correction depending on
@@ -133,30 +168,54 @@ class MuJoCoMeshcatAdapter:
                 else:
                     self.vis["visuals"][name].set_object(shape, material)
 
-    def update(self, data: mujoco.MjData):
-        """
-        Updates geometry transforms from MuJoCo data.
+    def update(self, data: mujoco.MjData, flush: bool = False) -> bool:
         """
-        if self.vis is None or data is None or self.model is None:
-            return
+        Queues changed geometry transforms and sends them when due.
 
-        model = self.model
-
-        # Update Geoms
-        for i in range(model.ngeom):
-            name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_GEOM, i)
-            if not name:
-                name = f"geom_{i}"
-
-            pos = data.geom_xpos[i]
-            mat = data.geom_xmat[i].reshape(3, 3)
+        Args:
+            data: MuJoCo data with up-to-date geom_xpos/geom_xmat
+            flush: Send queued poses now, ignoring the rate limit
 
-            # Construct 4x4 matrix
-            T = np.eye(4)
-            T[:3, :3] = mat
-            T[:3, 3] = pos
+        Returns:
+            True if a message was sent to the browser
+        """
+        if self.vis is None or data is None or self.model is None:
+            return False
 
-            self.vis["visuals"][name].set_transform(T)
+        transforms = self._geom_transforms(data)
+        moved = np.flatnonzero(
+            np.abs(transforms - self._sent_transforms).max(axis=(1, 2)) > self.tolerance
+        )
+        self._sent_transforms[moved] = transforms[moved]
+        for i in moved:
+            self._pending[int(i)] = transforms[i]
+
+        now = time.perf_counter()
+        if not self._pending or (
+            not flush and now - self._last_flush < 1.0 / self.max_rate
+        ):
+            return False
+
+        self._send_pending()
+        self._last_flush = now
+        return True
+
+    def _geom_transforms(self, data: mujoco.MjData) -> np.ndarray:
+        """Homogeneous transforms of all geoms, shape (ngeom, 4, 4)."""
+        ngeom = self.model.ngeom
+        transforms = np.zeros((ngeom, 4, 4))
+        transforms[:, :3, :3] = data.geom_xmat.reshape(ngeom, 3, 3)
+        transforms[:, :3, 3] = data.geom_xpos
+        transforms[:, 3, 3] = 1.0
+        return transforms
+
+    def _send_pending(self) -> None:
+        """Sends the latest queued pose of every moved geom."""
+        pending = self._pending
+        self._pending = {}
+        visuals = self.vis["visuals"]
+        for i, transform in pending.items():
+            visuals[self._geom_paths[i]].set_transform(transform)
 
     def draw_vectors(
         self,
@@ -39,6 +39,53 @@ class OptimizationObjectives:
     weight_torque: float = 0.1
     weight_accuracy: float = 5.0
 
+    def evaluate(
+        self,
+        peak_club_speed: float,
+        total_energy: float,
+        jerk: float,
+        total_torque: float,
+        final_club_position: np.ndarray,
+    ) -> float:
+        """Combine swing metrics into a weighted objective value.
+
+        Args:
+            peak_club_speed: Peak club head speed [m/s]
+            total_energy: Energy expenditure measure
+            jerk: Total jerk magnitude
+            total_torque: Sum of absolute control torques
+            final_club_position: Club head position at the end [3]
+
+        Returns:
+            Objective value (to minimize)
+        """
+        objective = 0.0
+
+        # Club head speed (maximize = minimize negative)
+        if self.maximize_club_speed:
+            objective -= self.weight_speed * peak_club_speed
+
+        # Energy (minimize)
+        if self.minimize_energy:
+            objective += self.weight_energy * total_energy
+
+        # Jerk (minimize)
+        if self.minimize_jerk:
+            objective += self.weight_jerk * jerk
+
+        # Torque (minimize)
+        if self.minimize_torque:
+            objective += self.weight_torque * total_torque
+
+        # Accuracy (hit target)
+        if self.target_ball_position is not None:
+            distance_error = float(
+                np.linalg.norm(final_club_position - self.target_ball_position),
+            )
+            objective += self.weight_accuracy * distance_error
+
+        return objective
+
 
 @dataclass
 class OptimizationConstraints:
@@ -326,38 +373,15 @@ class SwingOptimizer:
         # Simulate trajectory to get metrics
         _, controls, metrics = self._simulate_trajectory(trajectory)
 
-        objective = 0.0
-
-        # Club head speed (maximize = minimize negative)
-        if self.objectives.maximize_club_speed:
-            objective -= self.objectives.weight_speed * metrics["peak_club_speed"]
-
-        # Energy (minimize)
-        if self.objectives.minimize_energy:
-            total_energy = metrics["total_energy"]
-            objective += self.objectives.weight_energy * total_energy
-
-        # Jerk (minimize)
-        if self.objectives.minimize_jerk:
-            jerk = self._compute_jerk(trajectory)
-            objective += self.objectives.weight_jerk * jerk
-
-        # Torque (minimize)
-        if self.objectives.minimize_torque:
-            total_torque = np.sum(np.abs(controls))
-            objective += self.objectives.weight_torque * total_torque
-
-        # Accuracy (hit target)
-        if self.objectives.target_ball_position is not None:
-            distance_error = float(
-                np.linalg.norm(
-                    metrics["final_club_position"]
-                    - self.objectives.target_ball_position,
-                ),
-            )
-            objective += self.objectives.weight_accuracy * distance_error
+        jerk = self._compute_jerk(trajectory) if self.objectives.minimize_jerk else 0.0
 
-        return objective
+        return self.objectives.evaluate(
+            peak_club_speed=metrics["peak_club_speed"],
+            total_energy=metrics["total_energy"],
+            jerk=jerk,
+            total_torque=float(np.sum(np.abs(controls))),
+            final_club_position=metrics["final_club_position"],
+        )
 
     def _simulate_trajectory(
         self,
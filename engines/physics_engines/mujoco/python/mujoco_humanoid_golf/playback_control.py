@@ -5,13 +5,42 @@ Provides:
 - Variable playback speed
 - Timeline scrubbing
 - Loop control
+- Precomputed kinematics cache for physics-free scrubbing
 """
 
+import threading
 from collections.abc import Callable
 from enum import Enum
 
 import cv2
+import mujoco
 import numpy as np
+from shared.python.manipulability import ManipulabilityEllipsoid
+
+from .body_lookup import find_body_id
+
+# MjData fields restored from the cache: poses used by mjv_updateScene plus
+# the interaction/contact wrenches drawn by the force and torque overlays
+CACHED_FIELDS = (
+    "xpos",
+    "xquat",
+    "xmat",
+    "xipos",
+    "ximat",
+    "xanchor",
+    "xaxis",
+    "subtree_com",
+    "geom_xpos",
+    "geom_xmat",
+    "site_xpos",
+    "site_xmat",
+    "cam_xpos",
+    "cam_xmat",
+    "light_xpos",
+    "light_xdir",
+    "cfrc_int",
+    "cfrc_ext",
+)
 
 
 class PlaybackMode(Enum):
@@ -22,6 +51,177 @@ class PlaybackMode(Enum):
     PAUSED = 2
 
 
+class PlaybackCache:
+    """Precomputed kinematics and overlay quantities for every recorded frame.
+
+    Each frame is evaluated once (``mj_forward`` and ``mj_rnePostConstraint``
+    on a private MjData) and the fields in ``CACHED_FIELDS`` are stored as
+    float32 arrays of shape (N, ...). Applying a cached frame only copies
+    those arrays into an MjData, so seeking costs the same memory copy
+    regardless of model complexity and needs no physics calls.
+
+    The cache also stores club head speed and the translational mobility
+    ellipsoid (eigen-decomposition of J M^-1 J^T) of one body per frame.
+
+    Contacts are not cached: ``data.contact`` and the constraint arrays keep
+    whatever the target MjData last computed, so only overlays drawn from
+    the cached fields (e.g. ``cfrc_ext``) are valid while scrubbing.
+    """
+
+    def __init__(
+        self,
+        model: mujoco.MjModel,
+        states: np.ndarray,
+        controls: np.ndarray | None = None,
+        ellipsoid_body_id: int | None = None,
+    ) -> None:
+        """Initialize cache storage (call build() or start() to fill it).
+
+        Args:
+            model: MuJoCo model the states were recorded with
+            states: State array (N, nq+nv)
+            controls: Control array (N, nu), applied for contact/actuator forces
+            ellipsoid_body_id: Body for the mobility ellipsoid (default: last body)
+        """
+        self.model = model
+        self.states = states
+        self.controls = controls
+        self.num_frames = len(states)
+        self.ellipsoid_body_id = (
+            model.nbody - 1 if ellipsoid_body_id is None else ellipsoid_body_id
+        )
+        self.club_head_id = find_body_id(model, "club_head")
+
+        self._data = mujoco.MjData(model)
+        self.fields = {
+            name: np.zeros(
+                (self.num_frames, *getattr(self._data, name).shape), dtype=np.float32
+            )
+            for name in CACHED_FIELDS
+        }
+        self.club_head_speed = np.full(self.num_frames, np.nan, dtype=np.float32)
+        self.ellipsoid_eigvals = np.zeros((self.num_frames, 3), dtype=np.float32)
+        self.ellipsoid_axes = np.zeros((self.num_frames, 3, 3), dtype=np.float32)
+
+        self.frames_ready = 0
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every frame has been cached."""
+        return self.frames_ready == self.num_frames
+
+    @property
+    def progress(self) -> float:
+        """Fraction of frames cached (0.0 to 1.0)."""
+        return self.frames_ready / self.num_frames if self.num_frames else 1.0
+
+    def start(self) -> None:
+        """Fill the cache in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.build, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop a background build, keeping the frames cached so far."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until a background build finishes.
+
+        Returns:
+            True if every frame has been cached
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.is_complete
+
+    def build(self) -> None:
+        """Compute all frames not yet cached, in order."""
+        model, data = self.model, self._data
+        nq, nv = model.nq, model.nv
+        jacp = np.zeros((3, nv))
+        jac_m_inv = np.zeros((3, nv))
+        velocity = np.zeros(6)
+
+        for frame in range(self.frames_ready, self.num_frames):
+            if self._stop.is_set():
+                return
+            data.qpos[:] = self.states[frame, :nq]
+            data.qvel[:] = self.states[frame, nq : nq + nv]
+            if self.controls is not None and model.nu:
+                data.ctrl[:] = self.controls[frame]
+            mujoco.mj_forward(model, data)
+            mujoco.mj_rnePostConstraint(model, data)
+
+            for name, store in self.fields.items():
+                store[frame] = getattr(data, name)
+
+            if self.club_head_id is not None:
+                mujoco.mj_objectVelocity(
+                    model,
+                    data,
+                    mujoco.mjtObj.mjOBJ_BODY,
+                    self.club_head_id,
+                    velocity,
+                    0,
+                )
+                self.club_head_speed[frame] = np.linalg.norm(velocity[3:])
+
+            # Mobility ellipsoid core matrix J M^-1 J^T (M factorized by mj_forward)
+            mujoco.mj_jacBody(model, data, jacp, None, self.ellipsoid_body_id)
+            mujoco.mj_solveM(model, data, jac_m_inv, jacp)
+            eigvals, eigvecs = np.linalg.eigh(jac_m_inv @ jacp.T)
+            self.ellipsoid_eigvals[frame] = eigvals
+            self.ellipsoid_axes[frame] = eigvecs
+
+            self.frames_ready = frame + 1
+
+    def ellipsoid(self, frame: int) -> ManipulabilityEllipsoid | None:
+        """Cached mobility ellipsoid of ``ellipsoid_body_id`` at a frame.
+
+        Returns:
+            The ellipsoid, or None if the frame has not been cached yet
+        """
+        if not 0 <= frame < self.frames_ready:
+            return None
+        return ManipulabilityEllipsoid(
+            self.fields["xpos"][frame, self.ellipsoid_body_id].astype(float),
+            self.ellipsoid_axes[frame].astype(float),
+            self.ellipsoid_eigvals[frame].astype(float),
+        )
+
+    def apply(self, data: mujoco.MjData, frame: int) -> bool:
+        """Copy a cached frame into ``data`` for rendering.
+
+        qpos/qvel (and ctrl, if controls were recorded) are restored from the
+        recording and the cached kinematic fields are copied over; no physics
+        is evaluated. ``data.contact`` is left untouched.
+
+        Args:
+            data: MjData to render from
+            frame: Frame index
+
+        Returns:
+            False if the frame has not been cached yet (``data`` is unchanged)
+        """
+        if not 0 <= frame < self.frames_ready:
+            return False
+        nq, nv = self.model.nq, self.model.nv
+        data.qpos[:] = self.states[frame, :nq]
+        data.qvel[:] = self.states[frame, nq : nq + nv]
+        if self.controls is not None and self.model.nu:
+            data.ctrl[:] = self.controls[frame]
+        for name, store in self.fields.items():
+            getattr(data, name)[:] = store[frame]
+        return True
+
+
 class PlaybackController:
     """Control playback of recorded simulation data."""
 
@@ -55,6 +255,62 @@ class PlaybackController:
         self.on_frame_changed: Callable[[int], None] | None = None
         self.on_playback_finished: Callable[[], None] | None = None
 
+        # Precomputed kinematics (see build_cache)
+        self.cache: PlaybackCache | None = None
+
+    def build_cache(
+        self,
+        model: mujoco.MjModel,
+        ellipsoid_body_id: int | None = None,
+        background: bool = True,
+    ) -> PlaybackCache:
+        """Precompute kinematics and overlays for every frame.
+
+        Args:
+            model: MuJoCo model the recording was made with
+            ellipsoid_body_id: Body for the mobility ellipsoid (default: last body)
+            background: Build in a background thread instead of blocking
+
+        Returns:
+            The cache, also stored as ``self.cache``
+        """
+        if self.cache is not None:
+            self.cache.stop()
+        self.cache = PlaybackCache(model, self.states, self.controls, ellipsoid_body_id)
+        if background:
+            self.cache.start()
+        else:
+            self.cache.build()
+        return self.cache
+
+    def apply_current_frame(self, data: mujoco.MjData) -> bool:
+        """Load the current frame into ``data`` for rendering.
+
+        Uses the cache when the frame is ready. Otherwise the recorded state
+        is restored and ``mj_forward`` evaluated (requires a cache to know
+        the model).
+
+        Args:
+            data: MjData to render from
+
+        Returns:
+            True if the frame came from the cache
+        """
+        if self.cache is None:
+            msg = "build_cache() must be called before apply_current_frame()"
+            raise RuntimeError(msg)
+        if self.cache.apply(data, self.current_frame):
+            return True
+
+        model = self.cache.model
+        state = self.states[self.current_frame]
+        data.qpos[:] = state[: model.nq]
+        data.qvel[:] = state[model.nq : model.nq + model.nv]
+        if model.nu:
+            data.ctrl[:] = self.controls[self.current_frame]
+        mujoco.mj_forward(model, data)
+        return False
+
     def play(self) -> None:
         """Start playback."""
         self.mode = PlaybackMode.PLAYING
@@ -125,12 +381,14 @@ class PlaybackController:
         """Set playback speed.
 
         Args:
-            speed: Speed multiplier (0.1 to 10.0)
+            speed: Speed multiplier (magnitude 0.1 to 10.0)
                   1.0 = normal speed
                   0.5 = half speed
                   2.0 = double speed
+                  -1.0 = reverse at normal speed
         """
-        self.speed = max(0.1, min(speed, 10.0))
+        magnitude = max(0.1, min(abs(speed), 10.0))
+        self.speed = -magnitude if speed < 0 else magnitude
 
     def set_loop(self, loop: bool) -> None:
         """Enable/disable looping.
@@ -178,15 +436,16 @@ class PlaybackController:
         frames = int(self._frame_accumulator)
         self._frame_accumulator -= frames
 
-        if frames > 0:
+        if frames != 0:
             new_frame = self.current_frame + frames
 
-            if new_frame >= self.num_frames:
+            # Forward playback ends after the last frame, reverse before the first
+            if not 0 <= new_frame < self.num_frames:
                 if self.loop:
                     new_frame = new_frame % self.num_frames
                     self._frame_accumulator = 0.0
                 else:
-                    new_frame = self.num_frames - 1
+                    new_frame = self.num_frames - 1 if frames > 0 else 0
                     self.pause()
                     if self.on_playback_finished:
                         self.on_playback_finished()
@@ -0,0 +1,249 @@
+"""Sampling-based model predictive control for golf swings.
+
+This module implements a receding-horizon controller in the style of
+model predictive path integral (MPPI) control:
+- Fork the current simulation state into many candidate rollouts
+- Perturb a nominal control plan with Gaussian noise
+- Simulate the candidates in parallel threads, one MjData per worker
+- Score each rollout with the swing optimization objectives
+- Average the candidates with exponential weights to update the plan
+- Warm-start the next tick from the shifted plan
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import mujoco
+import numpy as np
+
+from .body_lookup import find_body_id
+from .motion_optimization import OptimizationObjectives
+
+# Full physical state, so a rollout starts exactly where the simulation is
+STATE_SPEC = mujoco.mjtState.mjSTATE_FULLPHYSICS
+
+
+@dataclass
+class MPCParameters:
+    """Parameters for sampling-based predictive control."""
+
+    horizon: int = 20  # Rollout length [physics steps]
+    num_samples: int = 16  # Candidate rollouts per plan
+    noise_scale: float = 0.1  # Std as a fraction of each actuator's half-range
+    temperature: float = 0.1  # Weighting temperature, relative to cost spread
+    replan_steps: int = 1  # Physics steps between plans
+    num_threads: int | None = None  # Rollout workers (default: CPU count)
+    seed: int | None = None  # Noise generator seed
+
+
+class SamplingMPC:
+    """Receding-horizon controller that plans with parallel MuJoCo rollouts.
+
+    Each plan simulates ``num_samples`` perturbed copies of the nominal
+    control sequence from the current state and blends them with weights
+    ``exp(-(J - J_min) / (T (J_max - J_min)))``. Sample 0 is always the
+    unperturbed nominal plan, so a plan never discards its warm start
+    without evaluating it.
+    """
+
+    def __init__(
+        self,
+        model: mujoco.MjModel,
+        data: mujoco.MjData,
+        objectives: OptimizationObjectives | None = None,
+        params: MPCParameters | None = None,
+    ) -> None:
+        """Initialize controller.
+
+        Args:
+            model: MuJoCo model
+            data: MuJoCo data holding the state to plan from
+            objectives: Swing objectives used to score rollouts
+            params: Sampling parameters
+        """
+        self.model = model
+        self.data = data
+        self.objectives = objectives or OptimizationObjectives()
+        self.params = params or MPCParameters()
+
+        if self.params.horizon < 1 or self.params.num_samples < 1:
+            msg = "horizon and num_samples must be positive"
+            raise ValueError(msg)
+        if not 1 <= self.params.replan_steps <= self.params.horizon:
+            msg = "replan_steps must be between 1 and horizon"
+            raise ValueError(msg)
+
+        self.club_head_id = find_body_id(model, "club_head")
+
+        # Noise scale and clipping bounds per actuator
+        limited = model.actuator_ctrllimited.astype(bool)
+        half_range = np.where(
+            limited,
+            0.5 * (model.actuator_ctrlrange[:, 1] - model.actuator_ctrlrange[:, 0]),
+            1.0,
+        )
+        self._noise_std = self.params.noise_scale * half_range
+        self._ctrl_low = np.where(limited, model.actuator_ctrlrange[:, 0], -np.inf)
+        self._ctrl_high = np.where(limited, model.actuator_ctrlrange[:, 1], np.inf)
+
+        self.plan = np.zeros((self.params.horizon, model.nu))
+        self.plan_times: deque[float] = deque(maxlen=100)
+        self.last_costs = np.zeros(self.params.num_samples)
+        self._steps_since_plan = self.params.replan_steps
+        self._rng = np.random.default_rng(self.params.seed)
+
+        # Rollout workers, each with its own MjData
+        num_threads = self.params.num_threads or os.cpu_count() or 1
+        num_threads = max(1, min(num_threads, self.params.num_samples))
+        self._worker_data = [mujoco.MjData(model) for _ in range(num_threads)]
+        self._executor = ThreadPoolExecutor(max_workers=num_threads)
+        self._state = np.zeros(mujoco.mj_stateSize(model, STATE_SPEC))
+
+    @property
+    def planning_rate(self) -> float:
+        """Mean planning rate over recent plans [Hz] (0 before the first)."""
+        if not self.plan_times:
+            return 0.0
+        return len(self.plan_times) / sum(self.plan_times)
+
+    def reset(self) -> None:
+        """Discard the current plan and timing history."""
+        self.plan[:] = 0.0
+        self.plan_times.clear()
+        self._steps_since_plan = self.params.replan_steps
+
+    def close(self) -> None:
+        """Shut down the rollout worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def compute_control(self) -> np.ndarray:
+        """Return the control for the current tick, replanning when due.
+
+        Returns:
+            Control vector [nu]
+        """
+        if self._steps_since_plan >= self.params.replan_steps:
+            self.update_plan()
+        ctrl = self.plan[self._steps_since_plan].copy()
+        self._steps_since_plan += 1
+        return ctrl
+
+    def update_plan(self) -> np.ndarray:
+        """Plan from the current state of ``data``.
+
+        Returns:
+            The updated nominal plan [horizon x nu]
+        """
+        start_time = time.perf_counter()
+        params = self.params
+
+        # Warm start: shift out the steps applied since the last plan
+        shift = min(self._steps_since_plan, params.horizon)
+        self.plan = np.roll(self.plan, -shift, axis=0)
+        self.plan[params.horizon - shift :] = self.plan[params.horizon - shift - 1]
+        self._steps_since_plan = 0
+
+        # Perturbed candidates, sample 0 being the nominal plan itself
+        noise = self._rng.standard_normal(
+            (params.num_samples, params.horizon, self.model.nu)
+        )
+        noise *= self._noise_std
+        noise[0] = 0.0
+        candidates = np.clip(self.plan + noise, self._ctrl_low, self._ctrl_high)
+
+        # Fork the current state and evaluate all candidates in parallel
+        mujoco.mj_getState(self.model, self.data, self._state, STATE_SPEC)
+        costs = np.empty(params.num_samples)
+        chunks = np.array_split(np.arange(params.num_samples), len(self._worker_data))
+        list(
+            self._executor.map(
+                lambda worker, indices: self._rollout(
+                    worker, candidates, indices, costs
+                ),
+                self._worker_data,
+                chunks,
+            )
+        )
+
+        # Exponentially weighted average of the candidates
+        spread = costs.max() - costs.min()
+        scale = params.temperature * spread if spread > 0 else 1.0
+        weights = np.exp(-(costs - costs.min()) / scale)
+        weights /= weights.sum()
+        self.plan = np.tensordot(weights, candidates, axes=1)
+
+        self.last_costs = costs
+        self.plan_times.append(time.perf_counter() - start_time)
+        return self.plan
+
+    def _rollout(
+        self,
+        data: mujoco.MjData,
+        candidates: np.ndarray,
+        indices: Sequence[int],
+        costs: np.ndarray,
+    ) -> None:
+        """Simulate candidate plans from the forked state and score them.
+
+        Args:
+            data: Worker MjData (used by this thread only)
+            candidates: Control sequences [num_samples x horizon x nu]
+            indices: Candidates handled by this worker
+            costs: Output objective values [num_samples]
+        """
+        model = self.model
+        horizon = self.params.horizon
+        nu = model.nu
+        velocities = np.zeros((horizon, model.nv))
+        club_velocity = np.zeros(6)
+
+        for k in indices:
+            mujoco.mj_setState(model, data, self._state, STATE_SPEC)
+            controls = candidates[k]
+            peak_club_speed = 0.0
+            for step in range(horizon):
+                data.ctrl[:] = controls[step]
+                mujoco.mj_step(model, data)
+                velocities[step] = data.qvel
+
+                # Club head speed (mj_step leaves kinematics at the step start)
+                if self.club_head_id is not None:
+                    mujoco.mj_objectVelocity(
+                        model,
+                        data,
+                        mujoco.mjtObj.mjOBJ_BODY,
+                        self.club_head_id,
+                        club_velocity,
+                        0,
+                    )
+                    speed = float(np.linalg.norm(club_velocity[3:]))
+                    peak_club_speed = max(peak_club_speed, speed)
+
+            if self.club_head_id is not None:
+                mujoco.mj_kinematics(model, data)
+                final_club_position = data.xpos[self.club_head_id]
+            else:
+                final_club_position = np.zeros(3)
+
+            # Jerk from the second difference of velocity, integrated over
+            # time so its weight does not depend on the physics timestep
+            jerk = 0.0
+            if self.objectives.minimize_jerk and horizon >= 3:
+                accel_diff = np.diff(velocities, n=2, axis=0)
+                jerk = float(np.sum(np.abs(accel_diff))) / model.opt.timestep
+
+            costs[k] = self.objectives.evaluate(
+                peak_club_speed=peak_club_speed,
+                total_energy=float(
+                    np.sum(np.abs(controls) * np.abs(velocities[:, :nu]))
+                ),
+                jerk=jerk,
+                total_torque=float(np.sum(np.abs(controls))),
+                final_club_position=final_club_position,
+            )
@@ -4,6 +4,7 @@ Provides:
 - SQLite database for metadata
 - Recording organization and search
 - Tagging and filtering
+- Content-based similarity search ("swings most like this one")
 - Import/export library
 """
 
@@ -16,13 +17,77 @@ import logging
 import re
 import shutil
 import sqlite3
+import threading
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Swing feature vector layout: time-normalized club speed profile, phase
+# durations (backswing, downswing, follow-through) and per-joint peak speeds.
+# Bump FEATURE_VERSION whenever the layout changes so stale vectors are ignored.
+FEATURE_VERSION = 1
+SPEED_PROFILE_POINTS = 32
+NUM_PHASE_FEATURES = 3
+
+
+def _split_tags(tags: str) -> list[str]:
+    """Split a comma-separated tag string into unique, stripped tags."""
+    return list(dict.fromkeys(t.strip() for t in tags.split(",") if t.strip()))
+
+
+def extract_swing_features(data_dict: dict[str, Any]) -> np.ndarray | None:
+    """Compute the fixed-layout feature vector used for similarity search.
+
+    The vector is the club head speed profile resampled onto
+    ``SPEED_PROFILE_POINTS`` samples of normalized time, the backswing,
+    downswing and follow-through durations (top of backswing is the slowest
+    club speed before impact, impact the fastest), and the peak absolute
+    velocity of each joint. Vectors only compare between recordings with the
+    same number of joints.
+
+    Args:
+        data_dict: Recording data with 'times', 'club_head_speed' and
+            optionally 'joint_velocities'
+
+    Returns:
+        Feature vector, or None if the recording has no usable speed data
+    """
+    times = data_dict.get("times")
+    speed = data_dict.get("club_head_speed")
+    if times is None or speed is None or len(times) < 2 or len(speed) != len(times):
+        return None
+
+    times = np.asarray(times, dtype=float)
+    speed = np.asarray(speed, dtype=float)
+    duration = times[-1] - times[0]
+    if not duration > 0 or not np.all(np.isfinite(speed)):
+        return None
+
+    grid = np.linspace(times[0], times[-1], SPEED_PROFILE_POINTS)
+    profile = np.interp(grid, times, speed)
+
+    impact = int(np.argmax(speed))
+    top = int(np.argmin(speed[:impact])) if impact > 0 else 0
+    phases = [
+        times[top] - times[0],
+        times[impact] - times[top],
+        times[-1] - times[impact],
+    ]
+
+    velocities = data_dict.get("joint_velocities")
+    peaks = np.zeros(0)
+    if velocities is not None and len(velocities) == len(times):
+        velocities = np.asarray(velocities, dtype=float).reshape(len(times), -1)
+        peaks = np.nanmax(np.abs(velocities), axis=0) if velocities.size else peaks
+
+    return np.concatenate([profile, phases, peaks])
+
 
 @dataclass
 class RecordingMetadata:
@@ -44,6 +109,54 @@ class RecordingMetadata:
     checksum: str = ""  # MD5 of data file
 
 
+@dataclass
+class _FeatureIndex:
+    """Standardized feature vectors of one length, searched by brute force."""
+
+    ids: np.ndarray
+    vectors: np.ndarray  # Standardized, shape (N, D)
+    sq_norms: np.ndarray
+    mean: np.ndarray
+    scale: np.ndarray
+    tree: Any = None  # scipy.spatial.cKDTree, built on first use
+
+    @classmethod
+    def build(cls, ids: list[int], vectors: list[np.ndarray]) -> _FeatureIndex:
+        """Standardize each feature over the library (z-score)."""
+        raw = np.vstack(vectors)
+        mean = raw.mean(axis=0)
+        scale = raw.std(axis=0)
+        scale[scale <= 1e-12] = 1.0
+        scaled = (raw - mean) / scale
+        return cls(
+            ids=np.asarray(ids, dtype=np.int64),
+            vectors=scaled,
+            sq_norms=np.einsum("ij,ij->i", scaled, scaled),
+            mean=mean,
+            scale=scale,
+        )
+
+    def query(
+        self, vector: np.ndarray, n: int, use_tree: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return (ids, distances) of the ``n`` nearest vectors, closest first."""
+        target = (vector - self.mean) / self.scale
+        n = min(n, len(self.ids))
+        if use_tree:
+            if self.tree is None:
+                from scipy.spatial import cKDTree
+
+                self.tree = cKDTree(self.vectors)
+            dist, pos = self.tree.query(target, k=n)
+            return self.ids[np.atleast_1d(pos)], np.atleast_1d(dist)
+
+        # |x - q|^2 = |x|^2 - 2 x.q + |q|^2, one matrix-vector product
+        sq_dist = self.sq_norms - 2.0 * (self.vectors @ target) + target @ target
+        pos = np.argpartition(sq_dist, n - 1)[:n]
+        pos = pos[np.argsort(sq_dist[pos], kind="stable")]
+        return self.ids[pos], np.sqrt(np.maximum(sq_dist[pos], 0.0))
+
+
 class RecordingLibrary:
     """Manage a library of golf swing recordings."""
 
@@ -57,8 +170,40 @@ class RecordingLibrary:
         self.library_path.mkdir(exist_ok=True)
 
         self.db_path = self.library_path / "library.db"
+        # One connection per thread, reused across calls
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Standardized feature matrices grouped by vector length, built lazily
+        self._feature_index: dict[int, _FeatureIndex] | None = None
         self._init_database()
 
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's pooled database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Cursor on the pooled connection, committed on success."""
+        conn = self._connection()
+        with conn:
+            yield conn.cursor()
+
+    def close(self) -> None:
+        """Close all pooled database connections."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
     def _is_relative_to(self, path: Path, other: Path) -> bool:
         """Check if path is relative to other (Python < 3.9 compat)."""
         try:
@@ -70,8 +215,16 @@ class RecordingLibrary:
 
     def _init_database(self) -> None:
         """Initialize SQLite database."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        with self._transaction() as cursor:
+            self._create_tables(cursor)
+
+    def _create_tables(self, cursor: sqlite3.Cursor) -> None:
+        """Create tables and indexes, migrating tags of older libraries."""
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type = 'table' AND name = 'recording_tags'"
+        )
+        migrate_tags = cursor.fetchone() is None
 
         cursor.execute(
             """
@@ -93,43 +246,81 @@ class RecordingLibrary:
             )
         """,
         )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS recording_tags (
+                recording_id INTEGER NOT NULL
+                    REFERENCES recordings(id) ON DELETE CASCADE,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (tag, recording_id)
+            )
+        """,
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS swing_features (
+                recording_id INTEGER PRIMARY KEY
+                    REFERENCES recordings(id) ON DELETE CASCADE,
+                version INTEGER NOT NULL,
+                vector BLOB NOT NULL
+            )
+        """,
+        )
+        for column in ("golfer_name", "club_type", "date_recorded"):
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_recordings_{column} "
+                f"ON recordings ({column})"
+            )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_recording_tags_recording "
+            "ON recording_tags (recording_id)"
+        )
 
-        conn.commit()
-        conn.close()
-
-    def _insert_recording_db(self, metadata: RecordingMetadata) -> int:
-        """Insert recording into database."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        if migrate_tags:
+            cursor.execute("SELECT id, tags FROM recordings WHERE tags != ''")
+            for recording_id, tags in cursor.fetchall():
+                self._write_tags(cursor, recording_id, tags or "")
 
+    def _write_tags(self, cursor: sqlite3.Cursor, recording_id: int, tags: str) -> None:
+        """Replace a recording's rows in the normalized tag table."""
         cursor.execute(
-            """
-            INSERT INTO recordings (
-                filename, golfer_name, date_recorded, club_type, model_name,
-                swing_type, rating, tags, notes, duration, peak_club_speed,
-                num_frames, checksum
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                metadata.filename,
-                metadata.golfer_name,
-                metadata.date_recorded,
-                metadata.club_type,
-                metadata.model_name,
-                metadata.swing_type,
-                metadata.rating,
-                metadata.tags,
-                metadata.notes,
-                metadata.duration,
-                metadata.peak_club_speed,
-                metadata.num_frames,
-                metadata.checksum,
-            ),
+            "DELETE FROM recording_tags WHERE recording_id = ?", (recording_id,)
+        )
+        cursor.executemany(
+            "INSERT INTO recording_tags (recording_id, tag) VALUES (?, ?)",
+            [(recording_id, tag) for tag in _split_tags(tags)],
         )
 
-        recording_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+    def _insert_recording_db(self, metadata: RecordingMetadata) -> int:
+        """Insert recording into database."""
+        with self._transaction() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO recordings (
+                    filename, golfer_name, date_recorded, club_type, model_name,
+                    swing_type, rating, tags, notes, duration, peak_club_speed,
+                    num_frames, checksum
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    metadata.filename,
+                    metadata.golfer_name,
+                    metadata.date_recorded,
+                    metadata.club_type,
+                    metadata.model_name,
+                    metadata.swing_type,
+                    metadata.rating,
+                    metadata.tags,
+                    metadata.notes,
+                    metadata.duration,
+                    metadata.peak_club_speed,
+                    metadata.num_frames,
+                    metadata.checksum,
+                ),
+            )
+            recording_id = cursor.lastrowid
+            if recording_id is not None:
+                self._write_tags(cursor, recording_id, metadata.tags)
 
         if recording_id is None:
             msg = "Failed to get recording ID from database"
@@ -183,7 +374,26 @@ class RecordingLibrary:
             metadata.filename = str(data_path)
 
         # Add to database
-        return self._insert_recording_db(metadata)
+        recording_id = self._insert_recording_db(metadata)
+
+        # Index the swing for similarity search
+        data_dict = self._load_data_dict(data_path)
+        if data_dict is not None:
+            self.update_features(recording_id, data_dict)
+
+        return recording_id
+
+    def _load_data_dict(self, data_path: Path) -> dict[str, Any] | None:
+        """Load a JSON recording for feature extraction (None if not possible)."""
+        if data_path.suffix.lower() != ".json":
+            return None
+        try:
+            with open(data_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug("Could not read '%s' for indexing: %s", data_path.name, e)
+            return None
+        return data if isinstance(data, dict) else None
 
     def _save_file_to_library(  # noqa: PLR0915
         self,
@@ -256,12 +466,9 @@ class RecordingLibrary:
         Returns:
             RecordingMetadata or None if not found
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM recordings WHERE id = ?", (recording_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute("SELECT * FROM recordings WHERE id = ?", (recording_id,))
+            row = cursor.fetchone()
 
         if row:
             return self._row_to_metadata(row)
@@ -279,48 +486,45 @@ class RecordingLibrary:
         if metadata.id is None:
             return False
 
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE recordings SET
-                filename = ?,
-                golfer_name = ?,
-                date_recorded = ?,
-                club_type = ?,
-                model_name = ?,
-                swing_type = ?,
-                rating = ?,
-                tags = ?,
-                notes = ?,
-                duration = ?,
-                peak_club_speed = ?,
-                num_frames = ?,
-                checksum = ?
-            WHERE id = ?
-        """,
-            (
-                metadata.filename,
-                metadata.golfer_name,
-                metadata.date_recorded,
-                metadata.club_type,
-                metadata.model_name,
-                metadata.swing_type,
-                metadata.rating,
-                metadata.tags,
-                metadata.notes,
-                metadata.duration,
-                metadata.peak_club_speed,
-                metadata.num_frames,
-                metadata.checksum,
-                metadata.id,
-            ),
-        )
-
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute(
+                """
+                UPDATE recordings SET
+                    filename = ?,
+                    golfer_name = ?,
+                    date_recorded = ?,
+                    club_type = ?,
+                    model_name = ?,
+                    swing_type = ?,
+                    rating = ?,
+                    tags = ?,
+                    notes = ?,
+                    duration = ?,
+                    peak_club_speed = ?,
+                    num_frames = ?,
+                    checksum = ?
+                WHERE id = ?
+            """,
+                (
+                    metadata.filename,
+                    metadata.golfer_name,
+                    metadata.date_recorded,
+                    metadata.club_type,
+                    metadata.model_name,
+                    metadata.swing_type,
+                    metadata.rating,
+                    metadata.tags,
+                    metadata.notes,
+                    metadata.duration,
+                    metadata.peak_club_speed,
+                    metadata.num_frames,
+                    metadata.checksum,
+                    metadata.id,
+                ),
+            )
+            success = cursor.rowcount > 0
+            if success:
+                self._write_tags(cursor, metadata.id, metadata.tags)
 
         return success
 
@@ -366,15 +570,13 @@ class RecordingLibrary:
                         )
                         # We continue to delete from DB even if file delete fails
 
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM recordings WHERE id = ?", (recording_id,))
-
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        # Tags and swing features are removed by ON DELETE CASCADE
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM recordings WHERE id = ?", (recording_id,))
+            success = cursor.rowcount > 0
 
+        if success:
+            self._feature_index = None
         return success
 
     def search_recordings(
@@ -401,9 +603,6 @@ class RecordingLibrary:
         Returns:
             List of matching RecordingMetadata
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
         query = "SELECT * FROM recordings WHERE 1=1"
         params: list[str | int] = []
 
@@ -431,21 +630,23 @@ class RecordingLibrary:
             query += " AND date_recorded <= ?"
             params.append(date_to)
 
-        query += " ORDER BY date_recorded DESC"
-
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        required_tags = _split_tags(",".join(tags or []))
+        if required_tags:
+            placeholders = ", ".join("?" * len(required_tags))
+            query += (
+                " AND id IN (SELECT recording_id FROM recording_tags"
+                f" WHERE tag IN ({placeholders})"
+                " GROUP BY recording_id HAVING COUNT(*) = ?)"
+            )
+            params.extend([*required_tags, len(required_tags)])
 
-        results = [self._row_to_metadata(row) for row in rows]
+        query += " ORDER BY date_recorded DESC"
 
-        # Filter by tags if specified
-        if tags:
-            results = [
-                r for r in results if all(tag in r.tags.split(",") for tag in tags)
-            ]
+        with self._transaction() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
 
-        return results
+        return [self._row_to_metadata(row) for row in rows]
 
     def get_all_recordings(self) -> list[RecordingMetadata]:
         """Get all recordings.
@@ -461,45 +662,41 @@ class RecordingLibrary:
         Returns:
             Dictionary with statistics
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        # Total recordings
-        cursor.execute("SELECT COUNT(*) FROM recordings")
-        total_count = cursor.fetchone()[0]
-
-        # By club type
-        cursor.execute(
-            """
-            SELECT club_type, COUNT(*) FROM recordings
-            GROUP BY club_type
-        """,
-        )
-        by_club = dict(cursor.fetchall())
-
-        # By swing type
-        cursor.execute(
-            """
-            SELECT swing_type, COUNT(*) FROM recordings
-            GROUP BY swing_type
-        """,
-        )
-        by_swing_type = dict(cursor.fetchall())
+        with self._transaction() as cursor:
+            # Total recordings
+            cursor.execute("SELECT COUNT(*) FROM recordings")
+            total_count = cursor.fetchone()[0]
+
+            # By club type
+            cursor.execute(
+                """
+                SELECT club_type, COUNT(*) FROM recordings
+                GROUP BY club_type
+            """,
+            )
+            by_club = dict(cursor.fetchall())
 
-        # Average rating
-        cursor.execute("SELECT AVG(rating) FROM recordings WHERE rating > 0")
-        avg_rating = cursor.fetchone()[0] or 0.0
+            # By swing type
+            cursor.execute(
+                """
+                SELECT swing_type, COUNT(*) FROM recordings
+                GROUP BY swing_type
+            """,
+            )
+            by_swing_type = dict(cursor.fetchall())
 
-        # Peak speed stats
-        cursor.execute(
-            """
-            SELECT MIN(peak_club_speed), MAX(peak_club_speed), AVG(peak_club_speed)
-            FROM recordings WHERE peak_club_speed > 0
-        """,
-        )
-        speed_stats = cursor.fetchone()
+            # Average rating
+            cursor.execute("SELECT AVG(rating) FROM recordings WHERE rating > 0")
+            avg_rating = cursor.fetchone()[0] or 0.0
 
-        conn.close()
+            # Peak speed stats
+            cursor.execute(
+                """
+                SELECT MIN(peak_club_speed), MAX(peak_club_speed), AVG(peak_club_speed)
+                FROM recordings WHERE peak_club_speed > 0
+            """,
+            )
+            speed_stats = cursor.fetchone()
 
         return {
             "total_recordings": total_count,
@@ -541,11 +738,9 @@ class RecordingLibrary:
 
         if not merge:
             # Clear existing database
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM recordings")
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                cursor.execute("DELETE FROM recordings")
+            self._feature_index = None
 
         # Add all recordings
         for rec_dict in data.get("recordings", []):
@@ -582,15 +777,140 @@ class RecordingLibrary:
         if field not in allowed_fields:
             return []
 
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute(f"SELECT DISTINCT {field} FROM recordings WHERE {field} != ''")
-        values = [row[0] for row in cursor.fetchall()]
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"SELECT DISTINCT {field} FROM recordings WHERE {field} != ''"
+            )
+            values = [row[0] for row in cursor.fetchall()]
 
-        conn.close()
         return sorted(values)
 
+    def update_features(self, recording_id: int, data_dict: dict[str, Any]) -> bool:
+        """Compute and store a recording's similarity-search features.
+
+        Args:
+            recording_id: Recording ID
+            data_dict: Recording data (see :func:`extract_swing_features`)
+
+        Returns:
+            True if features were stored, False if the data has none
+        """
+        vector = extract_swing_features(data_dict)
+        if vector is None:
+            return False
+
+        with self._transaction() as cursor:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO swing_features (recording_id, version, vector)
+                VALUES (?, ?, ?)
+                """,
+                (recording_id, FEATURE_VERSION, vector.astype("<f8").tobytes()),
+            )
+        self._feature_index = None
+        return True
+
+    def rebuild_feature_index(self) -> int:
+        """Recompute features for every recording from its data file.
+
+        Returns:
+            Number of recordings indexed
+        """
+        indexed = 0
+        for metadata in self.get_all_recordings():
+            data_dict = self._load_data_dict(self.get_recording_path(metadata))
+            if (
+                metadata.id is not None
+                and data_dict is not None
+                and self.update_features(metadata.id, data_dict)
+            ):
+                indexed += 1
+        return indexed
+
+    def _get_feature_index(self) -> dict[int, _FeatureIndex]:
+        """Load current-version feature vectors, grouped by length."""
+        if self._feature_index is None:
+            with self._transaction() as cursor:
+                cursor.execute(
+                    "SELECT recording_id, vector FROM swing_features WHERE version = ?",
+                    (FEATURE_VERSION,),
+                )
+                rows = cursor.fetchall()
+
+            groups: dict[int, tuple[list[int], list[np.ndarray]]] = {}
+            for recording_id, blob in rows:
+                vector = np.frombuffer(blob, dtype="<f8")
+                ids, vectors = groups.setdefault(len(vector), ([], []))
+                ids.append(recording_id)
+                vectors.append(vector)
+            self._feature_index = {
+                dim: _FeatureIndex.build(ids, vectors)
+                for dim, (ids, vectors) in groups.items()
+            }
+        return self._feature_index
+
+    def find_similar(
+        self,
+        query: int | dict[str, Any],
+        k: int = 10,
+        use_tree: bool = False,
+    ) -> list[tuple[RecordingMetadata, float]]:
+        """Find the recordings whose swings are most like the query.
+
+        Distances are Euclidean over features standardized across the
+        library. Only recordings with the same feature layout (same number of
+        joints) are compared.
+
+        Args:
+            query: Recording ID in the library, or recording data arrays
+            k: Number of matches to return
+            use_tree: Search a KD-tree instead of the brute-force scan
+
+        Returns:
+            List of (metadata, distance) pairs, closest first
+
+        Raises:
+            ValueError: If the query has no features to compare
+        """
+        exclude = None
+        if isinstance(query, dict):
+            vector = extract_swing_features(query)
+        else:
+            exclude = query
+            with self._transaction() as cursor:
+                cursor.execute(
+                    "SELECT vector FROM swing_features "
+                    "WHERE recording_id = ? AND version = ?",
+                    (query, FEATURE_VERSION),
+                )
+                row = cursor.fetchone()
+            vector = None if row is None else np.frombuffer(row[0], dtype="<f8")
+        if vector is None:
+            msg = "Query recording has no indexed club head speed data"
+            raise ValueError(msg)
+
+        index = self._get_feature_index().get(len(vector))
+        if index is None or k <= 0:
+            return []
+
+        ids, distances = index.query(vector, k + (exclude is not None), use_tree)
+        matches = [
+            (int(i), float(d))
+            for i, d in zip(ids, distances, strict=True)
+            if i != exclude
+        ][:k]
+        if not matches:
+            return []
+
+        placeholders = ", ".join("?" * len(matches))
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"SELECT * FROM recordings WHERE id IN ({placeholders})",
+                [i for i, _ in matches],
+            )
+            by_id = {row[0]: self._row_to_metadata(row) for row in cursor.fetchall()}
+        return [(by_id[i], d) for i, d in matches if i in by_id]
+
     def _row_to_metadata(self, row: tuple) -> RecordingMetadata:
         """Convert database row to RecordingMetadata."""
         return RecordingMetadata(
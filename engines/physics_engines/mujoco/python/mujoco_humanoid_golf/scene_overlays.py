@@ -0,0 +1,209 @@
+"""Native MuJoCo scene geoms for force, torque, frame and marker overlays.
+
+Overlays are appended to an ``MjvScene`` after ``mjv_updateScene`` and
+before rendering, so the GPU projects, depth-tests and rasterizes them
+with the rest of the scene. Endpoints are computed for all bodies or
+actuators at once from ``MjData`` arrays; there is no per-endpoint camera
+math and no CPU pass over the rendered image.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import mujoco
+import numpy as np
+
+# Overlay colors (RGBA)
+TORQUE_POSITIVE_RGBA = np.array([1.0, 0.0, 0.0, 1.0], dtype=np.float32)
+TORQUE_NEGATIVE_RGBA = np.array([0.0, 0.0, 1.0, 1.0], dtype=np.float32)
+EXTERNAL_FORCE_RGBA = np.array([0.0, 1.0, 0.0, 1.0], dtype=np.float32)
+INTERNAL_FORCE_RGBA = np.array([0.0, 1.0, 1.0, 1.0], dtype=np.float32)
+SELECTION_RGBA = np.array([0.0, 1.0, 1.0, 0.4], dtype=np.float32)
+CONSTRAINT_RGBA = np.array([1.0, 0.0, 1.0, 0.4], dtype=np.float32)
+COM_RGBA = np.array([0.0, 1.0, 1.0, 1.0], dtype=np.float32)
+SPEED_LABEL_RGBA = np.array([1.0, 1.0, 0.0, 1.0], dtype=np.float32)
+AXIS_RGBA = np.array(
+    [[1.0, 0.0, 0.0, 1.0], [0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0]],
+    dtype=np.float32,
+)
+
+TORQUE_THRESHOLD = 1e-6  # Smallest actuator control drawn
+FORCE_THRESHOLD = 1e-5  # Smallest force magnitude drawn [N]
+ARROW_WIDTH = 0.01  # Arrow shaft radius [m]
+AXIS_LINE_WIDTH = 2.0  # Frame axis line width [px]
+AXIS_LENGTH = 0.2  # Frame axis length [m]
+
+_IDENTITY = np.eye(3).ravel()
+
+
+def torque_arrows(
+    model: mujoco.MjModel,
+    data: mujoco.MjData,
+    scale: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Arrows along each actuated joint axis, scaled by the control.
+
+    Args:
+        model: MuJoCo model
+        data: MuJoCo data with up-to-date kinematics
+        scale: Arrow length per unit of control [m]
+
+    Returns:
+        Tuple of (starts [n x 3], ends [n x 3], rgba [n x 4])
+    """
+    joint_ids = model.actuator_trnid[:, 0]
+    torques = data.ctrl.copy()
+    valid = (joint_ids >= 0) & (joint_ids < model.njnt)
+    joint_ids = joint_ids[valid]
+    torques = torques[valid]
+
+    drawn = np.abs(torques) >= TORQUE_THRESHOLD
+    joint_ids = joint_ids[drawn]
+    torques = torques[drawn]
+
+    starts = data.xpos[model.jnt_bodyid[joint_ids]]
+    ends = starts + data.xaxis[joint_ids] * (torques * scale)[:, None]
+    rgba = np.where((torques >= 0)[:, None], TORQUE_POSITIVE_RGBA, TORQUE_NEGATIVE_RGBA)
+    return starts, ends, rgba
+
+
+def force_arrows(
+    model: mujoco.MjModel,
+    data: mujoco.MjData,
+    scale: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Arrows for external and joint reaction forces on every body.
+
+    ``cfrc_int`` is only populated after ``mj_rnePostConstraint`` (which
+    ``mj_step`` runs); stale values are drawn as they are.
+
+    Args:
+        model: MuJoCo model
+        data: MuJoCo data with up-to-date kinematics
+        scale: Arrow length per unit force [m/N]
+
+    Returns:
+        Tuple of (starts [n x 3], ends [n x 3], rgba [n x 4])
+    """
+    positions = data.xpos[1 : model.nbody]
+    starts, ends, rgba = [], [], []
+    for wrenches, color in (
+        (data.cfrc_ext, EXTERNAL_FORCE_RGBA),
+        (data.cfrc_int, INTERNAL_FORCE_RGBA),
+    ):
+        forces = wrenches[1 : model.nbody, 3:6]
+        drawn = np.linalg.norm(forces, axis=1) >= FORCE_THRESHOLD
+        starts.append(positions[drawn])
+        ends.append(positions[drawn] + forces[drawn] * scale)
+        rgba.append(np.broadcast_to(color, (int(drawn.sum()), 4)))
+    return np.concatenate(starts), np.concatenate(ends), np.concatenate(rgba)
+
+
+def frame_axes(
+    data: mujoco.MjData,
+    body_ids: Iterable[int],
+    length: float = AXIS_LENGTH,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Red, green and blue segments along the x, y and z axes of bodies.
+
+    Args:
+        data: MuJoCo data with up-to-date kinematics
+        body_ids: Bodies whose frames are drawn
+        length: Axis length [m]
+
+    Returns:
+        Tuple of (starts [3n x 3], ends [3n x 3], rgba [3n x 4])
+    """
+    ids = np.fromiter(body_ids, dtype=int)
+    origins = np.repeat(data.xpos[ids], 3, axis=0)
+    # Rows of xmat^T are the body axes expressed in the world frame
+    axes = data.xmat[ids].reshape(-1, 3, 3).transpose(0, 2, 1).reshape(-1, 3)
+    rgba = np.tile(AXIS_RGBA, (len(ids), 1))
+    return origins, origins + length * axes, rgba
+
+
+def add_connectors(
+    scene: mujoco.MjvScene,
+    geom_type: mujoco.mjtGeom,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    rgba: np.ndarray,
+    width: float,
+) -> int:
+    """Append arrow, capsule or line geoms between pairs of points.
+
+    Geoms that do not fit in the scene's ``maxgeom`` are dropped.
+
+    Args:
+        scene: Scene updated for the current frame
+        geom_type: Connector type (e.g. ``mjGEOM_ARROW`` or ``mjGEOM_LINE``)
+        starts: Start points [n x 3]
+        ends: End points [n x 3]
+        rgba: Colors [n x 4]
+        width: Radius [m], or width in pixels for lines
+
+    Returns:
+        Number of geoms added
+    """
+    count = min(len(starts), scene.maxgeom - scene.ngeom)
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    rgba = np.asarray(rgba, dtype=np.float32)
+    for i in range(count):
+        geom = _next_geom(scene, geom_type, rgba[i])
+        mujoco.mjv_connector(geom, geom_type, width, starts[i], ends[i])
+    return count
+
+
+def add_markers(
+    scene: mujoco.MjvScene,
+    geom_type: mujoco.mjtGeom,
+    positions: np.ndarray,
+    size: float,
+    rgba: np.ndarray,
+    labels: Iterable[str] | None = None,
+) -> int:
+    """Append world-aligned marker geoms, optionally labelled.
+
+    Args:
+        scene: Scene updated for the current frame
+        geom_type: Marker type (e.g. ``mjGEOM_SPHERE`` or ``mjGEOM_BOX``)
+        positions: Marker centers [n x 3]
+        size: Marker radius or half-size [m]
+        rgba: Marker color [4]
+        labels: Text shown next to each marker
+
+    Returns:
+        Number of geoms added
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    labels = list(labels) if labels is not None else [""] * len(positions)
+    count = min(len(positions), scene.maxgeom - scene.ngeom)
+    sizes = np.full(3, size)
+    for i in range(count):
+        geom = _next_geom(scene, geom_type, rgba, positions[i], sizes)
+        geom.label = labels[i]
+    return count
+
+
+def _next_geom(
+    scene: mujoco.MjvScene,
+    geom_type: mujoco.mjtGeom,
+    rgba: np.ndarray,
+    pos: np.ndarray | None = None,
+    size: np.ndarray | None = None,
+) -> mujoco.MjvGeom:
+    """Initialize the next free scene geom as a decoration."""
+    geom = scene.geoms[scene.ngeom]
+    mujoco.mjv_initGeom(
+        geom,
+        geom_type,
+        np.zeros(3) if size is None else size,
+        np.zeros(3) if pos is None else pos,
+        _IDENTITY,
+        np.asarray(rgba, dtype=np.float32),
+    )
+    geom.category = mujoco.mjtCatBit.mjCAT_DECOR
+    scene.ngeom += 1
+    return geom
@@ -4,44 +4,39 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Final
+from typing import Any
 
 import mujoco
 import numpy as np
 
 # ... imports ...
 from PyQt6 import QtCore, QtGui, QtWidgets
+from shared.python.manipulability import ManipulabilityEllipsoid
 
 # Removed unused scipy import
 from .biomechanics import BiomechanicalAnalyzer, SwingRecorder
 from .control_system import ControlSystem, ControlType
 from .interactive_manipulation import InteractiveManipulator
+from .manipulability import EllipsoidService
 from .meshcat_adapter import MuJoCoMeshcatAdapter
+from .playback_control import PlaybackController
+from .scene_overlays import (
+    ARROW_WIDTH,
+    AXIS_LINE_WIDTH,
+    COM_RGBA,
+    CONSTRAINT_RGBA,
+    SELECTION_RGBA,
+    SPEED_LABEL_RGBA,
+    add_connectors,
+    add_markers,
+    force_arrows,
+    frame_axes,
+    torque_arrows,
+)
 from .telemetry import TelemetryRecorder
 
-# Lazy loading globals for OpenCV
-CV2_LIB = None
-INVALID_CV2 = False
-
-
-def get_cv2():
-    """Lazy import of OpenCV to speed up initial load."""
-    global CV2_LIB, INVALID_CV2
-    if CV2_LIB is None and not INVALID_CV2:
-        try:
-            import cv2
-
-            CV2_LIB = cv2
-        except ImportError:
-            INVALID_CV2 = True
-    return CV2_LIB
-
-
 LOGGER = logging.getLogger(__name__)
-MIN_CAMERA_DEPTH: Final[float] = 0.1
-FORCE_VISUALIZATION_THRESHOLD: Final[float] = 1e-5
 
 
 class ModelLoaderThread(QtCore.QThread):
@@ -113,6 +108,7 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
         # Ellipsoid Visualization Toggles
         self.show_mobility_ellipsoid = False
         self.show_force_ellipsoid = False
+        self.ellipsoids: EllipsoidService | None = None
 
         # Meshcat integration
         self.meshcat_adapter: MuJoCoMeshcatAdapter | None = None
@@ -129,6 +125,9 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
         self.analyzer: BiomechanicalAnalyzer | None = None
         self.recorder = SwingRecorder()
 
+        # Replay of the recording from cached kinematics (see start_playback)
+        self.playback: PlaybackController | None = None
+
         # Interactive manipulation
         self.manipulator: InteractiveManipulator | None = None
         self.camera = mujoco.MjvCamera()
@@ -272,11 +271,17 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
         self.control_vector = np.zeros(self.model.nu, dtype=np.float64)
 
         # Reset Biomechanics
+        self.stop_playback()
         self.analyzer = BiomechanicalAnalyzer(self.model, self.data)
         self.recorder.reset()
 
         # Reset Interaction
         self.manipulator = InteractiveManipulator(self.model, self.data)
+        self.ellipsoids = EllipsoidService(self.model)
+
+        # Mirror the new model in the browser view
+        if self.meshcat_adapter is not None:
+            self.meshcat_adapter.set_model(self.model)
 
         # Restart timer
         self.timer.start(int(1000 / self.fps))
@@ -759,97 +764,30 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
                 self.meshcat_adapter.clear_ellipsoids()
             return
 
-        if self.model is None or self.data is None:
+        if self.model is None or self.data is None or self.ellipsoids is None:
             return
 
-        # Use selected body or last body
-        body_id = self.model.nbody - 1
-        if (
-            self.manipulator
-            and self.manipulator.selected_body_id is not None
-            and self.manipulator.selected_body_id > 0
-        ):
-            body_id = self.manipulator.selected_body_id
-
-        # 1. Get Jacobian (Translation only for 3D ellipsoid visualization usually)
-        # We focus on Translational Mobility/Force for visualization
-        jacp = np.zeros((3, self.model.nv))
-        jacr = np.zeros((3, self.model.nv))
-        mujoco.mj_jacBody(self.model, self.data, jacp, jacr, body_id)
-        J = jacp  # Use translational part (3 x nv)
-
-        # 2. Get Mass Matrix
-        # mj_fullM returns dense M (nv x nv)
-        M = np.zeros((self.model.nv, self.model.nv))
-        mujoco.mj_fullM(self.model, M, self.data.qM)
-
-        # Add damping/regularization to M for invertibility if needed?
-        # M should be PD.
+        # Translational mobility; reused while qpos is unchanged (e.g. paused)
         try:
-            Minv = np.linalg.inv(M)
-        except np.linalg.LinAlgError:
-            Minv = np.linalg.pinv(M)
-
-        # 3. Compute Core Matrix
-        # Lambda_inv = J * M^-1 * J^T
-        Lambda_inv = J @ Minv @ J.T
-
-        # Mobility Ellipsoid (Dynamic): v^T (J M^-1 J^T)^-1 v <= 1 ??
-        # Actually, usually defined such that axes are singular values of J*M^(-1/2)
-        # Or simply visualize the covariance defined by Lambda_inv?
-        # Let's use the standard definitions:
-        #
-        # Dynamic Manipulability (Velocity) Ellipsoid:
-        # Describes the set of velocities realizable with unit energy/torque?
-        # Core matrix A = (J M^-1 J^T).
-        # The ellipsoid is x^T A^-1 x = 1.
-        # Axes aligned with eigenvectors of A. Lengths = sqrt(eigenvalues of A).
-
-        # Force Ellipsoid:
-        # Core matrix B = (J M^-1 J^T)^-1 = Lambda.
-        # The ellipsoid is f^T B^-1 f = 1 => f^T (J M^-1 J^T) f = 1.
-        # Axes aligned with eigenvectors of B. Lengths = sqrt(eigenvalues of B).
-        # Note: Eigenvalues of B are 1/eigenvalues of A.
-        # So Force axes are sqrt(1/lambda_A) = 1/sqrt(lambda_A).
-        # Force ellipsoid is reciprocal to Velocity ellipsoid.
-
-        try:
-            eigvals, eigvecs = np.linalg.eigh(Lambda_inv)
-            # eigvals are the squares of the axis lengths for the velocity ellipsoid
-            # because the ellipsoid is defined by x^T (V D V^T)^-1 x = 1
-            # The semi-axes are sqrt(eigvals) * eigvecs.
-
-            body_pos = self.data.xpos[body_id]
+            ellipsoid = self._current_ellipsoid(self._ellipsoid_body_id())
 
             if self.show_mobility_ellipsoid:
-                # Radii = sqrt(eigenvalues)
-                radii = np.sqrt(np.maximum(eigvals, 1e-6))
-                # Scale for visibility?
-                radii *= 1.0  # Unit scale?
-
-                # Use Meshcat to draw
                 self.meshcat_adapter.draw_ellipsoid(
                     "mobility",
-                    body_pos,
-                    eigvecs,  # Rotation matrix (columns are axes)
-                    radii,
+                    ellipsoid.center,
+                    ellipsoid.axes,  # Rotation matrix (columns are axes)
+                    ellipsoid.mobility_radii,
                     color=0x00FF00,  # Green
                     opacity=0.3,
                 )
 
             if self.show_force_ellipsoid:
-                # Force ellipsoid radii are reciprocal
-                # Radii = 1 / sqrt(eigenvalues) = 1 / radii_mobility
-                radii_force = 1.0 / np.sqrt(np.maximum(eigvals, 1e-6))
-
-                # Scale for visibility - force ellipsoids can be huge near singularities
-                radii_force = np.clip(radii_force, 0.01, 5.0)
-
+                # Force ellipsoid radii are reciprocal, clipped near singularities
                 self.meshcat_adapter.draw_ellipsoid(
                     "force",
-                    body_pos,
-                    eigvecs,
-                    radii_force,
+                    ellipsoid.center,
+                    ellipsoid.axes,
+                    ellipsoid.force_radii,
                     color=0xFF0000,  # Red
                     opacity=0.3,
                 )
@@ -857,6 +795,88 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
         except Exception as e:
             LOGGER.warning(f"Failed to compute ellipsoids: {e}")
 
+    def _ellipsoid_body_id(self) -> int:
+        """Selected body, or the last body if none is selected."""
+        if (
+            self.manipulator
+            and self.manipulator.selected_body_id is not None
+            and self.manipulator.selected_body_id > 0
+        ):
+            return self.manipulator.selected_body_id
+        return self.model.nbody - 1
+
+    def _current_ellipsoid(self, body_id: int) -> ManipulabilityEllipsoid:
+        """Ellipsoid of a body at the displayed frame, from the cache if possible."""
+        if self.playback is None:
+            return self.ellipsoids.compute(self.data, body_id)
+
+        cache = self.playback.cache
+        if cache is not None and cache.ellipsoid_body_id == body_id:
+            cached = cache.ellipsoid(self.playback.current_frame)
+            if cached is not None:
+                return cached
+        # Cached frames carry no factorized mass matrix, so evaluate afresh
+        return self.ellipsoids.compute_trajectory(self.data.qpos[None], body_id)[0]
+
+    # -------- Playback of recordings --------
+
+    def start_playback(self) -> PlaybackController | None:
+        """Replay the current recording from precomputed kinematics.
+
+        Recording stops and physics stepping is suspended. The playback cache
+        is filled in the background; cached frames are shown by copying their
+        kinematics into ``self.data``, so seeking with :meth:`seek_playback`
+        needs no physics, and the ellipsoid and club head speed overlays are
+        read from the cache.
+
+        Returns:
+            The playback controller, or None if nothing has been recorded
+        """
+        if self.model is None or self.data is None:
+            return None
+        times, qpos = self.recorder.get_time_series("joint_positions")
+        _, qvel = self.recorder.get_time_series("joint_velocities")
+        _, ctrl = self.recorder.get_time_series("joint_torques")
+        if len(times) == 0:
+            return None
+
+        self.stop_playback()
+        self.recorder.stop_recording()
+        states = np.hstack([qpos, qvel])
+        controls = np.asarray(ctrl, dtype=float).reshape(len(times), -1)
+        self.playback = PlaybackController(times, states, controls)
+        self.playback.build_cache(
+            self.model, ellipsoid_body_id=self._ellipsoid_body_id()
+        )
+        self._show_playback_frame()
+        return self.playback
+
+    def seek_playback(self, frame: int) -> None:
+        """Show a frame of the playback (timeline scrubbing)."""
+        if self.playback is None:
+            return
+        self.playback.seek_to_frame(frame)
+        self._show_playback_frame()
+
+    def stop_playback(self) -> None:
+        """Leave playback; simulation resumes from the displayed frame."""
+        if self.playback is None:
+            return
+        if self.playback.cache is not None:
+            self.playback.cache.stop()
+        self.playback = None
+        if self.model is not None and self.data is not None:
+            # Recompute contacts and dynamics that cached frames do not restore
+            mujoco.mj_forward(self.model, self.data)
+
+    def _show_playback_frame(self) -> None:
+        """Load the current playback frame into ``self.data`` and render it."""
+        if self.playback is None or self.data is None:
+            return
+        self.playback.apply_current_frame(self.data)
+        self.compute_ellipsoids()
+        self._render_once()
+
     # -------- Internal stepping / rendering --------
 
     def _on_timer(self) -> None:
@@ -864,6 +884,11 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
         if self.model is None or self.data is None:
             return
 
+        if self.playback is not None:
+            self.playback.update(1.0 / self.fps)
+            self._show_playback_frame()
+            return
+
         if self.running:
             # If in Kinematic mode, we don't step physics, but may render/update
             if self.operating_mode == "kinematic":
@@ -948,22 +973,10 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
                 scene_option=self.scene_option,
             )
 
+        # Overlays are scene geoms, drawn and depth-tested by the renderer
+        self._add_scene_overlays(self.renderer.scene)
         rgb = self.renderer.render()
 
-        # Add force/torque overlays before manipulation overlays
-        if self.show_torque_vectors or self.show_force_vectors:
-            rgb = self._add_force_torque_overlays(rgb)
-
-        # Add visual overlays for interactive manipulation
-        if self.manipulator is not None and (
-            self.show_selected_body or self.show_constraints
-        ):
-            rgb = self._add_manipulation_overlays(rgb)
-
-        # Add coordinate frames and centers of mass
-        if self.visible_frames or self.visible_coms:
-            rgb = self._add_frame_and_com_overlays(rgb)
-
         # Update Meshcat
         if self.meshcat_adapter:
             try:
@@ -1015,233 +1028,78 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
             self._update_background_colors()
             self._render_once()
 
-    def _add_force_torque_overlays(self, rgb: np.ndarray) -> np.ndarray:
-        """Overlay torque/force vectors using screen-space arrows."""
-        if self.model is None or self.data is None:
-            return rgb
-
-        cv2 = get_cv2()
-        if cv2 is None:
-            LOGGER.warning("OpenCV not installed, cannot draw force/torque overlays.")
-            return rgb
-
-        img = rgb.copy()
-
-        def draw_arrow(
-            start: np.ndarray,
-            end: np.ndarray,
-            color: tuple[int, int, int],
-        ) -> None:
-            """Draw a screen-space arrow for the provided world-space segment."""
-            start_px = self._world_to_screen(start)
-            end_px = self._world_to_screen(end)
-            if start_px is None or end_px is None:
-                return
-            cv2.arrowedLine(
-                img,
-                start_px,
-                end_px,
-                color,
-                thickness=2,
-                tipLength=0.2,
-            )
-
-        if self.show_torque_vectors:
-            self._draw_torque_vectors(draw_arrow)
-
-        if self.show_force_vectors:
-            self._draw_force_vectors(draw_arrow)
-
-        return img
-
-    def _draw_torque_vectors(self, draw_arrow_func: Callable) -> None:
-        """Helper to draw torque vectors."""
-        if self.model is None or self.data is None:
-            return
-
-        for i in range(self.model.nu):
-            joint_id = self.model.actuator_trnid[i, 0]
-            if joint_id < 0 or joint_id >= self.model.njnt:
-                continue
-            body_id = self.model.jnt_bodyid[joint_id]
-            if body_id < 0 or body_id >= self.model.nbody:
-                continue
-            torque = float(self.data.ctrl[i])
-            if abs(torque) < 1e-6:
-                continue
-            joint_axis = self.data.xaxis[3 * joint_id : 3 * joint_id + 3]
-            joint_pos = self.data.xpos[body_id].copy()
-            arrow_length = abs(torque) * self.torque_scale
-            arrow_dir = joint_axis * np.sign(torque) * arrow_length
-            arrow_end = joint_pos + arrow_dir
-            color = (255, 0, 0) if torque >= 0 else (0, 0, 255)
-            draw_arrow_func(joint_pos, arrow_end, color)
-
-    def _draw_force_vectors(self, draw_arrow_func: Callable) -> None:
-        """Helper to draw force vectors (external and internal)."""
-        if self.data is None or self.model is None:
-            return
-
-        # External forces (Green)
-        external_forces = self.data.cfrc_ext.reshape(-1, 6)
-        for body_id in range(1, self.model.nbody):
-            world_force = external_forces[body_id, 3:6]
-            magnitude = float(np.linalg.norm(world_force))
-            if magnitude < FORCE_VISUALIZATION_THRESHOLD:  # Threshold
-                continue
-            body_pos = self.data.xpos[body_id].copy()
-            arrow_end = body_pos + world_force * self.force_scale
-            draw_arrow_func(body_pos, arrow_end, (0, 255, 0))
-
-        # Internal/Joint reaction forces (Cyan)
-        internal_forces = self.data.cfrc_int.reshape(-1, 6)
-        for body_id in range(1, self.model.nbody):
-            joint_force = internal_forces[body_id, 3:6]
-            magnitude = float(np.linalg.norm(joint_force))
-            if magnitude < FORCE_VISUALIZATION_THRESHOLD:
-                continue
-            body_pos = self.data.xpos[body_id].copy()
-            arrow_end = body_pos + joint_force * self.force_scale
-            # Cyan color (R=0, G=255, B=255)
-            draw_arrow_func(body_pos, arrow_end, (0, 255, 255))
-
-    def _add_manipulation_overlays(self, rgb: np.ndarray) -> np.ndarray:
-        """Add visual overlays for selected bodies and constraints.
+    def _add_scene_overlays(self, scene: mujoco.MjvScene) -> None:
+        """Append force, torque, selection, frame and COM geoms to a scene.
 
         Args:
-            rgb: Rendered image array
-
-        Returns:
-            Image array with overlays
+            scene: Renderer scene already updated for the current frame
         """
-        cv2 = get_cv2()
-        if cv2 is None:
-            # OpenCV not available, return original image
-            return rgb
-
         if self.model is None or self.data is None:
-            return rgb
+            return
 
-        # Make a copy to avoid modifying original
-        img = rgb.copy()
+        if self.show_torque_vectors:
+            starts, ends, rgba = torque_arrows(self.model, self.data, self.torque_scale)
+            add_connectors(
+                scene, mujoco.mjtGeom.mjGEOM_ARROW, starts, ends, rgba, ARROW_WIDTH
+            )
 
-        # Highlight selected body
-        if (
-            self.show_selected_body
-            and self.manipulator is not None
-            and self.manipulator.selected_body_id is not None
-        ):
-            body_pos = self.data.xpos[self.manipulator.selected_body_id].copy()
-
-            # Project 3D position to screen
-            screen_pos = self._world_to_screen(body_pos)
-            if screen_pos is not None:
-                x, y = screen_pos
-                # Draw circle around selected body
-                cv2.circle(img, (x, y), 20, (0, 255, 255), 3)  # Cyan circle
-                cv2.circle(img, (x, y), 3, (0, 255, 255), -1)  # Center dot
-
-                # Draw label
-                body_name = self.manipulator.get_body_name(
-                    self.manipulator.selected_body_id,
+        if self.show_force_vectors:
+            starts, ends, rgba = force_arrows(self.model, self.data, self.force_scale)
+            add_connectors(
+                scene, mujoco.mjtGeom.mjGEOM_ARROW, starts, ends, rgba, ARROW_WIDTH
+            )
+
+        if self.manipulator is not None:
+            selected = self.manipulator.selected_body_id
+            if self.show_selected_body and selected is not None:
+                add_markers(
+                    scene,
+                    mujoco.mjtGeom.mjGEOM_SPHERE,
+                    self.data.xpos[selected],
+                    0.06,
+                    SELECTION_RGBA,
+                    [self.manipulator.get_body_name(selected)],
                 )
-                cv2.putText(
-                    img,
-                    body_name,
-                    (x + 25, y - 10),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (0, 255, 255),
-                    2,
+            if self.show_constraints:
+                constrained = self.manipulator.get_constrained_bodies()
+                add_markers(
+                    scene,
+                    mujoco.mjtGeom.mjGEOM_BOX,
+                    self.data.xpos[constrained],
+                    0.05,
+                    CONSTRAINT_RGBA,
+                    ["FIXED"] * len(constrained),
                 )
 
-        # Highlight constrained bodies
-        if self.show_constraints and self.manipulator is not None:
-            for body_id in self.manipulator.get_constrained_bodies():
-                body_pos = self.data.xpos[body_id].copy()
-                screen_pos = self._world_to_screen(body_pos)
-
-                if screen_pos is not None:
-                    x, y = screen_pos
-                    # Draw square for constrained body
-                    cv2.rectangle(
-                        img,
-                        (x - 15, y - 15),
-                        (x + 15, y + 15),
-                        (255, 0, 255),
-                        2,
-                    )  # Magenta square
-                    cv2.putText(
-                        img,
-                        "FIXED",
-                        (x + 20, y + 20),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.4,
-                        (255, 0, 255),
-                        1,
-                    )
-
-        return img
-
-    def _world_to_screen(self, world_pos: np.ndarray) -> tuple[int, int] | None:
-        """Project 3D world position to 2D screen coordinates.
-
-        Args:
-            world_pos: 3D position in world coordinates
-
-        Returns:
-            Tuple of (x, y) screen coordinates or None if behind camera
-        """
-        # Get camera parameters
-        cam_azimuth = np.deg2rad(self.camera.azimuth)
-        cam_elevation = np.deg2rad(self.camera.elevation)
-        cam_distance = self.camera.distance
-        cam_lookat = self.camera.lookat.copy()
-
-        # Camera position
-        forward = np.array(
-            [
-                np.cos(cam_elevation) * np.sin(cam_azimuth),
-                np.cos(cam_elevation) * np.cos(cam_azimuth),
-                np.sin(cam_elevation),
-            ],
-        )
-        cam_pos = cam_lookat - forward * cam_distance
-
-        # Camera frame
-        up_world = np.array([0, 0, 1])
-        right = np.cross(up_world, forward)
-        right = right / (np.linalg.norm(right) + 1e-8)
-        up = np.cross(forward, right)
-
-        # Transform to camera space
-        to_point = world_pos - cam_pos
-        z = np.dot(to_point, forward)
-
-        # Check if behind camera
-        if z < MIN_CAMERA_DEPTH:
-            return None
-
-        # Project to screen
-        fovy = 45.0
-        aspect = self.frame_width / self.frame_height
-
-        x_cam = np.dot(to_point, right)
-        y_cam = np.dot(to_point, up)
-
-        # Perspective projection
-        x_ndc = x_cam / (z * np.tan(np.deg2rad(fovy / 2)) * aspect)
-        y_ndc = y_cam / (z * np.tan(np.deg2rad(fovy / 2)))
-
-        # Convert to screen coordinates
-        x_screen = int((x_ndc + 1.0) * 0.5 * self.frame_width)
-        y_screen = int((1.0 - y_ndc) * 0.5 * self.frame_height)
+        if self.visible_frames:
+            starts, ends, rgba = frame_axes(self.data, self.visible_frames)
+            add_connectors(
+                scene, mujoco.mjtGeom.mjGEOM_LINE, starts, ends, rgba, AXIS_LINE_WIDTH
+            )
 
-        # Clamp to screen bounds
-        if 0 <= x_screen < self.frame_width and 0 <= y_screen < self.frame_height:
-            return (x_screen, y_screen)
+        if self.visible_coms:
+            coms = sorted(self.visible_coms)
+            add_markers(
+                scene,
+                mujoco.mjtGeom.mjGEOM_SPHERE,
+                self.data.xipos[coms],
+                0.02,
+                COM_RGBA,
+                ["COM"] * len(coms),
+            )
 
-        return None
+        cache = self.playback.cache if self.playback is not None else None
+        if cache is not None and cache.club_head_id is not None:
+            frame = self.playback.current_frame
+            if frame < cache.frames_ready:
+                add_markers(
+                    scene,
+                    mujoco.mjtGeom.mjGEOM_SPHERE,
+                    self.data.xpos[cache.club_head_id],
+                    0.01,
+                    SPEED_LABEL_RGBA,
+                    [f"{cache.club_head_speed[frame]:.1f} m/s"],
+                )
 
     def _enforce_interactive_constraints(self) -> None:
         """Ensure interactive constraints remain active during simulation."""
@@ -1536,71 +1394,3 @@ class MuJoCoSimWidget(QtWidgets.QWidget):
         else:
             self.visible_coms.add(body_id)
         self._render_once()
-
-    def _add_frame_and_com_overlays(self, rgb: np.ndarray) -> np.ndarray:
-        """Overlay coordinate frames and center of mass markers."""
-        cv2 = get_cv2()
-        if self.model is None or self.data is None or cv2 is None:
-            return rgb
-
-        img = rgb.copy()
-
-        def draw_line(
-            start_px: tuple[int, int],
-            end_px: tuple[int, int],
-            color: tuple[int, int, int],
-            thickness: int = 2,
-        ) -> None:
-            """Draw a line on the image."""
-            cv2.line(img, start_px, end_px, color, thickness)
-
-        # Draw Frames
-        axis_length = 0.2
-        for body_id in self.visible_frames:
-            pos = self.data.xpos[body_id].copy()
-            rot = self.data.xmat[body_id].reshape(3, 3)
-
-            origin = self._world_to_screen(pos)
-            if origin is None:
-                continue
-
-            # Draw X-axis (Red)
-            x_end = pos + rot[:, 0] * axis_length
-            x_px = self._world_to_screen(x_end)
-            if x_px:
-                # RGB: Red axis
-                draw_line(origin, x_px, (255, 0, 0))
-
-            # Draw Y-axis (Green)
-            y_end = pos + rot[:, 1] * axis_length
-            y_px = self._world_to_screen(y_end)
-            if y_px:
-                draw_line(origin, y_px, (0, 255, 0))
-
-            # Draw Z-axis (Blue)
-            z_end = pos + rot[:, 2] * axis_length
-            z_px = self._world_to_screen(z_end)
-            if z_px:
-                draw_line(origin, z_px, (0, 0, 255))
-
-        # Draw COMs
-        for body_id in self.visible_coms:
-            # xipos is center of mass in global frame
-            com_pos = self.data.xipos[body_id].copy()
-            screen_pos = self._world_to_screen(com_pos)
-            if screen_pos:
-                cv2.circle(img, screen_pos, 5, (0, 255, 255), -1)  # Cyan dot
-                cv2.circle(img, screen_pos, 7, (0, 0, 0), 1)  # Black outline
-
-                # Label
-                cv2.putText(
-                    img,
-                    "COM",
-                    (screen_pos[0] + 10, screen_pos[1]),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.4,
-                    (0, 255, 255),
-                    1,
-                )
-
-        return img
@@ -0,0 +1,460 @@
+"""Workspace and singularity atlases for a body of a MuJoCo model.
+
+An atlas samples the joint space, evaluates the translational Jacobian of a
+body (typically the club head) at every sample and bins the results into a
+voxel grid over the reached positions:
+- Joint samples are drawn in one vectorized call (uniform, Sobol or Latin
+  hypercube) over the ranges of the limited hinge and slide joints
+- Only ``mj_kinematics`` and ``mj_comPos`` run per sample; the Jacobian
+  needs no dynamics, so full ``mj_forward`` is skipped
+- Manipulability and condition numbers come from one batched SVD per chunk
+- Chunks are distributed across a process pool; each worker receives the
+  model once and reuses its own ``MjData``
+
+The resulting :class:`WorkspaceAtlas` answers reachability and conditioning
+queries for arbitrary points by direct voxel lookup.
+"""
+
+from __future__ import annotations
+
+import os
+import warnings
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import mujoco
+import numpy as np
+from scipy.stats import qmc
+
+SAMPLING_METHODS = ("uniform", "sobol", "latin_hypercube")
+
+DEFAULT_CHUNK_SIZE = 10_000  # Samples per worker job
+DEFAULT_VOXEL_SIZE = 0.05  # Atlas grid resolution [m]
+MIN_SINGULAR_VALUE = 1e-10  # Below this the condition number is infinite
+SINGULAR_VALUE_THRESHOLD = 1e-3  # Samples below this are near-singular
+DEFAULT_SINGULARITY_THRESHOLD = 30.0  # Condition number of near-singular samples
+
+
+@dataclass
+class KinematicSamples:
+    """Per-sample Jacobian metrics of one body.
+
+    All arrays share the leading sample dimension ``N``.
+    """
+
+    positions: np.ndarray  # (N, 3) Point position in world [m]
+    manipulability: np.ndarray  # (N,) Yoshikawa measure sqrt(det(J J^T))
+    condition_numbers: np.ndarray  # (N,) Ratio of extreme singular values
+    min_singular_values: np.ndarray  # (N,)
+
+    def near_singular(
+        self, threshold: float = DEFAULT_SINGULARITY_THRESHOLD
+    ) -> np.ndarray:
+        """Mask of samples close to a kinematic singularity (N,)."""
+        return (self.condition_numbers > threshold) | (
+            self.min_singular_values < SINGULAR_VALUE_THRESHOLD
+        )
+
+
+@dataclass
+class WorkspaceAtlas:
+    """Voxelized reachability and conditioning of a body's workspace.
+
+    Voxel ``(i, j, k)`` covers ``origin + voxel_size * [i, j, k]`` up to the
+    next index. Voxels no sample reached have zero count, zero
+    manipulability and an infinite condition number.
+    """
+
+    origin: np.ndarray  # (3,) Lower corner of the grid [m]
+    voxel_size: float  # Edge length of a voxel [m]
+    counts: np.ndarray  # (X, Y, Z) Samples per voxel
+    max_manipulability: np.ndarray  # (X, Y, Z) Best manipulability reached
+    min_condition_number: np.ndarray  # (X, Y, Z) Best conditioning reached
+    singular_counts: np.ndarray  # (X, Y, Z) Near-singular samples per voxel
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Number of voxels along x, y and z."""
+        return tuple(self.counts.shape)  # type: ignore[return-value]
+
+    @property
+    def num_samples(self) -> int:
+        """Total number of samples binned into the grid."""
+        return int(self.counts.sum())
+
+    @property
+    def reachable_volume(self) -> float:
+        """Volume of all voxels reached by at least one sample [m^3]."""
+        return float(np.count_nonzero(self.counts)) * self.voxel_size**3
+
+    def voxel_indices(self, points: np.ndarray) -> np.ndarray:
+        """Grid indices of points, with -1 rows for points outside the grid.
+
+        Args:
+            points: Positions (3,) or (M, 3)
+
+        Returns:
+            Integer indices (M, 3)
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        indices = np.floor((points - self.origin) / self.voxel_size).astype(np.intp)
+        outside = np.any((indices < 0) | (indices >= self.shape), axis=1)
+        indices[outside] = -1
+        return indices
+
+    def _lookup(self, grid: np.ndarray, points: np.ndarray, fill: Any) -> np.ndarray:
+        indices = self.voxel_indices(points)
+        inside = indices[:, 0] >= 0
+        values = np.full(len(indices), fill, dtype=grid.dtype)
+        values[inside] = grid[tuple(indices[inside].T)]
+        return values
+
+    def is_reachable(self, points: np.ndarray) -> np.ndarray:
+        """Whether any sample reached the voxel of each point (M,)."""
+        return self._lookup(self.counts, points, 0) > 0
+
+    def manipulability_at(self, points: np.ndarray) -> np.ndarray:
+        """Best manipulability reached in the voxel of each point (M,)."""
+        return self._lookup(self.max_manipulability, points, 0.0)
+
+    def condition_number_at(self, points: np.ndarray) -> np.ndarray:
+        """Best condition number reached in the voxel of each point (M,)."""
+        return self._lookup(self.min_condition_number, points, np.inf)
+
+    def save(self, path: str | Path) -> Path:
+        """Write the atlas to a compressed ``.npz`` archive.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        np.savez_compressed(
+            path,
+            origin=self.origin,
+            voxel_size=self.voxel_size,
+            counts=self.counts,
+            max_manipulability=self.max_manipulability,
+            min_condition_number=self.min_condition_number,
+            singular_counts=self.singular_counts,
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> WorkspaceAtlas:
+        """Read an atlas written by :meth:`save`."""
+        with np.load(path) as archive:
+            return cls(
+                origin=archive["origin"],
+                voxel_size=float(archive["voxel_size"]),
+                counts=archive["counts"],
+                max_manipulability=archive["max_manipulability"],
+                min_condition_number=archive["min_condition_number"],
+                singular_counts=archive["singular_counts"],
+            )
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: KinematicSamples,
+        voxel_size: float = DEFAULT_VOXEL_SIZE,
+        bounds: tuple[np.ndarray, np.ndarray] | None = None,
+        singularity_threshold: float = DEFAULT_SINGULARITY_THRESHOLD,
+    ) -> WorkspaceAtlas:
+        """Bin evaluated samples into a voxel grid.
+
+        Args:
+            samples: Evaluated samples
+            voxel_size: Edge length of a voxel [m]
+            bounds: Grid (lower, upper) corners; defaults to the sample
+                bounding box. Samples outside are dropped.
+            singularity_threshold: Condition number of near-singular samples
+
+        Returns:
+            The atlas
+        """
+        if voxel_size <= 0:
+            msg = "voxel_size must be positive"
+            raise ValueError(msg)
+        positions = samples.positions
+        if bounds is None:
+            if len(positions) == 0:
+                msg = "Cannot infer atlas bounds without samples"
+                raise ValueError(msg)
+            bounds = (positions.min(axis=0), positions.max(axis=0))
+        lower = np.asarray(bounds[0], dtype=float)
+        upper = np.asarray(bounds[1], dtype=float)
+        shape = np.maximum(np.ceil((upper - lower) / voxel_size), 1).astype(int)
+        # Points on the upper face belong to the last voxel
+        indices = np.minimum(
+            np.floor((positions - lower) / voxel_size).astype(np.intp), shape - 1
+        )
+        inside = np.all((positions >= lower) & (positions <= upper), axis=1)
+        flat = np.ravel_multi_index(tuple(indices[inside].T), tuple(shape))
+        size = int(np.prod(shape))
+
+        counts = np.bincount(flat, minlength=size)
+        singular = samples.near_singular(singularity_threshold)[inside]
+        singular_counts = np.bincount(
+            flat, weights=singular.astype(float), minlength=size
+        )
+        max_manipulability = np.zeros(size)
+        np.maximum.at(max_manipulability, flat, samples.manipulability[inside])
+        min_condition = np.full(size, np.inf)
+        np.minimum.at(min_condition, flat, samples.condition_numbers[inside])
+
+        grid = tuple(shape)
+        return cls(
+            origin=lower,
+            voxel_size=float(voxel_size),
+            counts=counts.reshape(grid),
+            max_manipulability=max_manipulability.reshape(grid),
+            min_condition_number=min_condition.reshape(grid),
+            singular_counts=singular_counts.astype(np.int64).reshape(grid),
+        )
+
+
+def sampled_joints(model: mujoco.MjModel) -> tuple[np.ndarray, np.ndarray]:
+    """qpos addresses and ranges of the joints varied by the samplers.
+
+    Only limited hinge and slide joints are sampled; all other coordinates
+    (including free and ball joints) stay at their base value.
+
+    Returns:
+        Tuple of (qpos addresses (D,), ranges (D, 2))
+    """
+    scalar = np.isin(
+        model.jnt_type, [mujoco.mjtJoint.mjJNT_HINGE, mujoco.mjtJoint.mjJNT_SLIDE]
+    )
+    joints = np.flatnonzero(scalar & model.jnt_limited.astype(bool))
+    return model.jnt_qposadr[joints], model.jnt_range[joints]
+
+
+def sample_configurations(
+    model: mujoco.MjModel,
+    num_samples: int,
+    method: str = "uniform",
+    seed: int | None = None,
+    base_qpos: np.ndarray | None = None,
+) -> np.ndarray:
+    """Draw joint configurations within the joint limits.
+
+    Args:
+        model: MuJoCo model
+        num_samples: Number of configurations
+        method: One of ``SAMPLING_METHODS``
+        seed: Random seed
+        base_qpos: Values of unsampled coordinates (default: ``qpos0``)
+
+    Returns:
+        Configurations (num_samples x nq)
+    """
+    if method not in SAMPLING_METHODS:
+        msg = f"method must be one of {SAMPLING_METHODS}, got '{method}'"
+        raise ValueError(msg)
+
+    addresses, ranges = sampled_joints(model)
+    base = model.qpos0 if base_qpos is None else np.asarray(base_qpos, dtype=float)
+    configs = np.tile(base, (num_samples, 1))
+    if num_samples == 0 or len(addresses) == 0:
+        return configs
+
+    dims = len(addresses)
+    if method == "sobol":
+        with warnings.catch_warnings():
+            # Balance is only guaranteed for powers of two; any count is usable
+            warnings.simplefilter("ignore", UserWarning)
+            unit = qmc.Sobol(dims, seed=seed).random(num_samples)
+    elif method == "latin_hypercube":
+        unit = qmc.LatinHypercube(dims, seed=seed).random(num_samples)
+    else:
+        unit = np.random.default_rng(seed).random((num_samples, dims))
+
+    configs[:, addresses] = ranges[:, 0] + unit * (ranges[:, 1] - ranges[:, 0])
+    return configs
+
+
+def evaluate_configurations(
+    model: mujoco.MjModel,
+    data: mujoco.MjData,
+    qpos: np.ndarray,
+    body_id: int,
+    point_offset: np.ndarray | None = None,
+) -> KinematicSamples:
+    """Translational Jacobian metrics of a body point for many configurations.
+
+    ``data`` is used as scratch space; its state is overwritten.
+
+    Args:
+        model: MuJoCo model
+        data: MuJoCo data
+        qpos: Configurations (N x nq)
+        body_id: Body to analyze
+        point_offset: Point in the body frame (default: body origin)
+
+    Returns:
+        Metrics for every configuration
+    """
+    qpos = np.atleast_2d(qpos)
+    offset = np.zeros(3) if point_offset is None else np.asarray(point_offset)
+    num_samples = len(qpos)
+    jacobians = np.empty((num_samples, 3, model.nv))
+    positions = np.empty((num_samples, 3))
+
+    for k in range(num_samples):
+        data.qpos[:] = qpos[k]
+        mujoco.mj_kinematics(model, data)
+        mujoco.mj_comPos(model, data)
+        positions[k] = data.xpos[body_id] + data.xmat[body_id].reshape(3, 3) @ offset
+        mujoco.mj_jac(model, data, jacobians[k], None, positions[k], body_id)
+
+    singular_values = np.linalg.svd(jacobians, compute_uv=False)
+    s_max = singular_values[:, 0]
+    s_min = singular_values[:, -1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        condition = np.where(s_min > MIN_SINGULAR_VALUE, s_max / s_min, np.inf)
+
+    return KinematicSamples(
+        positions=positions,
+        manipulability=np.prod(singular_values, axis=1),
+        condition_numbers=condition,
+        min_singular_values=s_min,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+_WORKER_STATE: tuple[mujoco.MjModel, mujoco.MjData] | None = None
+
+
+def _init_worker(model: mujoco.MjModel) -> None:
+    """Receive the model once per worker process."""
+    global _WORKER_STATE  # noqa: PLW0603
+    _WORKER_STATE = (model, mujoco.MjData(model))
+
+
+def _evaluate_job(args) -> KinematicSamples:
+    if _WORKER_STATE is None:
+        msg = "Worker model is not initialized"
+        raise RuntimeError(msg)
+    qpos, body_id, point_offset = args
+    model, data = _WORKER_STATE
+    return evaluate_configurations(model, data, qpos, body_id, point_offset)
+
+
+def _run_jobs(
+    job: Callable[[Any], Any],
+    jobs: Sequence[Any],
+    on_result: Callable[[int, Any], None],
+    model: mujoco.MjModel,
+    max_workers: int | None,
+) -> None:
+    """Run jobs in a process pool, reporting each result as it completes."""
+    if not jobs:
+        return
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        _init_worker(model)
+        for index, args in enumerate(jobs):
+            on_result(index, job(args))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(model,)
+    ) as executor:
+        futures = {executor.submit(job, args): i for i, args in enumerate(jobs)}
+        for future in as_completed(futures):
+            on_result(futures[future], future.result())
+
+
+def evaluate_samples(
+    model: mujoco.MjModel,
+    qpos: np.ndarray,
+    body_id: int,
+    point_offset: np.ndarray | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> KinematicSamples:
+    """Evaluate configurations in chunks across a process pool.
+
+    Args:
+        model: MuJoCo model (sent once to each worker)
+        qpos: Configurations (N x nq)
+        body_id: Body to analyze
+        point_offset: Point in the body frame (default: body origin)
+        chunk_size: Configurations per job
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        Metrics for every configuration, in input order
+    """
+    qpos = np.atleast_2d(np.asarray(qpos, dtype=float))
+    if chunk_size < 1:
+        msg = "chunk_size must be positive"
+        raise ValueError(msg)
+    num_samples = len(qpos)
+    result = KinematicSamples(
+        positions=np.empty((num_samples, 3)),
+        manipulability=np.empty(num_samples),
+        condition_numbers=np.empty(num_samples),
+        min_singular_values=np.empty(num_samples),
+    )
+    starts = range(0, num_samples, chunk_size)
+    jobs = [(qpos[s : s + chunk_size], body_id, point_offset) for s in starts]
+
+    def store(index: int, chunk: KinematicSamples) -> None:
+        rows = slice(starts[index], starts[index] + len(chunk.positions))
+        result.positions[rows] = chunk.positions
+        result.manipulability[rows] = chunk.manipulability
+        result.condition_numbers[rows] = chunk.condition_numbers
+        result.min_singular_values[rows] = chunk.min_singular_values
+
+    _run_jobs(_evaluate_job, jobs, store, model, max_workers)
+    return result
+
+
+def build_workspace_atlas(
+    model: mujoco.MjModel,
+    body_id: int,
+    num_samples: int = 100_000,
+    method: str = "sobol",
+    seed: int | None = None,
+    voxel_size: float = DEFAULT_VOXEL_SIZE,
+    bounds: tuple[np.ndarray, np.ndarray] | None = None,
+    point_offset: np.ndarray | None = None,
+    singularity_threshold: float = DEFAULT_SINGULARITY_THRESHOLD,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> WorkspaceAtlas:
+    """Sample the joint space and voxelize the workspace of a body.
+
+    Args:
+        model: MuJoCo model
+        body_id: Body to analyze (e.g. the club head)
+        num_samples: Number of joint configurations
+        method: Sampling method, one of ``SAMPLING_METHODS``
+        seed: Random seed
+        voxel_size: Edge length of a voxel [m]
+        bounds: Grid (lower, upper) corners (default: sample bounding box)
+        point_offset: Point in the body frame (default: body origin)
+        singularity_threshold: Condition number of near-singular samples
+        chunk_size: Configurations per worker job
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        The workspace atlas
+    """
+    qpos = sample_configurations(model, num_samples, method, seed)
+    samples = evaluate_samples(
+        model, qpos, body_id, point_offset, chunk_size, max_workers
+    )
+    return WorkspaceAtlas.from_samples(
+        samples, voxel_size, bounds, singularity_threshold
+    )
@@ -10,7 +10,10 @@ from mujoco_humanoid_golf.advanced_control import (
     ImpedanceParameters,
     TrajectoryGenerator,
 )
-from mujoco_humanoid_golf.models import DOUBLE_PENDULUM_XML
+from mujoco_humanoid_golf.models import (
+    DOUBLE_PENDULUM_XML,
+    FULL_BODY_GOLF_SWING_XML,
+)
 
 
 class TestControlMode:
@@ -24,6 +27,7 @@ class TestControlMode:
         assert ControlMode.HYBRID.value == "hybrid"
         assert ControlMode.COMPUTED_TORQUE.value == "computed_torque"
         assert ControlMode.TASK_SPACE.value == "task_space"
+        assert ControlMode.PREDICTIVE.value == "predictive"
 
 
 class TestImpedanceParameters:
@@ -379,6 +383,66 @@ class TestAdvancedController:
         assert body_id is None
 
 
+class TestTaskSpaceFullBody:
+    """Task-space and operational space control on the full-body model."""
+
+    @pytest.fixture()
+    def controller(self) -> AdvancedController:
+        """Controller on a bent, moving full-body pose."""
+        model = mujoco.MjModel.from_xml_string(FULL_BODY_GOLF_SWING_XML)
+        data = mujoco.MjData(model)
+        rng = np.random.default_rng(0)
+        data.qpos[7:] = rng.uniform(-0.3, 0.3, model.nq - 7)
+        data.qvel[:] = rng.standard_normal(model.nv)
+        mujoco.mj_forward(model, data)
+        return AdvancedController(model, data)
+
+    def test_nullspace_is_dynamically_consistent(self, controller) -> None:
+        """Projected torques produce no club head acceleration."""
+        model, data = controller.model, controller.data
+        assert controller.club_head_id is not None
+
+        jacp, lambda_matrix = controller._task_space_terms(controller.club_head_id)
+        torque = np.random.default_rng(1).standard_normal(model.nv)
+        projected = controller._project_nullspace(torque.copy(), jacp, lambda_matrix)
+
+        qacc = np.zeros((1, model.nv))
+        mujoco.mj_solveM(model, data, qacc, projected[np.newaxis])
+        np.testing.assert_allclose(jacp @ qacc[0], 0.0, atol=1e-9)
+
+        controller.set_control_mode(ControlMode.TASK_SPACE)
+        tau = controller.compute_control()
+        assert tau.shape == (model.nu,)
+        assert np.all(np.isfinite(tau))
+
+    def test_operational_space_matches_dense(self, controller) -> None:
+        """Factorization-based OSC equals the dense-inverse formulation."""
+        model, data = controller.model, controller.data
+        body_id = controller.club_head_id
+        tau = controller.compute_operational_space_control(
+            np.zeros(3), np.zeros(3), np.zeros(3), body_id
+        )
+
+        mass = np.zeros((model.nv, model.nv))
+        for row, unit in zip(mass, np.eye(model.nv), strict=True):
+            mujoco.mj_mulM(model, data, row, unit)
+        jacp = np.zeros((3, model.nv))
+        mujoco.mj_jacBody(model, data, jacp, None, body_id)
+        mass_inv = np.linalg.inv(mass)
+        lambda_matrix = np.linalg.inv(jacp @ mass_inv @ jacp.T)
+        j_bar = mass_inv @ jacp.T @ lambda_matrix
+        force = lambda_matrix @ (-100.0 * data.xpos[body_id] - 20.0 * jacp @ data.qvel)
+        nullspace = np.eye(model.nv) - jacp.T @ j_bar.T
+        expected = jacp.T @ force + nullspace @ (-10.0 * data.qvel) + data.qfrc_bias
+
+        np.testing.assert_allclose(tau, expected[: model.nu], atol=1e-9)
+        # Results are copies, not views of the controller workspaces
+        again = controller.compute_operational_space_control(
+            np.ones(3), np.zeros(3), np.zeros(3), body_id
+        )
+        assert not np.shares_memory(tau, again)
+
+
 class TestTrajectoryGenerator:
     """Tests for TrajectoryGenerator class."""
 
@@ -327,6 +327,25 @@ class TestSwingRecorder:
 
         assert len(recorder.frames) == 0
 
+    def test_version_tracks_changes(self) -> None:
+        """Test that the version changes only when recorded data changes."""
+        recorder = SwingRecorder()
+        version = recorder.version
+
+        recorder.record_frame(BiomechanicalData(time=0.0))
+        assert recorder.version == version
+
+        recorder.start_recording()
+        recorder.record_frame(BiomechanicalData(time=0.0))
+        recorder.stop_recording()
+        assert recorder.version > version
+
+        version = recorder.version
+        recorder.get_time_series("time")
+        assert recorder.version == version
+        recorder.reset()
+        assert recorder.version > version
+
     def test_get_time_series_scalar(self) -> None:
         """Test getting time series for scalar field."""
         recorder = SwingRecorder()
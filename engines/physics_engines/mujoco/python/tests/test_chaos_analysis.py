@@ -0,0 +1,112 @@
+"""Tests for chaos analysis of the driven pendulum."""
+
+import mujoco
+import numpy as np
+import pytest
+from mujoco_humanoid_golf.chaos_analysis import (
+    DrivenPendulum,
+    ForcingParameters,
+    basin_of_attraction,
+    bifurcation_diagram,
+    lyapunov_sweep,
+)
+from mujoco_humanoid_golf.models import CHAOTIC_PENDULUM_XML
+
+
+@pytest.fixture()
+def pendulum() -> DrivenPendulum:
+    """Driven pendulum with its own compiled model."""
+    return DrivenPendulum(mujoco.MjModel.from_xml_string(CHAOTIC_PENDULUM_XML))
+
+
+def test_section_matches_stepped_simulation(pendulum) -> None:
+    """Rollout sections equal stepping with the sinusoidal base control."""
+    forcing = ForcingParameters(frequency=3.0, amplitude=15.0)
+    points = pendulum.poincare_section(forcing, (0.5, 0.0), 2, 3)
+    steps = round(1.0 / (3.0 * 0.001))
+    assert pendulum.period == pytest.approx(1.0 / 3.0)
+    assert pendulum.model.opt.timestep * steps == pytest.approx(1.0 / 3.0)
+
+    model = pendulum.model
+    data = mujoco.MjData(model)
+    data.qpos[1] = 0.5
+    expected = []
+    for step in range(5 * steps):
+        data.ctrl[0] = 15.0 * np.sin(2 * np.pi * step / steps)
+        mujoco.mj_step(model, data)
+        if step >= 2 * steps and (step + 1) % steps == 0:
+            theta = (data.qpos[1] + np.pi) % (2 * np.pi) - np.pi
+            expected.append([theta, data.qvel[1]])
+    np.testing.assert_allclose(points, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_lyapunov_exponent_sign(pendulum) -> None:
+    """Strong forcing is chaotic; without forcing nearby states do not diverge."""
+    chaotic = pendulum.largest_lyapunov_exponent(
+        ForcingParameters(frequency=2.0, amplitude=20.0), (0.5, 0.0), 10, 40
+    )
+    damped = pendulum.largest_lyapunov_exponent(
+        ForcingParameters(frequency=2.0, amplitude=0.0), (0.5, 0.0), 10, 40
+    )
+    assert chaotic > 0.5
+    assert damped < 0.1
+
+
+def test_bifurcation_streams_and_resumes(tmp_path) -> None:
+    """Partial results are written to disk and only missing rows recomputed."""
+    output = tmp_path / "bifurcation.npy"
+    values = [4.0, 5.0, 6.0]
+    kwargs = {"transient_periods": 2, "num_periods": 4, "output_path": output}
+
+    result = bifurcation_diagram(values, max_workers=2, **kwargs)
+    assert result.sections.shape == (3, 4, 2)
+    assert not np.isnan(result.sections).any()
+    np.testing.assert_array_equal(np.load(output), result.sections)
+
+    # Clear one row as if the sweep had been interrupted
+    partial = np.load(output, mmap_mode="r+")
+    partial[1] = np.nan
+    partial.flush()
+    del partial
+    resumed = bifurcation_diagram(values, max_workers=1, **kwargs)
+    np.testing.assert_allclose(resumed.sections, result.sections)
+
+    # A different sweep of the same shape must not reuse the stored rows
+    assert output.with_suffix(".json").exists()
+    other = [4.0, 5.0, 7.0]
+    changed = bifurcation_diagram(other, max_workers=1, **kwargs)
+    fresh = bifurcation_diagram(
+        other, max_workers=1, transient_periods=2, num_periods=4
+    )
+    np.testing.assert_allclose(changed.sections, fresh.sections)
+    assert not np.allclose(changed.sections[2], result.sections[2])
+
+    with pytest.raises(ValueError, match="parameter"):
+        bifurcation_diagram(values, parameter="damping")
+
+
+def test_lyapunov_sweep_and_basin() -> None:
+    """Sweeps return one value per point and a damped basin has one attractor."""
+    exponents = lyapunov_sweep(
+        [0.0, 20.0],
+        "amplitude",
+        ForcingParameters(frequency=2.0),
+        transient_periods=5,
+        num_periods=20,
+        max_workers=1,
+    )
+    assert exponents.shape == (2,)
+    assert exponents[0] < exponents[1]
+
+    basin = basin_of_attraction(
+        [-0.2, 0.2],
+        [0.0],
+        ForcingParameters(frequency=2.0, amplitude=0.0),
+        transient_periods=100,
+        num_periods=2,
+        tolerance=0.2,
+        max_workers=1,
+    )
+    assert basin.labels.shape == (1, 2)
+    assert len(basin.attractors) == 1
+    np.testing.assert_array_equal(basin.labels, 0)
@@ -0,0 +1,161 @@
+"""Tests for the humanoid_golf linearization and LQR gain synthesis."""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+
+mujoco = pytest.importorskip("mujoco")
+
+# Load the Docker package module directly; its siblings need dm_control
+file_path = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "../../docker/src/humanoid_golf/linearization.py",
+    )
+)
+spec = importlib.util.spec_from_file_location("humanoid_linearization", file_path)
+assert spec is not None
+assert spec.loader is not None
+linearization = importlib.util.module_from_spec(spec)
+sys.modules["humanoid_linearization"] = linearization
+spec.loader.exec_module(linearization)
+
+ARM_XML = """
+<mujoco>
+  <option timestep="0.005"/>
+  <worldbody>
+    <body>
+      <joint name="shoulder" type="hinge" axis="0 1 0" damping="0.1"/>
+      <geom type="capsule" fromto="0 0 0 0 0 0.5" size="0.04"/>
+      <body pos="0 0 0.5">
+        <joint name="elbow" type="hinge" axis="0 1 0" damping="0.1"/>
+        <geom type="capsule" fromto="0 0 0 0 0 0.4" size="0.03"/>
+      </body>
+    </body>
+  </worldbody>
+  <actuator>
+    <motor joint="shoulder" gear="10"/>
+    <motor joint="elbow" gear="5"/>
+  </actuator>
+</mujoco>
+"""
+
+FLOATING_XML = """
+<mujoco>
+  <worldbody>
+    <body pos="0 0 1">
+      <freejoint/>
+      <geom size="0.1"/>
+      <body pos="0 0 0.2">
+        <joint name="hinge" type="hinge" axis="0 1 0"/>
+        <geom type="capsule" fromto="0 0 0 0 0 0.3" size="0.03"/>
+      </body>
+    </body>
+  </worldbody>
+  <actuator>
+    <motor joint="hinge"/>
+  </actuator>
+</mujoco>
+"""
+
+
+@pytest.fixture
+def arm():
+    """Fixed-base two-link arm balanced upright."""
+    return mujoco.MjModel.from_xml_string(ARM_XML)
+
+
+def reference_swing(model, num_knots: int = 40, amplitude: float = 0.3):
+    """Open-loop rollout of a smooth torque profile."""
+    data = mujoco.MjData(model)
+    times, qpos, qvel, ctrl = [], [], [], []
+    for k in range(num_knots):
+        u = amplitude * np.sin(np.pi * k / num_knots) * np.ones(model.nu)
+        times.append(data.time)
+        qpos.append(data.qpos.copy())
+        qvel.append(data.qvel.copy())
+        ctrl.append(u)
+        data.ctrl[:] = u
+        mujoco.mj_step(model, data)
+    return tuple(np.array(a) for a in (times, qpos, qvel, ctrl))
+
+
+def test_state_error_uses_tangent_space() -> None:
+    """Free-joint orientation errors are rotation vectors, not quaternion gaps."""
+    model = mujoco.MjModel.from_xml_string(FLOATING_XML)
+    qpos = model.qpos0.copy()
+    qpos_ref = qpos.copy()
+    angle = 0.2
+    qpos_ref[3:7] = [np.cos(angle / 2), 0.0, 0.0, np.sin(angle / 2)]
+
+    err = linearization.state_error(
+        model, qpos, np.zeros(model.nv), qpos_ref, np.zeros(model.nv)
+    )
+    assert err.shape == (2 * model.nv,)
+    np.testing.assert_allclose(err[3:6], [0.0, 0.0, angle], atol=1e-12)
+    assert linearization.actuated_dofs(model).tolist() == [6]
+
+
+def test_regulator_stabilizes_and_caches(arm, tmp_path, monkeypatch) -> None:
+    """DARE gains stabilize the linearized arm and are reloaded from disk."""
+    cache = linearization.GainCache(str(tmp_path))
+    gains = linearization.regulator_gains(arm, arm.qpos0, cache=cache)
+
+    A, B = linearization.linearize(arm, arm.qpos0, np.zeros(arm.nv), gains.ctrl)
+    closed_loop = A - B @ gains.K
+    assert np.max(np.abs(np.linalg.eigvals(closed_loop))) < 1.0
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("gains should come from the cache")
+
+    monkeypatch.setattr(linearization, "linearize", fail)
+    cached = linearization.regulator_gains(arm, arm.qpos0, cache=cache)
+    np.testing.assert_array_equal(cached.K, gains.K)
+    np.testing.assert_array_equal(cached.ctrl, gains.ctrl)
+
+
+def test_floating_base_gains_skip_root() -> None:
+    """Only actuated DOFs get feedback on a floating-base model."""
+    model = mujoco.MjModel.from_xml_string(FLOATING_XML)
+    model.opt.gravity[:] = 0.0
+    gains = linearization.regulator_gains(model, model.qpos0)
+
+    assert gains.K.shape == (1, 2 * model.nv)
+    assert np.all(gains.K[:, [*range(6), *range(7, 13)]] == 0.0)
+    assert gains.K[0, 6] > 0 and gains.K[0, 13] > 0
+
+
+def test_riccati_recursion_converges_to_dare(arm) -> None:
+    """A long horizon of constant dynamics recovers the infinite-horizon gain."""
+    A, B = linearization.linearize(arm, arm.qpos0, np.zeros(arm.nv), np.zeros(arm.nu))
+    Q, R = linearization.cost_weights(arm)
+
+    gains = linearization.riccati_recursion(
+        np.repeat(A[None], 3000, axis=0), np.repeat(B[None], 3000, axis=0), Q, R
+    )
+    np.testing.assert_allclose(
+        gains[0], linearization.dare_gain(A, B, Q, R), rtol=1e-6, atol=1e-8
+    )
+
+
+def test_gain_library_matches_serial(arm, tmp_path) -> None:
+    """Parallel synthesis gives the same gains as one-by-one synthesis."""
+    references = {
+        "soft": reference_swing(arm, amplitude=0.2),
+        "hard": reference_swing(arm, amplitude=0.5),
+    }
+    cache = linearization.GainCache(str(tmp_path))
+    library = linearization.synthesize_gain_library(
+        arm, references, cache=cache, max_workers=2
+    )
+
+    assert list(library) == ["soft", "hard"]
+    for name, reference in references.items():
+        serial = linearization.tracking_gains(arm, *reference)
+        assert library[name].K.shape == (40, arm.nu, 2 * arm.nv)
+        np.testing.assert_allclose(library[name].K, serial.K)
+    assert len(list(tmp_path.glob("*.npz"))) == 2
@@ -0,0 +1,166 @@
+"""Tests for live, incrementally updated plotting."""
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from mujoco_humanoid_golf.biomechanics import SwingRecorder
+from mujoco_humanoid_golf.live_plotting import (
+    LIVE_PLOT_SPECS,
+    LivePlot,
+    MinMaxDecimator,
+    SeriesBuffer,
+    decimate_minmax,
+)
+from shared.python.biomechanics_data import BiomechanicalData
+
+DT = 1e-3
+
+
+def record(recorder: SwingRecorder, start: int, count: int) -> None:
+    """Append ``count`` frames of a two-joint swing starting at sample ``start``."""
+    for k in range(start, start + count):
+        t = k * DT
+        recorder.record_frame(
+            BiomechanicalData(
+                time=t,
+                joint_positions=np.array([np.sin(5 * t), np.cos(3 * t)]),
+                club_head_speed=None if k % 2 else 10.0 * t,
+            )
+        )
+
+
+@pytest.fixture
+def recorder() -> SwingRecorder:
+    """Recorder in the recording state."""
+    recorder = SwingRecorder()
+    recorder.start_recording()
+    return recorder
+
+
+@pytest.fixture
+def figure() -> Figure:
+    """Figure attached to a headless Agg canvas."""
+    fig = Figure(figsize=(4, 3), dpi=100)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def test_decimation_preserves_column_extrema() -> None:
+    """Every pixel column keeps its minimum and maximum sample."""
+    rng = np.random.default_rng(0)
+    times = np.sort(rng.uniform(0.0, 1.0, 10_000))
+    values = rng.standard_normal((10_000, 2))
+
+    x, y = decimate_minmax(times, values, 0.0, 1.0, 100)
+
+    assert x.shape == (200,)
+    assert y.shape == (200, 2)
+    np.testing.assert_allclose(y.min(axis=0), values.min(axis=0))
+    np.testing.assert_allclose(y.max(axis=0), values.max(axis=0))
+
+
+def test_incremental_decimation_matches_one_shot() -> None:
+    """Folding samples in chunks equals decimating them all at once."""
+    times = np.linspace(0.0, 2.0, 5_001)
+    values = np.column_stack((np.sin(times * 40), np.cos(times * 7)))
+
+    decimator = MinMaxDecimator(2, 0.0, 2.0, 64)
+    for chunk in np.array_split(np.arange(times.size), 17):
+        decimator.add(times[chunk], values[chunk])
+
+    expected = decimate_minmax(times, values, 0.0, 2.0, 64)
+    np.testing.assert_array_equal(decimator.xy()[0], expected[0])
+    np.testing.assert_array_equal(decimator.xy()[1], expected[1])
+
+
+def test_decimated_monotonic_series_stays_monotonic() -> None:
+    """Column pairs follow the direction of the signal instead of zigzagging."""
+    times = np.linspace(0.0, 1.0, 1_000)
+    values = np.column_stack((times**2, -times))
+
+    _, y = decimate_minmax(times, values, 0.0, 1.0, 50)
+
+    assert np.all(np.diff(y[:, 0]) >= 0.0)
+    assert np.all(np.diff(y[:, 1]) <= 0.0)
+
+
+def test_series_buffer_grows() -> None:
+    """Appends past the initial capacity keep all samples in order."""
+    buffer = SeriesBuffer(initial_capacity=4)
+    for k in range(5):
+        buffer.append(np.arange(3) + 3 * k, np.full((3, 1), k))
+
+    np.testing.assert_array_equal(buffer.times, np.arange(15))
+    assert buffer.values[-1, 0] == 4
+
+
+def test_live_plot_appends_only_new_frames(
+    recorder: SwingRecorder, figure: Figure
+) -> None:
+    """Updates consume new frames and fall back to blitting."""
+    live = LivePlot(figure, recorder, LIVE_PLOT_SPECS["Joint Angles"], ["a", "b"])
+    assert live.update() is False
+
+    record(recorder, 0, 50)
+    assert live.update() is True
+    assert len(live.lines) == 2
+    assert live.buffer.size == 50
+    assert live._background is not None
+
+    record(recorder, 50, 10)
+    assert live.update() is True
+    assert live.buffer.size == 60
+    np.testing.assert_allclose(
+        live.lines[1].get_ydata()[-1], np.rad2deg(np.cos(3 * 59 * DT))
+    )
+    assert [line.get_label() for line in live.lines] == ["a", "b"]
+
+
+def test_long_recording_is_decimated(recorder: SwingRecorder, figure: Figure) -> None:
+    """Drawn points stay bounded by the axes width in pixels."""
+    live = LivePlot(figure, recorder, LIVE_PLOT_SPECS["Joint Angles"])
+    for start in range(0, 20_000, 2_000):
+        record(recorder, start, 2_000)
+        live.update()
+
+    n_columns = int(live.ax.bbox.width)
+    assert live.buffer.size == 20_000
+    assert len(live.lines[0].get_xdata()) <= 2 * n_columns
+    assert live.ax.get_xlim()[1] >= 20_000 * DT
+
+
+def test_missing_samples_and_restart(recorder: SwingRecorder, figure: Figure) -> None:
+    """None values are skipped and a restarted recording resets the plot."""
+    live = LivePlot(figure, recorder, LIVE_PLOT_SPECS["Club Head Speed"])
+    record(recorder, 0, 20)
+    live.update()
+    assert live.buffer.size == 10
+
+    recorder.start_recording()
+    record(recorder, 0, 4)
+    live.update()
+    assert live.buffer.size == 2
+
+
+def test_series_count_change_restarts_once(
+    recorder: SwingRecorder, figure: Figure
+) -> None:
+    """A width change mid-recording restarts the plot without re-reading frames."""
+    live = LivePlot(figure, recorder, LIVE_PLOT_SPECS["Joint Angles"])
+    record(recorder, 0, 20)
+    live.update()
+
+    # Width changes between updates and again within one batch
+    for k, width in ((20, 3), (21, 3), (22, 4), (23, 4)):
+        recorder.record_frame(
+            BiomechanicalData(time=k * DT, joint_positions=np.full(width, 0.1 * k))
+        )
+        if k in (21, 23):
+            assert live.update() is True
+    assert len(live.lines) == 4
+    np.testing.assert_allclose(live.buffer.times, [22 * DT, 23 * DT])
+
+    record_count = recorder.get_num_frames()
+    assert live.update() is False
+    assert live._consumed == record_count
@@ -0,0 +1,75 @@
+"""Tests for MuJoCo manipulability ellipsoids."""
+
+import mujoco
+import numpy as np
+import pytest
+from mujoco_humanoid_golf.manipulability import EllipsoidService
+from mujoco_humanoid_golf.models import TRIPLE_PENDULUM_XML
+
+
+@pytest.fixture()
+def pendulum() -> tuple[mujoco.MjModel, mujoco.MjData]:
+    """Triple pendulum away from its singular straight configuration."""
+    model = mujoco.MjModel.from_xml_string(TRIPLE_PENDULUM_XML)
+    data = mujoco.MjData(model)
+    data.qpos[:] = [0.3, -0.5, 0.8]
+    mujoco.mj_forward(model, data)
+    return model, data
+
+
+def dense_core(model: mujoco.MjModel, data: mujoco.MjData, body_id: int) -> np.ndarray:
+    """Reference J M^-1 J^T from the dense mass matrix."""
+    mass = np.zeros((model.nv, model.nv))
+    column = np.zeros(model.nv)
+    for i in range(model.nv):
+        unit = np.zeros(model.nv)
+        unit[i] = 1.0
+        mujoco.mj_mulM(model, data, column, unit)
+        mass[:, i] = column
+    jacp = np.zeros((3, model.nv))
+    mujoco.mj_jacBody(model, data, jacp, None, body_id)
+    return jacp @ np.linalg.inv(mass) @ jacp.T
+
+
+def test_compute_matches_dense_inverse_and_caches(pendulum) -> None:
+    """mj_solveM gives the dense result; unchanged qpos skips recomputation."""
+    model, data = pendulum
+    body_id = model.nbody - 1
+    service = EllipsoidService(model)
+
+    ellipsoid = service.compute(data, body_id)
+    core = ellipsoid.axes @ np.diag(ellipsoid.eigenvalues) @ ellipsoid.axes.T
+    np.testing.assert_allclose(core, dense_core(model, data, body_id), atol=1e-10)
+    np.testing.assert_allclose(ellipsoid.center, data.xpos[body_id])
+
+    assert service.compute(data, body_id) is ellipsoid
+    data.qpos[0] += 0.1
+    mujoco.mj_forward(model, data)
+    moved = service.compute(data, body_id)
+    assert moved is not ellipsoid
+    assert not np.allclose(moved.center, ellipsoid.center)
+
+
+def test_trajectory_matches_live_computation(pendulum) -> None:
+    """Batch trajectory ellipsoids equal per-frame mj_forward results."""
+    model, data = pendulum
+    body_id = model.nbody - 1
+    qpos = np.column_stack(
+        [np.linspace(0.0, 1.0, 5), np.linspace(-0.5, 0.5, 5), np.full(5, 0.4)]
+    )
+    service = EllipsoidService(model)
+    trajectory = service.compute_trajectory(qpos, body_id)
+    assert trajectory.eigenvalues.shape == (5, 3)
+
+    live = EllipsoidService(model)
+    for frame, q in enumerate(qpos):
+        data.qpos[:] = q
+        mujoco.mj_forward(model, data)
+        expected = live.compute(data, body_id)
+        np.testing.assert_allclose(
+            trajectory.eigenvalues[frame], expected.eigenvalues, atol=1e-10
+        )
+        np.testing.assert_allclose(trajectory.centers[frame], expected.center)
+
+    with pytest.raises(ValueError, match="nq"):
+        service.compute_trajectory(qpos[:, :2], body_id)
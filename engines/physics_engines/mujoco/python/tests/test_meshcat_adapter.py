@@ -0,0 +1,96 @@
+"""Tests for delta-only Meshcat streaming."""
+
+import mujoco
+import numpy as np
+import pytest
+
+meshcat = pytest.importorskip("meshcat")
+
+from mujoco_humanoid_golf import meshcat_adapter  # noqa: E402
+from mujoco_humanoid_golf.meshcat_adapter import MuJoCoMeshcatAdapter  # noqa: E402
+from mujoco_humanoid_golf.models import DOUBLE_PENDULUM_XML  # noqa: E402
+
+
+class RecordingWindow:
+    """Meshcat window that records commands instead of serving them."""
+
+    web_url = "http://127.0.0.1:7000/static/"
+
+    def __init__(self) -> None:
+        self.commands = []
+
+    def send(self, command) -> None:
+        self.commands.append(command.lower())
+
+    def clear(self) -> None:
+        self.commands.clear()
+
+    def of_type(self, kind: str) -> list[dict]:
+        return [c for c in self.commands if c["type"] == kind]
+
+
+@pytest.fixture()
+def streaming(monkeypatch):
+    """Adapter on the double pendulum, sending to a recording window."""
+    window = RecordingWindow()
+    visualizer = meshcat.Visualizer
+    monkeypatch.setattr(
+        meshcat_adapter.meshcat, "Visualizer", lambda: visualizer(window=window)
+    )
+    model = mujoco.MjModel.from_xml_string(DOUBLE_PENDULUM_XML)
+    data = mujoco.MjData(model)
+    mujoco.mj_forward(model, data)
+    adapter = MuJoCoMeshcatAdapter(model, max_rate=1e9)
+    window.clear()
+    return adapter, model, data, window
+
+
+def sent_paths(window: RecordingWindow) -> list[str]:
+    """Object paths of the recorded set_transform commands."""
+    return [c["path"] for c in window.of_type("set_transform")]
+
+
+def test_only_moved_geoms_are_sent(streaming) -> None:
+    adapter, model, data, window = streaming
+
+    assert adapter.update(data)
+    assert len(sent_paths(window)) == model.ngeom
+    assert not window.of_type("set_animation")
+
+    # Unchanged poses send nothing
+    window.clear()
+    assert not adapter.update(data)
+    assert not window.commands
+
+    # Moving the wrist only re-sends the geoms downstream of it
+    data.qpos[1] += 0.1
+    mujoco.mj_forward(model, data)
+    assert adapter.update(data)
+    assert 0 < len(sent_paths(window)) < model.ngeom
+
+
+def test_rate_limit_sends_latest_pose(streaming) -> None:
+    adapter, model, data, window = streaming
+    adapter.max_rate = 1e-9  # Only the first update and explicit flushes send
+
+    assert adapter.update(data)
+    window.clear()
+    for _ in range(3):
+        data.qpos[0] += 0.05
+        mujoco.mj_forward(model, data)
+        assert not adapter.update(data)
+    assert not window.commands
+
+    # Each moved geom is sent once, at its final pose
+    assert adapter.update(data, flush=True)
+    paths = sent_paths(window)
+    assert 0 < len(paths) == len(set(paths)) < model.ngeom  # The floor stays put
+    assert not window.of_type("set_animation")
+
+    final = adapter._geom_transforms(data)
+    np.testing.assert_allclose(adapter._sent_transforms, final)
+    path = f"/meshcat/visuals/{adapter._geom_paths[-1]}"
+    (command,) = (c for c in window.of_type("set_transform") if c["path"] == path)
+    np.testing.assert_allclose(
+        np.reshape(command["matrix"], (4, 4)).T, final[-1], atol=1e-6
+    )
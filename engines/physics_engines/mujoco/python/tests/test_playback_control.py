@@ -0,0 +1,122 @@
+"""Tests for playback control and the playback kinematics cache."""
+
+import mujoco
+import numpy as np
+import pytest
+from mujoco_humanoid_golf.manipulability import EllipsoidService
+from mujoco_humanoid_golf.models import DOUBLE_PENDULUM_XML
+from mujoco_humanoid_golf.playback_control import (
+    CACHED_FIELDS,
+    PlaybackCache,
+    PlaybackController,
+)
+
+
+@pytest.fixture()
+def recording() -> tuple[mujoco.MjModel, PlaybackController]:
+    """Short driven double pendulum recording."""
+    model = mujoco.MjModel.from_xml_string(DOUBLE_PENDULUM_XML)
+    data = mujoco.MjData(model)
+    num_frames = 50
+    states = np.zeros((num_frames, model.nq + model.nv))
+    controls = np.zeros((num_frames, model.nu))
+    for i in range(num_frames):
+        data.ctrl[:] = 5.0 * np.sin(0.2 * i)
+        mujoco.mj_step(model, data)
+        states[i] = np.concatenate([data.qpos, data.qvel])
+        controls[i] = data.ctrl
+    times = np.arange(num_frames) * model.opt.timestep
+    return model, PlaybackController(times, states, controls)
+
+
+def test_cached_frames_match_forward(recording) -> None:
+    """Applying a cached frame reproduces mj_forward without physics."""
+    model, controller = recording
+    cache = controller.build_cache(model, background=False)
+    assert cache.is_complete
+
+    reference = mujoco.MjData(model)
+    target = mujoco.MjData(model)
+    for frame in (0, 17, 49):
+        state = controller.states[frame]
+        reference.qpos[:] = state[: model.nq]
+        reference.qvel[:] = state[model.nq :]
+        reference.ctrl[:] = controller.controls[frame]
+        mujoco.mj_forward(model, reference)
+        mujoco.mj_rnePostConstraint(model, reference)
+
+        controller.seek_to_frame(frame)
+        assert controller.apply_current_frame(target)
+        for name in CACHED_FIELDS:
+            np.testing.assert_allclose(
+                getattr(target, name), getattr(reference, name), rtol=1e-5, atol=1e-5
+            )
+
+    # The double pendulum has no club head body, so no speed is recorded
+    assert cache.club_head_id is None
+    assert np.all(np.isnan(cache.club_head_speed))
+    # Planar chain: J M^-1 J^T is positive semidefinite with rank 2
+    assert np.all(cache.ellipsoid_eigvals > -1e-6)
+    assert np.all(cache.ellipsoid_eigvals[:, -1] > 0)
+
+
+def test_cached_ellipsoids_and_controls(recording) -> None:
+    """Cached ellipsoids match the live service; controls are restored."""
+    model, controller = recording
+    cache = controller.build_cache(model, background=False)
+    body_id = cache.ellipsoid_body_id
+    qpos = controller.states[:, : model.nq]
+    expected = EllipsoidService(model).compute_trajectory(qpos, body_id)
+
+    for frame in (0, 25, 49):
+        ellipsoid = cache.ellipsoid(frame)
+        np.testing.assert_allclose(
+            ellipsoid.eigenvalues, expected.eigenvalues[frame], rtol=1e-4, atol=1e-6
+        )
+        np.testing.assert_allclose(
+            ellipsoid.center, expected.centers[frame], rtol=1e-5, atol=1e-6
+        )
+    assert cache.ellipsoid(cache.num_frames) is None
+
+    data = mujoco.MjData(model)
+    controller.seek_to_frame(30)
+    controller.apply_current_frame(data)
+    np.testing.assert_allclose(data.ctrl, controller.controls[30])
+
+
+def test_background_build_and_fallback(recording) -> None:
+    """Uncached frames fall back to mj_forward until the build completes."""
+    model, controller = recording
+    pending = PlaybackCache(model, controller.states, controller.controls)
+    data = mujoco.MjData(model)
+    assert not pending.apply(data, 0)
+    assert pending.progress == 0.0
+
+    controller.cache = pending
+    controller.seek_to_frame(10)
+    assert not controller.apply_current_frame(data)
+    np.testing.assert_allclose(data.qpos, controller.states[10, : model.nq])
+
+    cache = controller.build_cache(model)
+    assert cache.wait(timeout=30.0)
+    assert controller.apply_current_frame(data)
+
+
+def test_reverse_playback(recording) -> None:
+    """Negative speed plays backwards and stops at the first frame."""
+    _model, controller = recording
+    finished = []
+    controller.on_playback_finished = lambda: finished.append(True)
+    controller.seek_to_frame(10)
+    controller.set_speed(-2.0)
+    assert controller.speed == -2.0
+
+    frame_time = controller.duration / (controller.num_frames - 1)
+    controller.play()
+    assert controller.update(2 * frame_time)
+    assert controller.current_frame == 6
+
+    controller.update(100 * frame_time)
+    assert controller.current_frame == 0
+    assert finished
+    assert not controller.is_playing()
@@ -60,3 +60,18 @@ def test_plot_spectrogram(mock_recorder):
     assert fig.add_subplot.called
     ax = fig.add_subplot.return_value
     assert ax.pcolormesh.called
+
+
+def test_plot_several_joints(mock_recorder):
+    plotter = GolfSwingPlotter(mock_recorder)
+    fig = MagicMock()
+
+    plotter.plot_frequency_analysis(fig, joint_idx=None, signal_type="velocity")
+    ax = fig.add_subplot.return_value
+    assert ax.semilogy.call_count == 2
+    assert ax.legend.called
+
+    fig = MagicMock()
+    plotter.plot_spectrogram(fig, joint_idx=[1, 0], signal_type="velocity")
+    assert [c.args for c in fig.add_subplot.call_args_list] == [(2, 1, 1), (2, 1, 2)]
+    assert fig.add_subplot.return_value.pcolormesh.call_count == 2
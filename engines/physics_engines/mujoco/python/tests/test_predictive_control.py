@@ -0,0 +1,137 @@
+"""Tests for the sampling-based predictive controller."""
+
+import mujoco
+import numpy as np
+import pytest
+from mujoco_humanoid_golf import cli_runner
+from mujoco_humanoid_golf.advanced_control import AdvancedController, ControlMode
+from mujoco_humanoid_golf.body_lookup import find_body_id
+from mujoco_humanoid_golf.models import DOUBLE_PENDULUM_XML
+from mujoco_humanoid_golf.motion_optimization import OptimizationObjectives
+from mujoco_humanoid_golf.predictive_control import MPCParameters, SamplingMPC
+
+
+@pytest.fixture()
+def model_and_data() -> tuple[mujoco.MjModel, mujoco.MjData]:
+    """Double pendulum at rest."""
+    model = mujoco.MjModel.from_xml_string(DOUBLE_PENDULUM_XML)
+    data = mujoco.MjData(model)
+    mujoco.mj_forward(model, data)
+    return model, data
+
+
+def make_mpc(model, data, **kwargs) -> SamplingMPC:
+    """Controller with small, seeded defaults for fast tests."""
+    params = {"horizon": 10, "num_samples": 12, "seed": 0, "noise_scale": 0.5}
+    params.update(kwargs)
+    return SamplingMPC(model, data, params=MPCParameters(**params))
+
+
+def test_low_temperature_keeps_best_candidate(model_and_data) -> None:
+    """Near-zero temperature makes the plan the lowest-cost rollout."""
+    model, data = model_and_data
+    mpc = make_mpc(model, data, temperature=1e-9)
+
+    mpc.update_plan()
+    best = mpc.last_costs.min()
+    assert mpc.last_costs[0] >= best
+
+    # Replanning from the same state re-scores the new plan as sample 0
+    mpc.update_plan()
+    assert mpc.last_costs[0] == pytest.approx(best)
+    mpc.close()
+
+
+def test_warm_start_shifts_plan(model_and_data) -> None:
+    """Applied steps are shifted out and the last control is held."""
+    model, data = model_and_data
+    mpc = make_mpc(model, data, num_samples=1, replan_steps=3)
+    mpc.plan = np.arange(10 * model.nu, dtype=float).reshape(10, model.nu)
+    mpc._steps_since_plan = 0
+    expected = mpc.plan[[3, 4, 5, 6, 7, 8, 9, 9, 9, 9]]
+
+    np.testing.assert_array_equal(mpc.compute_control(), mpc.plan[0])
+    mpc.compute_control()
+    mpc.compute_control()
+    mpc.compute_control()
+    np.testing.assert_allclose(mpc.plan, expected)
+    assert mpc.planning_rate > 0
+    mpc.close()
+
+
+def test_threads_match_serial(model_and_data) -> None:
+    """Worker count does not change the plan."""
+    model, data = model_and_data
+    serial = make_mpc(model, data, num_threads=1)
+    parallel = make_mpc(model, data, num_threads=3)
+
+    np.testing.assert_array_equal(serial.update_plan(), parallel.update_plan())
+    np.testing.assert_array_equal(serial.last_costs, parallel.last_costs)
+    serial.close()
+    parallel.close()
+
+
+def test_predictive_mode_and_headless_run(model_and_data) -> None:
+    """Predictive mode drives AdvancedController and the headless runner."""
+    model, data = model_and_data
+    controller = AdvancedController(model, data)
+    controller.set_predictive_controller(
+        SamplingMPC(
+            model,
+            data,
+            OptimizationObjectives(target_ball_position=np.array([0.5, 0.0, 1.0])),
+            MPCParameters(horizon=5, num_samples=4, seed=1),
+        )
+    )
+    controller.set_control_mode(ControlMode.PREDICTIVE)
+
+    tau = controller.compute_control()
+    assert tau.shape == (model.nu,)
+    assert np.all(np.isfinite(tau))
+    controller.close()
+    assert controller.predictive_controller is None
+
+    summary = cli_runner.execute_run(
+        model="double_pendulum",
+        duration=0.01,
+        timestep=0.002,
+        control_config=None,
+        output_json=None,
+        output_csv=None,
+        show_summary=True,
+        mpc=True,
+    )
+    assert summary is not None
+    assert summary["planning_rate_hz"] > 0
+
+
+def test_lazy_planner_is_shut_down(model_and_data) -> None:
+    """A planner created by predictive mode is released when the mode changes."""
+    model, data = model_and_data
+    controller = AdvancedController(model, data)
+    controller.set_control_mode(ControlMode.PREDICTIVE)
+    controller.compute_control()
+    planner = controller.predictive_controller
+    assert planner is not None
+
+    controller.set_control_mode(ControlMode.TORQUE)
+    assert controller.predictive_controller is None
+    with pytest.raises(RuntimeError):
+        planner._executor.submit(int)
+    controller.close()  # Idempotent
+
+
+def test_find_body_id_ignores_case_and_underscores(model_and_data) -> None:
+    """Loose name patterns resolve to the first matching body."""
+    model, _data = model_and_data
+    club = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_BODY, "club_body")
+    assert find_body_id(model, "ClubBody") == club
+    assert find_body_id(model, "club") == club
+    assert find_body_id(model, "club_head") is None
+
+
+def test_invalid_parameters(model_and_data) -> None:
+    """Replanning cannot outrun the horizon."""
+    model, data = model_and_data
+    with pytest.raises(ValueError, match="replan_steps"):
+        make_mpc(model, data, replan_steps=11)
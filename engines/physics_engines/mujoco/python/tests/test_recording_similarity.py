@@ -0,0 +1,149 @@
+"""Tests for the recording library's tag table and similarity index."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+from mujoco_humanoid_golf.recording_library import (
+    SPEED_PROFILE_POINTS,
+    RecordingLibrary,
+    RecordingMetadata,
+    extract_swing_features,
+)
+
+
+def make_swing(rng: np.random.Generator, num_joints: int = 3) -> dict:
+    """Recording dict with a club speed peak at a random point of the swing."""
+    n = int(rng.integers(150, 400))
+    times = np.linspace(0.0, rng.uniform(1.0, 2.0), n)
+    u = np.linspace(0.0, 1.0, n)
+    impact = rng.uniform(0.5, 0.8)
+    speed = 5 * u + rng.uniform(20, 50) * np.exp(-(((u - impact) / 0.05) ** 2))
+    velocities = rng.standard_normal((n, num_joints)) * rng.uniform(1, 10, num_joints)
+    return {
+        "times": times.tolist(),
+        "club_head_speed": speed.tolist(),
+        "joint_velocities": velocities.tolist(),
+    }
+
+
+def add_swing(
+    library: RecordingLibrary, tmp_path: Path, name: str, data: dict, tags: str = ""
+) -> int:
+    """Write a recording to disk and add it to the library."""
+    data_file = tmp_path / f"{name}.json"
+    data_file.write_text(json.dumps(data))
+    metadata = RecordingMetadata(filename=f"{name}.json", golfer_name=name, tags=tags)
+    return library.add_recording(str(data_file), metadata)
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> RecordingLibrary:
+    """Empty library in a temporary directory."""
+    library = RecordingLibrary(str(tmp_path / "recordings"))
+    yield library
+    library.close()
+
+
+def test_extract_features_layout() -> None:
+    """Feature vectors hold the speed profile, phase durations and joint peaks."""
+    data = make_swing(np.random.default_rng(0), num_joints=4)
+    vector = extract_swing_features(data)
+
+    assert vector is not None
+    assert vector.shape == (SPEED_PROFILE_POINTS + 3 + 4,)
+    speed = np.asarray(data["club_head_speed"])
+    assert vector[:SPEED_PROFILE_POINTS].max() <= speed.max()
+    times = np.asarray(data["times"])
+    phases = vector[SPEED_PROFILE_POINTS : SPEED_PROFILE_POINTS + 3]
+    assert phases.sum() == pytest.approx(times[-1] - times[0])
+    np.testing.assert_allclose(
+        vector[-4:], np.abs(np.asarray(data["joint_velocities"])).max(axis=0)
+    )
+    assert extract_swing_features({"times": [0.0, 1.0]}) is None
+
+
+def test_find_similar_matches_brute_force(
+    library: RecordingLibrary, tmp_path: Path
+) -> None:
+    """Nearest recordings equal a direct scan over standardized features."""
+    rng = np.random.default_rng(1)
+    swings = [make_swing(rng) for _ in range(60)]
+    ids = [add_swing(library, tmp_path, f"s{i}", s) for i, s in enumerate(swings)]
+    # A different joint count is indexed separately and never returned
+    add_swing(library, tmp_path, "other", make_swing(rng, num_joints=5))
+
+    features = np.array([extract_swing_features(s) for s in swings])
+    std = features.std(axis=0)
+    scaled = (features - features.mean(axis=0)) / np.where(std > 1e-12, std, 1.0)
+    expected = np.argsort(np.linalg.norm(scaled - scaled[7], axis=1))[1:11]
+
+    matches = library.find_similar(ids[7], k=10)
+    assert [m.id for m, _ in matches] == [ids[i] for i in expected]
+    distances = [d for _, d in matches]
+    assert distances == sorted(distances)
+
+    tree_matches = library.find_similar(ids[7], k=10, use_tree=True)
+    assert [m.id for m, _ in tree_matches] == [m.id for m, _ in matches]
+    np.testing.assert_allclose([d for _, d in tree_matches], distances)
+
+    by_arrays = library.find_similar(swings[7], k=1)
+    assert by_arrays[0][0].id == ids[7]
+    assert by_arrays[0][1] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_find_similar_tracks_deletes(library: RecordingLibrary, tmp_path: Path) -> None:
+    """Deleted recordings drop out of the index; unindexed queries are rejected."""
+    rng = np.random.default_rng(2)
+    ids = [add_swing(library, tmp_path, f"s{i}", make_swing(rng)) for i in range(5)]
+    nearest = library.find_similar(ids[0], k=1)[0][0].id
+
+    assert library.delete_recording(nearest)
+    assert nearest not in [m.id for m, _ in library.find_similar(ids[0], k=5)]
+
+    data_file = tmp_path / "empty.json"
+    data_file.write_text("{}")
+    empty_id = library.add_recording(str(data_file), RecordingMetadata())
+    with pytest.raises(ValueError, match="no indexed"):
+        library.find_similar(empty_id)
+
+
+def test_tags_are_normalized(library: RecordingLibrary, tmp_path: Path) -> None:
+    """Tag filters run against the tag table and follow updates."""
+    rng = np.random.default_rng(3)
+    a = add_swing(library, tmp_path, "a", make_swing(rng), tags="range, driver")
+    add_swing(library, tmp_path, "b", make_swing(rng), tags="range")
+
+    assert [r.id for r in library.search_recordings(tags=["driver", "range"])] == [a]
+    assert len(library.search_recordings(tags=["range"])) == 2
+
+    metadata = library.get_recording(a)
+    assert metadata is not None
+    metadata.tags = "lesson"
+    assert library.update_recording(metadata)
+    assert library.search_recordings(tags=["driver"]) == []
+    assert [r.id for r in library.search_recordings(tags=["lesson"])] == [a]
+
+
+def test_existing_library_tags_are_migrated(tmp_path: Path) -> None:
+    """Libraries created before the tag table get their tags indexed on open."""
+    lib_dir = tmp_path / "old"
+    lib_dir.mkdir()
+    conn = sqlite3.connect(str(lib_dir / "library.db"))
+    conn.execute(
+        "CREATE TABLE recordings (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "filename TEXT UNIQUE NOT NULL, golfer_name TEXT, date_recorded TEXT, "
+        "club_type TEXT, model_name TEXT, swing_type TEXT, rating INTEGER, "
+        "tags TEXT, notes TEXT, duration REAL, peak_club_speed REAL, "
+        "num_frames INTEGER, checksum TEXT)"
+    )
+    conn.execute("INSERT INTO recordings (filename, tags) VALUES ('x.json', 'a,b')")
+    conn.commit()
+    conn.close()
+
+    library = RecordingLibrary(str(lib_dir))
+    assert len(library.search_recordings(tags=["b"])) == 1
+    assert library._connection() is library._connection()
+    library.close()
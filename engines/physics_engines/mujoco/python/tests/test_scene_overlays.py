@@ -0,0 +1,110 @@
+"""Tests for native scene overlay geoms."""
+
+import mujoco
+import numpy as np
+import pytest
+from mujoco_humanoid_golf.models import DOUBLE_PENDULUM_XML
+from mujoco_humanoid_golf.scene_overlays import (
+    ARROW_WIDTH,
+    AXIS_LINE_WIDTH,
+    TORQUE_NEGATIVE_RGBA,
+    TORQUE_POSITIVE_RGBA,
+    add_connectors,
+    add_markers,
+    force_arrows,
+    frame_axes,
+    torque_arrows,
+)
+
+
+@pytest.fixture()
+def pendulum() -> tuple[mujoco.MjModel, mujoco.MjData, mujoco.MjvScene]:
+    """Stepped double pendulum and a scene updated for its state."""
+    model = mujoco.MjModel.from_xml_string(DOUBLE_PENDULUM_XML)
+    data = mujoco.MjData(model)
+    data.qpos[:] = [0.4, -0.3]
+    data.ctrl[:] = [2.0, -1.0]
+    mujoco.mj_step(model, data)
+    mujoco.mj_forward(model, data)
+    mujoco.mj_rnePostConstraint(model, data)
+
+    scene = mujoco.MjvScene(model, maxgeom=100)
+    mujoco.mjv_updateScene(
+        model,
+        data,
+        mujoco.MjvOption(),
+        None,
+        mujoco.MjvCamera(),
+        mujoco.mjtCatBit.mjCAT_ALL,
+        scene,
+    )
+    return model, data, scene
+
+
+def test_torque_arrows_follow_joint_axes(pendulum) -> None:
+    """Each actuated joint gets one arrow along its axis, colored by sign."""
+    model, data, _scene = pendulum
+    starts, ends, rgba = torque_arrows(model, data, 0.1)
+    assert starts.shape == ends.shape == (model.nu, 3)
+
+    for i in range(model.nu):
+        joint_id = model.actuator_trnid[i, 0]
+        np.testing.assert_allclose(starts[i], data.xpos[model.jnt_bodyid[joint_id]])
+        np.testing.assert_allclose(
+            ends[i] - starts[i], 0.1 * data.ctrl[i] * data.xaxis[joint_id]
+        )
+    np.testing.assert_array_equal(rgba[0], TORQUE_POSITIVE_RGBA)
+    np.testing.assert_array_equal(rgba[1], TORQUE_NEGATIVE_RGBA)
+
+    data.ctrl[:] = 0.0
+    assert len(torque_arrows(model, data, 0.1)[0]) == 0
+
+
+def test_connectors_and_markers_are_scene_geoms(pendulum) -> None:
+    """Overlays are appended after the model geoms and respect maxgeom."""
+    model, data, scene = pendulum
+    base = scene.ngeom
+
+    starts, ends, rgba = force_arrows(model, data, 0.01)
+    assert len(starts) > 0  # Joint reactions hold up the links
+    added = add_connectors(
+        scene, mujoco.mjtGeom.mjGEOM_ARROW, starts, ends, rgba, ARROW_WIDTH
+    )
+    assert added == len(starts)
+    geom = scene.geoms[base]
+    assert geom.type == mujoco.mjtGeom.mjGEOM_ARROW
+    np.testing.assert_allclose(geom.pos, starts[0])
+    np.testing.assert_allclose(
+        geom.size[2], np.linalg.norm(ends[0] - starts[0]), rtol=1e-6
+    )
+
+    starts, ends, rgba = frame_axes(data, [1, 2])
+    assert starts.shape == (6, 3)
+    np.testing.assert_allclose(
+        ends[:3] - starts[:3], 0.2 * data.xmat[1].reshape(3, 3).T
+    )
+    add_connectors(
+        scene, mujoco.mjtGeom.mjGEOM_LINE, starts, ends, rgba, AXIS_LINE_WIDTH
+    )
+
+    count = scene.ngeom
+    add_markers(
+        scene,
+        mujoco.mjtGeom.mjGEOM_SPHERE,
+        data.xipos[[1, 2]],
+        0.02,
+        np.ones(4),
+        ["COM", "COM"],
+    )
+    assert scene.ngeom == count + 2
+    assert scene.geoms[count].label == "COM"
+    assert scene.geoms[count].category == mujoco.mjtCatBit.mjCAT_DECOR
+
+    # Only as many geoms as fit are added
+    free = scene.maxgeom - scene.ngeom
+    positions = np.zeros((free + 5, 3))
+    assert (
+        add_markers(scene, mujoco.mjtGeom.mjGEOM_BOX, positions, 0.05, np.ones(4))
+        == free
+    )
+    assert scene.ngeom == scene.maxgeom
@@ -116,3 +116,29 @@ def test_frequency_analysis_and_smoothness():
 
     # Smoother signal should have higher SAL (closer to 0)
     assert smoothness > smoothness_noisy
+
+
+def test_frequency_analysis_and_smoothness_all_joints():
+    N = 1000
+    fs = 1000.0
+    times = np.arange(N) / fs
+    velocities = np.column_stack(
+        [np.sin(2 * np.pi * f * times) * np.hanning(N) for f in (5, 10, 50)]
+    )
+    analyzer = StatisticalAnalyzer(
+        times=times,
+        joint_positions=np.zeros((N, 3)),
+        joint_velocities=velocities,
+        joint_torques=np.zeros((N, 3)),
+    )
+
+    freqs, psd = analyzer.compute_frequency_analysis(velocities)
+    assert psd.shape == (len(freqs), 3)
+    assert abs(freqs[np.argmax(psd[:, 2])] - 50.0) < 5.0
+
+    smoothness = analyzer.compute_smoothness_metric(velocities)
+    assert smoothness.shape == (3,)
+    for k in range(3):
+        assert np.isclose(
+            smoothness[k], analyzer.compute_smoothness_metric(velocities[:, k])
+        )
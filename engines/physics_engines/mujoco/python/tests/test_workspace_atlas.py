@@ -0,0 +1,142 @@
+"""Tests for the vectorized workspace and singularity atlas."""
+
+import mujoco
+import numpy as np
+import pytest
+from mujoco_humanoid_golf.advanced_kinematics import AdvancedKinematicsAnalyzer
+from mujoco_humanoid_golf.workspace_atlas import (
+    SAMPLING_METHODS,
+    WorkspaceAtlas,
+    build_workspace_atlas,
+    evaluate_configurations,
+    evaluate_samples,
+    sample_configurations,
+)
+
+ARM_XML = """
+<mujoco model="limited_arm">
+  <worldbody>
+    <body name="upper" pos="0 0 1">
+      <joint name="shoulder" type="hinge" axis="0 1 0" range="-90 90"/>
+      <geom type="capsule" fromto="0 0 0 0.5 0 0" size="0.03"/>
+      <body name="lower" pos="0.5 0 0">
+        <joint name="elbow" type="hinge" axis="0 1 0" range="-150 0"/>
+        <geom type="capsule" fromto="0 0 0 0.4 0 0" size="0.03"/>
+        <body name="hand" pos="0.4 0 0">
+          <joint name="wrist" type="hinge" axis="0 0 1" range="-45 45"/>
+          <geom type="sphere" size="0.04"/>
+        </body>
+      </body>
+    </body>
+    <body name="ball" pos="1 0 0.1">
+      <freejoint/>
+      <geom type="sphere" size="0.02"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+@pytest.fixture()
+def arm() -> tuple[mujoco.MjModel, mujoco.MjData]:
+    """Arm with limited hinges and an unsampled free body."""
+    model = mujoco.MjModel.from_xml_string(ARM_XML)
+    return model, mujoco.MjData(model)
+
+
+@pytest.mark.parametrize("method", SAMPLING_METHODS)
+def test_samples_stay_within_limits(arm, method) -> None:
+    """Limited hinges are sampled in range; other coordinates keep qpos0."""
+    model, _data = arm
+    configs = sample_configurations(model, 300, method, seed=1)
+    assert configs.shape == (300, model.nq)
+
+    hinges = model.jnt_qposadr[:3]
+    assert np.all(configs[:, hinges] >= model.jnt_range[:3, 0])
+    assert np.all(configs[:, hinges] <= model.jnt_range[:3, 1])
+    # Samples spread over most of each range
+    spread = np.ptp(configs[:, hinges], axis=0)
+    assert np.all(spread > 0.9 * np.diff(model.jnt_range[:3], axis=1).ravel())
+    np.testing.assert_array_equal(configs[:, 3:], np.tile(model.qpos0[3:], (300, 1)))
+
+    np.testing.assert_array_equal(
+        configs, sample_configurations(model, 300, method, seed=1)
+    )
+
+
+def test_sample_method_is_validated(arm) -> None:
+    """Unknown sampling methods raise."""
+    model, _data = arm
+    with pytest.raises(ValueError, match="method"):
+        sample_configurations(model, 10, "grid")
+
+
+def test_batched_metrics_match_analyzer(arm) -> None:
+    """Kinematics-only batches reproduce the per-sample mj_forward analysis."""
+    model, data = arm
+    body_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_BODY, "hand")
+    configs = sample_configurations(model, 20, "latin_hypercube", seed=2)
+    samples = evaluate_configurations(model, mujoco.MjData(model), configs, body_id)
+
+    analyzer = AdvancedKinematicsAnalyzer(model, data)
+    for q, position, condition in zip(
+        configs, samples.positions, samples.condition_numbers, strict=True
+    ):
+        data.qpos[:] = q
+        mujoco.mj_forward(model, data)
+        jacp, _ = analyzer.compute_body_jacobian(body_id)
+        singular_values = np.linalg.svd(jacp, compute_uv=False)
+        np.testing.assert_allclose(position, data.xpos[body_id])
+        assert condition == pytest.approx(
+            analyzer.compute_manipulability(jacp).condition_number
+        )
+    np.testing.assert_allclose(
+        samples.manipulability[-1], np.prod(singular_values), rtol=1e-10
+    )
+
+    # The legacy interface evaluates the same batch and leaves data untouched
+    data.qpos[:] = 0.0
+    singular, conditions = analyzer.analyze_singularities(body_id, configs)
+    np.testing.assert_allclose(conditions, samples.condition_numbers)
+    assert len(singular) == int(samples.near_singular().sum())
+    np.testing.assert_array_equal(data.qpos, 0.0)
+
+
+def test_atlas_voxels_and_queries(arm, tmp_path) -> None:
+    """Pooled chunks match a serial run and the grid answers point queries."""
+    model, _data = arm
+    body_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_BODY, "hand")
+    configs = sample_configurations(model, 2000, "sobol", seed=3)
+    serial = evaluate_samples(model, configs, body_id, chunk_size=2000, max_workers=1)
+    pooled = evaluate_samples(model, configs, body_id, chunk_size=300, max_workers=2)
+    np.testing.assert_allclose(pooled.positions, serial.positions)
+    np.testing.assert_allclose(pooled.condition_numbers, serial.condition_numbers)
+
+    atlas = WorkspaceAtlas.from_samples(serial, voxel_size=0.1)
+    assert atlas.num_samples == 2000
+    assert atlas.reachable_volume > 0
+
+    # Every sample lands in a reached voxel with at least its manipulability
+    assert np.all(atlas.is_reachable(serial.positions))
+    assert np.all(
+        atlas.manipulability_at(serial.positions) >= serial.manipulability - 1e-12
+    )
+    assert np.all(
+        atlas.condition_number_at(serial.positions) <= serial.condition_numbers + 1e-12
+    )
+    # Points far outside the sampled workspace are unreachable
+    assert not atlas.is_reachable(np.array([10.0, 10.0, 10.0]))[0]
+    assert atlas.condition_number_at(np.array([10.0, 10.0, 10.0]))[0] == np.inf
+
+    loaded = WorkspaceAtlas.load(atlas.save(tmp_path / "atlas.npz"))
+    np.testing.assert_array_equal(loaded.counts, atlas.counts)
+    assert loaded.voxel_size == atlas.voxel_size
+
+    analyzer = AdvancedKinematicsAnalyzer(model, mujoco.MjData(model))
+    built = analyzer.build_workspace_atlas(
+        body_id, num_samples=500, voxel_size=0.1, seed=3, max_workers=1
+    )
+    direct = build_workspace_atlas(
+        model, body_id, num_samples=500, voxel_size=0.1, seed=3, max_workers=1
+    )
+    np.testing.assert_array_equal(built.counts, direct.counts)
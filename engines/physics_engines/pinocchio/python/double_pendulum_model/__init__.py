@@ -17,6 +17,7 @@ from .physics.double_pendulum import (
     DoublePendulumState,
     ExpressionFunction,
     compile_forcing_functions,
+    compile_vectorized_forcing,
 )
 
 __all__ = [
@@ -36,4 +37,5 @@ __all__ = [
     "DoublePendulumState",
     "ExpressionFunction",
     "compile_forcing_functions",
+    "compile_vectorized_forcing",
 ]
@@ -10,9 +10,12 @@ for educational demonstrations of chaos and control.
 from __future__ import annotations
 
 import ast
+import functools
 import math
 import typing
 
+import numpy as np
+
 if typing.TYPE_CHECKING:
     from collections.abc import Callable, Iterable
 from dataclasses import dataclass
@@ -49,6 +52,10 @@ class ExpressionFunction:
     The expression can use standard math functions, state variables, and time
     (``t``). Only a curated subset of ``ast`` nodes are accepted to prevent
     arbitrary code execution.
+
+    The validated expression is compiled once (and cached by expression text)
+    into two functions: a scalar one using :mod:`math` for ``__call__`` and a
+    vectorized one using NumPy ufuncs for :meth:`evaluate`.
     """
 
     _ALLOWED_NODES: typing.ClassVar[set[type[ast.AST]]] = {
@@ -70,6 +77,15 @@ class ExpressionFunction:
         ast.BitXor,
     }
 
+    # Argument order of the compiled functions
+    _VARIABLES: typing.ClassVar[tuple[str, ...]] = (
+        "t",
+        "theta1",
+        "theta2",
+        "omega1",
+        "omega2",
+    )
+
     _ALLOWED_NAMES: typing.ClassVar[dict[str, typing.Any]] = {
         name: getattr(math, name)
         for name in (
@@ -93,37 +109,64 @@ class ExpressionFunction:
         "__builtins__": {},
         **_ALLOWED_NAMES,
     }
+    # NumPy equivalents of _ALLOWED_NAMES for array arguments
+    _VECTOR_GLOBALS: typing.ClassVar[dict[str, typing.Any]] = {
+        "__builtins__": {},
+        "sin": np.sin,
+        "cos": np.cos,
+        "tan": np.tan,
+        "asin": np.arcsin,
+        "acos": np.arccos,
+        "atan": np.arctan,
+        "atan2": np.arctan2,
+        "sqrt": np.sqrt,
+        "log": np.log,
+        "log10": np.log10,
+        "exp": np.exp,
+        "pi": math.pi,
+        "tau": math.tau,
+        "fabs": np.abs,
+    }
 
     def __init__(self, expression: str) -> None:
         self.expression = expression.strip()
-        parsed = ast.parse(self.expression, mode="eval")
-        self._validate_ast(parsed)
-        self._code = compile(parsed, filename="<ExpressionFunction>", mode="eval")
+        self._function, self._vector_function = _compile_expression(self.expression)
 
     def __call__(self, t: float, state: DoublePendulumState) -> float:
-        context: dict[str, float] = {
-            "t": t,
-            "theta1": state.theta1,
-            "theta2": state.theta2,
-            "omega1": state.omega1,
-            "omega2": state.omega2,
-        }
-        # Use _GLOBALS to avoid copying math functions into context on every call
-        result = eval(self._code, self._GLOBALS, context)  # noqa: S307
+        result = self._function(
+            t, state.theta1, state.theta2, state.omega1, state.omega2
+        )
         return float(result)
 
-    def _validate_ast(self, node: ast.AST) -> None:
+    def evaluate(self, t: float | np.ndarray, states: np.ndarray) -> np.ndarray:
+        """Evaluate the expression for many times and/or states at once.
+
+        Args:
+            t: Time, scalar or an array broadcastable against the states
+            states: Array (..., 4) with columns theta1, theta2, omega1, omega2
+
+        Returns:
+            Expression values with the broadcast shape of ``t`` and ``states``
+        """
+        states = np.asarray(states, dtype=float)
+        theta1, theta2, omega1, omega2 = np.moveaxis(states[..., :4], -1, 0)
+        shape = np.broadcast_shapes(np.shape(t), theta1.shape)
+        result = np.asarray(
+            self._vector_function(t, theta1, theta2, omega1, omega2), dtype=float
+        )
+        if result.shape != shape:
+            result = np.broadcast_to(result, shape).copy()
+        return result
+
+    @classmethod
+    def _validate_ast(cls, node: ast.AST) -> None:
         for child in ast.walk(node):
-            if type(child) not in self._ALLOWED_NODES:
+            if type(child) not in cls._ALLOWED_NODES:
                 msg = f"Disallowed syntax in expression: {type(child).__name__}"
                 raise ValueError(msg)
             if isinstance(child, ast.Name) and child.id not in {
-                "t",
-                "theta1",
-                "theta2",
-                "omega1",
-                "omega2",
-                *self._ALLOWED_NAMES,
+                *cls._VARIABLES,
+                *cls._ALLOWED_NAMES,
             }:
                 msg = f"Use of unknown variable '{child.id}' in expression"
                 raise ValueError(msg)
@@ -131,11 +174,40 @@ class ExpressionFunction:
                 if not isinstance(child.func, ast.Name):
                     msg = "Only direct function calls are permitted"
                     raise ValueError(msg)  # noqa: TRY004
-                if child.func.id not in self._ALLOWED_NAMES:
+                if child.func.id not in cls._ALLOWED_NAMES:
                     msg = f"Function '{child.func.id}' is not permitted"
                     raise ValueError(msg)
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_expression(
+    expression: str,
+) -> tuple[Callable[..., typing.Any], Callable[..., typing.Any]]:
+    """Validate an expression and compile it into scalar and vector functions.
+
+    The expression body becomes ``lambda t, theta1, theta2, omega1, omega2:``
+    so evaluation is a plain function call instead of ``eval`` with a fresh
+    context dictionary per call.
+    """
+    parsed = ast.parse(expression, mode="eval")
+    ExpressionFunction._validate_ast(parsed)
+
+    arguments = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=name) for name in ExpressionFunction._VARIABLES],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=[],
+    )
+    wrapper = ast.fix_missing_locations(
+        ast.Expression(body=ast.Lambda(args=arguments, body=parsed.body))
+    )
+    code = compile(wrapper, filename="<ExpressionFunction>", mode="eval")
+    scalar = eval(code, ExpressionFunction._GLOBALS)  # noqa: S307
+    vector = eval(code, ExpressionFunction._VECTOR_GLOBALS)  # noqa: S307
+    return scalar, vector
+
+
 @dataclass
 class SegmentProperties:
     """Physical properties of a single pendulum segment."""
@@ -468,3 +540,21 @@ def compile_forcing_functions(shoulder_expression: str, wrist_expression: str) -
     Callable[[float, DoublePendulumState], float],
 ]:
     return ExpressionFunction(shoulder_expression), ExpressionFunction(wrist_expression)
+
+
+def compile_vectorized_forcing(
+    shoulder_expression: str, wrist_expression: str
+) -> Callable[[float | np.ndarray, np.ndarray], np.ndarray]:
+    """Compile shoulder and wrist expressions into one batched torque function.
+
+    The result maps ``(t, states)`` with ``states`` of shape (..., 4) to
+    torques of shape (..., 2), so it can drive a ``DoublePendulumEnsemble``
+    or evaluate the forcing over a whole time grid.
+    """
+    shoulder = ExpressionFunction(shoulder_expression)
+    wrist = ExpressionFunction(wrist_expression)
+
+    def forcing(t: float | np.ndarray, states: np.ndarray) -> np.ndarray:
+        return np.stack([shoulder.evaluate(t, states), wrist.evaluate(t, states)], -1)
+
+    return forcing
@@ -0,0 +1,504 @@
+"""
+Vectorized ensemble simulation of the double and triple pendulum models.
+
+Sensitivity studies and parameter maps integrate many copies of the same model
+from different initial states and with different physical parameters. The
+ensembles here hold ``K`` members side by side: states are ``(K, 2n)`` arrays
+of joint angles followed by joint velocities, and parameters are ``(K, P)``
+arrays whose columns are listed in ``DOUBLE_PENDULUM_PARAMETERS`` and
+``TRIPLE_PENDULUM_PARAMETERS``. Every member is advanced by the same array
+operations, either with fixed-step RK4 or with an adaptive Dormand-Prince
+RK45 that keeps a separate step size per member.
+"""
+
+from __future__ import annotations
+
+import typing
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+
+from .double_pendulum import DoublePendulumDynamics, DoublePendulumParameters
+from .triple_pendulum import (
+    TriplePendulumDynamics,
+    TriplePendulumParameters,
+    _calc_bias_vector,
+    _calc_mass_matrix,
+)
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    # Constant (K, n) or (n,) torques, or a function torques(t, states)
+    TorqueInput = (
+        np.ndarray | Callable[[float | np.ndarray, np.ndarray], np.ndarray] | None
+    )
+
+# Parameter columns, matching the quantities cached by the scalar models
+DOUBLE_PENDULUM_PARAMETERS = (
+    "m1",  # Upper segment mass (kg)
+    "m2",  # Lower segment mass (kg)
+    "l1",  # Upper segment length (m)
+    "lc1",  # Upper segment COM distance (m)
+    "lc2",  # Lower segment COM distance (m)
+    "i1",  # Upper segment inertia about the shoulder (kg·m^2)
+    "i2",  # Lower segment inertia about the wrist (kg·m^2)
+    "d1",  # Shoulder damping (N·m·s/rad)
+    "d2",  # Wrist damping (N·m·s/rad)
+    "g",  # Gravity projected onto the swing plane (m/s^2)
+)
+TRIPLE_PENDULUM_PARAMETERS = (
+    "l1",
+    "l2",
+    "l3",
+    "lc1",
+    "lc2",
+    "lc3",
+    "m1",
+    "m2",
+    "m3",
+    "I1",  # Segment inertias about their COM (kg·m^2)
+    "I2",
+    "I3",
+    "g",
+    "d1",
+    "d2",
+    "d3",
+)
+
+# Numerical tolerance for detecting singular mass matrices (dimensionless)
+MASS_MATRIX_SINGULAR_TOLERANCE = 1e-12
+
+# Dormand-Prince 5(4) tableau
+_DP_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+# Fifth-order weights minus the embedded fourth-order weights
+_DP_E = (
+    71 / 57600,
+    0.0,
+    -71 / 16695,
+    71 / 1920,
+    -17253 / 339200,
+    22 / 525,
+    -1 / 40,
+)
+
+
+@dataclass
+class EnsembleTrajectory:
+    """States of every ensemble member at the recorded times."""
+
+    times: np.ndarray  # (T,)
+    states: np.ndarray  # (T, K, 2n)
+
+    @property
+    def final_states(self) -> np.ndarray:
+        """State of every member at the last sample, shape (K, 2n)."""
+        return self.states[-1]
+
+
+class _PendulumEnsemble(ABC):
+    """Shared state handling for the pendulum ensembles."""
+
+    num_joints: int
+    parameter_names: tuple[str, ...]
+
+    def __init__(
+        self,
+        parameters: np.ndarray,
+        torques: TorqueInput = None,
+    ) -> None:
+        parameters = np.atleast_2d(np.asarray(parameters, dtype=float))
+        if parameters.shape[1] != len(self.parameter_names):
+            msg = (
+                f"Expected {len(self.parameter_names)} parameter columns "
+                f"{self.parameter_names}, got {parameters.shape[1]}"
+            )
+            raise ValueError(msg)
+        self.parameters = parameters
+        self.torques = torques
+
+    @property
+    def size(self) -> int:
+        """Number of ensemble members."""
+        return self.parameters.shape[0]
+
+    def _columns(self, members: np.ndarray | None) -> dict[str, np.ndarray]:
+        """Parameter values of the selected members, keyed by parameter name."""
+        params = self.parameters if members is None else self.parameters[members]
+        return dict(zip(self.parameter_names, params.T, strict=True))
+
+    def _applied_torques(
+        self,
+        t: float | np.ndarray,
+        states: np.ndarray,
+        members: np.ndarray | None,
+    ) -> np.ndarray | float:
+        if self.torques is None:
+            return 0.0
+        if callable(self.torques):
+            return np.asarray(self.torques(t, states), dtype=float)
+        torques = np.broadcast_to(
+            np.asarray(self.torques, dtype=float), (self.size, self.num_joints)
+        )
+        return torques if members is None else torques[members]
+
+    @abstractmethod
+    def accelerations(
+        self,
+        t: float | np.ndarray,
+        states: np.ndarray,
+        members: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Joint accelerations of the selected members, shape (K, n)."""
+
+    def derivatives(
+        self,
+        t: float | np.ndarray,
+        states: np.ndarray,
+        members: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Time derivative of the ensemble state.
+
+        Args:
+            t: Time, shared or per member
+            states: Member states (K, 2n)
+            members: Indices of the members in ``states`` (all when None)
+
+        Returns:
+            State derivatives (K, 2n)
+        """
+        n = self.num_joints
+        derivs = np.empty_like(states)
+        derivs[:, :n] = states[:, n:]
+        derivs[:, n:] = self.accelerations(t, states, members)
+        return derivs
+
+    def _check_states(self, states: np.ndarray) -> np.ndarray:
+        states = np.array(states, dtype=float, ndmin=2)
+        if states.shape != (self.size, 2 * self.num_joints):
+            if states.shape[0] == 1 and states.shape[1] == 2 * self.num_joints:
+                return np.repeat(states, self.size, axis=0)
+            msg = (
+                f"Expected states of shape ({self.size}, {2 * self.num_joints}), "
+                f"got {states.shape}"
+            )
+            raise ValueError(msg)
+        return states
+
+    def integrate_rk4(
+        self,
+        states: np.ndarray,
+        t_span: tuple[float, float],
+        dt: float,
+        record_every: int | None = None,
+    ) -> EnsembleTrajectory:
+        """Integrate every member with fixed-step RK4.
+
+        Args:
+            states: Initial states (K, 2n), or (2n,) shared by all members
+            t_span: Start and end time (s)
+            dt: Step size (s); the last step is shortened to end on t_span[1]
+            record_every: Record the states every this many steps (start and
+                end only when None)
+
+        Returns:
+            Recorded trajectory
+        """
+        if dt <= 0:
+            msg = "dt must be positive"
+            raise ValueError(msg)
+        t0, t1 = t_span
+        y = self._check_states(states)
+        num_steps = max(1, int(np.ceil((t1 - t0) / dt - 1e-9)))
+
+        times = [t0]
+        recorded = [y.copy()]
+        t = t0
+        for step in range(1, num_steps + 1):
+            h = min(dt, t1 - t)
+            k1 = self.derivatives(t, y)
+            k2 = self.derivatives(t + h / 2, y + (h / 2) * k1)
+            k3 = self.derivatives(t + h / 2, y + (h / 2) * k2)
+            k4 = self.derivatives(t + h, y + h * k3)
+            y = y + (h / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+            t = t0 + step * dt if step < num_steps else t1
+            if step == num_steps or (record_every and step % record_every == 0):
+                times.append(t)
+                recorded.append(y)
+
+        return EnsembleTrajectory(np.array(times), np.stack(recorded))
+
+    def integrate_rk45(
+        self,
+        states: np.ndarray,
+        t_span: tuple[float, float],
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        first_step: float | None = None,
+        max_steps: int = 100_000,
+    ) -> EnsembleTrajectory:
+        """Integrate every member with adaptive Dormand-Prince RK45.
+
+        Each member keeps its own time and step size, so a chaotic member
+        taking small steps does not slow down the others. The right-hand
+        side is evaluated only for members that have not yet finished.
+
+        Args:
+            states: Initial states (K, 2n), or (2n,) shared by all members
+            t_span: Start and end time (s)
+            rtol: Relative error tolerance
+            atol: Absolute error tolerance
+            first_step: Initial step size (s); 1% of the span when None
+            max_steps: Maximum number of batched steps
+
+        Returns:
+            Trajectory with the initial and final states
+        """
+        t0, t1 = t_span
+        y0 = self._check_states(states)
+        y = y0.copy()
+        t = np.full(self.size, t0)
+        h = np.full(self.size, first_step or 0.01 * (t1 - t0))
+        k_first = self.derivatives(t, y)
+
+        for _ in range(max_steps):
+            active = np.flatnonzero(t < t1)
+            if active.size == 0:
+                break
+            ta = t[active]
+            ya = y[active]
+            ha = np.minimum(h[active], t1 - ta)[:, np.newaxis]
+
+            stages = [k_first[active]]
+            for c, a in zip(_DP_C[1:], _DP_A[1:], strict=True):
+                increment = sum(
+                    coeff * k for coeff, k in zip(a, stages, strict=False) if coeff
+                )
+                stages.append(
+                    self.derivatives(ta + c * ha[:, 0], ya + ha * increment, active)
+                )
+            y_new = ya + ha * sum(
+                coeff * k for coeff, k in zip(_DP_A[6], stages, strict=False) if coeff
+            )
+            error = ha * sum(
+                coeff * k for coeff, k in zip(_DP_E, stages, strict=True) if coeff
+            )
+            scale = atol + rtol * np.maximum(np.abs(ya), np.abs(y_new))
+            error_norm = np.sqrt(np.mean((error / scale) ** 2, axis=1))
+
+            accepted = error_norm <= 1.0
+            done = active[accepted]
+            # Land exactly on t1 so rounding cannot leave a sliver step
+            t_new = ta + ha[:, 0]
+            t[done] = np.where(ha[:, 0] == t1 - ta, t1, t_new)[accepted]
+            y[done] = y_new[accepted]
+            k_first[done] = stages[6][accepted]  # First same as last
+
+            with np.errstate(divide="ignore"):
+                h[active] = ha[:, 0] * np.clip(0.9 * error_norm**-0.2, 0.2, 5.0)
+        else:
+            msg = f"RK45 did not reach t={t1} within {max_steps} steps"
+            raise RuntimeError(msg)
+
+        return EnsembleTrajectory(np.array([t0, t1]), np.stack([y0, y]))
+
+
+class DoublePendulumEnsemble(_PendulumEnsemble):
+    """K double pendulums with per-member parameters.
+
+    Matches ``DoublePendulumDynamics.derivatives`` member by member, using
+    the closed-form inverse of the 2x2 mass matrix.
+    """
+
+    num_joints = 2
+    parameter_names = DOUBLE_PENDULUM_PARAMETERS
+
+    def __init__(
+        self,
+        parameters: np.ndarray,
+        torques: TorqueInput = None,
+    ) -> None:
+        """Create the ensemble.
+
+        Args:
+            parameters: (K, 10) array with DOUBLE_PENDULUM_PARAMETERS columns
+            torques: Applied joint torques: a (K, 2) or (2,) array, or a
+                function ``torques(t, states) -> (K, 2)``. In RK45, ``t`` and
+                ``states`` cover only the members still integrating.
+        """
+        super().__init__(parameters, torques)
+        p = self._columns(None)
+        # Configuration-independent combinations, computed once
+        self._m11_const = p["i1"] + p["i2"] + p["m2"] * p["l1"] ** 2
+        self._coupling = p["m2"] * p["l1"] * p["lc2"]
+        self._i2 = p["i2"]
+        self._gravity1 = (p["m1"] * p["lc1"] + p["m2"] * p["l1"]) * p["g"]
+        self._gravity2 = p["m2"] * p["lc2"] * p["g"]
+        self._d1 = p["d1"]
+        self._d2 = p["d2"]
+
+    @staticmethod
+    def parameter_row(parameters: DoublePendulumParameters) -> np.ndarray:
+        """Parameter row for one configuration of the scalar model."""
+        dynamics = DoublePendulumDynamics(parameters)
+        return np.array(
+            [
+                dynamics._m1,
+                dynamics._m2,
+                dynamics._l1,
+                dynamics._lc1,
+                dynamics._lc2,
+                dynamics._i1,
+                dynamics._i2,
+                dynamics._d1,
+                dynamics._d2,
+                parameters.projected_gravity,
+            ]
+        )
+
+    @classmethod
+    def from_parameters(
+        cls,
+        parameters: DoublePendulumParameters | None = None,
+        size: int = 1,
+        torques: TorqueInput = None,
+    ) -> DoublePendulumEnsemble:
+        """Ensemble of ``size`` members sharing one configuration."""
+        row = cls.parameter_row(parameters or DoublePendulumParameters.default())
+        return cls(np.tile(row, (size, 1)), torques)
+
+    def _constants(self, members: np.ndarray | None) -> tuple[np.ndarray, ...]:
+        constants = (
+            self._m11_const,
+            self._coupling,
+            self._i2,
+            self._gravity1,
+            self._gravity2,
+            self._d1,
+            self._d2,
+        )
+        if members is None:
+            return constants
+        return tuple(c[members] for c in constants)
+
+    def mass_matrix(
+        self, theta2: np.ndarray, members: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Mass matrices (K, 2, 2)."""
+        m11_const, coupling, i2, *_ = self._constants(members)
+        cross = coupling * np.cos(theta2)
+        m12 = i2 + cross
+        return np.stack(
+            [
+                np.stack([m11_const + 2 * cross, m12], axis=-1),
+                np.stack([m12, np.broadcast_to(i2, m12.shape)], axis=-1),
+            ],
+            axis=-2,
+        )
+
+    def accelerations(
+        self,
+        t: float | np.ndarray,
+        states: np.ndarray,
+        members: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Joint accelerations (K, 2)."""
+        m11_const, coupling, i2, gravity1, gravity2, d1, d2 = self._constants(members)
+        theta1, theta2, omega1, omega2 = states.T
+        cos2 = np.cos(theta2)
+        sin2 = np.sin(theta2)
+        sin12 = np.sin(theta1 + theta2)
+
+        # Coriolis/centripetal, gravity and damping torques
+        h = -coupling * sin2
+        bias1 = h * (2 * omega1 * omega2 + omega2**2)
+        bias1 += gravity1 * np.sin(theta1) + gravity2 * sin12 + d1 * omega1
+        bias2 = -h * omega1**2 + gravity2 * sin12 + d2 * omega2
+
+        tau = self._applied_torques(t, states, members)
+        if np.ndim(tau):
+            rhs1 = tau[:, 0] - bias1
+            rhs2 = tau[:, 1] - bias2
+        else:
+            rhs1 = -bias1
+            rhs2 = -bias2
+
+        # Closed-form inverse of the symmetric 2x2 mass matrix
+        cross = coupling * cos2
+        m11 = m11_const + 2 * cross
+        m12 = i2 + cross
+        determinant = m11 * i2 - m12**2
+        if np.any(np.abs(determinant) <= MASS_MATRIX_SINGULAR_TOLERANCE):
+            msg = "Mass matrix determinant too close to zero; check pendulum parameters"
+            raise ZeroDivisionError(msg)
+
+        acc = np.empty((states.shape[0], 2))
+        acc[:, 0] = (i2 * rhs1 - m12 * rhs2) / determinant
+        acc[:, 1] = (m11 * rhs2 - m12 * rhs1) / determinant
+        return acc
+
+
+class TriplePendulumEnsemble(_PendulumEnsemble):
+    """K triple pendulums with per-member parameters.
+
+    Evaluates the symbolic mass matrix and bias vector of the scalar model
+    over the whole ensemble and solves the 3x3 systems as one batch.
+    """
+
+    num_joints = 3
+    parameter_names = TRIPLE_PENDULUM_PARAMETERS
+
+    @staticmethod
+    def parameter_row(parameters: TriplePendulumParameters) -> np.ndarray:
+        """Parameter row for one configuration of the scalar model."""
+        dynamics = TriplePendulumDynamics(parameters)
+        return np.array([*dynamics._parameter_vector(), *parameters.damping])
+
+    @classmethod
+    def from_parameters(
+        cls,
+        parameters: TriplePendulumParameters | None = None,
+        size: int = 1,
+        torques: TorqueInput = None,
+    ) -> TriplePendulumEnsemble:
+        """Ensemble of ``size`` members sharing one configuration."""
+        row = cls.parameter_row(parameters or TriplePendulumParameters.default())
+        return cls(np.tile(row, (size, 1)), torques)
+
+    def mass_matrix(
+        self, states: np.ndarray, members: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Mass matrices (K, 3, 3)."""
+        p = self._columns(members)
+        mass = _calc_mass_matrix(
+            *states.T,
+            *(p[name] for name in TRIPLE_PENDULUM_PARAMETERS[:13]),
+        )
+        return np.moveaxis(mass, -1, 0)
+
+    def accelerations(
+        self,
+        t: float | np.ndarray,
+        states: np.ndarray,
+        members: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Joint accelerations (K, 3)."""
+        p = self._columns(members)
+        params = [p[name] for name in TRIPLE_PENDULUM_PARAMETERS[:13]]
+        omega = states[:, 3:]
+        bias = _calc_bias_vector(*states.T, *params).T
+        bias += np.stack([p["d1"], p["d2"], p["d3"]], axis=-1) * omega
+
+        mass = np.moveaxis(_calc_mass_matrix(*states.T, *params), -1, 0)
+        rhs = self._applied_torques(t, states, members) - bias
+        return np.linalg.solve(mass, rhs[..., np.newaxis])[..., 0]
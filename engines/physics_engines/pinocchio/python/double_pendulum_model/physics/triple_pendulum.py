@@ -98,6 +98,11 @@ class PolynomialProfile:
         return float(np.poly1d(derivative)(t))
 
 
+def _batch_shape(*values: float | np.ndarray) -> tuple[int, ...]:
+    """Broadcast shape of the arguments; ``()`` when all are scalars."""
+    return np.broadcast(*values).shape
+
+
 def _calc_mass_matrix(
     theta1: float,
     theta2: float,
@@ -119,7 +124,8 @@ def _calc_mass_matrix(
     I3: float,
     g: float,
 ) -> np.ndarray:
-    mass = np.zeros((3, 3))
+    shape = _batch_shape(theta2, theta3, l1, l2, lc1, lc2, lc3, m1, m2, m3, I1, I2, I3)
+    mass = np.zeros((3, 3, *shape))
     mass[0, 0] = (
         I1
         + I2
@@ -198,7 +204,24 @@ def _calc_bias_vector(
     I3: float,
     g: float,
 ) -> np.ndarray:
-    bias = np.zeros((3,))
+    shape = _batch_shape(
+        theta1,
+        theta2,
+        theta3,
+        omega1,
+        omega2,
+        omega3,
+        l1,
+        l2,
+        lc1,
+        lc2,
+        lc3,
+        m1,
+        m2,
+        m3,
+        g,
+    )
+    bias = np.zeros((3, *shape))
     bias[0] = (
         g * l1 * m2 * np.sin(theta1)
         + g * l1 * m3 * np.sin(theta1)
@@ -262,7 +285,8 @@ def _calc_gravity_vector(
     I3: float,
     g: float,
 ) -> np.ndarray:
-    gravity = np.zeros((3,))
+    shape = _batch_shape(theta1, theta2, theta3, l1, l2, lc1, lc2, lc3, m1, m2, m3, g)
+    gravity = np.zeros((3, *shape))
     gravity[0] = (
         g * l1 * m2 * np.sin(theta1)
         + g * l1 * m3 * np.sin(theta1)
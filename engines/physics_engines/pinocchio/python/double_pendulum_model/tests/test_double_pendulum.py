@@ -2,6 +2,7 @@ import math
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -15,6 +16,11 @@ from double_pendulum_model.physics.double_pendulum import (  # noqa: E402
     ExpressionFunction,
     LowerSegmentProperties,
     SegmentProperties,
+    compile_forcing_functions,
+    compile_vectorized_forcing,
+)
+from double_pendulum_model.physics.ensemble import (  # noqa: E402
+    DoublePendulumEnsemble,
 )
 
 
@@ -26,6 +32,53 @@ def test_expression_function_allows_state_variables() -> None:
     assert math.isclose(value, expected, rel_tol=1e-9)
 
 
+def test_expression_function_vectorized_matches_scalar() -> None:
+    text = "0.5*sin(t) + atan2(theta2, 1 + omega1**2) - fabs(omega2) % 0.3"
+    expr = ExpressionFunction(text)
+    states = np.random.default_rng(0).uniform(-2.0, 2.0, (25, 4))
+    times = np.linspace(0.0, 2.0, 25)
+
+    values = expr.evaluate(times, states)
+    expected = [
+        expr(t, DoublePendulumState(*state))
+        for t, state in zip(times, states, strict=True)
+    ]
+    np.testing.assert_allclose(values, expected, rtol=1e-12)
+
+    # Compiled once per expression text, constants broadcast to the batch
+    assert ExpressionFunction(text)._vector_function is expr._vector_function
+    assert ExpressionFunction("2.0").evaluate(0.0, states).shape == (25,)
+
+
+def test_expression_function_rejects_disallowed_syntax() -> None:
+    with pytest.raises(ValueError, match="not permitted"):
+        ExpressionFunction("abs(theta1)")
+    with pytest.raises(ValueError, match="unknown variable"):
+        ExpressionFunction("__import__")
+    with pytest.raises(ValueError, match="Disallowed syntax"):
+        ExpressionFunction("sin.__class__")
+
+
+def test_vectorized_forcing_drives_ensemble() -> None:
+    forcing = compile_vectorized_forcing("2*sin(t)", "-0.5*omega2")
+    parameters = DoublePendulumParameters.default()
+    dynamics = DoublePendulumDynamics(
+        parameters,
+        forcing_functions=compile_forcing_functions("2*sin(t)", "-0.5*omega2"),
+    )
+    ensemble = DoublePendulumEnsemble.from_parameters(parameters, 1, forcing)
+
+    state = DoublePendulumState(theta1=0.3, theta2=-0.2, omega1=0.1, omega2=0.4)
+    final = ensemble.integrate_rk4(
+        [state.theta1, state.theta2, state.omega1, state.omega2], (0.0, 0.1), 0.01
+    ).final_states[0]
+    for step in range(10):
+        state = dynamics.step(step * 0.01, state, 0.01)
+    np.testing.assert_allclose(
+        final, [state.theta1, state.theta2, state.omega1, state.omega2]
+    )
+
+
 def test_control_affine_matches_explicit_dynamics() -> None:
     control = (3.0, -1.0)
     parameters = DoublePendulumParameters.default()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import numpy as np  # noqa: TID253
+import pytest
+from double_pendulum_model.physics.double_pendulum import (
+    DoublePendulumDynamics,
+    DoublePendulumParameters,
+    DoublePendulumState,
+)
+from double_pendulum_model.physics.ensemble import (
+    DOUBLE_PENDULUM_PARAMETERS,
+    DoublePendulumEnsemble,
+    TriplePendulumEnsemble,
+)
+from double_pendulum_model.physics.triple_pendulum import (
+    TriplePendulumDynamics,
+    TriplePendulumState,
+)
+from scipy.integrate import solve_ivp
+
+RNG = np.random.default_rng(0)
+
+
+def random_states(count: int, num_joints: int) -> np.ndarray:
+    return np.hstack(
+        [
+            RNG.uniform(-np.pi, np.pi, (count, num_joints)),
+            RNG.uniform(-2.0, 2.0, (count, num_joints)),
+        ]
+    )
+
+
+def test_double_derivatives_match_scalar_model() -> None:
+    parameters = DoublePendulumParameters.default()
+    torques = RNG.uniform(-5.0, 5.0, (50, 2))
+    ensemble = DoublePendulumEnsemble.from_parameters(parameters, 50, torques)
+    states = random_states(50, 2)
+
+    derivs = ensemble.derivatives(0.0, states)
+    for state, torque, expected in zip(states, torques, derivs, strict=True):
+        dynamics = DoublePendulumDynamics(
+            parameters,
+            forcing_functions=(
+                lambda _t, _s, tau=torque[0]: tau,
+                lambda _t, _s, tau=torque[1]: tau,
+            ),
+        )
+        actual = dynamics.derivatives(0.0, DoublePendulumState(*state))
+        np.testing.assert_allclose(actual, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_double_rk4_matches_scalar_steps_per_member() -> None:
+    """Members with different parameters evolve like their scalar models."""
+    rows = []
+    for length in (0.6, 0.75, 0.9):
+        parameters = DoublePendulumParameters.default()
+        parameters.upper_segment.length_m = length
+        rows.append(DoublePendulumEnsemble.parameter_row(parameters))
+    ensemble = DoublePendulumEnsemble(np.array(rows))
+    states = random_states(3, 2)
+
+    trajectory = ensemble.integrate_rk4(states, (0.0, 0.5), 0.01, record_every=10)
+    assert trajectory.states.shape == (6, 3, 4)
+    np.testing.assert_allclose(trajectory.times, np.linspace(0.0, 0.5, 6))
+
+    for member, length in enumerate((0.6, 0.75, 0.9)):
+        parameters = DoublePendulumParameters.default()
+        parameters.upper_segment.length_m = length
+        dynamics = DoublePendulumDynamics(parameters)
+        state = DoublePendulumState(*states[member])
+        for step in range(50):
+            state = dynamics.step(step * 0.01, state, 0.01)
+        expected = [state.theta1, state.theta2, state.omega1, state.omega2]
+        np.testing.assert_allclose(trajectory.final_states[member], expected)
+
+
+def test_rk45_matches_solve_ivp() -> None:
+    """Adaptive members reach the reference solution with their own steps."""
+    ensemble = DoublePendulumEnsemble.from_parameters(
+        size=4,
+        torques=lambda t, x: np.stack(
+            [np.sin(t) + 0.0 * x[:, 0], 0.5 * x[:, 0]], axis=-1
+        ),
+    )
+    states = random_states(4, 2)
+    trajectory = ensemble.integrate_rk45(states, (0.0, 2.0), rtol=1e-9, atol=1e-11)
+
+    for member in range(4):
+        reference = solve_ivp(
+            lambda t, x, m=member: ensemble.derivatives(
+                t, x[np.newaxis], np.array([m])
+            )[0],
+            (0.0, 2.0),
+            states[member],
+            method="DOP853",
+            rtol=1e-11,
+            atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            trajectory.final_states[member], reference.y[:, -1], atol=1e-6
+        )
+
+
+def test_triple_ensemble_matches_scalar_model() -> None:
+    dynamics = TriplePendulumDynamics()
+    control = (1.0, -0.5, 0.2)
+    ensemble = TriplePendulumEnsemble.from_parameters(size=20, torques=control)
+    states = random_states(20, 3)
+
+    accelerations = ensemble.accelerations(0.0, states)
+    for state, expected in zip(states, accelerations, strict=True):
+        actual = dynamics.forward_dynamics(TriplePendulumState(*state), control)
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    final = ensemble.integrate_rk4(states[0], (0.0, 0.05), 0.01).final_states
+    state = TriplePendulumState(*states[0])
+    for _ in range(5):
+        state = dynamics.step(0.0, state, 0.01, control)
+    np.testing.assert_allclose(final[7], list(vars(state).values()))
+
+
+def test_invalid_inputs() -> None:
+    with pytest.raises(ValueError, match="parameter columns"):
+        DoublePendulumEnsemble(np.ones((2, len(DOUBLE_PENDULUM_PARAMETERS) - 1)))
+    ensemble = DoublePendulumEnsemble.from_parameters(size=2)
+    with pytest.raises(ValueError, match="states of shape"):
+        ensemble.integrate_rk4(np.zeros((3, 4)), (0.0, 1.0), 0.1)
@@ -3,12 +3,36 @@
 from __future__ import annotations
 
 import logging
+import typing
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 
 import numpy as np  # noqa: TID253
 import pinocchio as pin
 
 logger = logging.getLogger(__name__)
 
+# Dataset names used by the Simscape counterfactual workflow and its GUI.
+BASEQ: typing.Final[str] = "BASEQ"
+ZTCFQ: typing.Final[str] = "ZTCFQ"
+DELTAQ: typing.Final[str] = "DELTAQ"
+TIME_COLUMN: typing.Final[str] = "Time"
+
+
+@dataclass
+class CounterfactualSeries:
+    """Per-sample counterfactual evaluated along a trajectory.
+
+    Every sample is an independent one-step counterfactual starting from the
+    recorded state at that sample.
+    """
+
+    acceleration: np.ndarray  # (N, nv)
+    q_next: np.ndarray  # (N, nq)
+    v_next: np.ndarray  # (N, nv)
+
 
 class DynamicsEngine:
     """Wrapper for Pinocchio dynamics algorithms."""
@@ -22,6 +46,8 @@ class DynamicsEngine:
         """
         self.model = model
         self.data = data
+        # Extra pin.Data instances for worker threads (one per thread).
+        self._thread_data: list[pin.Data] = []
 
     def forward_dynamics(
         self, q: np.ndarray, v: np.ndarray, tau: np.ndarray, f_ext: list | None = None
@@ -91,3 +117,291 @@ class DynamicsEngine:
         v_next = v_zero + a * dt
         q_next = pin.integrate(self.model, q, v_next * dt)
         return q_next, v_next
+
+    def _worker_data(self, n_workers: int) -> list[pin.Data]:
+        """Return ``n_workers`` Data objects, reusing those already created."""
+        while len(self._thread_data) < n_workers - 1:
+            self._thread_data.append(self.model.createData())
+        return [self.data, *self._thread_data[: n_workers - 1]]
+
+    def _map_samples(
+        self,
+        n_samples: int,
+        kernel: Callable[[pin.Data, int, int], None],
+        n_threads: int,
+    ) -> None:
+        """Run ``kernel(data, start, stop)`` over contiguous sample chunks.
+
+        Each chunk owns one ``pin.Data`` so threads never share scratch
+        memory. Speed-up depends on the bindings releasing the GIL.
+        """
+        n_workers = max(1, min(n_threads, n_samples))
+        data_list = self._worker_data(n_workers)
+        if n_workers == 1:
+            kernel(data_list[0], 0, n_samples)
+            return
+
+        bounds = np.linspace(0, n_samples, n_workers + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(kernel, data, int(start), int(stop))
+                for data, start, stop in zip(
+                    data_list, bounds[:-1], bounds[1:], strict=True
+                )
+            ]
+            for future in futures:
+                future.result()
+
+    def _check_trajectory(
+        self, q: np.ndarray, *arrays: np.ndarray
+    ) -> tuple[np.ndarray, ...]:
+        """Validate ``(N, nq)`` positions and ``(N, nv)`` companions."""
+        q_arr = np.atleast_2d(np.asarray(q, dtype=np.float64))
+        n_samples = q_arr.shape[0]
+        if q_arr.shape[1] != self.model.nq:
+            msg = f"q must have shape (N, {self.model.nq}), got {q_arr.shape}"
+            raise ValueError(msg)
+
+        checked = [q_arr]
+        for arr in arrays:
+            arr_2d = np.atleast_2d(np.asarray(arr, dtype=np.float64))
+            if arr_2d.shape != (n_samples, self.model.nv):
+                msg = (
+                    f"Expected shape ({n_samples}, {self.model.nv}), got {arr_2d.shape}"
+                )
+                raise ValueError(msg)
+            checked.append(arr_2d)
+        return tuple(checked)
+
+    def forward_dynamics_trajectory(
+        self, q: np.ndarray, v: np.ndarray, tau: np.ndarray, n_threads: int = 1
+    ) -> np.ndarray:
+        """Compute forward dynamics for every sample of a trajectory.
+
+        Args:
+            q: Joint configurations (N, nq)
+            v: Joint velocities (N, nv)
+            tau: Joint torques (N, nv)
+            n_threads: Number of worker threads
+
+        Returns:
+            Joint accelerations (N, nv)
+        """
+        q, v, tau = self._check_trajectory(q, v, tau)
+        acc = np.empty_like(v)
+        model = self.model
+
+        def kernel(data: pin.Data, start: int, stop: int) -> None:
+            for k in range(start, stop):
+                acc[k] = pin.aba(model, data, q[k], v[k], tau[k])
+
+        self._map_samples(q.shape[0], kernel, n_threads)
+        return acc
+
+    def _counterfactual_trajectory(
+        self,
+        q: np.ndarray,
+        v: np.ndarray,
+        tau: np.ndarray,
+        dt: float,
+        n_threads: int,
+    ) -> CounterfactualSeries:
+        """One-step semi-implicit Euler counterfactual from every sample."""
+        acc = self.forward_dynamics_trajectory(q, v, tau, n_threads=n_threads)
+        v_next = v + acc * dt
+        q_next = np.empty_like(q)
+        model = self.model
+
+        def kernel(_data: pin.Data, start: int, stop: int) -> None:
+            for k in range(start, stop):
+                q_next[k] = pin.integrate(model, q[k], v_next[k] * dt)
+
+        self._map_samples(q.shape[0], kernel, n_threads)
+        return CounterfactualSeries(acceleration=acc, q_next=q_next, v_next=v_next)
+
+    def compute_ztcf_trajectory(
+        self, q: np.ndarray, v: np.ndarray, dt: float, n_threads: int = 1
+    ) -> CounterfactualSeries:
+        """Compute the Zero Torque Counterfactual for every trajectory sample.
+
+        Trajectory-level equivalent of :meth:`compute_ztcf`.
+
+        Args:
+            q: Joint configurations (N, nq)
+            v: Joint velocities (N, nv)
+            dt: Counterfactual step [s]
+            n_threads: Number of worker threads
+
+        Returns:
+            Passive accelerations and one-step states for every sample
+        """
+        q, v = self._check_trajectory(q, v)
+        return self._counterfactual_trajectory(q, v, np.zeros_like(v), dt, n_threads)
+
+    def compute_zvcf_trajectory(
+        self, q: np.ndarray, tau: np.ndarray, dt: float, n_threads: int = 1
+    ) -> CounterfactualSeries:
+        """Compute the Zero Velocity Counterfactual for every trajectory sample.
+
+        Trajectory-level equivalent of :meth:`compute_zvcf`.
+
+        Args:
+            q: Joint configurations (N, nq)
+            tau: Joint torques (N, nv)
+            dt: Counterfactual step [s]
+            n_threads: Number of worker threads
+
+        Returns:
+            Accelerations and one-step states starting from v=0 for every sample
+        """
+        q, tau = self._check_trajectory(q, tau)
+        return self._counterfactual_trajectory(
+            q, np.zeros_like(tau), tau, dt, n_threads
+        )
+
+    def coordinate_names(self) -> tuple[list[str], list[str]]:
+        """Column names for configuration and velocity coordinates.
+
+        Single-DOF joints use the joint name; multi-DOF joints (e.g. free
+        flyers) append the coordinate index.
+
+        Returns:
+            (position_names, velocity_names) of length nq and nv
+        """
+        q_names: list[str] = []
+        v_names: list[str] = []
+        for joint_id in range(1, self.model.njoints):
+            name = self.model.names[joint_id]
+            joint = self.model.joints[joint_id]
+            q_names.extend(
+                [name] if joint.nq == 1 else [f"{name}_{i}" for i in range(joint.nq)]
+            )
+            v_names.extend(
+                [name] if joint.nv == 1 else [f"{name}_{i}" for i in range(joint.nv)]
+            )
+        return q_names, v_names
+
+    def compute_counterfactual_datasets(
+        self,
+        times: np.ndarray,
+        q: np.ndarray,
+        v: np.ndarray,
+        tau: np.ndarray,
+        frames: Mapping[str, str] | None = None,
+        n_threads: int = 1,
+    ) -> dict[str, dict[str, np.ndarray]]:
+        """Build BASEQ/ZTCFQ/DELTAQ tables for a whole swing in one call.
+
+        Tables follow the Simscape data layout: one row per sample, a
+        ``Time`` column, and one column per signal. ``BASEQ`` holds the
+        recorded dynamics, ``ZTCFQ`` the zero-torque counterfactual from the
+        same states, and ``DELTAQ = BASEQ - ZTCFQ`` (the torque contribution).
+
+        Args:
+            times: Sample times (N,)
+            q: Joint configurations (N, nq)
+            v: Joint velocities (N, nv)
+            tau: Joint torques (N, nv)
+            frames: Optional mapping of column name to Pinocchio frame name
+                (e.g. ``{"Clubhead": "club_head"}``); positions are emitted
+                as (N, 3) columns.
+            n_threads: Number of worker threads
+
+        Returns:
+            Mapping of dataset name to ``{column: array}``
+        """
+        q, v, tau = self._check_trajectory(q, v, tau)
+        times = np.asarray(times, dtype=np.float64).reshape(-1)
+        if times.shape[0] != q.shape[0]:
+            msg = f"times must have {q.shape[0]} samples, got {times.shape[0]}"
+            raise ValueError(msg)
+
+        acc_base = self.forward_dynamics_trajectory(q, v, tau, n_threads=n_threads)
+        acc_ztcf = self.forward_dynamics_trajectory(
+            q, v, np.zeros_like(tau), n_threads=n_threads
+        )
+
+        frame_positions = self._frame_positions(q, frames or {}, n_threads)
+
+        q_names, v_names = self.coordinate_names()
+        zeros_v = np.zeros_like(v)
+
+        def table(accel: np.ndarray, torque: np.ndarray) -> dict[str, np.ndarray]:
+            columns: dict[str, np.ndarray] = {TIME_COLUMN: times}
+            for i, name in enumerate(q_names):
+                columns[f"{name}Position"] = q[:, i]
+            for i, name in enumerate(v_names):
+                columns[f"{name}Velocity"] = v[:, i]
+                columns[f"{name}Acceleration"] = accel[:, i]
+                columns[f"{name}Torque"] = torque[:, i]
+            columns.update(frame_positions)
+            return columns
+
+        base = table(acc_base, tau)
+        ztcf = table(acc_ztcf, zeros_v)
+        delta = {
+            name: (values if name == TIME_COLUMN else values - ztcf[name])
+            for name, values in base.items()
+        }
+        return {BASEQ: base, ZTCFQ: ztcf, DELTAQ: delta}
+
+    def _frame_positions(
+        self, q: np.ndarray, frames: Mapping[str, str], n_threads: int
+    ) -> dict[str, np.ndarray]:
+        """World positions (N, 3) of the requested frames."""
+        if not frames:
+            return {}
+
+        frame_ids = {}
+        for column, frame_name in frames.items():
+            if not self.model.existFrame(frame_name):
+                msg = f"Frame '{frame_name}' not found in model"
+                raise ValueError(msg)
+            frame_ids[column] = self.model.getFrameId(frame_name)
+
+        positions = {column: np.empty((q.shape[0], 3)) for column in frame_ids}
+        model = self.model
+
+        def kernel(data: pin.Data, start: int, stop: int) -> None:
+            for k in range(start, stop):
+                pin.framesForwardKinematics(model, data, q[k])
+                for column, frame_id in frame_ids.items():
+                    positions[column][k] = data.oMf[frame_id].translation
+
+        self._map_samples(q.shape[0], kernel, n_threads)
+        return positions
+
+
+def save_counterfactual_mat(
+    datasets: Mapping[str, Mapping[str, np.ndarray]], output_dir: Path | str
+) -> list[Path]:
+    """Write counterfactual tables as ``<NAME>.mat`` struct arrays.
+
+    Each file holds one variable named after the dataset: an (N, 1) struct
+    array whose fields are the table columns, matching what the Simscape GUI
+    loaders read from MATLAB.
+
+    Args:
+        datasets: Output of :meth:`DynamicsEngine.compute_counterfactual_datasets`
+        output_dir: Destination directory
+
+    Returns:
+        Paths of the written files
+    """
+    import scipy.io
+
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    for name, columns in datasets.items():
+        n_rows = len(columns[TIME_COLUMN])
+        dtype = [(col, np.float64, values.shape[1:]) for col, values in columns.items()]
+        table = np.zeros((n_rows, 1), dtype=dtype)
+        for col, values in columns.items():
+            table[col][:, 0] = values
+
+        path = out / f"{name}.mat"
+        scipy.io.savemat(path, {name: table})
+        written.append(path)
+    return written
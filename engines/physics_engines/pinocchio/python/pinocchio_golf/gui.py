@@ -17,6 +17,11 @@ from pinocchio.visualize import MeshcatVisualizer
 from PyQt6 import QtCore, QtWidgets
 from shared.python.biomechanics_data import BiomechanicalData
 from shared.python.common_utils import get_shared_urdf_path
+from shared.python.manipulability import (
+    EllipsoidCache,
+    core_matrix,
+    ellipsoid_from_core,
+)
 from shared.python.plotting import GolfSwingPlotter, MplCanvas
 from shared.python.statistical_analysis import StatisticalAnalyzer
 
@@ -79,17 +84,22 @@ class PinocchioRecorder:
 
     def __init__(self) -> None:
         """Initialize empty recorder."""
+        # Incremented whenever the recorded data changes, so analyses of a
+        # finished recording can be reused
+        self.version = 0
         self.reset()
 
     def reset(self) -> None:
         """Clear all recorded data."""
         self.frames: list[BiomechanicalData] = []
         self.is_recording = False
+        self.version += 1
 
     def start_recording(self) -> None:
         """Start recording data."""
         self.is_recording = True
         self.frames = []
+        self.version += 1
 
     def stop_recording(self) -> None:
         """Stop recording data."""
@@ -148,6 +158,7 @@ class PinocchioRecorder:
                 club_head_speed=club_head_speed,
             )
             self.frames.append(frame)
+            self.version += 1
 
     def get_time_series(self, field_name: str) -> tuple[np.ndarray, np.ndarray | list]:
         """Extract time series for a specific field.
@@ -202,6 +213,7 @@ class PinocchioGUI(QtWidgets.QMainWindow):
         self.viz: MeshcatVisualizer | None = None
         self.q: np.ndarray | None = None
         self.v: np.ndarray | None = None
+        self.ellipsoid_cache = EllipsoidCache()
 
         # Recorder
         self.recorder = PinocchioRecorder()
@@ -563,18 +575,8 @@ class PinocchioGUI(QtWidgets.QMainWindow):
         if not filename:
             return
 
-        times, positions = self.recorder.get_time_series("joint_positions")
-        _, velocities = self.recorder.get_time_series("joint_velocities")
-        _, torques = self.recorder.get_time_series("joint_torques")
-
-        # Ensure arrays are numpy arrays for mypy
-        positions_arr = np.asarray(positions)
-        velocities_arr = np.asarray(velocities)
-        torques_arr = np.asarray(torques)
-
-        analyzer = StatisticalAnalyzer(
-            times, positions_arr, velocities_arr, torques_arr
-        )
+        # Reuses the cached analysis while the recording is unchanged
+        analyzer = StatisticalAnalyzer.for_recorder(self.recorder)
 
         try:
             analyzer.export_statistics_csv(filename)
@@ -692,6 +694,7 @@ class PinocchioGUI(QtWidgets.QMainWindow):
             self.q = pin.neutral(self.model)
             self.v = np.zeros(self.model.nv)
             self.sim_time = 0.0
+            self.ellipsoid_cache.clear()
 
             # Reset recorder
             self.recorder.reset()
@@ -1040,43 +1043,46 @@ class PinocchioGUI(QtWidgets.QMainWindow):
 
         # End effector joint
         joint_id = self.model.njoints - 1
-        joint_pos = self.data.oMi[joint_id].translation
-
-        # Get Jacobian (Translational only for 3D visualization)
-        J_full = pin.getJointJacobian(
-            self.model,
-            self.data,
-            joint_id,
-            pin.ReferenceFrame.LOCAL_WORLD_ALIGNED,
-        )
-        J = J_full[:3, :]  # Linear part
 
-        # Mass Matrix
-        M = pin.crba(self.model, self.data, self.q)
-        # Ensure symmetric if using older pin version
-        M_sym = np.triu(M) + np.triu(M, 1).T
+        # Reuse the last ellipsoid while the configuration is unchanged
+        ellipsoid = self.ellipsoid_cache.lookup(joint_id, self.q)
 
         try:
-            Minv = np.linalg.inv(M_sym)
-            Lambda_inv = J @ Minv @ J.T
-
-            # Eigen decomposition
-            eigvals, eigvecs = np.linalg.eigh(Lambda_inv)
+            if ellipsoid is None:
+                # Get Jacobian (Translational only for 3D visualization)
+                J_full = pin.getJointJacobian(
+                    self.model,
+                    self.data,
+                    joint_id,
+                    pin.ReferenceFrame.LOCAL_WORLD_ALIGNED,
+                )
+                J = J_full[:3, :]  # Linear part
+
+                # Mass Matrix
+                M = pin.crba(self.model, self.data, self.q)
+                # Ensure symmetric if using older pin version
+                M_sym = np.triu(M) + np.triu(M, 1).T
+                ellipsoid = ellipsoid_from_core(
+                    core_matrix(J, M_sym), self.data.oMi[joint_id].translation
+                )
+                self.ellipsoid_cache.store(joint_id, self.q, ellipsoid)
 
             if self.chk_mobility.isChecked():
-                # Radii = sqrt(eigenvalues)
-                radii = np.sqrt(np.maximum(eigvals, 1e-6))
                 self._draw_ellipsoid_meshcat(
-                    "mobility", joint_pos, eigvecs, radii, 0x00FF00
+                    "mobility",
+                    ellipsoid.center,
+                    ellipsoid.axes,
+                    ellipsoid.mobility_radii,
+                    0x00FF00,
                 )
 
             if self.chk_force_ellip.isChecked():
-                # Radii = 1/sqrt(eigenvalues)
-                radii_force = 1.0 / np.sqrt(np.maximum(eigvals, 1e-6))
-                # Clip to reasonable visual size
-                radii_force = np.clip(radii_force, 0.01, 5.0)
                 self._draw_ellipsoid_meshcat(
-                    "force", joint_pos, eigvecs, radii_force, 0xFF0000
+                    "force",
+                    ellipsoid.center,
+                    ellipsoid.axes,
+                    ellipsoid.force_radii,
+                    0xFF0000,
                 )
 
         except Exception as e:
@@ -0,0 +1,127 @@
+"""Tests for trajectory-level ZTCF/ZVCF counterfactuals in DynamicsEngine."""
+
+import numpy as np
+import pytest
+
+pin = pytest.importorskip("pinocchio")
+
+try:
+    from dtack.sim.dynamics import (
+        BASEQ,
+        DELTAQ,
+        ZTCFQ,
+        DynamicsEngine,
+        save_counterfactual_mat,
+    )
+except ImportError:
+    pytest.skip("dtack dependencies missing", allow_module_level=True)
+
+DT = 1e-3
+
+
+@pytest.fixture
+def engine() -> DynamicsEngine:
+    """Dynamics engine on Pinocchio's sample manipulator."""
+    model = pin.buildSampleModelManipulator()
+    return DynamicsEngine(model, model.createData())
+
+
+@pytest.fixture
+def swing(engine: DynamicsEngine) -> tuple[np.ndarray, ...]:
+    """Random (q, v, tau) trajectory with 40 samples."""
+    rng = np.random.default_rng(7)
+    n = 40
+    model = engine.model
+    q = np.array([pin.randomConfiguration(model) for _ in range(n)])
+    v = rng.standard_normal((n, model.nv))
+    tau = rng.standard_normal((n, model.nv))
+    return q, v, tau
+
+
+def test_ztcf_trajectory_matches_single_step(
+    engine: DynamicsEngine, swing: tuple[np.ndarray, ...]
+) -> None:
+    """Batched ZTCF equals calling compute_ztcf per sample."""
+    q, v, _ = swing
+    series = engine.compute_ztcf_trajectory(q, v, DT)
+
+    for k in range(q.shape[0]):
+        q_next, v_next = engine.compute_ztcf(q[k], v[k], DT)
+        np.testing.assert_allclose(series.q_next[k], q_next, atol=1e-12)
+        np.testing.assert_allclose(series.v_next[k], v_next, atol=1e-12)
+
+
+def test_zvcf_trajectory_matches_single_step(
+    engine: DynamicsEngine, swing: tuple[np.ndarray, ...]
+) -> None:
+    """Batched ZVCF equals calling compute_zvcf per sample."""
+    q, _, tau = swing
+    series = engine.compute_zvcf_trajectory(q, tau, DT)
+
+    for k in range(q.shape[0]):
+        q_next, v_next = engine.compute_zvcf(q[k], tau[k], DT)
+        np.testing.assert_allclose(series.q_next[k], q_next, atol=1e-12)
+        np.testing.assert_allclose(series.v_next[k], v_next, atol=1e-12)
+
+
+def test_threaded_results_match_serial(
+    engine: DynamicsEngine, swing: tuple[np.ndarray, ...]
+) -> None:
+    """Splitting samples over threads does not change the result."""
+    q, v, tau = swing
+    serial = engine.forward_dynamics_trajectory(q, v, tau)
+    threaded = engine.forward_dynamics_trajectory(q, v, tau, n_threads=4)
+    np.testing.assert_array_equal(serial, threaded)
+
+
+def test_counterfactual_datasets_layout(
+    engine: DynamicsEngine, swing: tuple[np.ndarray, ...]
+) -> None:
+    """BASEQ/ZTCFQ/DELTAQ share columns and DELTAQ isolates the torques."""
+    q, v, tau = swing
+    times = np.arange(q.shape[0]) * DT
+    frame = engine.model.frames[-1].name
+    datasets = engine.compute_counterfactual_datasets(
+        times, q, v, tau, frames={"Clubhead": frame}, n_threads=2
+    )
+
+    assert set(datasets) == {BASEQ, ZTCFQ, DELTAQ}
+    assert list(datasets[BASEQ]) == list(datasets[ZTCFQ]) == list(datasets[DELTAQ])
+    np.testing.assert_array_equal(datasets[DELTAQ]["Time"], times)
+    assert datasets[BASEQ]["Clubhead"].shape == (q.shape[0], 3)
+
+    # DELTAQ acceleration = M^-1 tau
+    joint = engine.model.names[1]
+    data = engine.model.createData()
+    M = pin.crba(engine.model, data, q[0])
+    M = np.triu(M) + np.triu(M, 1).T
+    expected = np.linalg.solve(M, tau[0])
+    np.testing.assert_allclose(
+        datasets[DELTAQ][f"{joint}Acceleration"][0], expected[0], atol=1e-9
+    )
+    np.testing.assert_allclose(datasets[DELTAQ][f"{joint}Torque"], tau[:, 0])
+    np.testing.assert_allclose(datasets[ZTCFQ][f"{joint}Torque"], 0.0)
+
+
+def test_save_counterfactual_mat_round_trip(
+    engine: DynamicsEngine, swing: tuple[np.ndarray, ...], tmp_path
+) -> None:
+    """Tables are written as (N, 1) struct arrays readable by scipy."""
+    scipy_io = pytest.importorskip("scipy.io")
+    q, v, tau = swing
+    times = np.arange(q.shape[0]) * DT
+    datasets = engine.compute_counterfactual_datasets(times, q, v, tau)
+
+    paths = save_counterfactual_mat(datasets, tmp_path)
+    assert [p.name for p in paths] == ["BASEQ.mat", "ZTCFQ.mat", "DELTAQ.mat"]
+
+    table = scipy_io.loadmat(tmp_path / "ZTCFQ.mat")["ZTCFQ"]
+    assert table.shape == (q.shape[0], 1)
+    assert table[5, 0]["Time"].item() == pytest.approx(times[5])
+
+
+def test_rejects_mismatched_shapes(engine: DynamicsEngine) -> None:
+    """Trajectory arrays must agree on sample count and width."""
+    q = np.array([pin.neutral(engine.model)] * 3)
+    with pytest.raises(ValueError, match="Expected shape"):
+        engine.compute_ztcf_trajectory(q, np.zeros((2, engine.model.nv)), DT)
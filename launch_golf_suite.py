@@ -208,13 +208,13 @@ def launch_urdf_generator():
 def show_status():
     """Show Golf Modeling Suite status."""
     try:
-        from launchers.unified_launcher import UnifiedLauncher
+        # Status is printed without constructing the Qt launcher window.
+        from launchers.unified_launcher import print_status_report
 
-        launcher = UnifiedLauncher()
-        launcher.show_status()
+        print_status_report()
     except Exception as e:
-        # Fallback to basic status if UnifiedLauncher fails
-        logger.warning(f"Could not use UnifiedLauncher for status: {e}")
+        # Fallback to basic status if the status report fails
+        logger.warning(f"Could not print status report: {e}")
         _show_basic_status()
 
 
@@ -66,55 +66,7 @@ class UnifiedLauncher:
 
         Shows available engines, their status, and configuration.
         """
-        from shared.python.engine_manager import EngineManager
-
-        manager = EngineManager()
-
-        print("\n" + "=" * 60)
-        print("Golf Modeling Suite - Status Report")
-        print("=" * 60 + "\n")
-
-        # Show available engines
-        print("Available Engines:")
-        print("-" * 60)
-
-        engines = manager.get_available_engines()
-        if engines:
-            for engine in engines:
-                print(f"  ✅ {engine.value.upper()}")
-        else:
-            print("  ❌ No engines available")
-
-        print()
-
-        # Show suite root
-        from shared.python import SUITE_ROOT
-
-        print(f"Suite Root: {SUITE_ROOT}")
-        print()
-
-        # Show launcher paths
-        print("Launcher Paths:")
-        print("-" * 60)
-
-        launcher_dir = Path(__file__).parent
-        for launcher_file in launcher_dir.glob("*_launcher.py"):
-            if launcher_file.name != "unified_launcher.py":
-                print(f"  • {launcher_file.name}")
-
-        print()
-
-        # Show engine directories
-        print("Engine Directories:")
-        print("-" * 60)
-
-        engines_dir = SUITE_ROOT / "engines"
-        if engines_dir.exists():
-            for engine_dir in engines_dir.iterdir():
-                if engine_dir.is_dir() and not engine_dir.name.startswith("."):
-                    print(f"  • {engine_dir.name}")
-
-        print("\n" + "=" * 60 + "\n")
+        print_status_report()
 
     def get_version(self) -> str:
         """Get suite version from package metadata.
@@ -147,6 +99,71 @@ class UnifiedLauncher:
         return "1.0.0-beta"
 
 
+def print_status_report() -> None:
+    """Print suite status without creating any Qt objects.
+
+    Engine readiness comes from the probe cache, so on a warm cache this only
+    stats a handful of directories and never imports the physics engines.
+    """
+    from shared.python.engine_manager import EngineManager
+
+    manager = EngineManager()
+
+    print("\n" + "=" * 60)
+    print("Golf Modeling Suite - Status Report")
+    print("=" * 60 + "\n")
+
+    # Show available engines
+    print("Available Engines:")
+    print("-" * 60)
+
+    engines = manager.get_available_engines()
+    if engines:
+        results = manager.probe_all_engines()
+        for engine in engines:
+            result = results.get(engine)
+            if result is None:
+                print(f"  ✅ {engine.value.upper()}")
+                continue
+            icon = "✅" if result.is_available() else "⚠️"
+            print(f"  {icon} {engine.value.upper()}: {result.diagnostic_message}")
+        probe_ms = sum(manager.probe_timings.values()) * 1000
+        print(f"\n  Probe time: {probe_ms:.0f} ms (cache: {manager.probe_cache.path})")
+    else:
+        print("  ❌ No engines available")
+
+    print()
+
+    # Show suite root
+    from shared.python import SUITE_ROOT
+
+    print(f"Suite Root: {SUITE_ROOT}")
+    print()
+
+    # Show launcher paths
+    print("Launcher Paths:")
+    print("-" * 60)
+
+    launcher_dir = Path(__file__).parent
+    for launcher_file in launcher_dir.glob("*_launcher.py"):
+        if launcher_file.name != "unified_launcher.py":
+            print(f"  • {launcher_file.name}")
+
+    print()
+
+    # Show engine directories
+    print("Engine Directories:")
+    print("-" * 60)
+
+    engines_dir = SUITE_ROOT / "engines"
+    if engines_dir.exists():
+        for engine_dir in engines_dir.iterdir():
+            if engine_dir.is_dir() and not engine_dir.name.startswith("."):
+                print(f"  • {engine_dir.name}")
+
+    print("\n" + "=" * 60 + "\n")
+
+
 # Convenience function for CLI usage
 def launch() -> int:
     """Launch the Golf Modeling Suite GUI.
@@ -160,8 +177,7 @@ def launch() -> int:
 
 def show_status() -> None:
     """Show suite status without launching GUI."""
-    launcher = UnifiedLauncher()
-    launcher.show_status()
+    print_status_report()
 
 
 if __name__ == "__main__":
@@ -1,19 +1,31 @@
-"""Comparative analysis module for comparing two golf swings.
+"""Comparative analysis module for comparing golf swings.
 
 This module provides tools to align and compare two sets of swing data,
-calculating differences in kinematics, kinetics, and timing.
+calculating differences in kinematics, kinetics, and timing, and a
+:class:`SwingLibrary` that compares one swing against many references.
+
+Swings are resampled once onto a normalized time base (0-100% of the swing)
+and the resampled matrices are cached, so all-pairs RMS/correlation is a
+single vectorized pass. Time-warped comparisons use banded dynamic time
+warping (Sakoe-Chiba band) with LB_Keogh pruning and early abandoning.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import Any, Literal, Protocol
 
 import numpy as np
-from scipy import interpolate
+from numpy.lib.stride_tricks import sliding_window_view
+
+DEFAULT_NUM_POINTS = 100
+DEFAULT_BAND_FRACTION = 0.1  # Warping window as a fraction of the swing
+FLAT_SIGNAL_STD = 1e-6  # Signals flatter than this have no defined correlation
+DTW_BATCH_SIZE = 64  # References warped together between threshold updates
+DTW_ABANDON_RTOL = 1e-12  # Slack on max_cost so bounds summed in another order hold
 
-if TYPE_CHECKING:
-    pass
+AlignmentMethod = Literal["linear", "dtw"]
 
 
 class RecorderInterface(Protocol):
@@ -31,6 +43,223 @@ class RecorderInterface(Protocol):
         ...
 
 
+def resample_normalized(
+    times: np.ndarray, values: np.ndarray, num_points: int = DEFAULT_NUM_POINTS
+) -> np.ndarray:
+    """Linearly resample a signal onto ``num_points`` samples of normalized time.
+
+    Equivalent to ``interp1d(t_norm, values, axis=0)(linspace(0, 1, num_points))``
+    but resamples every column in one pass.
+
+    Args:
+        times: Sample times, shape (N,), strictly increasing
+        values: Samples, shape (N,) or (N, C)
+        num_points: Number of points on the normalized time base
+
+    Returns:
+        Resampled values, shape (num_points,) or (num_points, C)
+
+    Raises:
+        ValueError: If fewer than two samples are given or shapes disagree
+    """
+    times = np.asarray(times, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if times.ndim != 1 or len(times) < 2 or len(values) != len(times):
+        msg = "Resampling requires at least two samples with one value per time"
+        raise ValueError(msg)
+
+    t_norm = (times - times[0]) / (times[-1] - times[0])
+    grid = np.linspace(0.0, 1.0, num_points)
+    idx = np.clip(np.searchsorted(t_norm, grid, side="right") - 1, 0, len(times) - 2)
+    weight = (grid - t_norm[idx]) / (t_norm[idx + 1] - t_norm[idx])
+    if values.ndim > 1:
+        weight = weight.reshape(-1, *([1] * (values.ndim - 1)))
+    return values[idx] * (1.0 - weight) + values[idx + 1] * weight
+
+
+def band_radius(num_points: int, band: float = DEFAULT_BAND_FRACTION) -> int:
+    """Convert a warping band given as a fraction of the swing to samples.
+
+    Args:
+        num_points: Length of the normalized time base
+        band: Band half-width as a fraction of ``num_points`` (0 disables warping)
+
+    Returns:
+        Band half-width in samples
+    """
+    if band < 0:
+        msg = f"Warping band must be non-negative, got {band}"
+        raise ValueError(msg)
+    return min(int(round(band * num_points)), num_points - 1)
+
+
+def _as_channels(values: np.ndarray, ndim: int) -> np.ndarray:
+    """Give 1-D signals (or stacks of them) an explicit channel axis."""
+    values = np.asarray(values, dtype=float)
+    return values[..., None] if values.ndim < ndim else values
+
+
+def _zscore(values: np.ndarray) -> np.ndarray:
+    """Standardize each channel over time (axis -2); flat channels become 0."""
+    mean = values.mean(axis=-2, keepdims=True)
+    std = values.std(axis=-2, keepdims=True)
+    return np.divide(
+        values - mean,
+        std,
+        out=np.zeros_like(values),
+        where=std > FLAT_SIGNAL_STD,
+    )
+
+
+def _correlation(a: np.ndarray, b: np.ndarray) -> float:
+    """Mean per-channel Pearson correlation of two (P,) or (P, C) signals."""
+    za = _zscore(_as_channels(a, 2))
+    zb = _zscore(_as_channels(b, 2))
+    return float(np.mean(za * zb) if za.size else 0.0)
+
+
+def lb_keogh(query: np.ndarray, references: np.ndarray, radius: int) -> np.ndarray:
+    """LB_Keogh lower bound of the banded DTW cost of each reference.
+
+    Every reference sample is matched to at least one query sample within
+    ``radius``, so its distance to the query's running min/max envelope
+    bounds the accumulated squared-error cost from below.
+
+    Args:
+        query: Query signal, shape (P,) or (P, C)
+        references: Reference signals, shape (R, P) or (R, P, C)
+        radius: Band half-width in samples
+
+    Returns:
+        Lower bounds on :func:`dtw_costs`, shape (R,)
+    """
+    query = _as_channels(query, 2)
+    references = _as_channels(references, 3)
+    padded = np.pad(query, ((radius, radius), (0, 0)), mode="edge")
+    windows = sliding_window_view(padded, 2 * radius + 1, axis=0)
+    upper = windows.max(axis=-1)
+    lower = windows.min(axis=-1)
+    excess = np.maximum(references - upper, 0.0) + np.maximum(lower - references, 0.0)
+    return (excess**2).sum(axis=(1, 2))
+
+
+def _dtw_row(previous: np.ndarray, cost: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    """Advance the DTW recurrence by one query sample for a batch of references.
+
+    ``previous`` holds the prior row of the accumulated cost matrix with a
+    leading sentinel column (column ``j + 1`` is reference sample ``j``).
+    Within the band the left-neighbour dependency
+    ``D[j] = cost[j] + min(entry[j], D[j - 1])`` is a min-plus prefix scan,
+    solved with cumulative sums instead of a loop over ``j``.
+    """
+    entry = np.minimum(previous[:, lo:hi], previous[:, lo + 1 : hi + 1])
+    total = np.cumsum(cost, axis=1)
+    row = np.full_like(previous, np.inf)
+    row[:, lo + 1 : hi + 1] = total + np.minimum.accumulate(
+        entry - (total - cost), axis=1
+    )
+    return row
+
+
+def dtw_costs(
+    query: np.ndarray,
+    references: np.ndarray,
+    radius: int,
+    max_cost: float | np.ndarray = np.inf,
+) -> np.ndarray:
+    """Banded DTW cost between one query and a batch of equal-length references.
+
+    The local cost is the squared difference summed over channels, so with
+    ``radius=0`` the result is the squared Euclidean distance. References are
+    warped together, one query sample at a time; once the smallest entry of a
+    reference's current row exceeds ``max_cost`` its final cost must too, and
+    it is dropped from the batch (early abandoning). ``max_cost`` is widened
+    by a relative ``DTW_ABANDON_RTOL`` so that a bound computed with a
+    different summation order (such as the Euclidean cost) is not rejected
+    by round-off.
+
+    Args:
+        query: Query signal, shape (P,) or (P, C)
+        references: Reference signals, shape (R, P) or (R, P, C)
+        radius: Band half-width in samples (Sakoe-Chiba window)
+        max_cost: Abandoning threshold, scalar or per reference
+
+    Returns:
+        Accumulated costs, shape (R,); ``inf`` where the cost exceeds ``max_cost``
+
+    Raises:
+        ValueError: If the query and references differ in shape
+    """
+    query = _as_channels(query, 2)
+    references = _as_channels(references, 3)
+    if references.shape[1:] != query.shape:
+        msg = (
+            f"References of shape {references.shape[1:]} do not match "
+            f"query of shape {query.shape}"
+        )
+        raise ValueError(msg)
+
+    n_refs, n_points, _ = references.shape
+    limit = np.broadcast_to(np.asarray(max_cost, dtype=float), (n_refs,))
+    limit = limit * (1.0 + DTW_ABANDON_RTOL) + np.finfo(float).tiny
+    result = np.full(n_refs, np.inf)
+    active = np.arange(n_refs)
+
+    row = np.full((n_refs, n_points + 1), np.inf)
+    row[:, 0] = 0.0
+    for i in range(n_points):
+        lo, hi = max(0, i - radius), min(n_points, i + radius + 1)
+        cost = ((references[active, lo:hi] - query[i]) ** 2).sum(axis=2)
+        row = _dtw_row(row, cost, lo, hi)
+
+        keep = row[:, lo + 1 : hi + 1].min(axis=1) <= limit[active]
+        if not keep.all():
+            active = active[keep]
+            row = row[keep]
+            if not active.size:
+                return result
+
+    final = row[:, n_points]
+    result[active] = np.where(final <= limit[active], final, np.inf)
+    return result
+
+
+def dtw_path(a: np.ndarray, b: np.ndarray, radius: int) -> tuple[float, np.ndarray]:
+    """Optimal banded DTW alignment between two equal-length signals.
+
+    Args:
+        a: First signal, shape (P,) or (P, C)
+        b: Second signal, same shape as ``a``
+        radius: Band half-width in samples
+
+    Returns:
+        Tuple of (accumulated cost, warping path as an (L, 2) array of
+        ``(index_a, index_b)`` pairs from (0, 0) to (P - 1, P - 1))
+    """
+    a = _as_channels(a, 2)
+    b = _as_channels(b, 2)
+    if a.shape != b.shape:
+        msg = f"Signals of shape {a.shape} and {b.shape} cannot be warped"
+        raise ValueError(msg)
+
+    n_points = len(a)
+    acc = np.full((n_points + 1, n_points + 1), np.inf)
+    acc[0, 0] = 0.0
+    for i in range(n_points):
+        lo, hi = max(0, i - radius), min(n_points, i + radius + 1)
+        cost = ((b[lo:hi] - a[i]) ** 2).sum(axis=1)
+        acc[i + 1] = _dtw_row(acc[i][None], cost[None], lo, hi)[0]
+
+    # Backtrack in the padded matrix, where acc[i + 1, j + 1] is D[i, j]
+    i = j = n_points
+    path = [(i - 1, j - 1)]
+    while (i, j) != (1, 1):
+        steps = ((i - 1, j - 1), (i - 1, j), (i, j - 1))
+        i, j = min(steps, key=lambda step: acc[step])
+        path.append((i - 1, j - 1))
+    return float(acc[n_points, n_points]), np.array(path[::-1])
+
+
 @dataclass
 class ComparisonMetric:
     """Result of a metric comparison between two swings."""
@@ -76,76 +305,94 @@ class ComparativeSwingAnalyzer:
         self.recorder_b = recorder_b
         self.name_a = name_a
         self.name_b = name_b
+        # Resampled fields keyed by (recorder, field_name, num_points)
+        self._resampled: dict[tuple[str, str, int], np.ndarray | None] = {}
+
+    def clear_cache(self) -> None:
+        """Forget resampled signals (call after the recorders change)."""
+        self._resampled.clear()
+
+    def _resample(
+        self, which: str, field_name: str, num_points: int
+    ) -> np.ndarray | None:
+        """Resample a recorder's field once and cache it."""
+        key = (which, field_name, num_points)
+        if key not in self._resampled:
+            recorder = self.recorder_a if which == "a" else self.recorder_b
+            times, values = recorder.get_time_series(field_name)
+            times = np.asarray(times)
+            values = np.asarray(values)
+            if len(times) < 2 or len(values) != len(times):
+                self._resampled[key] = None
+            else:
+                self._resampled[key] = resample_normalized(times, values, num_points)
+        return self._resampled[key]
 
     def align_signals(
         self,
         field_name: str,
-        num_points: int = 100,
+        num_points: int = DEFAULT_NUM_POINTS,
         joint_idx: int | None = None,
+        method: AlignmentMethod = "linear",
+        band: float = DEFAULT_BAND_FRACTION,
     ) -> AlignedSignals | None:
         """Align two signals by normalizing time to 0-100%.
 
+        With ``method="dtw"`` swing B is additionally time-warped onto swing
+        A's normalized time base (banded DTW), so differences in tempo within
+        the swing do not show up as error.
+
         Args:
             field_name: Name of data field (e.g. 'joint_velocities')
             num_points: Number of points for normalized time base
             joint_idx: Index if field is multidimensional
+            method: 'linear' time normalization or 'dtw' warping
+            band: DTW band half-width as a fraction of ``num_points``
 
         Returns:
             AlignedSignals object or None if data missing
         """
-        # Get data
-        t_a, data_a = self.recorder_a.get_time_series(field_name)
-        t_b, data_b = self.recorder_b.get_time_series(field_name)
-
-        # Convert to numpy
-        data_a = np.asarray(data_a)
-        data_b = np.asarray(data_b)
+        if method not in ("linear", "dtw"):
+            msg = f"Unknown alignment method: {method}"
+            raise ValueError(msg)
 
-        if len(t_a) < 2 or len(t_b) < 2:
+        sig_a_resampled = self._resample("a", field_name, num_points)
+        sig_b_resampled = self._resample("b", field_name, num_points)
+        if sig_a_resampled is None or sig_b_resampled is None:
             return None
 
         # Handle multidimensional data
         if joint_idx is not None:
-            if data_a.ndim > 1:
-                if joint_idx >= data_a.shape[1]:
+            if sig_a_resampled.ndim > 1:
+                if joint_idx >= sig_a_resampled.shape[1]:
                     return None
-                data_a = data_a[:, joint_idx]
-            if data_b.ndim > 1:
-                if joint_idx >= data_b.shape[1]:
+                sig_a_resampled = sig_a_resampled[:, joint_idx]
+            if sig_b_resampled.ndim > 1:
+                if joint_idx >= sig_b_resampled.shape[1]:
                     return None
-                data_b = data_b[:, joint_idx]
-
-        # Normalize time to 0..1
-        t_a_norm = (t_a - t_a[0]) / (t_a[-1] - t_a[0])
-        t_b_norm = (t_b - t_b[0]) / (t_b[-1] - t_b[0])
-
-        # Common time base
-        t_common = np.linspace(0, 1, num_points)
+                sig_b_resampled = sig_b_resampled[:, joint_idx]
 
-        # Interpolate
-        interp_a = interpolate.interp1d(t_a_norm, data_a, kind="linear")
-        interp_b = interpolate.interp1d(t_b_norm, data_b, kind="linear")
-
-        sig_a_resampled = interp_a(t_common)
-        sig_b_resampled = interp_b(t_common)
+        if method == "dtw":
+            _, path = dtw_path(
+                sig_a_resampled, sig_b_resampled, band_radius(num_points, band)
+            )
+            # Average the samples of B matched to each sample of A
+            counts = np.bincount(path[:, 0], minlength=num_points)
+            matched = np.zeros_like(sig_b_resampled, dtype=float)
+            np.add.at(matched, path[:, 0], sig_b_resampled[path[:, 1]])
+            sig_b_resampled = matched / counts.reshape(-1, *[1] * (matched.ndim - 1))
 
         # Compute differences
         error_curve = sig_a_resampled - sig_b_resampled
         rms = float(np.sqrt(np.mean(error_curve**2)))
 
-        # Compute correlation
-        if np.std(sig_a_resampled) > 1e-6 and np.std(sig_b_resampled) > 1e-6:
-            correlation = float(np.corrcoef(sig_a_resampled, sig_b_resampled)[0, 1])
-        else:
-            correlation = 0.0
-
         return AlignedSignals(
-            times=t_common,
+            times=np.linspace(0, 1, num_points),
             signal_a=sig_a_resampled,
             signal_b=sig_b_resampled,
             error_curve=error_curve,
             rms_error=rms,
-            correlation=correlation,
+            correlation=_correlation(sig_a_resampled, sig_b_resampled),
         )
 
     def compare_scalars(
@@ -223,3 +470,269 @@ class ComparativeSwingAnalyzer:
 
         report = {"swing_a": self.name_a, "swing_b": self.name_b, "metrics": metrics}
         return report
+
+
+@dataclass
+class ReferenceMatch:
+    """A reference swing returned by a nearest-neighbour query."""
+
+    name: str
+    index: int
+    distance: float  # RMS-equivalent: sqrt(cost / (num_points * num_channels))
+
+
+class SwingLibrary:
+    """Library of reference swings for many-to-many comparison.
+
+    Each swing is resampled once onto a normalized time base and stored in a
+    stacked (R, P, C) matrix, so comparing a query against every reference,
+    or all references against each other, is a single vectorized pass.
+    """
+
+    def __init__(
+        self,
+        field_name: str = "joint_velocities",
+        num_points: int = DEFAULT_NUM_POINTS,
+        joint_indices: Sequence[int] | None = None,
+    ) -> None:
+        """Initialize an empty library.
+
+        Args:
+            field_name: Recorder field compared between swings
+            num_points: Number of points on the normalized time base
+            joint_indices: Columns of a multidimensional field to compare
+                (all columns if None)
+        """
+        if num_points < 2:
+            msg = f"num_points must be at least 2, got {num_points}"
+            raise ValueError(msg)
+        self.field_name = field_name
+        self.num_points = num_points
+        self.joint_indices = None if joint_indices is None else list(joint_indices)
+        self._names: list[str] = []
+        self._rows: list[np.ndarray] = []
+        self._data: np.ndarray | None = None
+        self._zscored: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        """Number of reference swings."""
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        """Whether a reference with this name exists."""
+        return name in self._names
+
+    @property
+    def names(self) -> list[str]:
+        """Reference names in insertion order."""
+        return list(self._names)
+
+    @property
+    def data(self) -> np.ndarray:
+        """Resampled references, shape (R, num_points, C)."""
+        if self._data is None:
+            if not self._rows:
+                msg = "Swing library is empty"
+                raise ValueError(msg)
+            self._data = np.stack(self._rows)
+        return self._data
+
+    def resample(self, recorder: RecorderInterface) -> np.ndarray:
+        """Resample a recorder's field onto the library's time base.
+
+        Args:
+            recorder: Swing recorder
+
+        Returns:
+            Resampled signal, shape (num_points, C)
+
+        Raises:
+            ValueError: If the field has fewer than two samples
+        """
+        times, values = recorder.get_time_series(self.field_name)
+        values = _as_channels(np.asarray(values), 2)
+        if self.joint_indices is not None and len(values):
+            values = values[:, self.joint_indices]
+        return resample_normalized(np.asarray(times), values, self.num_points)
+
+    def add(self, name: str, recorder: RecorderInterface) -> None:
+        """Resample and add a reference swing.
+
+        Args:
+            name: Unique reference name
+            recorder: Swing recorder
+        """
+        self.add_resampled(name, self.resample(recorder))
+
+    def add_resampled(self, name: str, signal: np.ndarray) -> None:
+        """Add a reference that is already on the library's time base.
+
+        Args:
+            name: Unique reference name
+            signal: Resampled signal, shape (num_points,) or (num_points, C)
+
+        Raises:
+            ValueError: If the name is taken or the shape does not match
+        """
+        if name in self._names:
+            msg = f"Reference '{name}' already exists"
+            raise ValueError(msg)
+        signal = self._check_shape(signal)
+        self._names.append(name)
+        self._rows.append(signal)
+        self._data = None
+        self._zscored = None
+
+    def _check_shape(self, signal: np.ndarray) -> np.ndarray:
+        """Validate a resampled signal against the library's shape."""
+        signal = _as_channels(signal, 2)
+        expected = self._rows[0].shape if self._rows else None
+        if len(signal) != self.num_points or (
+            expected is not None and signal.shape != expected
+        ):
+            msg = (
+                f"Signal of shape {signal.shape} does not match library "
+                f"shape {expected or (self.num_points, 'C')}"
+            )
+            raise ValueError(msg)
+        return signal
+
+    def _as_query(self, query: RecorderInterface | np.ndarray) -> np.ndarray:
+        """Resample a recorder query, or validate a pre-resampled one."""
+        if isinstance(query, np.ndarray):
+            signal = _as_channels(query, 2)
+        else:
+            signal = self.resample(query)
+        if signal.shape != self.data.shape[1:]:
+            msg = (
+                f"Query of shape {signal.shape} does not match library "
+                f"shape {self.data.shape[1:]}"
+            )
+            raise ValueError(msg)
+        return signal
+
+    def _zscores(self) -> np.ndarray:
+        """Per-channel standardized references, cached."""
+        if self._zscored is None:
+            self._zscored = _zscore(self.data)
+        return self._zscored
+
+    def compare(
+        self, query: RecorderInterface | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """RMS error and correlation of a query against every reference.
+
+        Correlation is the mean per-channel Pearson correlation, with flat
+        channels contributing 0, matching
+        :meth:`ComparativeSwingAnalyzer.align_signals` for a single channel.
+
+        Args:
+            query: Recorder, or a signal already on the library's time base
+
+        Returns:
+            Tuple of (rms, correlation), each of shape (R,)
+        """
+        signal = self._as_query(query)
+        rms = np.sqrt(((self.data - signal) ** 2).mean(axis=(1, 2)))
+        correlation = np.einsum("rpc,pc->r", self._zscores(), _zscore(signal))
+        return rms, correlation / signal.size
+
+    def pairwise(self) -> tuple[np.ndarray, np.ndarray]:
+        """RMS error and correlation between all pairs of references.
+
+        Returns:
+            Tuple of (rms, correlation), each of shape (R, R)
+        """
+        data = self.data
+        n_refs = len(data)
+        size = data[0].size
+        flat = data.reshape(n_refs, -1)
+        sq_norms = np.einsum("ij,ij->i", flat, flat)
+        sq_dist = sq_norms[:, None] + sq_norms[None, :] - 2.0 * (flat @ flat.T)
+        np.fill_diagonal(sq_dist, 0.0)
+        rms = np.sqrt(np.maximum(sq_dist, 0.0) / size)
+
+        z = self._zscores().reshape(n_refs, -1)
+        return rms, (z @ z.T) / size
+
+    def dtw_distances(
+        self, query: RecorderInterface | np.ndarray, band: float = DEFAULT_BAND_FRACTION
+    ) -> np.ndarray:
+        """Banded DTW distance from a query to every reference (no pruning).
+
+        Args:
+            query: Recorder, or a signal already on the library's time base
+            band: Band half-width as a fraction of ``num_points``
+
+        Returns:
+            RMS-equivalent DTW distances, shape (R,)
+        """
+        signal = self._as_query(query)
+        costs = dtw_costs(signal, self.data, band_radius(self.num_points, band))
+        return np.sqrt(costs / signal.size)
+
+    def nearest(
+        self,
+        query: RecorderInterface | np.ndarray,
+        k: int = 1,
+        method: AlignmentMethod = "linear",
+        band: float = DEFAULT_BAND_FRACTION,
+    ) -> list[ReferenceMatch]:
+        """Find the ``k`` references closest to a query.
+
+        For ``method="dtw"`` the Euclidean distance (the diagonal warping
+        path) of the k-th closest reference is an upper bound on the answer.
+        References whose LB_Keogh bound exceeds it are skipped, the rest are
+        warped in batches ordered by lower bound, and the bound tightens
+        after each batch so later references are abandoned early.
+
+        Args:
+            query: Recorder, or a signal already on the library's time base
+            k: Number of matches to return
+            method: 'linear' (RMS on normalized time) or 'dtw'
+            band: DTW band half-width as a fraction of ``num_points``
+
+        Returns:
+            Matches sorted by increasing distance
+        """
+        if method not in ("linear", "dtw"):
+            msg = f"Unknown alignment method: {method}"
+            raise ValueError(msg)
+        signal = self._as_query(query)
+        data = self.data
+        k = max(1, min(k, len(data)))
+
+        costs = ((data - signal) ** 2).sum(axis=(1, 2))
+        if method == "dtw":
+            costs = self._dtw_nearest_costs(signal, costs, k, band)
+
+        order = np.argsort(costs, kind="stable")[:k]
+        return [
+            ReferenceMatch(
+                name=self._names[i],
+                index=int(i),
+                distance=float(np.sqrt(costs[i] / signal.size)),
+            )
+            for i in order
+        ]
+
+    def _dtw_nearest_costs(
+        self, signal: np.ndarray, euclidean: np.ndarray, k: int, band: float
+    ) -> np.ndarray:
+        """Exact DTW costs for every reference that can be among the k nearest."""
+        data = self.data
+        radius = band_radius(self.num_points, band)
+        threshold = np.partition(euclidean, k - 1)[k - 1]
+        lower = lb_keogh(signal, data, radius)
+
+        candidates = np.flatnonzero(lower <= threshold)
+        candidates = candidates[np.argsort(lower[candidates], kind="stable")]
+        costs = np.full(len(data), np.inf)
+        for start in range(0, len(candidates), DTW_BATCH_SIZE):
+            batch = candidates[start : start + DTW_BATCH_SIZE]
+            batch = batch[lower[batch] <= threshold]
+            if not batch.size:
+                break  # Candidates are sorted, so no later bound can qualify
+            costs[batch] = dtw_costs(signal, data[batch], radius, threshold)
+            threshold = min(threshold, np.partition(costs, k - 1)[k - 1])
+        return costs
@@ -0,0 +1,352 @@
+"""Screen-resolution-aware downsampling for time-series plots.
+
+A line can never show more detail than the axes has pixel columns, yet 1 kHz
+simulations and analog force-plate channels easily reach hundreds of thousands
+of samples per line. This module reduces each series to a few points per pixel
+column before it reaches ``ax.plot``:
+
+- ``minmax``: the minimum and maximum of every column (exact envelope, default)
+- ``lttb``: Largest-Triangle-Three-Buckets (visually smooth, fixed point count)
+
+:func:`plot_downsampled` keeps the full-resolution arrays behind the returned
+line and re-queries them whenever the x-limits change, so zooming in reveals
+the original samples while panning stays responsive. Reduced views are stored
+in a :class:`DownsampleCache` keyed on (series, pixel width, x-range).
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.lines import Line2D
+
+DownsampleMethod = Literal["minmax", "lttb"]
+
+DEFAULT_PIXEL_WIDTH: Final[int] = 800  # [px] Used before the axes has a size
+MAX_SCATTER_POINTS: Final[int] = 2000  # Markers drawn for parametric plots
+DEFAULT_CACHE_SIZE: Final[int] = 256  # Reduced views kept by the cache
+
+
+def minmax_indices(values: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Indices of the minimum and maximum sample in each bucket.
+
+    Samples are split into ``n_buckets`` equal-count buckets. Within a bucket
+    the two extrema are emitted in sample order, so monotonic stretches stay
+    monotonic instead of zigzagging. For 2-D ``values`` the indices of every
+    column are merged, which keeps stacked plots on a common time base.
+
+    Args:
+        values: ``(N,)`` or ``(N, K)`` samples. NaN samples are ignored unless
+            a whole bucket is NaN, in which case the gap is preserved.
+        n_buckets: Number of buckets (typically the axes width in pixels).
+
+    Returns:
+        Sorted, unique indices including the first and last sample.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[0]
+    if n <= 2 * n_buckets or n_buckets < 1:
+        return np.arange(n)
+
+    size = -(-n // n_buckets)  # ceil division
+    n_buckets = -(-n // size)
+    pad = n_buckets * size - n
+    columns = values.reshape(n, -1)
+
+    nan = np.isnan(columns)
+    low = np.pad(np.where(nan, np.inf, columns), ((0, pad), (0, 0)), "edge")
+    high = np.pad(np.where(nan, -np.inf, columns), ((0, pad), (0, 0)), "edge")
+    low = low.reshape(n_buckets, size, -1)
+    high = high.reshape(n_buckets, size, -1)
+
+    offsets = (np.arange(n_buckets) * size)[:, None]
+    i_min = offsets + low.argmin(axis=1)
+    i_max = offsets + high.argmax(axis=1)
+
+    indices = np.concatenate(([0, n - 1], i_min.ravel(), i_max.ravel()))
+    return np.unique(np.minimum(indices, n - 1))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices selected by Largest-Triangle-Three-Buckets.
+
+    The first and last samples are always kept; every bucket in between
+    contributes the sample forming the largest triangle with the previously
+    selected point and the mean of the next bucket.
+
+    Args:
+        x: ``(N,)`` increasing abscissae.
+        y: ``(N,)`` ordinates.
+        n_out: Number of points to keep (at least 3 to have any effect).
+
+    Returns:
+        ``min(N, n_out)`` increasing indices.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[: n - 1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[: n - 1], edges[:-1]) / counts
+    # The bucket after the last one is the final sample itself
+    mean_x = np.append(mean_x[1:], x[-1])
+    mean_y = np.append(mean_y[1:], y[-1])
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = a = 0
+    indices[-1] = n - 1
+    for k in range(n_out - 2):
+        start, stop = edges[k], edges[k + 1]
+        area = np.abs(
+            (x[a] - mean_x[k]) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (mean_y[k] - y[a])
+        )
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        indices[k + 1] = a
+    return indices
+
+
+def downsample_indices(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int,
+    method: DownsampleMethod = "minmax",
+) -> np.ndarray:
+    """Indices of at most about ``n_out`` samples representing ``(x, y)``.
+
+    Args:
+        x: ``(N,)`` increasing abscissae.
+        y: ``(N,)`` ordinates.
+        n_out: Target number of points.
+        method: ``"minmax"`` envelope or ``"lttb"``.
+
+    Returns:
+        Increasing sample indices.
+
+    Raises:
+        ValueError: If ``method`` is unknown.
+    """
+    if method == "minmax":
+        return minmax_indices(y, n_out // 2)
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    msg = f"Unknown downsampling method: {method!r}"
+    raise ValueError(msg)
+
+
+def downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int,
+    method: DownsampleMethod = "minmax",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce ``(x, y)`` to about ``n_out`` points.
+
+    Args:
+        x: ``(N,)`` increasing abscissae.
+        y: ``(N,)`` ordinates.
+        n_out: Target number of points.
+        method: ``"minmax"`` envelope or ``"lttb"``.
+
+    Returns:
+        Tuple of (x, y) for the kept samples.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    idx = downsample_indices(x, y, n_out, method)
+    return x[idx], y[idx]
+
+
+def stride_indices(n: int, max_points: int = MAX_SCATTER_POINTS) -> np.ndarray:
+    """Evenly strided indices for plots without a monotonic x-axis.
+
+    Used for parametric curves (3D trajectories, phase portraits) whose points
+    cannot be bucketed by x. The last sample is always kept.
+
+    Args:
+        n: Number of samples.
+        max_points: Maximum number of indices returned.
+
+    Returns:
+        Increasing indices.
+    """
+    if n <= max_points:
+        return np.arange(n)
+    step = -(-n // max(max_points - 1, 1))
+    return np.append(np.arange(0, n - 1, step), n - 1)
+
+
+def pixel_width(ax: Axes) -> int:
+    """Width of the axes in device pixels."""
+    width = int(round(ax.bbox.width))
+    return width if width > 0 else DEFAULT_PIXEL_WIDTH
+
+
+class DownsampleCache:
+    """Least-recently-used cache of reduced views.
+
+    Keys are ``(series key, pixel width, x-range)`` where the x-range is
+    resolved to the visible sample span, so repeated zooms to the same view
+    and redraws at the same size reuse the previous reduction.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of reduced views to keep.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: tuple,
+        compute: Callable[[], tuple[np.ndarray, np.ndarray]],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the view stored under ``key``, computing it on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = compute()
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached views."""
+        self._entries.clear()
+
+
+# Shared by every plot in the process; entries are small (a few points per px).
+_DEFAULT_CACHE = DownsampleCache()
+
+
+def get_default_cache() -> DownsampleCache:
+    """Return the process-wide downsampling cache."""
+    return _DEFAULT_CACHE
+
+
+class DownsampledSeries:
+    """Full-resolution data drawn through a screen-resolution view."""
+
+    _keys = itertools.count()
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        method: DownsampleMethod = "minmax",
+        cache: DownsampleCache | None = None,
+    ) -> None:
+        """Initialize the series.
+
+        Args:
+            x: ``(N,)`` abscissae; zoom re-queries require them to be sorted.
+            y: ``(N,)`` ordinates.
+            method: ``"minmax"`` envelope or ``"lttb"``.
+            cache: Cache for reduced views; defaults to the process-wide one.
+
+        Raises:
+            ValueError: If ``x`` and ``y`` differ in length.
+        """
+        self.x = np.asarray(x, dtype=np.float64).ravel()
+        self.y = np.asarray(y, dtype=np.float64).ravel()
+        if self.x.shape != self.y.shape:
+            msg = f"x and y must have the same length, got {self.x.size} and {self.y.size}."
+            raise ValueError(msg)
+        self.method = method
+        self.cache = _DEFAULT_CACHE if cache is None else cache
+        self.key = next(self._keys)
+        self.sorted = bool(np.all(np.diff(self.x) >= 0))
+        self.line: Line2D | None = None
+
+    def span(self, x_lo: float, x_hi: float) -> tuple[int, int]:
+        """Sample range covering ``[x_lo, x_hi]`` plus one sample either side."""
+        if not self.sorted:
+            return 0, self.x.size
+        start = int(np.searchsorted(self.x, x_lo, side="left")) - 1
+        stop = int(np.searchsorted(self.x, x_hi, side="right")) + 1
+        return max(start, 0), min(stop, self.x.size)
+
+    def view(self, width: int, start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+        """Reduced ``(x, y)`` for samples ``start:stop`` at ``width`` pixels."""
+        n_out = 2 * width if self.method == "minmax" else width
+        if stop - start <= n_out:
+            return self.x[start:stop], self.y[start:stop]
+
+        def compute() -> tuple[np.ndarray, np.ndarray]:
+            return downsample(
+                self.x[start:stop], self.y[start:stop], n_out, self.method
+            )
+
+        return self.cache.get((self.key, self.method, width, start, stop), compute)
+
+    def refresh(self) -> None:
+        """Re-query the full data for the current x-limits of the line's axes."""
+        if self.line is None or self.line.axes is None:
+            return
+        ax = self.line.axes
+        x_lo, x_hi = sorted(ax.get_xlim())
+        start, stop = self.span(x_lo, x_hi)
+        self.line.set_data(*self.view(pixel_width(ax), start, stop))
+
+
+def plot_downsampled(
+    ax: Axes,
+    x: Any,
+    y: Any,
+    *args: Any,
+    method: DownsampleMethod = "minmax",
+    cache: DownsampleCache | None = None,
+    **kwargs: Any,
+) -> Line2D:
+    """Drop-in replacement for ``ax.plot(x, y, ...)`` on long series.
+
+    The line is drawn at the axes' pixel resolution. When ``x`` is sorted and
+    the series is longer than the view, the full data is re-queried on every
+    x-limit change (zoom, pan, autoscale).
+
+    Args:
+        ax: Target axes.
+        x: ``(N,)`` abscissae.
+        y: ``(N,)`` ordinates.
+        *args: Positional arguments forwarded to ``ax.plot`` (format string).
+        method: ``"minmax"`` envelope or ``"lttb"``.
+        cache: Cache for reduced views; defaults to the process-wide one.
+        **kwargs: Keyword arguments forwarded to ``ax.plot``.
+
+    Returns:
+        The created line.
+    """
+    series = DownsampledSeries(x, y, method, cache)
+    x_view, y_view = series.view(pixel_width(ax), 0, series.x.size)
+    (line,) = ax.plot(x_view, y_view, *args, **kwargs)
+
+    if series.sorted and x_view.size < series.x.size:
+        series.line = line
+        # A plain closure is held strongly by the registry (bound methods are
+        # not), which keeps the full-resolution data alive with the axes.
+        ax.callbacks.connect("xlim_changed", lambda _ax: series.refresh())
+    return line
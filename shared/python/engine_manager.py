@@ -5,11 +5,14 @@ This module provides unified management of different physics engines
 including MuJoCo, Drake, Pinocchio, MATLAB models, and pendulum models.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 from .common_utils import GolfModelingError, setup_logging
+from .engine_probes import ProbeCache, fingerprint, path_mtime
 
 logger = setup_logging(__name__)
 
@@ -38,11 +41,19 @@ class EngineStatus(Enum):
 class EngineManager:
     """Manages different physics engines for golf swing modeling."""
 
-    def __init__(self, suite_root: Path | None = None):
+    def __init__(
+        self, suite_root: Path | None = None, probe_cache: ProbeCache | None = None
+    ):
         """Initialize the engine manager.
 
+        Probes are not run here; each engine is probed the first time its
+        readiness is requested, and results are reused from the probe cache
+        while installed packages and engine directories are unchanged.
+
         Args:
             suite_root: Root directory of the Golf Modeling Suite
+            probe_cache: Cache of probe results. Defaults to
+                ``output/cache/engine_probes.json`` under the suite root.
         """
         if suite_root is None:
             suite_root = Path(__file__).parent.parent.parent
@@ -84,6 +95,12 @@ class EngineManager:
             EngineType.MATLAB_3D: MatlabProbe(self.suite_root, is_3d=True),
         }
         self.probe_results: dict[EngineType, Any] = {}
+        self.probe_timings: dict[EngineType, float] = {}
+        if probe_cache is None:
+            probe_cache = ProbeCache(
+                self.suite_root / "output" / "cache" / "engine_probes.json"
+            )
+        self.probe_cache = probe_cache
 
         # Initialize engine status
         self._discover_engines()
@@ -186,10 +203,7 @@ class EngineManager:
         """Load MuJoCo engine with full initialization."""
         try:
             # 1. Run probe to validate dependencies
-            from .engine_probes import MuJoCoProbe
-
-            probe = MuJoCoProbe(self.suite_root)
-            result = probe.probe()
+            result = self.get_probe_result(EngineType.MUJOCO)
 
             if not result.is_available():
                 raise GolfModelingError(
@@ -219,17 +233,38 @@ class EngineManager:
 
             logger.info(f"Found {len(model_files)} MuJoCo models in {model_dir}")
 
-            # 5. Test load a model to verify MuJoCo works
+            # 5. Test load a model to verify MuJoCo works (skipped when the
+            # same model already compiled with this MuJoCo version)
             test_model = model_files[0]
-            try:
-                _ = mujoco.MjModel.from_xml_path(str(test_model))
-                logger.info(
-                    f"Successfully validated MuJoCo with test model: {test_model.name}"
-                )
-            except Exception as e:
-                raise GolfModelingError(
-                    f"MuJoCo model validation failed for {test_model.name}: {e}"
-                ) from e
+            model_mtime = path_mtime(test_model)
+            validation_key = fingerprint(
+                {
+                    "mujoco": str(mujoco.__version__),
+                    "model": str(test_model),
+                    "mtime": model_mtime,
+                }
+            )
+            if model_mtime is not None and self.probe_cache.get_entry(
+                "mujoco_model_validation", validation_key
+            ):
+                logger.info(f"MuJoCo test model {test_model.name} validated (cached)")
+            else:
+                try:
+                    _ = mujoco.MjModel.from_xml_path(str(test_model))
+                    logger.info(
+                        "Successfully validated MuJoCo with test model: "
+                        f"{test_model.name}"
+                    )
+                except Exception as e:
+                    raise GolfModelingError(
+                        f"MuJoCo model validation failed for {test_model.name}: {e}"
+                    ) from e
+                if model_mtime is not None:
+                    self.probe_cache.put_entry(
+                        "mujoco_model_validation",
+                        validation_key,
+                        {"model": str(test_model)},
+                    )
 
             # 6. Store loaded state
             self._mujoco_module = mujoco
@@ -246,10 +281,7 @@ class EngineManager:
         """Load Drake engine with full initialization."""
         try:
             # 1. Run probe
-            from .engine_probes import DrakeProbe
-
-            probe = DrakeProbe(self.suite_root)
-            result = probe.probe()
+            result = self.get_probe_result(EngineType.DRAKE)
 
             if not result.is_available():
                 raise GolfModelingError(
@@ -295,10 +327,7 @@ class EngineManager:
         """Load Pinocchio engine with full initialization."""
         try:
             # 1. Run probe
-            from .engine_probes import PinocchioProbe
-
-            probe = PinocchioProbe(self.suite_root)
-            result = probe.probe()
+            result = self.get_probe_result(EngineType.PINOCCHIO)
 
             if not result.is_available():
                 raise GolfModelingError(
@@ -467,31 +496,55 @@ class EngineManager:
         validation_path = validation_paths.get(engine_type, base_path)
         return validation_path.exists()
 
-    def probe_all_engines(self) -> dict[EngineType, Any]:
+    def probe_all_engines(self, refresh: bool = False) -> dict[EngineType, Any]:
         """Probe all engines for detailed readiness checks.
 
+        Probes that are not cached run in parallel threads; most of their
+        time is spent importing the engine's extension modules.
+
+        Args:
+            refresh: Ignore cached results and re-run every probe
+
         Returns:
             Dictionary mapping engine types to probe results
         """
+        engine_types = list(self.probes)
+        with ThreadPoolExecutor(max_workers=len(engine_types)) as executor:
+            results = list(
+                executor.map(
+                    lambda engine_type: self.get_probe_result(engine_type, refresh),
+                    engine_types,
+                )
+            )
 
-        for engine_type, probe in self.probes.items():
-            self.probe_results[engine_type] = probe.probe()
-
+        self.probe_results = dict(zip(engine_types, results, strict=True))
         return self.probe_results
 
-    def get_probe_result(self, engine_type: EngineType) -> Any:
-        """Get probe result for a specific engine.
+    def get_probe_result(self, engine_type: EngineType, refresh: bool = False) -> Any:
+        """Get probe result for a specific engine, probing it on first use.
 
         Args:
             engine_type: The engine to get results for
+            refresh: Ignore cached results and re-run the probe
 
         Returns:
-            Probe result or None if not probed
+            Probe result or None if the engine has no probe
         """
-        if not self.probe_results:
-            self.probe_all_engines()
+        if not refresh and engine_type in self.probe_results:
+            return self.probe_results[engine_type]
+
+        probe = self.probes.get(engine_type)
+        if probe is None:
+            return None
+
+        start = time.perf_counter()
+        result = self.probe_cache.run(probe, refresh=refresh)
+        elapsed = time.perf_counter() - start
 
-        return self.probe_results.get(engine_type)
+        self.probe_results[engine_type] = result
+        self.probe_timings[engine_type] = elapsed
+        logger.debug(f"Probed {engine_type.value} in {elapsed * 1000:.1f} ms")
+        return result
 
     def get_diagnostic_report(self) -> str:
         """Get human-readable diagnostic report for all engines.
@@ -500,7 +553,7 @@ class EngineManager:
             Formatted diagnostic report
         """
 
-        if not self.probe_results:
+        if len(self.probe_results) < len(self.probes):
             self.probe_all_engines()
 
         lines = [
@@ -6,11 +6,23 @@ are properly installed and ready to use, with actionable diagnostics.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
 from dataclasses import dataclass
 from enum import Enum
+from importlib import metadata
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+# Bump when the cache layout or probe semantics change.
+PROBE_CACHE_VERSION = 2
+
 
 class ProbeStatus(Enum):
     """Status of an engine probe."""
@@ -52,10 +64,58 @@ class EngineProbeResult:
             return f"Fix {self.engine_name} configuration"
         return "Engine is available"
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the result to a JSON-compatible dictionary."""
+        return {
+            "engine_name": self.engine_name,
+            "status": self.status.value,
+            "version": self.version,
+            "missing_dependencies": list(self.missing_dependencies),
+            "diagnostic_message": self.diagnostic_message,
+            "details": self.details,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EngineProbeResult:
+        """Rebuild a result produced by :meth:`to_dict`."""
+        return cls(
+            engine_name=data["engine_name"],
+            status=ProbeStatus(data["status"]),
+            version=data.get("version"),
+            missing_dependencies=list(data.get("missing_dependencies", [])),
+            diagnostic_message=data.get("diagnostic_message", ""),
+            details=data.get("details"),
+        )
+
+
+def installed_version(distribution: str) -> str | None:
+    """Return the installed version of a distribution without importing it."""
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def path_mtime(path: Path) -> float | None:
+    """Return the modification time of ``path``, or None if it is missing."""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def fingerprint(payload: dict[str, Any]) -> str:
+    """Hash a JSON-compatible payload into a short cache key."""
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
 
 class EngineProbe:
     """Base class for engine readiness probes."""
 
+    # Distributions whose installed versions invalidate cached results.
+    package_names: tuple[str, ...] = ()
+
     def __init__(self, engine_name: str, suite_root: Path) -> None:
         """Initialize engine probe.
 
@@ -74,13 +134,182 @@ class EngineProbe:
         """
         raise NotImplementedError
 
+    def probe_installation(self) -> EngineProbeResult:
+        """Check the installation only, leaving out transient environment state.
+
+        This is the part of the probe that :class:`ProbeCache` stores. Probes
+        without transient checks return the full :meth:`probe` result.
+
+        Returns:
+            Probe result with status and diagnostics
+        """
+        return self.probe()
+
+    def check_environment(self, result: EngineProbeResult) -> EngineProbeResult:
+        """Apply transient checks (e.g. free ports) to an installation result.
+
+        Runs on every lookup, including cache hits, so its output is never
+        persisted.
+
+        Args:
+            result: Result of :meth:`probe_installation`
+
+        Returns:
+            Probe result with status and diagnostics
+        """
+        return result
+
+    def watched_paths(self) -> list[Path]:
+        """Directories whose modification times invalidate cached results.
+
+        Probes check for the presence of files in these directories, and
+        adding or removing an entry updates the directory mtime.
+        """
+        return []
+
+    def fingerprint(self) -> str:
+        """Cheap cache key for the probe result.
+
+        Built from the interpreter, installed package versions and directory
+        mtimes, so computing it never imports the engine itself.
+        """
+        return fingerprint(
+            {
+                "python": sys.version.split()[0],
+                "prefix": sys.prefix,
+                "packages": {
+                    name: installed_version(name) for name in self.package_names
+                },
+                "paths": {str(p): path_mtime(p) for p in self.watched_paths()},
+            }
+        )
+
+
+class ProbeCache:
+    """Probe results persisted as JSON and keyed by probe fingerprints.
+
+    Entries are only reused while the fingerprint they were stored with still
+    matches, so upgrading a package or adding engine files re-runs the probe.
+    Only installation results are stored; transient environment checks run
+    again on every lookup. A cache without a path lives in memory only.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize probe cache.
+
+        Args:
+            path: JSON file backing the cache
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read the cache file on first access (caller holds the lock)."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if self.path is None:
+            return self._entries
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._entries
+
+        if isinstance(data, dict) and data.get("version") == PROBE_CACHE_VERSION:
+            entries = data.get("entries", {})
+            if isinstance(entries, dict):
+                self._entries = entries
+        return self._entries
+
+    def _save(self) -> None:
+        """Write the cache atomically (caller holds the lock)."""
+        if self.path is None or self._entries is None:
+            return
+        payload = {"version": PROBE_CACHE_VERSION, "entries": self._entries}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write probe cache {self.path}: {e}")
+
+    def get_entry(self, name: str, key: str) -> dict[str, Any] | None:
+        """Return the payload stored under ``name`` if its key still matches."""
+        with self._lock:
+            entry = self._load().get(name)
+        if entry is None or entry.get("key") != key:
+            return None
+        payload = entry.get("payload")
+        return payload if isinstance(payload, dict) else None
+
+    def put_entry(self, name: str, key: str, payload: dict[str, Any]) -> None:
+        """Store ``payload`` under ``name`` and persist the cache."""
+        with self._lock:
+            self._load()[name] = {"key": key, "payload": payload}
+            self._save()
+
+    def run(self, probe: EngineProbe, refresh: bool = False) -> EngineProbeResult:
+        """Return the cached result for ``probe``, probing on a miss.
+
+        Args:
+            probe: Probe to run
+            refresh: Ignore any cached result
+
+        Returns:
+            Probe result with status and diagnostics
+        """
+        key = probe.fingerprint()
+        result = None
+        if not refresh:
+            payload = self.get_entry(probe.engine_name, key)
+            if payload is not None:
+                try:
+                    result = EngineProbeResult.from_dict(payload)
+                except (KeyError, TypeError, ValueError):
+                    result = None
+
+        if result is None:
+            result = probe.probe_installation()
+            # Configuration errors are transient; re-check them.
+            if (
+                isinstance(result, EngineProbeResult)
+                and result.status != ProbeStatus.CONFIGURATION_ERROR
+            ):
+                self.put_entry(probe.engine_name, key, result.to_dict())
+        return probe.check_environment(result)
+
+    def clear(self) -> None:
+        """Drop all entries, including the persisted file."""
+        with self._lock:
+            self._entries = {}
+            if self.path is not None:
+                try:
+                    self.path.unlink()
+                except OSError:
+                    pass
+
 
 class MuJoCoProbe(EngineProbe):
     """Probe for MuJoCo physics engine."""
 
+    package_names = ("mujoco",)
+
     def __init__(self, suite_root: Path) -> None:
         """Initialize MuJoCo probe."""
         super().__init__("MuJoCo", suite_root)
+        self.engine_dir = suite_root / "engines" / "physics_engines" / "mujoco"
+
+    def watched_paths(self) -> list[Path]:
+        """Engine, python and asset directories."""
+        return [
+            self.engine_dir,
+            self.engine_dir / "python",
+            self.engine_dir / "assets",
+            self.engine_dir / "myo_sim",
+        ]
 
     def probe(self) -> EngineProbeResult:
         """Check MuJoCo readiness."""
@@ -112,7 +341,7 @@ class MuJoCoProbe(EngineProbe):
             )
 
         # Check for engine directory
-        engine_dir = self.suite_root / "engines" / "physics_engines" / "mujoco"
+        engine_dir = self.engine_dir
         if not engine_dir.exists():
             missing.append("engine directory")
 
@@ -138,9 +367,8 @@ class MuJoCoProbe(EngineProbe):
             valid_assets_dir = myo_sim_dir
 
         if valid_assets_dir:
-            # Check for model files
-            models = list(valid_assets_dir.glob("**/*.xml"))
-            if not models:
+            # Check for model files (stop at the first match)
+            if next(valid_assets_dir.rglob("*.xml"), None) is None:
                 missing.append("model XML files")
         else:
             missing.append("assets or myo_sim directory")
@@ -171,12 +399,24 @@ class MuJoCoProbe(EngineProbe):
 class DrakeProbe(EngineProbe):
     """Probe for Drake physics engine."""
 
+    package_names = ("drake",)
+
     def __init__(self, suite_root: Path) -> None:
         """Initialize Drake probe."""
         super().__init__("Drake", suite_root)
+        self.engine_dir = suite_root / "engines" / "physics_engines" / "drake"
+
+    def watched_paths(self) -> list[Path]:
+        """Engine, python and source directories."""
+        python_dir = self.engine_dir / "python"
+        return [self.engine_dir, python_dir, python_dir / "src"]
 
     def probe(self) -> EngineProbeResult:
         """Check Drake readiness."""
+        return self.check_environment(self.probe_installation())
+
+    def probe_installation(self) -> EngineProbeResult:
+        """Check the Drake package and engine files."""
         missing = []
 
         # Check for pydrake package
@@ -208,34 +448,8 @@ class DrakeProbe(EngineProbe):
                 "Install with: pip install drake",
             )
 
-        # Check meshcat port availability
-        import socket
-
-        meshcat_available = False
-        available_port = None
-        for port in range(7000, 7011):
-            try:
-                sock = socket.socket()
-                sock.bind(("localhost", port))
-                sock.close()
-                meshcat_available = True
-                available_port = port
-                break
-            except OSError:
-                continue
-
-        if not meshcat_available:
-            return EngineProbeResult(
-                engine_name=self.engine_name,
-                status=ProbeStatus.CONFIGURATION_ERROR,
-                version=version,
-                missing_dependencies=["meshcat ports 7000-7010"],
-                diagnostic_message=f"Drake {version} installed but meshcat ports "
-                "7000-7010 are all blocked. Close other instances or use Docker.",
-            )
-
         # Check for engine directory
-        engine_dir = self.suite_root / "engines" / "physics_engines" / "drake"
+        engine_dir = self.engine_dir
         if not engine_dir.exists():
             missing.append("engine directory")
 
@@ -268,22 +482,63 @@ class DrakeProbe(EngineProbe):
             status=ProbeStatus.AVAILABLE,
             version=version,
             missing_dependencies=[],
+            diagnostic_message=f"Drake {version} ready",
+            details={"engine_dir": str(engine_dir)},
+        )
+
+    def check_environment(self, result: EngineProbeResult) -> EngineProbeResult:
+        """Check meshcat port availability for an installed Drake."""
+        if not result.is_available():
+            return result
+
+        import socket
+
+        available_port = None
+        for port in range(7000, 7011):
+            try:
+                sock = socket.socket()
+                sock.bind(("localhost", port))
+                sock.close()
+                available_port = port
+                break
+            except OSError:
+                continue
+
+        if available_port is None:
+            return EngineProbeResult(
+                engine_name=self.engine_name,
+                status=ProbeStatus.CONFIGURATION_ERROR,
+                version=result.version,
+                missing_dependencies=["meshcat ports 7000-7010"],
+                diagnostic_message=f"Drake {result.version} installed but meshcat "
+                "ports 7000-7010 are all blocked. Close other instances or use Docker.",
+            )
+
+        return EngineProbeResult(
+            engine_name=self.engine_name,
+            status=ProbeStatus.AVAILABLE,
+            version=result.version,
+            missing_dependencies=[],
             diagnostic_message=(
-                f"Drake {version} ready, meshcat port {available_port} available"
+                f"{result.diagnostic_message}, meshcat port {available_port} available"
             ),
-            details={
-                "engine_dir": str(engine_dir),
-                "meshcat_port": available_port,
-            },
+            details={**(result.details or {}), "meshcat_port": available_port},
         )
 
 
 class PinocchioProbe(EngineProbe):
     """Probe for Pinocchio physics engine."""
 
+    package_names = ("pin", "pinocchio")
+
     def __init__(self, suite_root: Path) -> None:
         """Initialize Pinocchio probe."""
         super().__init__("Pinocchio", suite_root)
+        self.engine_dir = suite_root / "engines" / "physics_engines" / "pinocchio"
+
+    def watched_paths(self) -> list[Path]:
+        """Engine and python directories."""
+        return [self.engine_dir, self.engine_dir / "python"]
 
     def probe(self) -> EngineProbeResult:
         """Check Pinocchio readiness."""
@@ -305,7 +560,7 @@ class PinocchioProbe(EngineProbe):
             )
 
         # Check for engine directory
-        engine_dir = self.suite_root / "engines" / "physics_engines" / "pinocchio"
+        engine_dir = self.engine_dir
         if not engine_dir.exists():
             missing.append("engine directory")
 
@@ -345,13 +600,19 @@ class PendulumProbe(EngineProbe):
     def __init__(self, suite_root: Path) -> None:
         """Initialize Pendulum probe."""
         super().__init__("Pendulum", suite_root)
+        self.engine_dir = suite_root / "engines" / "pendulum_models"
+
+    def watched_paths(self) -> list[Path]:
+        """Engine, python and source directories."""
+        python_dir = self.engine_dir / "python"
+        return [self.engine_dir, python_dir, python_dir / "src"]
 
     def probe(self) -> EngineProbeResult:
         """Check Pendulum models readiness."""
         missing = []
 
         # Check for engine directory
-        engine_dir = self.suite_root / "engines" / "pendulum_models"
+        engine_dir = self.engine_dir
         if not engine_dir.exists():
             return EngineProbeResult(
                 engine_name=self.engine_name,
@@ -397,6 +658,8 @@ class PendulumProbe(EngineProbe):
 class MatlabProbe(EngineProbe):
     """Probe for MATLAB engine."""
 
+    package_names = ("matlabengine", "matlabengineforpython")
+
     def __init__(self, suite_root: Path, is_3d: bool = False) -> None:
         """Initialize MATLAB probe.
 
@@ -407,6 +670,14 @@ class MatlabProbe(EngineProbe):
         name = "MATLAB 3D" if is_3d else "MATLAB 2D"
         super().__init__(name, suite_root)
         self.is_3d = is_3d
+        model_type = "3D_Golf_Model" if is_3d else "2D_Golf_Model"
+        self.engine_dir = (
+            suite_root / "engines" / "Simscape_Multibody_Models" / model_type
+        )
+
+    def watched_paths(self) -> list[Path]:
+        """Model directory."""
+        return [self.engine_dir]
 
     def probe(self) -> EngineProbeResult:
         """Check MATLAB readiness."""
@@ -431,10 +702,7 @@ class MatlabProbe(EngineProbe):
             )
 
         # Check for model directory
-        model_type = "3D_Golf_Model" if self.is_3d else "2D_Golf_Model"
-        engine_dir = (
-            self.suite_root / "engines" / "Simscape_Multibody_Models" / model_type
-        )
+        engine_dir = self.engine_dir
 
         if not engine_dir.exists():
             return EngineProbeResult(
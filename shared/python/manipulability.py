@@ -0,0 +1,206 @@
+"""Mobility and force ellipsoids shared by the engine GUIs.
+
+For a body with translational Jacobian ``J`` (3 x nv) and joint-space mass
+matrix ``M``, the core matrix ``A = J M^-1 J^T`` defines
+
+- the mobility (dynamic manipulability) ellipsoid ``x^T A^-1 x = 1`` with
+  semi-axes ``sqrt(eig(A))`` along the eigenvectors of ``A``
+- the force ellipsoid ``f^T A f = 1`` with the reciprocal semi-axes
+
+``M^-1 J^T`` is obtained from a Cholesky factorization (a three-column
+solve), never from an explicit inverse. Engines with their own factorized
+mass matrix (e.g. MuJoCo's ``mj_solveM``) only need
+:func:`ellipsoid_from_core`. :class:`EllipsoidCache` skips recomputation
+while the configuration has not moved.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+MIN_EIGENVALUE: Final[float] = 1e-6  # Floor before taking square roots
+FORCE_RADIUS_LIMITS: Final[tuple[float, float]] = (0.01, 5.0)  # [visual units]
+DEFAULT_QPOS_TOLERANCE: Final[float] = 1e-9  # Max |dq| treated as unchanged
+
+
+@dataclass(frozen=True)
+class ManipulabilityEllipsoid:
+    """Ellipsoid of one body at one configuration."""
+
+    center: np.ndarray  # (3,) Body position in world [m]
+    axes: np.ndarray  # (3, 3) Principal axes as columns
+    eigenvalues: np.ndarray  # (3,) Eigenvalues of J M^-1 J^T, ascending
+
+    @property
+    def mobility_radii(self) -> np.ndarray:
+        """Semi-axes of the mobility ellipsoid."""
+        return np.sqrt(np.maximum(self.eigenvalues, MIN_EIGENVALUE))
+
+    @property
+    def force_radii(self) -> np.ndarray:
+        """Semi-axes of the force ellipsoid, clipped for display."""
+        return np.clip(1.0 / self.mobility_radii, *FORCE_RADIUS_LIMITS)
+
+    def transform(self, radii: np.ndarray) -> np.ndarray:
+        """Homogeneous transform mapping the unit sphere onto the ellipsoid.
+
+        Args:
+            radii: Semi-axes, e.g. :attr:`mobility_radii`
+
+        Returns:
+            4x4 matrix ``[axes @ diag(radii) | center]``
+        """
+        transform = np.eye(4)
+        transform[:3, :3] = self.axes * radii
+        transform[:3, 3] = self.center
+        return transform
+
+
+@dataclass
+class EllipsoidTrajectory:
+    """Ellipsoids of one body along a recorded trajectory.
+
+    All arrays share the leading frame dimension ``N``.
+    """
+
+    centers: np.ndarray  # (N, 3)
+    axes: np.ndarray  # (N, 3, 3)
+    eigenvalues: np.ndarray  # (N, 3)
+
+    def __len__(self) -> int:
+        """Number of frames."""
+        return len(self.eigenvalues)
+
+    def __getitem__(self, frame: int) -> ManipulabilityEllipsoid:
+        """Ellipsoid at one frame."""
+        return ManipulabilityEllipsoid(
+            self.centers[frame], self.axes[frame], self.eigenvalues[frame]
+        )
+
+    @property
+    def mobility_radii(self) -> np.ndarray:
+        """Mobility semi-axes per frame (N, 3)."""
+        return np.sqrt(np.maximum(self.eigenvalues, MIN_EIGENVALUE))
+
+    @property
+    def force_radii(self) -> np.ndarray:
+        """Force semi-axes per frame, clipped for display (N, 3)."""
+        return np.clip(1.0 / self.mobility_radii, *FORCE_RADIUS_LIMITS)
+
+    def save(self, path: str | Path) -> Path:
+        """Export all frames to a compressed ``.npz`` archive.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        np.savez_compressed(
+            path,
+            centers=self.centers,
+            axes=self.axes,
+            eigenvalues=self.eigenvalues,
+            mobility_radii=self.mobility_radii,
+            force_radii=self.force_radii,
+        )
+        return path
+
+
+def factor_mass_matrix(mass_matrix: np.ndarray) -> tuple[np.ndarray, bool] | None:
+    """Cholesky factor of ``M``, or None if it is not positive definite.
+
+    Only the upper triangle of ``M`` is read.
+    """
+    try:
+        return cho_factor(mass_matrix, check_finite=False)
+    except LinAlgError:
+        return None
+
+
+def core_matrix(
+    jacobian: np.ndarray,
+    mass_matrix: np.ndarray,
+    factor: tuple[np.ndarray, bool] | None = None,
+) -> np.ndarray:
+    """Ellipsoid core matrix ``J M^-1 J^T``.
+
+    Args:
+        jacobian: Translational Jacobian (3 x nv)
+        mass_matrix: Joint-space mass matrix (nv x nv)
+        factor: Result of :func:`factor_mass_matrix`, if already computed
+
+    Returns:
+        Symmetric 3x3 core matrix
+    """
+    factor = factor or factor_mass_matrix(mass_matrix)
+    if factor is not None:
+        m_inv_jt = cho_solve(factor, jacobian.T, check_finite=False)
+    else:
+        # Degenerate (e.g. massless) trees only
+        m_inv_jt = np.linalg.lstsq(mass_matrix, jacobian.T, rcond=None)[0]
+    core = jacobian @ m_inv_jt
+    return 0.5 * (core + core.T)
+
+
+def ellipsoid_from_core(
+    core: np.ndarray, center: np.ndarray
+) -> ManipulabilityEllipsoid:
+    """Eigen-decompose a core matrix into an ellipsoid.
+
+    Args:
+        core: ``J M^-1 J^T`` (3x3), or a stack (N x 3 x 3)
+        center: Body position (3,), or a stack (N x 3)
+
+    Returns:
+        The ellipsoid (arrays gain the leading ``N`` for stacked input)
+    """
+    eigenvalues, axes = np.linalg.eigh(core)
+    return ManipulabilityEllipsoid(np.array(center, dtype=float), axes, eigenvalues)
+
+
+class EllipsoidCache:
+    """Last ellipsoid per body, reused while the configuration is unchanged.
+
+    The mass matrix and Jacobian depend only on the generalized positions,
+    so an ellipsoid stays valid until any coordinate moves by more than
+    ``tolerance``.
+    """
+
+    def __init__(self, tolerance: float = DEFAULT_QPOS_TOLERANCE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            tolerance: Largest coordinate change treated as no change
+        """
+        self.tolerance = tolerance
+        self._entries: dict[Hashable, tuple[np.ndarray, ManipulabilityEllipsoid]] = {}
+
+    def lookup(self, key: Hashable, q: np.ndarray) -> ManipulabilityEllipsoid | None:
+        """Cached ellipsoid for ``key`` if ``q`` is within tolerance."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached_q, ellipsoid = entry
+        if cached_q.shape != np.shape(q):
+            return None
+        if np.max(np.abs(cached_q - q), initial=0.0) > self.tolerance:
+            return None
+        return ellipsoid
+
+    def store(
+        self, key: Hashable, q: np.ndarray, ellipsoid: ManipulabilityEllipsoid
+    ) -> None:
+        """Remember the ellipsoid computed at configuration ``q``."""
+        self._entries[key] = (np.array(q, dtype=float), ellipsoid)
+
+    def clear(self) -> None:
+        """Forget all ellipsoids (e.g. after a model change)."""
+        self._entries.clear()
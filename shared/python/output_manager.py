@@ -3,11 +3,34 @@ Output Manager for Golf Modeling Suite
 
 Handles all output operations including saving simulation results,
 managing file organization, and exporting analysis reports.
+
+Simulation results are saved by default as an array store: a directory with
+one ``.npy`` file per field plus a JSON manifest. Multi-dimensional fields
+such as ``(N, nv)`` joint arrays keep their shape, nothing passes through a
+DataFrame, and loading memory-maps the fields so it takes constant time
+regardless of file size.
+
+Saved simulations are indexed in an OutputCatalog, a SQLite sidecar
+(``catalog.db`` in the output root) holding each file's engine, format,
+timestamps, size, shape and column schema. Listing, filtering and age-based
+cleanup are index queries instead of directory walks that stat every file.
+Files placed in the simulations directory by other tools are picked up
+lazily: the catalog compares the modification times of the simulation
+directories with the ones it saw last and rescans only those that changed.
 """
 
 import json
 import logging
+import os
 import pickle
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
@@ -29,6 +52,605 @@ class OutputFormat(Enum):
     HDF5 = "hdf5"
     PICKLE = "pickle"
     PARQUET = "parquet"
+    ARRAYS = "arrays"  # Directory of .npy files plus a JSON manifest
+
+
+ARRAY_MANIFEST = "manifest.json"
+ARRAY_STORE_VERSION = 1
+
+# Row groups small enough that reading a row range touches little extra data
+PARQUET_ROW_GROUP_SIZE = 65_536
+
+# Formats written through _to_frame, with (N, k) fields flattened to columns
+TABULAR_FORMATS = (OutputFormat.CSV, OutputFormat.HDF5, OutputFormat.PARQUET)
+
+RowSelection = slice | Sequence[int]
+
+
+def _resolve_rows(rows: RowSelection, num_rows: int | None) -> np.ndarray | None:
+    """Absolute row positions of a selection, or None if the count is needed.
+
+    Args:
+        rows: Slice or sequence of row positions
+        num_rows: Total number of rows, if known
+
+    Returns:
+        Row positions, or None when they depend on an unknown row count
+    """
+    if isinstance(rows, slice):
+        if num_rows is None:
+            start, stop, step = rows.start or 0, rows.stop, rows.step or 1
+            if start < 0 or stop is None or stop < 0 or step < 0:
+                return None
+            return np.arange(start, stop, step)
+        return np.arange(num_rows)[rows]
+
+    positions = np.asarray(rows, dtype=np.int64).reshape(-1)
+    if positions.size and positions.min() < 0:
+        if num_rows is None:
+            return None
+        positions = np.where(positions < 0, positions + num_rows, positions)
+    return positions
+
+
+def _select(
+    frame: pd.DataFrame,
+    columns: Sequence[str] | None,
+    positions: np.ndarray | None,
+    offset: int = 0,
+) -> pd.DataFrame:
+    """Select columns and absolute row positions from a frame read at ``offset``.
+
+    The returned frame is indexed by the absolute row positions.
+    """
+    if columns is not None:
+        frame = frame[list(columns)]
+    if positions is None:
+        return frame
+    local = positions - offset
+    if local.size and (local.min() < 0 or local.max() >= len(frame)):
+        msg = "Row selection out of range"
+        raise IndexError(msg)
+    selected = frame.iloc[local]
+    selected.index = pd.Index(positions)
+    return selected
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON serializer for numpy values and datetimes."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, np.integer | np.floating):
+        return float(obj)
+    elif isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-]")
+
+
+def _as_fields(results: Any) -> dict[str, Any]:
+    """Named fields of results: DataFrame columns, dict items or record columns."""
+    if isinstance(results, pd.DataFrame):
+        return {str(name): results[name].to_numpy() for name in results.columns}
+    if isinstance(results, dict):
+        return {str(name): value for name, value in results.items()}
+    return _as_fields(pd.DataFrame(results))
+
+
+def _to_frame(results: Any) -> pd.DataFrame:
+    """Tabular view of results; (N, k) fields become columns name_0..name_k-1."""
+    if isinstance(results, pd.DataFrame):
+        return results
+    if not isinstance(results, dict):
+        return pd.DataFrame(results)
+
+    columns: dict[str, Any] = {}
+    for name, value in results.items():
+        array = value if isinstance(value, np.ndarray) else None
+        if array is not None and array.ndim > 1:
+            flat = array.reshape(len(array), -1)
+            for k in range(flat.shape[1]):
+                columns[f"{name}_{k}"] = flat[:, k]
+        else:
+            columns[name] = value
+    return pd.DataFrame(columns)
+
+
+def _as_written(results: Any, format_type: OutputFormat) -> Any:
+    """Results as laid out on disk, so the catalog schema matches the file."""
+    if format_type in TABULAR_FORMATS:
+        return _to_frame(results)
+    return results
+
+
+def write_array_store(
+    path: Path,
+    results: Any,
+    engine: str | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Write results as a directory of ``.npy`` fields plus a JSON manifest.
+
+    Numeric and string fields are stored as arrays with their full shape.
+    Other values (nested lists, dicts, None) must be JSON serializable and go
+    into the manifest's ``attributes``. The store is written to a temporary
+    directory and renamed into place.
+
+    Args:
+        path: Store directory to create (replaced if it exists)
+        results: Dict of fields, DataFrame, or list of records
+        engine: Physics engine name
+        metadata: Additional metadata for the manifest
+
+    Returns:
+        The manifest
+
+    Raises:
+        TypeError: If a non-array field is not JSON serializable
+    """
+    path = Path(path)
+    staging = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    fields: dict[str, dict[str, Any]] = {}
+    attributes: dict[str, Any] = {}
+    try:
+        for i, (name, value) in enumerate(_as_fields(results).items()):
+            array = np.asarray(value)
+            if array.dtype == object:
+                if not array.size or not all(isinstance(v, str) for v in array.flat):
+                    json.dumps(value, default=_json_default)
+                    attributes[name] = value
+                    continue
+                array = array.astype(str)
+            file_name = f"{i:04d}_{_UNSAFE_FILENAME_CHARS.sub('_', name)}.npy"
+            np.save(staging / file_name, array, allow_pickle=False)
+            fields[name] = {
+                "file": file_name,
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+            }
+
+        manifest = {
+            "format": "golf-modeling-suite/arrays",
+            "version": ARRAY_STORE_VERSION,
+            "engine": engine,
+            "timestamp": datetime.now().isoformat(),
+            "metadata": metadata or {},
+            "fields": fields,
+            "attributes": attributes,
+        }
+        with open(staging / ARRAY_MANIFEST, "w") as f:
+            json.dump(manifest, f, indent=2, default=_json_default)
+
+        if path.exists():
+            shutil.rmtree(path)
+        staging.rename(path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return manifest
+
+
+def read_array_manifest(path: Path) -> dict[str, Any]:
+    """Read the manifest of an array store."""
+    with open(Path(path) / ARRAY_MANIFEST) as f:
+        return json.load(f)
+
+
+def read_array_store(
+    path: Path,
+    fields: Sequence[str] | None = None,
+    rows: "RowSelection | None" = None,
+    mmap: bool = True,
+) -> dict[str, Any]:
+    """Load fields of an array store, memory-mapped by default.
+
+    Opening is constant time: only the manifest and ``.npy`` headers are
+    read, and row selections on memory-mapped fields touch only those rows.
+
+    Args:
+        path: Store directory
+        fields: Fields (or attributes) to load; all if None
+        rows: Rows (first axis) to select from every array field
+        mmap: Memory-map fields read-only instead of reading them into memory
+
+    Returns:
+        Mapping of field name to array (attributes as stored)
+
+    Raises:
+        KeyError: If a requested field does not exist
+    """
+    path = Path(path)
+    manifest = read_array_manifest(path)
+    stored = manifest["fields"]
+    attributes = manifest.get("attributes", {})
+    names = [*stored, *attributes] if fields is None else list(fields)
+
+    results: dict[str, Any] = {}
+    for name in names:
+        if name in stored:
+            info = stored[name]
+            # Zero-size arrays cannot be memory-mapped
+            mode = "r" if mmap and 0 not in info["shape"] else None
+            array = np.load(path / info["file"], mmap_mode=mode, allow_pickle=False)
+            if rows is not None and array.ndim:
+                array = array[rows if isinstance(rows, slice) else np.asarray(rows)]
+            results[name] = array
+        elif name in attributes:
+            results[name] = attributes[name]
+        else:
+            msg = f"Field '{name}' not found in array store '{path.name}'"
+            raise KeyError(msg)
+    return results
+
+
+def _path_stats(path: Path) -> tuple[float, int]:
+    """(mtime, size) of an output file, or of an array store directory."""
+    stat = path.stat()
+    if not path.is_dir():
+        return stat.st_mtime, stat.st_size
+    return stat.st_mtime, sum(e.stat().st_size for e in os.scandir(path) if e.is_file())
+
+
+def _is_array_store(name: str) -> bool:
+    """Whether a directory name is an array store rather than an engine."""
+    return name.endswith(f".{OutputFormat.ARRAYS.value}")
+
+
+def _infer_format(directory: Path, filename: str) -> OutputFormat:
+    """Output format of a file from its suffix.
+
+    Bare names resolve to an array store, or to the CSV file of the same
+    name that older versions wrote by default.
+    """
+    suffix = Path(filename).suffix.lstrip(".")
+    if suffix in {f.value for f in OutputFormat}:
+        return OutputFormat(suffix)
+    store = directory / f"{filename}.{OutputFormat.ARRAYS.value}"
+    legacy = directory / f"{filename}.{OutputFormat.CSV.value}"
+    if not store.exists() and legacy.exists():
+        return OutputFormat.CSV
+    return OutputFormat.ARRAYS
+
+
+CATALOG_FILENAME = "catalog.db"
+
+
+@dataclass
+class CatalogEntry:
+    """Catalog record of one simulation output file."""
+
+    path: Path
+    engine: str | None  # None for files in the simulations root
+    format: str  # OutputFormat value, or the file suffix for foreign files
+    created: datetime
+    modified: datetime
+    size_bytes: int
+    num_rows: int | None = None
+    columns: dict[str, str] | None = None  # name -> dtype; None if unknown
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        """File name."""
+        return self.path.name
+
+
+def describe_results(results: Any) -> tuple[int | None, dict[str, str] | None]:
+    """Row count and column schema of simulation results, where tabular.
+
+    Args:
+        results: DataFrame, dict of columns, or any other saved object
+
+    Returns:
+        Tuple of (num_rows, {column: dtype}); (None, None) if not tabular
+    """
+    if isinstance(results, list) and results and isinstance(results[0], dict):
+        results = pd.DataFrame(results)
+    if isinstance(results, pd.DataFrame):
+        dtypes = results.dtypes.items()
+        return len(results), {str(name): str(dtype) for name, dtype in dtypes}
+    if not isinstance(results, dict):
+        return None, None
+
+    # Fields may be multi-dimensional or short labels; rows are the longest
+    # leading dimension
+    arrays = {str(name): np.asarray(value) for name, value in results.items()}
+    num_rows = max((len(a) for a in arrays.values() if a.ndim), default=None)
+    return num_rows, {name: str(a.dtype) for name, a in arrays.items()}
+
+
+class OutputCatalog:
+    """SQLite index of the files under a simulations directory."""
+
+    def __init__(self, base_path: Path, simulations_dir: Path) -> None:
+        """Open (or create) the catalog.
+
+        Args:
+            base_path: Output root; the catalog database lives here and
+                entry paths are stored relative to it
+            simulations_dir: Directory whose files are catalogued
+        """
+        self.base_path = Path(base_path)
+        self.simulations_dir = Path(simulations_dir)
+        self.db_path = self.base_path / CATALOG_FILENAME
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._transaction() as cursor:
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    directory TEXT NOT NULL,
+                    engine TEXT,
+                    format TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    modified REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    num_rows INTEGER,
+                    columns TEXT,
+                    metadata TEXT
+                )
+                """
+            )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS directories (
+                    directory TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL
+                )
+                """
+            )
+            for column in ("engine", "format", "modified", "directory"):
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_files_{column} ON files ({column})"
+                )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Serialized cursor, committed on success."""
+        with self._lock, self._conn:
+            yield self._conn.cursor()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _relative(self, path: Path) -> str:
+        """Catalog key of a path (POSIX, relative to the output root)."""
+        return Path(path).resolve().relative_to(self.base_path.resolve()).as_posix()
+
+    def _directory_key(self, directory: Path) -> str:
+        """Key of a simulations directory ('' for the root, else engine name)."""
+        if directory.resolve() == self.simulations_dir.resolve():
+            return ""
+        return directory.name
+
+    def record(
+        self,
+        path: Path,
+        engine: str | None,
+        format_type: str,
+        results: Any = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> CatalogEntry:
+        """Add or replace the entry of a file that was just written.
+
+        Args:
+            path: Saved file
+            engine: Physics engine name (None for the simulations root)
+            format_type: Output format value
+            results: The saved results, used to derive shape and schema
+            metadata: Additional metadata stored alongside
+
+        Returns:
+            The new catalog entry
+        """
+        path = Path(path)
+        modified, size = _path_stats(path)
+        num_rows, columns = describe_results(results)
+        now = time.time()
+        with self._transaction() as cursor:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO files (
+                    path, name, directory, engine, format, created, modified,
+                    size, num_rows, columns, metadata
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    self._relative(path),
+                    path.name,
+                    self._directory_key(path.parent),
+                    engine,
+                    format_type,
+                    now,
+                    modified,
+                    size,
+                    num_rows,
+                    None if columns is None else json.dumps(columns),
+                    json.dumps(metadata or {}, default=str),
+                ),
+            )
+            # Our own write changed the directory; it is still in sync
+            cursor.execute(
+                "UPDATE directories SET mtime_ns = ? WHERE directory = ?",
+                (path.parent.stat().st_mtime_ns, self._directory_key(path.parent)),
+            )
+        return self.get(path)  # type: ignore[return-value]
+
+    def remove(self, path: Path) -> None:
+        """Drop a file's entry (after it was moved or deleted)."""
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM files WHERE path = ?", (self._relative(path),))
+
+    def get(self, path: Path) -> CatalogEntry | None:
+        """Entry of a file, or None if it is not catalogued."""
+        with self._transaction() as cursor:
+            cursor.execute(
+                "SELECT * FROM files WHERE path = ?", (self._relative(path),)
+            )
+            row = cursor.fetchone()
+        return None if row is None else self._row_to_entry(row)
+
+    def sync(self) -> None:
+        """Rescan the simulation directories whose contents changed."""
+        root = self.simulations_dir
+        with self._transaction() as cursor:
+            cursor.execute("SELECT directory, mtime_ns FROM directories")
+            known = dict(cursor.fetchall())
+
+            if not root.is_dir():
+                cursor.execute("DELETE FROM files")
+                cursor.execute("DELETE FROM directories")
+                return
+
+            root_mtime = root.stat().st_mtime_ns
+            if known.get("") != root_mtime:
+                subdirs = [
+                    entry.name
+                    for entry in os.scandir(root)
+                    if entry.is_dir() and not _is_array_store(entry.name)
+                ]
+                self._rescan(cursor, root, "", None, root_mtime)
+                for gone in set(known) - {"", *subdirs}:
+                    cursor.execute("DELETE FROM files WHERE directory = ?", (gone,))
+                    cursor.execute(
+                        "DELETE FROM directories WHERE directory = ?", (gone,)
+                    )
+            else:
+                subdirs = [key for key in known if key]
+
+            for name in subdirs:
+                directory = root / name
+                try:
+                    mtime = directory.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if known.get(name) != mtime:
+                    self._rescan(cursor, directory, name, name, mtime)
+
+    def _rescan(
+        self,
+        cursor: sqlite3.Cursor,
+        directory: Path,
+        key: str,
+        engine: str | None,
+        mtime_ns: int,
+    ) -> None:
+        """Reconcile the entries of one directory with its files."""
+        cursor.execute(
+            "SELECT path, modified, size FROM files WHERE directory = ?", (key,)
+        )
+        existing = {path: (modified, size) for path, modified, size in cursor}
+        prefix = self._relative(directory)
+        seen = set()
+        for entry in os.scandir(directory):
+            if entry.is_dir():
+                if not _is_array_store(entry.name):
+                    continue
+            elif not entry.is_file() or entry.name == CATALOG_FILENAME:
+                continue
+            modified, size = _path_stats(Path(entry.path))
+            rel = f"{prefix}/{entry.name}"
+            seen.add(rel)
+            if existing.get(rel) == (modified, size):
+                continue
+            # New or changed by another tool: the stored schema is unknown
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO files (
+                    path, name, directory, engine, format, created, modified,
+                    size, num_rows, columns, metadata
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL, NULL, '{}')
+                """,
+                (
+                    rel,
+                    entry.name,
+                    key,
+                    engine,
+                    Path(entry.name).suffix.lstrip("."),
+                    modified,
+                    modified,
+                    size,
+                ),
+            )
+        cursor.executemany(
+            "DELETE FROM files WHERE path = ?", [(p,) for p in set(existing) - seen]
+        )
+        cursor.execute(
+            "INSERT OR REPLACE INTO directories (directory, mtime_ns) VALUES (?, ?)",
+            (key, mtime_ns),
+        )
+
+    def query(
+        self,
+        engine: str | None = None,
+        format_type: str | None = None,
+        modified_after: datetime | None = None,
+        modified_before: datetime | None = None,
+        has_columns: Sequence[str] | None = None,
+    ) -> list[CatalogEntry]:
+        """Find catalogued files, newest first.
+
+        Args:
+            engine: Only files of this engine
+            format_type: Only files of this format
+            modified_after: Only files modified at or after this time
+            modified_before: Only files modified before this time
+            has_columns: Only tabular files containing all these columns
+
+        Returns:
+            Matching entries
+        """
+        self.sync()
+        query = "SELECT * FROM files WHERE 1=1"
+        params: list[Any] = []
+        if engine is not None:
+            query += " AND engine = ?"
+            params.append(engine)
+        if format_type is not None:
+            query += " AND format = ?"
+            params.append(format_type)
+        if modified_after is not None:
+            query += " AND modified >= ?"
+            params.append(modified_after.timestamp())
+        if modified_before is not None:
+            query += " AND modified < ?"
+            params.append(modified_before.timestamp())
+        for column in has_columns or []:
+            query += (
+                " AND columns IS NOT NULL"
+                " AND EXISTS (SELECT 1 FROM json_each(files.columns) WHERE key = ?)"
+            )
+            params.append(column)
+        query += " ORDER BY modified DESC, name"
+
+        with self._transaction() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def _row_to_entry(self, row: tuple) -> CatalogEntry:
+        """Convert a database row to a CatalogEntry."""
+        return CatalogEntry(
+            path=self.base_path / row[0],
+            engine=row[3],
+            format=row[4],
+            created=datetime.fromtimestamp(row[5]),
+            modified=datetime.fromtimestamp(row[6]),
+            size_bytes=row[7],
+            num_rows=row[8],
+            columns=None if row[9] is None else json.loads(row[9]),
+            metadata=json.loads(row[10]) if row[10] else {},
+        )
 
 
 class OutputManager:
@@ -77,6 +699,8 @@ class OutputManager:
             "cache": self.base_path / "cache",
         }
 
+        self.catalog = OutputCatalog(self.base_path, self.directories["simulations"])
+
         logger.info(f"OutputManager initialized with base path: {self.base_path}")
 
     def create_output_structure(self) -> None:
@@ -116,7 +740,7 @@ class OutputManager:
         self,
         results: pd.DataFrame | dict[str, Any],
         filename: str,
-        format_type: OutputFormat = OutputFormat.CSV,
+        format_type: OutputFormat = OutputFormat.ARRAYS,
         engine: str = "mujoco",
         metadata: dict[str, Any] | None = None,
     ) -> Path:
@@ -136,6 +760,9 @@ class OutputManager:
         # Ensure simulation directory exists
         engine_dir = self.directories["simulations"] / engine
         engine_dir.mkdir(parents=True, exist_ok=True)
+        # Pick up foreign changes first so recording this save keeps the
+        # catalog in step with the directory
+        self.catalog.sync()
 
         # Clean filename - remove format_type enum representation if present
         if "OutputFormat." in filename:
@@ -155,62 +782,14 @@ class OutputManager:
         file_path = engine_dir / f"{filename}.{format_type.value}"
 
         try:
-            if format_type == OutputFormat.CSV:
-                if isinstance(results, pd.DataFrame):
-                    results.to_csv(file_path, index=False)
-                else:
-                    # Convert dict to DataFrame if possible
-                    df = pd.DataFrame(results)
-                    df.to_csv(file_path, index=False)
-
-            elif format_type == OutputFormat.JSON:
-                # Handle numpy arrays in JSON serialization
-                def json_serializer(obj: Any) -> Any:
-                    if isinstance(obj, np.ndarray):
-                        return obj.tolist()
-                    elif isinstance(obj, np.integer | np.floating):
-                        return float(obj)
-                    elif isinstance(obj, datetime):
-                        return obj.isoformat()
-                    raise TypeError(
-                        f"Object of type {type(obj)} is not JSON serializable"
-                    )
-
-                output_data = {
-                    "metadata": metadata or {},
-                    "results": results,
-                    "timestamp": datetime.now().isoformat(),
-                    "engine": engine,
-                }
-
-                with open(file_path, "w") as f:
-                    json.dump(output_data, f, indent=2, default=json_serializer)
-
-            elif format_type == OutputFormat.HDF5:
-                if isinstance(results, pd.DataFrame):
-                    results.to_hdf(file_path, key="data", mode="w")
-                else:
-                    # Convert to DataFrame first
-                    df = pd.DataFrame(results)
-                    df.to_hdf(file_path, key="data", mode="w")
-
-            elif format_type == OutputFormat.PICKLE:
-                pickle_data: dict[str, Any] = {
-                    "metadata": metadata or {},
-                    "results": results,
-                    "timestamp": datetime.now(),
-                    "engine": engine,
-                }
-                with open(file_path, "wb") as f_pickle:
-                    pickle.dump(pickle_data, f_pickle)
-
-            elif format_type == OutputFormat.PARQUET:
-                if isinstance(results, pd.DataFrame):
-                    results.to_parquet(file_path, index=False)
-                else:
-                    df = pd.DataFrame(results)
-                    df.to_parquet(file_path, index=False)
-
+            self._write_results(file_path, results, format_type, engine, metadata)
+            self.catalog.record(
+                file_path,
+                engine,
+                format_type.value,
+                _as_written(results, format_type),
+                metadata,
+            )
             logger.info(f"Simulation results saved to: {file_path}")
             return file_path
 
@@ -218,24 +797,89 @@ class OutputManager:
             logger.error(f"Error saving simulation results: {e}")
             raise
 
+    @staticmethod
+    def _write_results(
+        file_path: Path,
+        results: Any,
+        format_type: OutputFormat,
+        engine: str,
+        metadata: dict[str, Any] | None,
+    ) -> None:
+        """Write results to file_path in the given format."""
+        if format_type == OutputFormat.ARRAYS:
+            write_array_store(file_path, results, engine, metadata)
+
+        elif format_type == OutputFormat.CSV:
+            _to_frame(results).to_csv(file_path, index=False)
+
+        elif format_type == OutputFormat.JSON:
+            output_data = {
+                "metadata": metadata or {},
+                "results": results,
+                "timestamp": datetime.now().isoformat(),
+                "engine": engine,
+            }
+
+            with open(file_path, "w") as f:
+                json.dump(output_data, f, indent=2, default=_json_default)
+
+        elif format_type == OutputFormat.HDF5:
+            frame = _to_frame(results)
+            try:
+                # Table format supports reading column and row subsets
+                frame.to_hdf(file_path, key="data", mode="w", format="table")
+            except (TypeError, ValueError):
+                frame.to_hdf(file_path, key="data", mode="w")
+
+        elif format_type == OutputFormat.PICKLE:
+            pickle_data: dict[str, Any] = {
+                "metadata": metadata or {},
+                "results": results,
+                "timestamp": datetime.now(),
+                "engine": engine,
+            }
+            with open(file_path, "wb") as f_pickle:
+                pickle.dump(pickle_data, f_pickle)
+
+        elif format_type == OutputFormat.PARQUET:
+            _to_frame(results).to_parquet(
+                file_path, index=False, row_group_size=PARQUET_ROW_GROUP_SIZE
+            )
+
     def load_simulation_results(
         self,
         filename: str,
-        format_type: OutputFormat = OutputFormat.CSV,
+        format_type: OutputFormat | None = None,
         engine: str = "mujoco",
+        columns: Sequence[str] | None = None,
+        rows: RowSelection | None = None,
     ) -> pd.DataFrame | dict[str, Any]:
         """
         Load simulation results from file.
 
+        Array stores are memory-mapped and return a dict of arrays, so
+        opening one takes constant time and row selections stay lazy.
+        Parquet and HDF5 (table format) outputs read only the requested
+        columns and the row groups/ranges covering the requested rows; other
+        formats are read in full and then subset.
+
         Args:
             filename: Input filename
-            format_type: File format
+            format_type: File format; inferred from the filename suffix if
+                None, and for bare names an array store is preferred over
+                a CSV file of the same name
             engine: Physics engine name
+            columns: Columns (array store fields) to load (all if None)
+            rows: Row positions to load, as a slice or sequence (all if None);
+                the result is indexed by these positions
 
         Returns:
-            Loaded simulation results
+            Loaded simulation results (a DataFrame when subsetting tabular
+            formats, a dict of arrays for array stores)
         """
         engine_dir = self.directories["simulations"] / engine
+        if format_type is None:
+            format_type = _infer_format(engine_dir, filename)
 
         # Handle filename with or without extension
         if not filename.endswith(f".{format_type.value}"):
@@ -246,36 +890,207 @@ class OutputManager:
         if not file_path.exists():
             raise FileNotFoundError(f"Simulation file not found: {file_path}")
 
+        subset = columns is not None or rows is not None
+
         try:
-            if format_type == OutputFormat.CSV:
-                return pd.read_csv(file_path)
+            if format_type == OutputFormat.ARRAYS:
+                return read_array_store(file_path, columns, rows)
+
+            elif format_type == OutputFormat.CSV:
+                return self._read_csv(file_path, columns, rows)
 
             elif format_type == OutputFormat.JSON:
                 with open(file_path) as f:
                     data = json.load(f)
-                return data.get("results", data)
+                results = data.get("results", data)
+                return self._subset(results, columns, rows) if subset else results
 
             elif format_type == OutputFormat.HDF5:
-                result = pd.read_hdf(file_path, key="data")
-                if not isinstance(result, pd.DataFrame):
-                    raise TypeError(
-                        f"Expected HDF5 key 'data' to contain a pandas DataFrame, "
-                        f"but got {type(result).__name__}"
-                    )
-                return result
+                return self._read_hdf(file_path, columns, rows)
 
             elif format_type == OutputFormat.PICKLE:
                 with open(file_path, "rb") as f:
                     data = pickle.load(f)
-                return data.get("results", data)
+                results = data.get("results", data)
+                return self._subset(results, columns, rows) if subset else results
 
             elif format_type == OutputFormat.PARQUET:
-                return pd.read_parquet(file_path)
+                return self._read_parquet(file_path, columns, rows)
 
         except Exception as e:
             logger.error(f"Error loading simulation results: {e}")
             raise
 
+    @staticmethod
+    def _subset(
+        results: Any,
+        columns: Sequence[str] | None,
+        rows: RowSelection | None,
+    ) -> pd.DataFrame:
+        """Select columns/rows from fully loaded results."""
+        frame = results if isinstance(results, pd.DataFrame) else pd.DataFrame(results)
+        positions = None if rows is None else _resolve_rows(rows, len(frame))
+        return _select(frame, columns, positions)
+
+    def _read_csv(
+        self,
+        file_path: Path,
+        columns: Sequence[str] | None,
+        rows: RowSelection | None,
+    ) -> pd.DataFrame:
+        """Read a CSV, parsing only the requested columns and row range."""
+        if rows is None:
+            return pd.read_csv(file_path, usecols=columns)
+
+        entry = self.catalog.get(file_path)
+        positions = _resolve_rows(rows, entry.num_rows if entry else None)
+        if positions is None or not positions.size:
+            return self._subset(pd.read_csv(file_path, usecols=columns), None, rows)
+
+        start, stop = int(positions.min()), int(positions.max()) + 1
+        frame = pd.read_csv(
+            file_path,
+            usecols=columns,
+            skiprows=range(1, start + 1),
+            nrows=stop - start,
+        )
+        return _select(frame, None, positions, offset=start)
+
+    @staticmethod
+    def _read_hdf(
+        file_path: Path,
+        columns: Sequence[str] | None,
+        rows: RowSelection | None,
+    ) -> pd.DataFrame:
+        """Read an HDF5 output, selecting columns/rows on disk for tables."""
+        with pd.HDFStore(file_path, mode="r") as store:
+            if store.get_storer("data").is_table:
+                num_rows = int(store.get_storer("data").nrows)
+                positions = None if rows is None else _resolve_rows(rows, num_rows)
+                start, stop = 0, num_rows
+                if positions is not None:
+                    start = int(positions.min()) if positions.size else 0
+                    stop = int(positions.max()) + 1 if positions.size else 0
+                result = store.select("data", columns=columns, start=start, stop=stop)
+                columns = None
+            else:
+                # Fixed format has to be read whole
+                result = store.get("data")
+                positions = None if rows is None else _resolve_rows(rows, len(result))
+                start = 0
+
+        if not isinstance(result, pd.DataFrame):
+            raise TypeError(
+                f"Expected HDF5 key 'data' to contain a pandas DataFrame, "
+                f"but got {type(result).__name__}"
+            )
+        return _select(result, columns, positions, offset=start)
+
+    @staticmethod
+    def _read_parquet(
+        file_path: Path,
+        columns: Sequence[str] | None,
+        rows: RowSelection | None,
+    ) -> pd.DataFrame:
+        """Read a Parquet output, loading only the row groups that are needed."""
+        if rows is None:
+            return pd.read_parquet(file_path, columns=columns)
+
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(file_path)
+        metadata = parquet_file.metadata
+        positions = _resolve_rows(rows, metadata.num_rows)
+        column_list = None if columns is None else list(columns)
+        if positions is None or not positions.size:
+            table = parquet_file.schema_arrow.empty_table()
+            frame = table.to_pandas()
+            return frame if column_list is None else frame[column_list]
+
+        group_sizes = [
+            metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+        ]
+        bounds = np.concatenate([[0], np.cumsum(group_sizes)])
+        start, stop = int(positions.min()), int(positions.max()) + 1
+        first = int(np.searchsorted(bounds, start, side="right")) - 1
+        last = int(np.searchsorted(bounds, stop, side="left"))
+        table = parquet_file.read_row_groups(range(first, last), columns=column_list)
+        return _select(table.to_pandas(), None, positions, offset=int(bounds[first]))
+
+    def convert_simulation_results(
+        self,
+        filename: str,
+        from_format: OutputFormat,
+        to_format: OutputFormat = OutputFormat.ARRAYS,
+        engine: str = "mujoco",
+    ) -> Path:
+        """
+        Convert a saved simulation output to another format.
+
+        The converted output is written next to the original under the same
+        name with the new extension; the original is kept. Metadata stored in
+        the catalog carries over.
+
+        Args:
+            filename: Input filename
+            from_format: Format of the existing output
+            to_format: Format to convert to
+            engine: Physics engine name
+
+        Returns:
+            Path to the converted output
+        """
+        results = self.load_simulation_results(filename, from_format, engine)
+        if from_format == OutputFormat.ARRAYS:
+            # Detach from the memory-mapped files before they are rewritten
+            results = {
+                name: np.array(value) if isinstance(value, np.ndarray) else value
+                for name, value in results.items()
+            }
+
+        source = self.directories["simulations"] / engine / filename
+        stem = source.name.removesuffix(f".{from_format.value}")
+        target = source.with_name(f"{stem}.{to_format.value}")
+        entry = self.catalog.get(source.with_name(f"{stem}.{from_format.value}"))
+        metadata = entry.metadata if entry else None
+
+        self._write_results(target, results, to_format, engine, metadata)
+        self.catalog.record(
+            target, engine, to_format.value, _as_written(results, to_format), metadata
+        )
+        logger.info(f"Converted {source.name} to {target}")
+        return target
+
+    def find_simulations(
+        self,
+        engine: str | None = None,
+        format_type: OutputFormat | None = None,
+        modified_after: datetime | None = None,
+        modified_before: datetime | None = None,
+        has_columns: Sequence[str] | None = None,
+    ) -> list[CatalogEntry]:
+        """
+        Query the simulation catalog.
+
+        Args:
+            engine: Only simulations of this engine
+            format_type: Only simulations in this format
+            modified_after: Only files modified at or after this time
+            modified_before: Only files modified before this time
+            has_columns: Only tabular results containing all these columns
+
+        Returns:
+            Catalog entries (path, engine, format, timestamps, size, shape,
+            column schema and metadata), newest first
+        """
+        return self.catalog.query(
+            engine=engine,
+            format_type=None if format_type is None else format_type.value,
+            modified_after=modified_after,
+            modified_before=modified_before,
+            has_columns=has_columns,
+        )
+
     def get_simulation_list(self, engine: str | None = None) -> list[str]:
         """
         Get list of available simulation files.
@@ -286,30 +1101,9 @@ class OutputManager:
         Returns:
             List of simulation filenames
         """
-        simulations = []
-
-        if engine:
-            engine_dir = self.directories["simulations"] / engine
-            if engine_dir.exists():
-                simulations.extend(
-                    [f.name for f in engine_dir.iterdir() if f.is_file()]
-                )
-        else:
-            # Get from all engines and also from root simulations directory
-            sim_dir = self.directories["simulations"]
-
-            # Check root simulations directory
-            if sim_dir.exists():
-                simulations.extend([f.name for f in sim_dir.iterdir() if f.is_file()])
-
-            # Check engine subdirectories
-            for engine_dir in sim_dir.iterdir():
-                if engine_dir.is_dir():
-                    simulations.extend(
-                        [f.name for f in engine_dir.iterdir() if f.is_file()]
-                    )
-
-        return sorted(simulations)
+        # Covers engine subdirectories and the root simulations directory
+        entries = self.catalog.query(engine=engine or None)
+        return sorted(entry.name for entry in entries)
 
     def export_analysis_report(
         self,
@@ -399,11 +1193,22 @@ class OutputManager:
                         except (OSError, PermissionError):
                             continue
 
-        # Clean older simulation and analysis files
-        for directory in [
-            self.directories["simulations"],
-            self.directories["analysis"],
-        ]:
+        archive_dir = self.base_path / "archive"
+
+        # Old simulations come straight from the catalog
+        for entry in self.catalog.query(modified_before=cutoff_date):
+            try:
+                archive_path = archive_dir / entry.path.relative_to(self.base_path)
+                archive_path.parent.mkdir(parents=True, exist_ok=True)
+                # Array stores are directories; rename moves them whole
+                entry.path.rename(archive_path)
+                self.catalog.remove(entry.path)
+                cleaned_count += 1
+            except (OSError, PermissionError):
+                continue
+
+        # Analysis files are not catalogued
+        for directory in [self.directories["analysis"]]:
             if directory.exists():
                 for file_path in directory.rglob("*"):
                     if file_path.is_file():
@@ -413,7 +1218,6 @@ class OutputManager:
                             )
                             if file_time < cutoff_date:
                                 # Move to archive instead of deleting
-                                archive_dir = self.base_path / "archive"
                                 archive_dir.mkdir(exist_ok=True)
 
                                 relative_path = file_path.relative_to(self.base_path)
@@ -473,7 +1277,7 @@ class OutputManager:
 
 # Convenience functions for backward compatibility
 def save_results(
-    results: Any, filename: str, format_type: str = "csv", engine: str = "mujoco"
+    results: Any, filename: str, format_type: str = "arrays", engine: str = "mujoco"
 ) -> str:
     """Convenience function for saving results."""
     manager = OutputManager()
@@ -484,8 +1288,10 @@ def save_results(
 
 
 def load_results(
-    filename: str, format_type: str = "csv", engine: str = "mujoco"
+    filename: str, format_type: str | None = None, engine: str = "mujoco"
 ) -> Any:
     """Convenience function for loading results."""
     manager = OutputManager()
-    return manager.load_simulation_results(filename, OutputFormat(format_type), engine)
+    return manager.load_simulation_results(
+        filename, None if format_type is None else OutputFormat(format_type), engine
+    )
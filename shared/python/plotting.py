@@ -10,11 +10,19 @@ This module provides comprehensive plotting capabilities including:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Protocol
 
 import numpy as np
 from matplotlib.figure import Figure
 
+from shared.python.downsampling import (
+    downsample,
+    minmax_indices,
+    pixel_width,
+    plot_downsampled,
+    stride_indices,
+)
 from shared.python.swing_plane_analysis import SwingPlaneAnalyzer
 
 if TYPE_CHECKING:
@@ -107,6 +115,23 @@ class GolfSwingPlotter:
             return self.joint_names[joint_idx]
         return f"Joint {joint_idx}"
 
+    @staticmethod
+    def _joint_columns(
+        data: np.ndarray, joint_idx: int | Sequence[int] | None
+    ) -> list[int] | None:
+        """Columns selected by joint_idx (all if None), or None if unavailable."""
+        if data.ndim < 2:
+            return None
+        if joint_idx is None:
+            columns = list(range(data.shape[1]))
+        elif isinstance(joint_idx, int | np.integer):
+            columns = [int(joint_idx)]
+        else:
+            columns = [int(i) for i in joint_idx]
+        if not columns or max(columns) >= data.shape[1]:
+            return None
+        return columns
+
     def _get_aligned_label(self, idx: int, data_dim: int) -> str:
         """Get label aligned with data dimension (handling nq != nv)."""
         # Assume joint_names corresponds to NV (actuated/velocity DOFs)
@@ -162,7 +187,13 @@ class GolfSwingPlotter:
         for idx in joint_indices:
             if idx < positions.shape[1]:
                 label = self._get_aligned_label(idx, positions.shape[1])
-                ax.plot(times, np.rad2deg(positions[:, idx]), label=label, linewidth=2)
+                plot_downsampled(
+                    ax,
+                    times,
+                    np.rad2deg(positions[:, idx]),
+                    label=label,
+                    linewidth=2,
+                )
 
         ax.set_xlabel("Time (s)", fontsize=12, fontweight="bold")
         ax.set_ylabel("Joint Angle (degrees)", fontsize=12, fontweight="bold")
@@ -201,7 +232,13 @@ class GolfSwingPlotter:
         for idx in joint_indices:
             if idx < velocities.shape[1]:
                 label = self._get_aligned_label(idx, velocities.shape[1])
-                ax.plot(times, np.rad2deg(velocities[:, idx]), label=label, linewidth=2)
+                plot_downsampled(
+                    ax,
+                    times,
+                    np.rad2deg(velocities[:, idx]),
+                    label=label,
+                    linewidth=2,
+                )
 
         ax.set_xlabel("Time (s)", fontsize=12, fontweight="bold")
         ax.set_ylabel("Angular Velocity (deg/s)", fontsize=12, fontweight="bold")
@@ -240,7 +277,7 @@ class GolfSwingPlotter:
         for idx in joint_indices:
             if idx < torques.shape[1]:
                 label = self._get_aligned_label(idx, torques.shape[1])
-                ax.plot(times, torques[:, idx], label=label, linewidth=2)
+                plot_downsampled(ax, times, torques[:, idx], label=label, linewidth=2)
 
         ax.set_xlabel("Time (s)", fontsize=12, fontweight="bold")
         ax.set_ylabel("Torque (Nm)", fontsize=12, fontweight="bold")
@@ -271,7 +308,9 @@ class GolfSwingPlotter:
 
         for idx in range(powers.shape[1]):
             label = self.get_joint_name(idx)
-            ax.plot(times, powers[:, idx], label=label, linewidth=2, alpha=0.7)
+            plot_downsampled(
+                ax, times, powers[:, idx], label=label, linewidth=2, alpha=0.7
+            )
 
         ax.set_xlabel("Time (s)", fontsize=12, fontweight="bold")
         ax.set_ylabel("Power (W)", fontsize=12, fontweight="bold")
@@ -298,21 +337,24 @@ class GolfSwingPlotter:
 
         ax = fig.add_subplot(111)
 
-        ax.plot(
+        plot_downsampled(
+            ax,
             times_ke,
             ke,
             label="Kinetic Energy",
             linewidth=2.5,
             color=self.colors["primary"],
         )
-        ax.plot(
+        plot_downsampled(
+            ax,
             times_pe,
             pe,
             label="Potential Energy",
             linewidth=2.5,
             color=self.colors["secondary"],
         )
-        ax.plot(
+        plot_downsampled(
+            ax,
             times_te,
             te,
             label="Total Energy",
@@ -350,8 +392,11 @@ class GolfSwingPlotter:
         # Convert to mph for golf context
         speeds_mph = speeds * 2.23694
 
-        ax.plot(times, speeds_mph, linewidth=3, color=self.colors["primary"])
-        ax.fill_between(times, 0, speeds_mph, alpha=0.3, color=self.colors["primary"])
+        plot_downsampled(
+            ax, times, speeds_mph, linewidth=3, color=self.colors["primary"]
+        )
+        fill_t, fill_v = downsample(times, speeds_mph, 2 * pixel_width(ax))
+        ax.fill_between(fill_t, 0, fill_v, alpha=0.3, color=self.colors["primary"])
 
         # Mark peak speed
         max_idx = np.argmax(speeds_mph)
@@ -391,9 +436,12 @@ class GolfSwingPlotter:
 
         ax = fig.add_subplot(111, projection="3d")
 
-        x = positions[:, 0]
-        y = positions[:, 1]
-        z = positions[:, 2]
+        # Parametric curve: thin evenly instead of bucketing by x
+        keep = stride_indices(len(times))
+        times = np.asarray(times)[keep]
+        x = positions[keep, 0]
+        y = positions[keep, 1]
+        z = positions[keep, 2]
 
         # Color by time
         sc = ax.scatter(x, y, z, c=times, cmap="viridis", s=20)  # type: ignore[misc]
@@ -466,8 +514,10 @@ class GolfSwingPlotter:
         # but plotting phase diagrams across misaligned q/v (e.g. quaternions) is complex.
         # We assume for now that if user asks for joint_idx, they know the indices align or are
         # aware of the structure. We just ensure safety.
-        angles = np.rad2deg(positions[:, joint_idx])
-        ang_vels = np.rad2deg(velocities[:, joint_idx])
+        keep = stride_indices(min(len(times), len(positions), len(velocities)))
+        times = np.asarray(times)[keep]
+        angles = np.rad2deg(positions[keep, joint_idx])
+        ang_vels = np.rad2deg(velocities[keep, joint_idx])
 
         # Color by time
         sc = ax.scatter(angles, ang_vels, c=times, cmap="viridis", s=30, alpha=0.6)
@@ -514,6 +564,11 @@ class GolfSwingPlotter:
         # Create stacked area plot
         ax = fig.add_subplot(111)
 
+        # Keep every joint's extrema on one shared time base
+        keep = minmax_indices(torques, pixel_width(ax))
+        times = np.asarray(times)[keep]
+        torques = torques[keep]
+
         # Separate positive and negative torques
         torques_pos = np.maximum(torques, 0)
         torques_neg = np.minimum(torques, 0)
@@ -540,14 +595,16 @@ class GolfSwingPlotter:
     def plot_frequency_analysis(
         self,
         fig: Figure,
-        joint_idx: int = 0,
+        joint_idx: int | Sequence[int] | None = 0,
         signal_type: str = "velocity",
     ) -> None:
-        """Plot frequency content (PSD) of a joint signal.
+        """Plot frequency content (PSD) of joint signals.
+
+        The PSDs of all selected joints are computed in one batched call.
 
         Args:
             fig: Matplotlib figure
-            joint_idx: Joint index
+            joint_idx: Joint index, several indices, or None for all joints
             signal_type: 'position', 'velocity', or 'torque'
         """
         if signal_type == "position":
@@ -564,12 +621,13 @@ class GolfSwingPlotter:
             title = "Joint Velocity PSD"
 
         data = np.asarray(data)
-        if data.ndim < 2 or joint_idx >= data.shape[1]:
+        columns = self._joint_columns(data, joint_idx)
+        if columns is None:
             ax = fig.add_subplot(111)
             ax.text(0.5, 0.5, "No data available", ha="center", va="center")
             return
 
-        signal_data = data[:, joint_idx]
+        signal_data = data[:, columns]
 
         # Calculate sampling rate
         # Assuming consistent time
@@ -585,18 +643,25 @@ class GolfSwingPlotter:
         try:
             from shared.python import signal_processing
 
-            freqs, psd = signal_processing.compute_psd(signal_data, fs)
+            freqs, psd = signal_processing.compute_psd(signal_data, fs, axis=0)
         except ImportError:
             # Fallback
             from scipy import signal
 
-            freqs, psd = signal.welch(signal_data, fs=fs)
+            freqs, psd = signal.welch(signal_data, fs=fs, axis=0)
 
         ax = fig.add_subplot(111)
-        ax.semilogy(freqs, psd, color=self.colors["primary"], linewidth=2)
-
-        joint_name = self.get_joint_name(joint_idx)
-        ax.set_title(f"{title}: {joint_name}", fontsize=14, fontweight="bold")
+        if len(columns) == 1:
+            ax.semilogy(freqs, psd[:, 0], color=self.colors["primary"], linewidth=2)
+            joint_name = self.get_joint_name(columns[0])
+            ax.set_title(f"{title}: {joint_name}", fontsize=14, fontweight="bold")
+        else:
+            for k, idx in enumerate(columns):
+                ax.semilogy(
+                    freqs, psd[:, k], linewidth=1.5, label=self.get_joint_name(idx)
+                )
+            ax.set_title(title, fontsize=14, fontweight="bold")
+            ax.legend(loc="upper left", bbox_to_anchor=(1, 1), framealpha=0.9)
         ax.set_xlabel("Frequency (Hz)", fontsize=12, fontweight="bold")
         ax.set_ylabel(ylabel, fontsize=12, fontweight="bold")
         ax.grid(True, alpha=0.3, which="both", linestyle="--")
@@ -605,14 +670,17 @@ class GolfSwingPlotter:
     def plot_spectrogram(
         self,
         fig: Figure,
-        joint_idx: int = 0,
+        joint_idx: int | Sequence[int] = 0,
         signal_type: str = "velocity",
     ) -> None:
-        """Plot spectrogram of a joint signal.
+        """Plot spectrograms of joint signals, one row per joint.
+
+        The spectrograms of all selected joints are computed in one batched
+        call.
 
         Args:
             fig: Matplotlib figure
-            joint_idx: Joint index
+            joint_idx: Joint index or several indices
             signal_type: 'position', 'velocity', or 'torque'
         """
         if signal_type == "position":
@@ -626,12 +694,13 @@ class GolfSwingPlotter:
             title = "Joint Velocity Spectrogram"
 
         data = np.asarray(data)
-        if data.ndim < 2 or joint_idx >= data.shape[1]:
+        columns = self._joint_columns(data, joint_idx)
+        if columns is None:
             ax = fig.add_subplot(111)
             ax.text(0.5, 0.5, "No data available", ha="center", va="center")
             return
 
-        signal_data = data[:, joint_idx]
+        signal_data = data[:, columns]
 
         # Calculate sampling rate
         times, _ = self.recorder.get_time_series("joint_positions")
@@ -646,28 +715,34 @@ class GolfSwingPlotter:
         try:
             from shared.python import signal_processing
 
-            f, t, Sxx = signal_processing.compute_spectrogram(signal_data, fs)
+            f, t, Sxx = signal_processing.compute_spectrogram(signal_data, fs, axis=0)
         except ImportError:
             # Fallback
             from scipy import signal
 
-            f, t, Sxx = signal.spectrogram(signal_data, fs=fs)
+            f, t, Sxx = signal.spectrogram(signal_data, fs=fs, axis=0)
+
+        # Sxx is (frequencies, joints, times)
+        for k, idx in enumerate(columns):
+            ax = fig.add_subplot(len(columns), 1, k + 1)
+            # Use pcolormesh for better visualization
+            pcm = ax.pcolormesh(
+                t,
+                f,
+                10 * np.log10(Sxx[:, k] + 1e-10),
+                shading="gouraud",
+                cmap="inferno",
+            )
 
-        ax = fig.add_subplot(111)
-        # Use pcolormesh for better visualization
-        pcm = ax.pcolormesh(
-            t, f, 10 * np.log10(Sxx + 1e-10), shading="gouraud", cmap="inferno"
-        )
+            joint_name = self.get_joint_name(idx)
+            ax.set_title(f"{title}: {joint_name}", fontsize=14, fontweight="bold")
+            ax.set_ylabel("Frequency (Hz)", fontsize=12, fontweight="bold")
 
-        joint_name = self.get_joint_name(joint_idx)
-        ax.set_title(f"{title}: {joint_name}", fontsize=14, fontweight="bold")
-        ax.set_ylabel("Frequency (Hz)", fontsize=12, fontweight="bold")
+            # Add colorbar
+            cbar = fig.colorbar(pcm, ax=ax)
+            cbar.set_label("Power Spectral Density (dB)", rotation=270, labelpad=15)
         ax.set_xlabel("Time (s)", fontsize=12, fontweight="bold")
 
-        # Add colorbar
-        cbar = fig.colorbar(pcm, ax=ax)
-        cbar.set_label("Power Spectral Density (dB)", rotation=270, labelpad=15)
-
         fig.tight_layout()
 
     def plot_summary_dashboard(self, fig: Figure) -> None:
@@ -686,11 +761,14 @@ class GolfSwingPlotter:
         speeds = np.asarray(speeds)
         if len(times) > 0 and len(speeds) > 0:
             speeds_mph = speeds * 2.23694
-            ax1.plot(times, speeds_mph, linewidth=2, color=self.colors["primary"])
+            plot_downsampled(
+                ax1, times, speeds_mph, linewidth=2, color=self.colors["primary"]
+            )
+            fill_t, fill_v = downsample(times, speeds_mph, 2 * pixel_width(ax1))
             ax1.fill_between(
-                times,
+                fill_t,
                 0,
-                speeds_mph,
+                fill_v,
                 alpha=0.3,
                 color=self.colors["primary"],
             )
@@ -711,14 +789,16 @@ class GolfSwingPlotter:
         times_ke, ke = self.recorder.get_time_series("kinetic_energy")
         times_pe, pe = self.recorder.get_time_series("potential_energy")
         if len(times_ke) > 0:
-            ax2.plot(
+            plot_downsampled(
+                ax2,
                 times_ke,
                 ke,
                 label="KE",
                 linewidth=2,
                 color=self.colors["primary"],
             )
-            ax2.plot(
+            plot_downsampled(
+                ax2,
                 times_pe,
                 pe,
                 label="PE",
@@ -740,7 +820,8 @@ class GolfSwingPlotter:
         positions = np.asarray(positions)
         if len(times) > 0 and len(positions) > 0 and positions.ndim >= 2:
             for idx in range(min(3, positions.shape[1])):  # Plot first 3 joints
-                ax3.plot(
+                plot_downsampled(
+                    ax3,
                     times,
                     np.rad2deg(positions[:, idx]),
                     label=self.get_joint_name(idx),
@@ -761,7 +842,8 @@ class GolfSwingPlotter:
         torques = np.asarray(torques)
         if len(times) > 0 and len(torques) > 0 and torques.ndim >= 2:
             for idx in range(min(3, torques.shape[1])):  # Plot first 3 actuators
-                ax4.plot(
+                plot_downsampled(
+                    ax4,
                     times,
                     torques[:, idx],
                     label=self.get_joint_name(idx),
@@ -827,7 +909,9 @@ class GolfSwingPlotter:
                     vel_norm = vel
 
                 color = colors[i % len(colors)]
-                ax.plot(times, vel_norm, label=name, color=color, linewidth=2)
+                plot_downsampled(
+                    ax, times, vel_norm, label=name, color=color, linewidth=2
+                )
 
                 # Mark peak
                 max_t_idx = np.argmax(vel)
@@ -874,9 +958,11 @@ class GolfSwingPlotter:
 
         ax = fig.add_subplot(111, projection="3d")
 
-        pos = np.rad2deg(positions[:, joint_idx])
-        vel = np.rad2deg(velocities[:, joint_idx])
-        acc = np.rad2deg(accelerations[:, joint_idx])
+        keep = stride_indices(len(times))
+        times = np.asarray(times)[keep]
+        pos = np.rad2deg(positions[keep, joint_idx])
+        vel = np.rad2deg(velocities[keep, joint_idx])
+        acc = np.rad2deg(accelerations[keep, joint_idx])
 
         # Color by time
         sc = ax.scatter(pos, vel, acc, c=times, cmap="viridis", s=20)  # type: ignore[misc]
@@ -1006,11 +1092,12 @@ class GolfSwingPlotter:
         deviations = analyzer.calculate_deviation(positions, centroid, normal)
 
         # Plot trajectory
+        keep = stride_indices(len(deviations))
         sc = ax.scatter(
-            x,
-            y,
-            z,
-            c=np.abs(deviations),
+            x[keep],
+            y[keep],
+            z[keep],
+            c=np.abs(deviations[keep]),
             cmap="coolwarm",
             s=20,  # type: ignore[misc]
             label="Trajectory",
@@ -1048,7 +1135,7 @@ class GolfSwingPlotter:
         ax.set_zlabel("Z (m)")  # type: ignore[attr-defined]
         ax.set_title(
             f"Swing Plane Analysis\nSteepness: {metrics.steepness_deg:.1f}°, "
-            f"RMSE: {metrics.rmse*100:.1f} cm",
+            f"RMSE: {metrics.rmse * 100:.1f} cm",
             fontsize=12,
             fontweight="bold",
         )
@@ -7,28 +7,59 @@ analysis, and signal quality assessment.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 from scipy import signal
 
+# Welch segment length used when none is given (scipy's default)
+DEFAULT_NPERSEG = 256
+
+
+@lru_cache(maxsize=32)
+def _get_window(window: str, nperseg: int) -> np.ndarray:
+    """Window of nperseg samples, computed once per (window, nperseg)."""
+    values = signal.get_window(window, nperseg)
+    values.setflags(write=False)
+    return values
+
+
+def _segment_window(
+    data: np.ndarray, window: str, nperseg: int | None, axis: int
+) -> tuple[np.ndarray, int]:
+    """Cached window and segment length, clipped to the signal length."""
+    nperseg = nperseg or DEFAULT_NPERSEG
+    if data.ndim and 0 < data.shape[axis] < nperseg:
+        nperseg = data.shape[axis]
+    return _get_window(window, nperseg), nperseg
+
 
 def compute_psd(
     data: np.ndarray,
     fs: float,
     window: str = "hann",
     nperseg: int | None = None,
+    axis: int = -1,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Compute Power Spectral Density using Welch's method.
 
+    Multi-channel data is handled in one call: for an (N, channels) array
+    pass ``axis=0`` to get a (frequencies, channels) PSD.
+
     Args:
         data: Input time series data
         fs: Sampling frequency in Hz
         window: Window function to use (default: 'hann')
-        nperseg: Length of each segment (default: None -> 256)
+        nperseg: Length of each segment (default: None -> 256, clipped to
+            the signal length)
+        axis: Time axis of data
 
     Returns:
         tuple: (frequencies, psd_values)
     """
-    freqs, psd = signal.welch(data, fs=fs, window=window, nperseg=nperseg)
+    data = np.asarray(data)
+    win, nperseg = _segment_window(data, window, nperseg, axis)
+    freqs, psd = signal.welch(data, fs=fs, window=win, nperseg=nperseg, axis=axis)
     return freqs, psd
 
 
@@ -36,31 +67,73 @@ def compute_spectrogram(
     data: np.ndarray,
     fs: float,
     window: str = "hann",
-    nperseg: int = 256,
+    nperseg: int = DEFAULT_NPERSEG,
     noverlap: int | None = None,
+    axis: int = -1,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Compute Spectrogram.
 
+    Multi-channel data is handled in one call: for an (N, channels) array
+    pass ``axis=0`` to get Sxx of shape (frequencies, channels, times).
+
     Args:
         data: Input time series data
         fs: Sampling frequency in Hz
         window: Window function to use
-        nperseg: Length of each segment
+        nperseg: Length of each segment (clipped to the signal length)
         noverlap: Number of points to overlap between segments
+        axis: Time axis of data
 
     Returns:
         tuple: (frequencies, times, Sxx)
     """
+    data = np.asarray(data)
+    win, nperseg = _segment_window(data, window, nperseg, axis)
     f, t, Sxx = signal.spectrogram(
         data,
         fs=fs,
-        window=window,
+        window=win,
         nperseg=nperseg,
         noverlap=noverlap,
+        axis=axis,
     )
     return f, t, Sxx
 
 
+def _padded_length(n: int, pad_level: int) -> int:
+    """FFT length for n samples: next power of 2, times 2**pad_level."""
+    return int(pow(2, np.ceil(np.log2(max(n, 1))) + pad_level))
+
+
+def _spectral_arc_lengths(
+    frames: np.ndarray,
+    fs: float,
+    n_padded: int,
+    fc: float,
+    amp_th: float,
+) -> np.ndarray:
+    """SAL of each row of frames, zero padded to n_padded points."""
+    # Real input: the non-negative half of the spectrum carries everything.
+    # The Nyquist bin only counts towards the peak, as in a full FFT.
+    spectrum_mag = np.abs(np.fft.rfft(frames, n_padded, axis=-1))
+    max_mag = spectrum_mag.max(axis=-1, keepdims=True)
+
+    # Select frequencies up to fc
+    freqs = np.fft.rfftfreq(n_padded, 1 / fs)[: n_padded // 2]
+    mask = freqs <= fc
+    with np.errstate(invalid="ignore", divide="ignore"):
+        spectrum_sel = spectrum_mag[:, : n_padded // 2][:, mask] / max_mag
+
+    # Scale frequency to [0, 1] for the integral
+    d_freq = np.diff(freqs[mask] / fc)
+    d_mag = np.diff(spectrum_sel, axis=-1)
+    sal = -np.sqrt(d_freq**2 + d_mag**2).sum(axis=-1)
+
+    # Silent frames, or no magnitude above the threshold, score 0
+    valid = (max_mag[:, 0] > 0) & (spectrum_sel >= amp_th).any(axis=-1)
+    return np.where(valid, sal, 0.0)
+
+
 def compute_spectral_arc_length(
     data: np.ndarray,
     fs: float,
@@ -83,49 +156,180 @@ def compute_spectral_arc_length(
     Returns:
         float: SAL value (negative dimensionless metric)
     """
-    # Number of points
-    n = len(data)
-    if n == 0:
+    data = np.asarray(data, dtype=np.float64)
+    if len(data) == 0:
         return 0.0
 
-    # Zero padding
-    n_padded = int(pow(2, np.ceil(np.log2(n)) + pad_level))
+    n_padded = _padded_length(len(data), pad_level)
+    return float(_spectral_arc_lengths(data[None], fs, n_padded, fc, amp_th)[0])
 
-    # FFT
-    spectrum = np.fft.fft(data, n_padded)
-    spectrum_mag = np.abs(spectrum)
 
-    max_mag = np.max(spectrum_mag)
-    if max_mag == 0:
-        return 0.0
+def compute_spectral_arc_length_channels(
+    data: np.ndarray,
+    fs: float,
+    pad_level: int = 4,
+    fc: float = 20.0,
+    amp_th: float = 0.05,
+    axis: int = 0,
+) -> np.ndarray:
+    """Compute SAL of every channel of a multi-channel signal at once.
 
-    # Normalize magnitude
-    spectrum_norm = spectrum_mag / max_mag
+    All channels go through a single batched FFT; each value equals
+    compute_spectral_arc_length of that channel.
 
-    # Frequency axis
-    freqs = np.fft.fftfreq(n_padded, 1 / fs)
+    Args:
+        data: Velocity profiles, e.g. (N, joints)
+        fs: Sampling frequency
+        pad_level: Zero padding level (power of 2)
+        fc: Cut-off frequency for normalization
+        amp_th: Amplitude threshold (fraction of peak)
+        axis: Time axis of data
 
-    # Select frequencies up to fc
-    mask = (freqs >= 0) & (freqs <= fc)
-    freqs_sel = freqs[mask]
-    spectrum_sel = spectrum_norm[mask]
-
-    # Select magnitudes above threshold
-    # Note: The original paper defines the support region based on amplitude threshold
-    # We apply it to filter out noise
-    valid_indices = spectrum_sel >= amp_th
-    if not np.any(valid_indices):
-        return 0.0
+    Returns:
+        SAL of each channel, shaped like data without the time axis
+    """
+    frames = np.moveaxis(np.asarray(data, dtype=np.float64), axis, -1)
+    n = frames.shape[-1]
+    if n == 0:
+        return np.zeros(frames.shape[:-1])
 
-    # Calculate arc length
-    # Scale frequency to [0, 1] for the integral
-    freq_norm = freqs_sel / fc
+    n_padded = _padded_length(n, pad_level)
+    flat = frames.reshape(-1, n)
+    return _spectral_arc_lengths(flat, fs, n_padded, fc, amp_th).reshape(
+        frames.shape[:-1]
+    )
+
+
+# Windows transformed per FFT batch in compute_sliding_spectral_arc_length
+SAL_BATCH_WINDOWS = 256
+
+
+def compute_sliding_spectral_arc_length(
+    data: np.ndarray,
+    fs: float,
+    window: int,
+    step: int = 1,
+    pad_level: int = 4,
+    fc: float = 20.0,
+    amp_th: float = 0.05,
+) -> np.ndarray:
+    """Compute SAL over sliding windows of a velocity profile.
+
+    Each window is the same computation as compute_spectral_arc_length on
+    that slice, so the cost per value depends only on the window length.
+    Windows are transformed in batches with one FFT call each.
+
+    Args:
+        data: Velocity profile
+        fs: Sampling frequency
+        window: Window length in samples
+        step: Samples between consecutive windows
+        pad_level: Zero padding level (power of 2)
+        fc: Cut-off frequency for normalization
+        amp_th: Amplitude threshold (fraction of peak)
+
+    Returns:
+        SAL of each window, in order of window start (empty if data is
+        shorter than one window)
+
+    Raises:
+        ValueError: If window or step is not positive.
+    """
+    if window < 1 or step < 1:
+        msg = f"window and step must be positive, got {window} and {step}"
+        raise ValueError(msg)
+
+    data = np.asarray(data, dtype=np.float64)
+    if len(data) < window:
+        return np.empty(0)
+
+    frames = np.lib.stride_tricks.sliding_window_view(data, window)[::step]
+    n_padded = _padded_length(window, pad_level)
+    return np.concatenate(
+        [
+            _spectral_arc_lengths(
+                frames[i : i + SAL_BATCH_WINDOWS], fs, n_padded, fc, amp_th
+            )
+            for i in range(0, len(frames), SAL_BATCH_WINDOWS)
+        ]
+    )
+
+
+class StreamingSpectralArcLength:
+    """SAL of the most recent samples of a signal, updated as samples arrive.
+
+    Samples go into a fixed-length ring buffer, so an update costs one FFT
+    of the window no matter how long the recording is. With ``hop`` > 1 the
+    value is only recomputed every ``hop`` samples, which keeps per-sample
+    cost low at simulation rate.
+    """
+
+    def __init__(
+        self,
+        fs: float,
+        window: int,
+        hop: int = 1,
+        pad_level: int = 4,
+        fc: float = 20.0,
+        amp_th: float = 0.05,
+    ) -> None:
+        """Initialize the streaming metric.
+
+        Args:
+            fs: Sampling frequency
+            window: Number of most recent samples the metric covers
+            hop: Samples between recomputations
+            pad_level: Zero padding level (power of 2)
+            fc: Cut-off frequency for normalization
+            amp_th: Amplitude threshold (fraction of peak)
+
+        Raises:
+            ValueError: If window or hop is not positive.
+        """
+        if window < 1 or hop < 1:
+            msg = f"window and hop must be positive, got {window} and {hop}"
+            raise ValueError(msg)
+
+        self.fs = fs
+        self.window = window
+        self.hop = hop
+        self.fc = fc
+        self.amp_th = amp_th
+        # Fixed FFT length, so values from partial windows are comparable
+        self._n_padded = _padded_length(window, pad_level)
+        self._buffer = np.zeros(window)
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all samples."""
+        self._buffer[:] = 0.0
+        self._count = 0
+        self._pending = 0
+        self.value = 0.0
+
+    def update(self, sample: float) -> float:
+        """Add one sample.
 
-    # Calculate gradient
-    d_mag = np.diff(spectrum_sel)
-    d_freq = np.diff(freq_norm)
+        Args:
+            sample: New value of the velocity profile
 
-    # Arc length
-    sal = -np.sum(np.sqrt(d_freq**2 + d_mag**2))
+        Returns:
+            SAL of the last ``window`` samples (fewer until the buffer fills)
+        """
+        self._buffer[self._count % self.window] = sample
+        self._count += 1
+        self._pending += 1
+        if self._pending >= self.hop:
+            self._pending = 0
+            self.value = float(
+                _spectral_arc_lengths(
+                    self.samples()[None], self.fs, self._n_padded, self.fc, self.amp_th
+                )[0]
+            )
+        return self.value
 
-    return float(sal)
+    def samples(self) -> np.ndarray:
+        """Buffered samples in arrival order."""
+        if self._count <= self.window:
+            return self._buffer[: self._count].copy()
+        return np.roll(self._buffer, -(self._count % self.window))
@@ -5,17 +5,95 @@ Provides comprehensive statistical analysis including:
 - Summary statistics
 - Swing quality metrics
 - Phase-specific analysis
+- Vectorized analysis of whole sessions (batches of swings)
+
+Derived quantities of a single swing (smoothed speed, phases, peaks, tempo,
+per-joint and per-phase statistics) are memoized on the analyzer and only
+recomputed when the arrays they depend on are replaced.
 """
 
 from __future__ import annotations
 
+import copy
 import csv
+import functools
+import weakref
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
 import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.signal import find_peaks, savgol_filter
 
+SWING_PHASE_NAMES: tuple[str, ...] = (
+    "Address",
+    "Takeaway",
+    "Backswing",
+    "Transition",
+    "Downswing",
+    "Impact",
+    "Follow-through",
+    "Finish",
+)
+
+# Club head speed smoothing used for tempo and phase detection
+SMOOTHING_WINDOW = 11
+SMOOTHING_POLYORDER = 3
+
+# Recorded arrays that StatisticalAnalyzer results are derived from
+ANALYSIS_INPUTS: tuple[str, ...] = (
+    "times",
+    "joint_positions",
+    "joint_velocities",
+    "joint_torques",
+    "club_head_speed",
+    "club_head_position",
+)
+
+# Cached quantity -> inputs and cached quantities it is computed from
+_ANALYSIS_GRAPH: dict[str, tuple[str, ...]] = {}
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _cached(*depends_on: str) -> Callable[[_Method], _Method]:
+    """Memoize an argument-free StatisticalAnalyzer method.
+
+    The method becomes a node of the analysis graph: its result is kept
+    until one of ``depends_on`` (analysis inputs or other cached methods)
+    changes.
+    """
+
+    def decorator(method: _Method) -> _Method:
+        name = method.__name__
+        _ANALYSIS_GRAPH[name] = depends_on
+
+        @functools.wraps(method)
+        def wrapper(self: StatisticalAnalyzer) -> Any:
+            if name not in self._cache:
+                self._cache[name] = method(self)
+            return self._cache[name]
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _dependents(names: set[str]) -> set[str]:
+    """Cached quantities derived, directly or not, from any of names."""
+    stale: set[str] = set()
+    frontier = set(names)
+    while frontier:
+        frontier = {
+            node
+            for node, inputs in _ANALYSIS_GRAPH.items()
+            if node not in stale and frontier.intersection(inputs)
+        }
+        stale |= frontier
+    return stale
+
 
 @dataclass
 class PeakInfo:
@@ -67,7 +145,18 @@ class KinematicSequenceInfo:
 
 
 class StatisticalAnalyzer:
-    """Comprehensive statistical analysis for golf swing data."""
+    """Comprehensive statistical analysis for golf swing data.
+
+    Derived quantities are computed once and cached. Assigning a new array to
+    one of ANALYSIS_INPUTS drops only the results that depend on it; call
+    invalidate() after modifying an array in place. Cached results are
+    shared between calls and should be treated as read-only.
+    """
+
+    # Analyzers reused for recorders until their version changes
+    _recorder_analyzers: weakref.WeakKeyDictionary[Any, StatisticalAnalyzer] = (
+        weakref.WeakKeyDictionary()
+    )
 
     def __init__(
         self,
@@ -77,6 +166,7 @@ class StatisticalAnalyzer:
         joint_torques: np.ndarray,
         club_head_speed: np.ndarray | None = None,
         club_head_position: np.ndarray | None = None,
+        data_version: int | None = None,
     ) -> None:
         """Initialize analyzer with recorded data.
 
@@ -87,26 +177,109 @@ class StatisticalAnalyzer:
             joint_torques: Joint torques (N, nu)
             club_head_speed: Club head speed (N,) [optional]
             club_head_position: Club head 3D position (N, 3) [optional]
+            data_version: Version of the source recording the arrays were
+                taken from [optional]
         """
+        self._cache: dict[str, Any] = {}
         self.times = times
         self.joint_positions = joint_positions
         self.joint_velocities = joint_velocities
         self.joint_torques = joint_torques
         self.club_head_speed = club_head_speed
         self.club_head_position = club_head_position
+        self.data_version = data_version
+
+    @classmethod
+    def for_recorder(cls, recorder: Any) -> StatisticalAnalyzer:
+        """Analyzer for a recorder's data, reused while the recording is unchanged.
+
+        Recorders with a ``version`` counter get the same analyzer back, with
+        its cached results, until the counter changes. Others get a fresh
+        analyzer each call.
+
+        Args:
+            recorder: Recorder with get_time_series() (and optionally version)
+
+        Returns:
+            StatisticalAnalyzer for the recorded swing
+        """
+        version = getattr(recorder, "version", None)
+        if version is not None:
+            cached = cls._recorder_analyzers.get(recorder)
+            if cached is not None and cached.data_version == version:
+                return cached
+
+        times, positions = recorder.get_time_series("joint_positions")
+        _, velocities = recorder.get_time_series("joint_velocities")
+        _, torques = recorder.get_time_series("joint_torques")
+        _, speed = recorder.get_time_series("club_head_speed")
+        _, club_position = recorder.get_time_series("club_head_position")
+
+        analyzer = cls(
+            np.asarray(times),
+            np.asarray(positions),
+            np.asarray(velocities),
+            np.asarray(torques),
+            club_head_speed=np.asarray(speed) if len(speed) else None,
+            club_head_position=(
+                np.asarray(club_position) if len(club_position) else None
+            ),
+            data_version=version,
+        )
+        if version is not None:
+            cls._recorder_analyzers[recorder] = analyzer
+        return analyzer
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping cached results derived from it."""
+        super().__setattr__(name, value)
+        if name in ANALYSIS_INPUTS:
+            self.invalidate(name)
 
-        self.dt = float(np.mean(np.diff(times))) if len(times) > 1 else 0.0
-        self.duration = times[-1] - times[0] if len(times) > 1 else 0.0
+    def invalidate(self, *inputs: str) -> None:
+        """Drop cached results derived from the given inputs (all if none).
 
-    def compute_summary_stats(self, data: np.ndarray) -> SummaryStatistics:
+        Args:
+            inputs: Names from ANALYSIS_INPUTS whose arrays changed
+        """
+        if not inputs:
+            self._cache.clear()
+            return
+        for name in _dependents(set(inputs)):
+            self._cache.pop(name, None)
+
+    @_cached("times")
+    def _sampling(self) -> tuple[float, float]:
+        """Mean sample interval and duration of the recording."""
+        times = self.times
+        if len(times) < 2:
+            return 0.0, 0.0
+        return float(np.mean(np.diff(times))), times[-1] - times[0]
+
+    @property
+    def dt(self) -> float:
+        """Mean sample interval in seconds."""
+        return self._sampling()[0]
+
+    @property
+    def duration(self) -> float:
+        """Recording duration in seconds."""
+        return self._sampling()[1]
+
+    def compute_summary_stats(
+        self, data: np.ndarray, times: np.ndarray | None = None
+    ) -> SummaryStatistics:
         """Compute summary statistics for a 1D array.
 
         Args:
             data: 1D numpy array
+            times: Sample times of data (defaults to the analyzer's times)
 
         Returns:
             SummaryStatistics object
         """
+        if times is None:
+            times = self.times
         min_idx = np.argmin(data)
         max_idx = np.argmax(data)
         min_val = float(data[min_idx])
@@ -119,8 +292,8 @@ class StatisticalAnalyzer:
             min=min_val,
             max=max_val,
             range=max_val - min_val,
-            min_time=float(self.times[min_idx]),
-            max_time=float(self.times[max_idx]),
+            min_time=float(times[min_idx]),
+            max_time=float(times[max_idx]),
             rms=float(np.sqrt(np.mean(data**2))),
         )
 
@@ -168,6 +341,7 @@ class StatisticalAnalyzer:
 
         return peak_list
 
+    @_cached("club_head_speed", "times")
     def find_club_head_speed_peak(self) -> PeakInfo | None:
         """Find peak club head speed.
 
@@ -203,6 +377,7 @@ class StatisticalAnalyzer:
 
         return (min_angle, max_angle, rom)
 
+    @_cached("club_head_speed", "times")
     def compute_tempo(self) -> tuple[float, float, float] | None:
         """Compute swing tempo (backswing:downswing ratio).
 
@@ -322,6 +497,19 @@ class StatisticalAnalyzer:
             "energy_drift": float(energy_drift),
         }
 
+    @_cached("club_head_speed")
+    def _smoothed_club_head_speed(self) -> np.ndarray:
+        """Club head speed smoothed for phase detection."""
+        speed = self.club_head_speed
+        window_len = min(SMOOTHING_WINDOW, len(speed))
+        if window_len % 2 == 0:
+            window_len -= 1
+
+        if window_len <= SMOOTHING_POLYORDER:
+            return speed
+        return savgol_filter(speed, window_len, SMOOTHING_POLYORDER)
+
+    @_cached("_smoothed_club_head_speed", "_sampling", "times")
     def detect_swing_phases(self) -> list[SwingPhase]:
         """Automatically detect swing phases.
 
@@ -345,15 +533,7 @@ class StatisticalAnalyzer:
                 ),
             ]
 
-        # Smooth speed for phase detection
-        window_len = min(11, len(self.club_head_speed))
-        if window_len % 2 == 0:
-            window_len -= 1
-
-        if window_len <= 3:
-            smoothed_speed = self.club_head_speed
-        else:
-            smoothed_speed = savgol_filter(self.club_head_speed, window_len, 3)
+        smoothed_speed = self._smoothed_club_head_speed()
 
         # Key events
         impact_idx = np.argmax(smoothed_speed)  # Peak speed = impact
@@ -450,24 +630,84 @@ class StatisticalAnalyzer:
         phase_stats = {}
 
         for phase in phases:
-            phase_data = data[phase.start_index : phase.end_index + 1]
+            window = slice(phase.start_index, phase.end_index + 1)
+            phase_data = data[window]
             if len(phase_data) > 0:
-                # Temporarily override times for this phase
-                original_times = self.times
-                self.times = self.times[phase.start_index : phase.end_index + 1]
+                phase_stats[phase.name] = self.compute_summary_stats(
+                    phase_data, self.times[window]
+                )
 
-                phase_stats[phase.name] = self.compute_summary_stats(phase_data)
+        return phase_stats
 
-                self.times = original_times
+    @_cached("detect_swing_phases", "club_head_speed", "times")
+    def _club_head_speed_phase_statistics(self) -> dict[str, SummaryStatistics]:
+        """Club head speed statistics for each detected phase."""
+        if self.club_head_speed is None:
+            return {}
+        return self.compute_phase_statistics(
+            self.detect_swing_phases(), self.club_head_speed
+        )
 
-        return phase_stats
+    @_cached("times", "joint_positions", "joint_velocities", "joint_torques")
+    def _joint_statistics(self) -> dict[str, dict[str, Any]]:
+        """Range of motion and position/velocity/torque statistics per joint."""
+        joints: dict[str, dict[str, Any]] = {}
+        for i in range(self.joint_positions.shape[1]):
+            angles_deg = np.rad2deg(self.joint_positions[:, i])
+            position_stats = self.compute_summary_stats(angles_deg)
+
+            velocities = (
+                self.joint_velocities[:, i]
+                if i < self.joint_velocities.shape[1]
+                else None
+            )
+
+            joint_stats = {
+                "range_of_motion": {
+                    "min_deg": position_stats.min,
+                    "max_deg": position_stats.max,
+                    "rom_deg": position_stats.range,
+                },
+                "position_stats": position_stats.__dict__,
+            }
+
+            if velocities is not None:
+                joint_stats["velocity_stats"] = self.compute_summary_stats(
+                    np.rad2deg(velocities),
+                ).__dict__
+
+            if i < self.joint_torques.shape[1]:
+                joint_stats["torque_stats"] = self.compute_summary_stats(
+                    self.joint_torques[:, i],
+                ).__dict__
+
+            joints[f"joint_{i}"] = joint_stats
+
+        return joints
 
     def generate_comprehensive_report(self) -> dict[str, Any]:
         """Generate comprehensive statistical report.
 
+        The report is assembled from cached results, so repeated calls on
+        unchanged data cost only a copy.
+
         Returns:
             Dictionary with all analysis results
         """
+        return copy.deepcopy(self._report())
+
+    @_cached(
+        "_sampling",
+        "times",
+        "club_head_speed",
+        "find_club_head_speed_peak",
+        "compute_tempo",
+        "detect_swing_phases",
+        "_club_head_speed_phase_statistics",
+        "_joint_statistics",
+    )
+    def _report(self) -> dict[str, Any]:
+        """Comprehensive report shared by generate_comprehensive_report calls."""
         report: dict[str, Any] = {
             "duration": float(self.duration),
             "sample_rate": float(1.0 / self.dt) if self.dt > 0 else 0.0,
@@ -507,38 +747,15 @@ class StatisticalAnalyzer:
             for p in phases
         ]
 
-        # Joint statistics
-        report["joints"] = {}
-        for i in range(self.joint_positions.shape[1]):
-            angles_deg = np.rad2deg(self.joint_positions[:, i])
-            position_stats = self.compute_summary_stats(angles_deg)
-
-            velocities = (
-                self.joint_velocities[:, i]
-                if i < self.joint_velocities.shape[1]
-                else None
-            )
-
-            joint_stats = {
-                "range_of_motion": {
-                    "min_deg": position_stats.min,
-                    "max_deg": position_stats.max,
-                    "rom_deg": position_stats.range,
-                },
-                "position_stats": position_stats.__dict__,
+        # Club head speed within each phase
+        phase_stats = self._club_head_speed_phase_statistics()
+        if phase_stats:
+            report["phase_statistics"] = {
+                name: stats.__dict__ for name, stats in phase_stats.items()
             }
 
-            if velocities is not None:
-                joint_stats["velocity_stats"] = self.compute_summary_stats(
-                    np.rad2deg(velocities),
-                ).__dict__
-
-            if i < self.joint_torques.shape[1]:
-                joint_stats["torque_stats"] = self.compute_summary_stats(
-                    self.joint_torques[:, i],
-                ).__dict__
-
-            report["joints"][f"joint_{i}"] = joint_stats
+        # Joint statistics
+        report["joints"] = self._joint_statistics()
 
         return report
 
@@ -550,11 +767,13 @@ class StatisticalAnalyzer:
         """Compute frequency analysis (PSD).
 
         Args:
-            data: Input time series data
+            data: Input time series data, (N,) or (N, channels); all channels
+                are analyzed in one call
             window: Window function
 
         Returns:
-            (frequencies, psd_values)
+            (frequencies, psd_values), psd_values shaped (frequencies,) or
+            (frequencies, channels)
         """
         fs = 1.0 / self.dt if self.dt > 0 else 0.0
         if fs == 0.0:
@@ -563,33 +782,38 @@ class StatisticalAnalyzer:
         try:
             from shared.python import signal_processing
 
-            return signal_processing.compute_psd(data, fs, window=window)
+            return signal_processing.compute_psd(data, fs, window=window, axis=0)
         except ImportError:
             # Fallback if shared module not found
             from scipy import signal
 
-            freqs, psd = signal.welch(data, fs=fs, window=window)
+            freqs, psd = signal.welch(data, fs=fs, window=window, axis=0)
             return freqs, psd
 
-    def compute_smoothness_metric(self, data: np.ndarray) -> float:
+    def compute_smoothness_metric(self, data: np.ndarray) -> float | np.ndarray:
         """Compute smoothness metric (Spectral Arc Length).
 
         Args:
-            data: Velocity profile (or other signal)
+            data: Velocity profile (or other signal), (N,) or (N, channels);
+                all channels are scored in one batched FFT
 
         Returns:
-            Smoothness score (negative dimensionless value)
+            Smoothness score (negative dimensionless value), one per channel
+            for 2-D data
         """
+        data = np.asarray(data)
         fs = 1.0 / self.dt if self.dt > 0 else 0.0
         if fs == 0.0:
-            return 0.0
+            return 0.0 if data.ndim < 2 else np.zeros(data.shape[1])
 
         try:
             from shared.python import signal_processing
 
-            return signal_processing.compute_spectral_arc_length(data, fs)
+            if data.ndim < 2:
+                return signal_processing.compute_spectral_arc_length(data, fs)
+            return signal_processing.compute_spectral_arc_length_channels(data, fs)
         except ImportError:
-            return 0.0
+            return 0.0 if data.ndim < 2 else np.zeros(data.shape[1])
 
     def analyze_kinematic_sequence(
         self,
@@ -782,3 +1006,568 @@ class StatisticalAnalyzer:
                         f"{torque_stats.get('max', 0.0):.1f}",
                     ],
                 )
+
+
+def _smooth_prefixes(data: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Savitzky-Golay smooth the prefix ``data[k, :ends[k]]`` of every row.
+
+    Equivalent to ``savgol_filter(data[k, :ends[k]], 11, 3)`` per row, using
+    the same polynomial fits at both edges.
+
+    Args:
+        data: (K, T) samples
+        ends: (K,) prefix lengths, each at least ``SMOOTHING_WINDOW``
+
+    Returns:
+        (K, T) smoothed rows, NaN at and beyond ``ends``
+    """
+    window = SMOOTHING_WINDOW
+    half = window // 2
+    # Row i maps a window of samples to the smoothed value at position i
+    weights = savgol_filter(np.eye(window), window, SMOOTHING_POLYORDER, axis=0)
+
+    n_rows, n_samples = data.shape
+    smoothed = np.full((n_rows, n_samples), np.nan)
+    smoothed[:, half : n_samples - half] = (
+        sliding_window_view(data, window, axis=1) @ weights[half]
+    )
+    smoothed[:, :half] = data[:, :window] @ weights[:half].T
+
+    tail = np.take_along_axis(data, ends[:, None] - window + np.arange(window), 1)
+    np.put_along_axis(
+        smoothed,
+        ends[:, None] - half + np.arange(half),
+        tail @ weights[window - half :].T,
+        axis=1,
+    )
+    smoothed[np.arange(n_samples) >= ends[:, None]] = np.nan
+    return smoothed
+
+
+def _pad_ragged(series: Sequence[np.ndarray], n_samples: int) -> np.ndarray:
+    """Stack variable-length arrays into a NaN-padded (K, T, ...) array."""
+    first = np.asarray(series[0])
+    padded = np.full((len(series), n_samples, *first.shape[1:]), np.nan)
+    for k, values in enumerate(series):
+        values = np.asarray(values, dtype=np.float64)
+        padded[k, : values.shape[0]] = values
+    return padded
+
+
+@dataclass
+class BatchKinematicSequence:
+    """Kinematic sequence of every swing in a batch."""
+
+    segment_names: list[str]
+    peak_velocity: np.ndarray  # (K, S)
+    peak_time: np.ndarray  # (K, S)
+    peak_index: np.ndarray  # (K, S)
+    order_index: np.ndarray  # (K, S) rank of each segment by peak time
+    efficiency: np.ndarray  # (K,)
+
+
+class BatchStatisticalAnalyzer:
+    """Vectorized statistical analysis over a batch of swings.
+
+    Swings are stored padded to a common length ``T`` together with their
+    individual ``lengths``; samples past a swing's length are ignored. Every
+    metric is computed for all swings at once and matches running
+    :class:`StatisticalAnalyzer` on each swing separately.
+    """
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        joint_positions: np.ndarray,
+        joint_velocities: np.ndarray,
+        joint_torques: np.ndarray,
+        lengths: np.ndarray | None = None,
+        club_head_speed: np.ndarray | None = None,
+    ) -> None:
+        """Initialize analyzer with padded swing data.
+
+        Args:
+            times: Time arrays (K, T)
+            joint_positions: Joint positions (K, T, nq)
+            joint_velocities: Joint velocities (K, T, nv)
+            joint_torques: Joint torques (K, T, nu)
+            lengths: Valid samples per swing (K,); None means all T
+            club_head_speed: Club head speed (K, T) [optional]
+
+        Raises:
+            ValueError: If shapes disagree or a length is outside [1, T]
+        """
+        times = np.asarray(times, dtype=np.float64)
+        if times.ndim != 2:
+            msg = f"times must have shape (K, T), got {times.shape}"
+            raise ValueError(msg)
+        n_swings, n_samples = times.shape
+
+        self.lengths = (
+            np.full(n_swings, n_samples, dtype=np.intp)
+            if lengths is None
+            else np.asarray(lengths, dtype=np.intp)
+        )
+        if self.lengths.shape != (n_swings,) or np.any(
+            (self.lengths < 1) | (self.lengths > n_samples)
+        ):
+            msg = f"lengths must be {n_swings} values in [1, {n_samples}]"
+            raise ValueError(msg)
+        self.mask = np.arange(n_samples) < self.lengths[:, None]
+
+        self.times = self._masked(times)
+        self.joint_positions = self._masked(joint_positions, ndim=3)
+        self.joint_velocities = self._masked(joint_velocities, ndim=3)
+        self.joint_torques = self._masked(joint_torques, ndim=3)
+        self.club_head_speed = (
+            None if club_head_speed is None else self._masked(club_head_speed)
+        )
+
+        rows = np.arange(n_swings)
+        last = self.lengths - 1
+        self.duration = self.times[rows, last] - self.times[:, 0]
+        # Mean of the sample spacing telescopes to duration / (N - 1)
+        self.dt = np.where(last > 0, self.duration / np.maximum(last, 1), 0.0)
+
+    @classmethod
+    def from_ragged(
+        cls,
+        times: Sequence[np.ndarray],
+        joint_positions: Sequence[np.ndarray],
+        joint_velocities: Sequence[np.ndarray],
+        joint_torques: Sequence[np.ndarray],
+        club_head_speed: Sequence[np.ndarray] | None = None,
+    ) -> BatchStatisticalAnalyzer:
+        """Build a batch from per-swing arrays of different lengths.
+
+        Args:
+            times: K time arrays (N_k,)
+            joint_positions: K arrays (N_k, nq)
+            joint_velocities: K arrays (N_k, nv)
+            joint_torques: K arrays (N_k, nu)
+            club_head_speed: K arrays (N_k,) [optional]
+
+        Returns:
+            Analyzer over the NaN-padded batch
+        """
+        lengths = np.array([len(t) for t in times], dtype=np.intp)
+        n_samples = int(lengths.max())
+        return cls(
+            _pad_ragged(times, n_samples),
+            _pad_ragged(joint_positions, n_samples),
+            _pad_ragged(joint_velocities, n_samples),
+            _pad_ragged(joint_torques, n_samples),
+            lengths=lengths,
+            club_head_speed=(
+                None
+                if club_head_speed is None
+                else _pad_ragged(club_head_speed, n_samples)
+            ),
+        )
+
+    @property
+    def num_swings(self) -> int:
+        """Number of swings ``K``."""
+        return int(self.lengths.shape[0])
+
+    def _masked(self, data: np.ndarray, ndim: int = 2) -> np.ndarray:
+        """Copy ``data`` as float with samples past each swing set to NaN."""
+        data = np.array(data, dtype=np.float64)
+        if data.ndim != ndim or data.shape[:2] != self.mask.shape:
+            msg = (
+                f"Expected {ndim}-D array with leading shape {self.mask.shape}, "
+                f"got {data.shape}"
+            )
+            raise ValueError(msg)
+        data[~self.mask] = np.nan
+        return data
+
+    def _at(self, data: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """Gather ``data[k, indices[k, ...]]`` along the sample axis."""
+        return np.take_along_axis(data, indices[:, None, ...], axis=1)[:, 0]
+
+    def _moments(self, data: np.ndarray) -> dict[str, np.ndarray]:
+        """Summary statistics except the median of NaN-padded data.
+
+        Reductions use explicit masks rather than ``np.nan*`` functions,
+        which copy the whole batch on every call.
+        """
+        times = np.broadcast_to(
+            self.times.reshape(self.times.shape + (1,) * (data.ndim - 2)),
+            data.shape,
+        )
+        valid = ~np.isnan(data)
+        counts = np.count_nonzero(valid, axis=1)
+
+        filled = np.where(valid, data, 0.0)
+        mean = filled.sum(axis=1) / counts
+        deviation = np.where(valid, data - mean[:, None], 0.0)
+
+        min_idx = np.where(valid, data, np.inf).argmin(axis=1)
+        max_idx = np.where(valid, data, -np.inf).argmax(axis=1)
+        min_val = self._at(data, min_idx)
+        max_val = self._at(data, max_idx)
+
+        return {
+            "mean": mean,
+            "std": np.sqrt((deviation**2).sum(axis=1) / counts),
+            "min": min_val,
+            "max": max_val,
+            "range": max_val - min_val,
+            "min_time": self._at(times, min_idx),
+            "max_time": self._at(times, max_idx),
+            "rms": np.sqrt((filled**2).sum(axis=1) / counts),
+        }
+
+    def _median(self, data: np.ndarray) -> np.ndarray:
+        """Median of NaN-padded data along the sample axis.
+
+        ``np.nanmedian`` loops over every series in Python for N-D input;
+        sorting once (NaN sorts last) and gathering the middle is vectorized.
+        """
+        counts = np.count_nonzero(~np.isnan(data), axis=1)
+        ordered = np.sort(data, axis=1)
+        lower = self._at(ordered, np.maximum(counts - 1, 0) // 2)
+        upper = self._at(ordered, counts // 2)
+        return (lower + upper) / 2
+
+    def compute_summary_stats(self, data: np.ndarray) -> dict[str, np.ndarray]:
+        """Compute summary statistics of every swing.
+
+        Padding and NaN samples are excluded.
+
+        Args:
+            data: (K, T) or (K, T, J) samples aligned with ``times``
+
+        Returns:
+            Dictionary with the :class:`SummaryStatistics` fields, each of
+            shape (K,) or (K, J)
+        """
+        data = self._masked(data, ndim=np.ndim(data))
+        stats = self._moments(data)
+        stats["median"] = self._median(data)
+        return {field: stats[field] for field in SummaryStatistics.__annotations__}
+
+    def find_club_head_speed_peak(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """Find peak club head speed of every swing.
+
+        Returns:
+            (values, times, indices), each (K,), or None without club data
+        """
+        if self.club_head_speed is None:
+            return None
+        indices = np.nanargmax(self.club_head_speed, axis=1)
+        return (
+            self._at(self.club_head_speed, indices),
+            self._at(self.times, indices),
+            indices,
+        )
+
+    def compute_tempo(self) -> dict[str, np.ndarray] | None:
+        """Compute swing tempo (backswing:downswing ratio) of every swing.
+
+        Returns:
+            Dictionary of (K,) arrays ``backswing_duration``,
+            ``downswing_duration``, ``ratio`` and ``transition_index``; NaN
+            (or -1) where :meth:`StatisticalAnalyzer.compute_tempo` returns
+            None. None without club data.
+        """
+        if self.club_head_speed is None:
+            return None
+
+        speed = self.club_head_speed
+        impact = np.nanargmax(speed, axis=1)
+        search_end = (impact * 0.7).astype(np.intp)
+        valid = (self.lengths >= 10) & (search_end > 5)
+        transition = np.full(self.num_swings, -1, dtype=np.intp)
+
+        # Impacts this early smooth the pre-impact segment with a shorter
+        # window; they are rare enough to analyze one by one.
+        batched = valid & (impact >= SMOOTHING_WINDOW)
+        if np.any(batched):
+            smoothed = _smooth_prefixes(speed[batched], impact[batched])
+            cols = np.arange(speed.shape[1])
+            in_search = (cols >= 5) & (cols < search_end[batched, None])
+            transition[batched] = np.argmin(
+                np.where(in_search, smoothed, np.inf), axis=1
+            )
+        for k in np.flatnonzero(valid & ~batched):
+            odd_window = impact[k] - 1 + impact[k] % 2
+            segment = savgol_filter(
+                speed[k, : impact[k]], odd_window, SMOOTHING_POLYORDER
+            )
+            transition[k] = 5 + np.argmin(segment[5 : search_end[k]])
+
+        rows = np.arange(self.num_swings)
+        t_start = self.times[:, 0]
+        t_transition = self.times[rows, np.maximum(transition, 0)]
+        t_impact = self.times[rows, impact]
+        backswing = np.where(valid, t_transition - t_start, np.nan)
+        downswing = np.where(valid, t_impact - t_transition, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(downswing > 0, backswing / downswing, 0.0)
+
+        return {
+            "backswing_duration": backswing,
+            "downswing_duration": downswing,
+            "ratio": np.where(valid, ratio, np.nan),
+            "transition_index": transition,
+        }
+
+    def compute_x_factor(
+        self,
+        shoulder_joint_idx: int,
+        hip_joint_idx: int,
+    ) -> np.ndarray | None:
+        """Compute X-Factor (shoulder-hip rotation difference) of every swing.
+
+        Args:
+            shoulder_joint_idx: Index of shoulder/torso rotation joint
+            hip_joint_idx: Index of hip rotation joint
+
+        Returns:
+            X-Factor time series (K, T) in degrees, or None
+        """
+        n_joints = self.joint_positions.shape[2]
+        if shoulder_joint_idx >= n_joints or hip_joint_idx >= n_joints:
+            return None
+        return np.rad2deg(
+            self.joint_positions[:, :, shoulder_joint_idx]
+            - self.joint_positions[:, :, hip_joint_idx]
+        )
+
+    def detect_swing_phases(self) -> np.ndarray:
+        """Detect swing phases of every swing.
+
+        Uses the same heuristics as :meth:`StatisticalAnalyzer.detect_swing_phases`.
+
+        Returns:
+            (K, len(SWING_PHASE_NAMES), 2) start and end sample indices. Rows
+            are -1 for swings without club data or with fewer than 20
+            samples (the single-swing analyzer reports "Complete Swing").
+        """
+        n_phases = len(SWING_PHASE_NAMES)
+        boundaries = np.full((self.num_swings, n_phases, 2), -1, dtype=np.intp)
+        if self.club_head_speed is None:
+            return boundaries
+
+        valid = self.lengths >= 20
+        if not np.any(valid):
+            return boundaries
+
+        lengths = self.lengths[valid]
+        last = lengths - 1
+        smoothed = _smooth_prefixes(self.club_head_speed[valid], lengths)
+        rows = np.arange(smoothed.shape[0])
+        cols = np.arange(smoothed.shape[1])
+
+        # Key events
+        impact = np.nanargmax(smoothed, axis=1)
+        search_end = (impact * 0.7).astype(np.intp)
+        in_search = (cols >= 5) & (cols < search_end[:, None])
+        transition = np.where(
+            search_end > 5,
+            np.argmin(np.where(in_search, smoothed, np.inf), axis=1),
+            impact // 2,
+        )
+
+        # First significant movement before the transition
+        moving = (
+            (cols >= 1)
+            & (cols < transition[:, None])
+            & (smoothed > 0.1 * smoothed[rows, transition][:, None])
+        )
+        takeaway = np.where(moving.any(axis=1), moving.argmax(axis=1), 0)
+
+        # Speed drops after impact
+        slowed = (cols > impact[:, None]) & (
+            smoothed < 0.3 * smoothed[rows, impact][:, None]
+        )
+        finish = np.where(slowed.any(axis=1), slowed.argmax(axis=1), last)
+
+        backswing_start = (takeaway + (transition - takeaway) * 0.3).astype(np.intp)
+        downswing_start = (transition + (impact - transition) * 0.2).astype(np.intp)
+        starts = np.stack(
+            [
+                np.zeros_like(impact),
+                takeaway,
+                backswing_start,
+                transition,
+                downswing_start,
+                np.maximum(0, impact - 2),
+                impact,
+                finish,
+            ],
+            axis=1,
+        )
+        ends = np.stack(
+            [
+                takeaway,
+                backswing_start,
+                transition,
+                downswing_start,
+                impact,
+                np.minimum(last, impact + 2),
+                finish,
+                last,
+            ],
+            axis=1,
+        )
+        starts = np.clip(starts, 0, last[:, None])
+        ends = np.maximum(starts, np.minimum(ends, last[:, None]))
+
+        boundaries[valid] = np.stack([starts, ends], axis=2)
+        return boundaries
+
+    def analyze_kinematic_sequence(
+        self,
+        segment_indices: dict[str, int],
+    ) -> BatchKinematicSequence:
+        """Analyze the kinematic sequence of every swing.
+
+        Args:
+            segment_indices: Dictionary mapping segment names to joint indices,
+                in the expected proximal-to-distal order
+
+        Returns:
+            BatchKinematicSequence with per-swing peaks and efficiency scores
+        """
+        n_velocities = self.joint_velocities.shape[2]
+        names = [name for name, idx in segment_indices.items() if idx < n_velocities]
+        columns = [segment_indices[name] for name in names]
+
+        speeds = np.abs(self.joint_velocities[:, :, columns])
+        peak_index = np.nanargmax(speeds, axis=1)
+        peak_time = self._at(
+            np.broadcast_to(self.times[:, :, None], speeds.shape), peak_index
+        )
+
+        # Stable sort keeps ties in input order, like list.sort
+        order = np.argsort(peak_time, axis=1, kind="stable")
+        order_index = np.empty_like(order)
+        np.put_along_axis(order_index, order, np.arange(len(names)), axis=1)
+
+        expected = list(segment_indices)
+        if expected:
+            actual_names = np.asarray(names, dtype=object)[order]
+            matches = actual_names == np.asarray(expected[: len(names)], dtype=object)
+            efficiency = matches.sum(axis=1) / len(expected)
+        else:
+            efficiency = np.zeros(self.num_swings)
+
+        return BatchKinematicSequence(
+            segment_names=names,
+            peak_velocity=self._at(speeds, peak_index),
+            peak_time=peak_time,
+            peak_index=peak_index,
+            order_index=order_index,
+            efficiency=efficiency,
+        )
+
+    def generate_summary_table(
+        self,
+        segment_indices: dict[str, int] | None = None,
+        shoulder_joint_idx: int | None = None,
+        hip_joint_idx: int | None = None,
+    ) -> pd.DataFrame:
+        """Summarize every swing as one row of a tidy table.
+
+        Args:
+            segment_indices: Segments for kinematic sequence columns [optional]
+            shoulder_joint_idx: Shoulder rotation joint for X-Factor [optional]
+            hip_joint_idx: Hip rotation joint for X-Factor [optional]
+
+        Returns:
+            DataFrame indexed by swing with duration, club head speed, tempo,
+            phase timing, kinematic sequence and X-Factor columns
+        """
+        rows = np.arange(self.num_swings)
+        with np.errstate(divide="ignore"):
+            sample_rate = np.where(self.dt > 0, 1.0 / self.dt, 0.0)
+        columns: dict[str, np.ndarray] = {
+            "num_samples": self.lengths,
+            "duration": self.duration,
+            "sample_rate": sample_rate,
+        }
+
+        if self.club_head_speed is not None:
+            stats = self.compute_summary_stats(self.club_head_speed)
+            columns["club_head_speed_peak"] = stats["max"]
+            columns["club_head_speed_peak_time"] = stats["max_time"]
+            for key in ("mean", "std", "rms"):
+                columns[f"club_head_speed_{key}"] = stats[key]
+
+        tempo = self.compute_tempo()
+        if tempo is not None:
+            columns["backswing_duration"] = tempo["backswing_duration"]
+            columns["downswing_duration"] = tempo["downswing_duration"]
+            columns["tempo_ratio"] = tempo["ratio"]
+
+        phases = self.detect_swing_phases()
+        detected = phases[:, 0, 0] >= 0
+        for p, name in enumerate(SWING_PHASE_NAMES):
+            key = name.lower().replace("-", "_")
+            for side, label in enumerate(("start", "end")):
+                idx = np.maximum(phases[:, p, side], 0)
+                columns[f"{key}_{label}_time"] = np.where(
+                    detected, self.times[rows, idx], np.nan
+                )
+
+        if segment_indices:
+            sequence = self.analyze_kinematic_sequence(segment_indices)
+            columns["sequence_efficiency"] = sequence.efficiency
+            for s, name in enumerate(sequence.segment_names):
+                columns[f"{name}_peak_time"] = sequence.peak_time[:, s]
+
+        if shoulder_joint_idx is not None and hip_joint_idx is not None:
+            x_factor = self.compute_x_factor(shoulder_joint_idx, hip_joint_idx)
+            if x_factor is not None:
+                columns["x_factor_max"] = np.nanmax(x_factor, axis=1)
+                top = phases[:, SWING_PHASE_NAMES.index("Transition"), 0]
+                columns["x_factor_at_top"] = np.where(
+                    detected, x_factor[rows, np.maximum(top, 0)], np.nan
+                )
+
+        table = pd.DataFrame(columns)
+        table.index.name = "swing"
+        return table
+
+    def generate_joint_table(self) -> pd.DataFrame:
+        """Summarize every joint of every swing as one row of a tidy table.
+
+        Returns:
+            DataFrame with one row per (swing, joint): range of motion in
+            degrees and peak/mean velocity and torque statistics. Velocity and
+            torque columns are NaN for joints beyond nv or nu.
+        """
+        n_swings, _, n_joints = self.joint_positions.shape
+        positions = self._moments(np.rad2deg(self.joint_positions))
+
+        def per_joint(data: np.ndarray) -> dict[str, np.ndarray]:
+            stats = self._moments(data)  # internal arrays are already padded
+            padded = {}
+            for key in ("max", "min", "mean", "rms"):
+                values = np.full((n_swings, n_joints), np.nan)
+                width = min(n_joints, stats[key].shape[1])
+                values[:, :width] = stats[key][:, :width]
+                padded[key] = values.ravel()
+            return padded
+
+        velocities = per_joint(np.rad2deg(self.joint_velocities))
+        torques = per_joint(self.joint_torques)
+
+        table = pd.DataFrame(
+            {
+                "swing": np.repeat(np.arange(n_swings), n_joints),
+                "joint": np.tile(np.arange(n_joints), n_swings),
+                "min_deg": positions["min"].ravel(),
+                "max_deg": positions["max"].ravel(),
+                "rom_deg": positions["range"].ravel(),
+                "mean_deg": positions["mean"].ravel(),
+                **{f"velocity_{key}": value for key, value in velocities.items()},
+                **{f"torque_{key}": value for key, value in torques.items()},
+            }
+        )
+        return table
@@ -4,6 +4,7 @@ Provides analysis of the golf swing plane, including:
 - Fitting a plane to the club head trajectory.
 - Calculating deviation from the plane.
 - Computing plane orientation (steepness/inclination, direction).
+- Updating the fit sample by sample for live readouts during recording.
 """
 
 from __future__ import annotations
@@ -25,6 +26,21 @@ class SwingPlaneMetrics:
     max_deviation: float  # Maximum distance from plane
 
 
+def _orientation(normal: np.ndarray) -> tuple[np.ndarray, float, float]:
+    """Upward-facing normal with its steepness and direction in degrees."""
+    # Ensure normal z is positive to measure from top
+    if normal[2] < 0:
+        normal = -normal
+
+    # Steepness: Angle between normal and vertical (Z axis)
+    steepness = np.degrees(np.arccos(np.clip(normal[2], -1.0, 1.0)))
+
+    # Direction (Azimuth): Direction the plane is facing (projected on XY)
+    direction = np.degrees(np.arctan2(normal[1], normal[0]))
+
+    return normal, float(steepness), float(direction)
+
+
 class SwingPlaneAnalyzer:
     """Analyzes the swing plane from 3D trajectory data."""
 
@@ -91,25 +107,128 @@ class SwingPlaneAnalyzer:
 
         rmse = np.sqrt(np.mean(deviations**2))
         max_dev = np.max(np.abs(deviations))
+        normal, steepness, direction = _orientation(normal)
+
+        return SwingPlaneMetrics(
+            normal_vector=normal,
+            point_on_plane=centroid,
+            steepness_deg=steepness,
+            direction_deg=direction,
+            rmse=float(rmse),
+            max_deviation=float(max_dev),
+        )
+
+
+class StreamingSwingPlane:
+    """Swing plane fit updated one club head sample at a time.
 
-        # Steepness: Angle between normal and vertical (Z axis)
-        # Ensure normal z is positive to measure from top
-        if normal[2] < 0:
-            normal = -normal
+    Keeps the running mean and scatter matrix of the points (Welford's
+    update), so each sample costs O(1) regardless of how many came before.
+    The normal is the eigenvector of the 3x3 scatter matrix with the smallest
+    eigenvalue, which is the same plane the SVD fit of all points gives, and
+    that eigenvalue yields the exact RMSE of the points about the plane.
 
-        nz = normal[2]
-        angle_rad = np.arccos(np.clip(nz, -1.0, 1.0))
-        steepness = np.degrees(angle_rad)
+    The exact maximum deviation would need every point, so ``max_deviation``
+    is the largest distance of a sample from the plane fitted when it
+    arrived.
+    """
 
-        # Direction (Azimuth): Direction the plane is facing (projected on XY)
-        nx, ny = normal[0], normal[1]
-        direction = np.degrees(np.arctan2(ny, nx))
+    def __init__(self) -> None:
+        """Initialize an empty fit."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all samples."""
+        self.count = 0
+        self._mean = np.zeros(3)
+        self._scatter = np.zeros((3, 3))
+        self._fit: tuple[np.ndarray, float] | None = None
+        self.max_deviation = 0.0
+
+    def update(self, point: np.ndarray) -> float | None:
+        """Add one sample.
+
+        Args:
+            point: Club head position (3,)
 
+        Returns:
+            Signed distance of the sample from the updated plane, or None
+            while fewer than 3 samples have been seen
+        """
+        point = np.asarray(point, dtype=np.float64)
+        self.count += 1
+        delta = point - self._mean
+        self._mean += delta / self.count
+        self._scatter += np.outer(delta, point - self._mean)
+        self._fit = None
+
+        if self.count < 3:
+            return None
+        deviation = float(np.dot(point - self._mean, self._solve()[0]))
+        self.max_deviation = max(self.max_deviation, abs(deviation))
+        return deviation
+
+    def extend(self, points: np.ndarray) -> None:
+        """Add a block of samples at once, merging their moments.
+
+        Args:
+            points: Club head positions (N, 3)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if not len(points):
+            return
+
+        n = len(points)
+        mean = points.mean(axis=0)
+        centered = points - mean
+        total = self.count + n
+        delta = mean - self._mean
+        self._scatter += centered.T @ centered + np.outer(delta, delta) * (
+            self.count * n / total
+        )
+        self._mean += delta * (n / total)
+        self.count = total
+        self._fit = None
+
+        if self.count >= 3:
+            deviations = np.abs((points - self._mean) @ self._solve()[0])
+            self.max_deviation = max(self.max_deviation, float(deviations.max()))
+
+    def _solve(self) -> tuple[np.ndarray, float]:
+        """Normal and RMSE of the current fit (cached until the next sample)."""
+        if self._fit is None:
+            eigenvalues, eigenvectors = np.linalg.eigh(self._scatter)
+            rmse = np.sqrt(max(float(eigenvalues[0]), 0.0) / self.count)
+            self._fit = (eigenvectors[:, 0], rmse)
+        return self._fit
+
+    @property
+    def rmse(self) -> float:
+        """RMS distance of all samples from the current plane."""
+        if self.count < 3:
+            return 0.0
+        return self._solve()[1]
+
+    def metrics(self) -> SwingPlaneMetrics:
+        """Plane metrics for the samples seen so far.
+
+        Returns:
+            SwingPlaneMetrics object
+
+        Raises:
+            ValueError: If fewer than 3 samples have been seen.
+        """
+        if self.count < 3:
+            msg = "At least 3 points are required to fit a plane."
+            raise ValueError(msg)
+
+        normal, rmse = self._solve()
+        normal, steepness, direction = _orientation(normal)
         return SwingPlaneMetrics(
             normal_vector=normal,
-            point_on_plane=centroid,
-            steepness_deg=float(steepness),
-            direction_deg=float(direction),
+            point_on_plane=self._mean.copy(),
+            steepness_deg=steepness,
+            direction_deg=direction,
             rmse=float(rmse),
-            max_deviation=float(max_dev),
+            max_deviation=self.max_deviation,
         )
@@ -0,0 +1,60 @@
+"""
+Benchmarks for per-step AdvancedController task-space and OSC control.
+
+Both controllers run once per physics step, so on the full-body model they
+should stay well inside a 1 ms step.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+MUJOCO_PYTHON_PATH = REPO_ROOT / "engines" / "physics_engines" / "mujoco" / "python"
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+if str(MUJOCO_PYTHON_PATH) not in sys.path:
+    sys.path.append(str(MUJOCO_PYTHON_PATH))
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+mujoco = pytest.importorskip("mujoco")
+
+from mujoco_humanoid_golf.advanced_control import (  # noqa: E402
+    AdvancedController,
+    ControlMode,
+)
+from mujoco_humanoid_golf.models import FULL_BODY_GOLF_SWING_XML  # noqa: E402
+
+
+@pytest.fixture
+def controller():
+    """Full-body controller at a bent, moving pose."""
+    model = mujoco.MjModel.from_xml_string(FULL_BODY_GOLF_SWING_XML)
+    data = mujoco.MjData(model)
+    rng = np.random.default_rng(0)
+    data.qpos[7:] = rng.uniform(-0.3, 0.3, model.nq - 7)
+    data.qvel[:] = rng.standard_normal(model.nv)
+    mujoco.mj_forward(model, data)
+    return AdvancedController(model, data)
+
+
+def test_task_space_control_benchmark(benchmark, controller):
+    """Benchmark task-space control with nullspace joint centering."""
+    controller.set_control_mode(ControlMode.TASK_SPACE)
+    tau = benchmark(controller.compute_control)
+    assert np.all(np.isfinite(tau))
+
+
+def test_operational_space_control_benchmark(benchmark, controller):
+    """Benchmark operational space control of the club head."""
+    target = np.array([0.5, 0.0, 1.0])
+    zeros = np.zeros(3)
+    tau = benchmark(
+        controller.compute_operational_space_control,
+        target,
+        zeros,
+        zeros,
+        controller.club_head_id,
+    )
+    assert np.all(np.isfinite(tau))
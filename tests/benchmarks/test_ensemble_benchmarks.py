@@ -0,0 +1,29 @@
+"""
+Benchmarks for the vectorized double pendulum ensemble integrators.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+PINOCCHIO_PYTHON_PATH = (
+    REPO_ROOT / "engines" / "physics_engines" / "pinocchio" / "python"
+)
+if str(PINOCCHIO_PYTHON_PATH) not in sys.path:
+    sys.path.append(str(PINOCCHIO_PYTHON_PATH))
+
+import numpy as np  # noqa: E402
+from double_pendulum_model.physics.ensemble import (  # noqa: E402
+    DoublePendulumEnsemble,
+)
+
+ENSEMBLE_SIZE = 100_000
+
+
+def test_double_pendulum_ensemble_rk4_benchmark(benchmark):
+    """Benchmark ten RK4 steps of a 100 000-member ensemble."""
+    ensemble = DoublePendulumEnsemble.from_parameters(size=ENSEMBLE_SIZE)
+    states = np.random.default_rng(0).uniform(-1.0, 1.0, (ENSEMBLE_SIZE, 4))
+
+    trajectory = benchmark(ensemble.integrate_rk4, states, (0.0, 0.01), 0.001)
+    assert np.all(np.isfinite(trajectory.final_states))
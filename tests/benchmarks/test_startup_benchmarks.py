@@ -0,0 +1,59 @@
+"""
+Benchmarks for suite startup: cold versus warm engine probe cache.
+
+Each round starts a fresh interpreter, so engine imports are never already
+loaded and the two cases differ only in the state of the cache file.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Probes every engine and prints how many results were returned
+STARTUP_SCRIPT = """
+import sys
+from pathlib import Path
+
+root, cache_file = Path(sys.argv[1]), Path(sys.argv[2])
+sys.path.insert(0, str(root))
+from shared.python.engine_manager import EngineManager
+from shared.python.engine_probes import ProbeCache
+
+manager = EngineManager(root, probe_cache=ProbeCache(cache_file))
+print(len(manager.probe_all_engines()))
+"""
+
+
+def start_suite(cache_file: Path) -> int:
+    """Probe every engine in a new interpreter and return the result count."""
+    completed = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT, str(REPO_ROOT), str(cache_file)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(completed.stdout.strip().splitlines()[-1])
+
+
+def test_startup_cold_cache(benchmark, tmp_path):
+    """Probe every engine with no cache file (imports each engine)."""
+    cache_file = tmp_path / "engine_probes.json"
+
+    def remove_cache():
+        cache_file.unlink(missing_ok=True)
+
+    count = benchmark.pedantic(
+        start_suite, args=(cache_file,), setup=remove_cache, rounds=5
+    )
+    assert count > 0
+
+
+def test_startup_warm_cache(benchmark, tmp_path):
+    """Probe every engine from a populated cache file."""
+    cache_file = tmp_path / "engine_probes.json"
+    start_suite(cache_file)
+
+    count = benchmark.pedantic(start_suite, args=(cache_file,), rounds=5)
+    assert count > 0
@@ -0,0 +1,169 @@
+"""Unit tests for the array-store simulation output format."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared.python.output_manager import (
+    ARRAY_MANIFEST,
+    OutputFormat,
+    OutputManager,
+    read_array_store,
+    write_array_store,
+)
+
+
+@pytest.fixture
+def manager(tmp_path) -> OutputManager:
+    """OutputManager with its directory structure in a temporary directory."""
+    manager = OutputManager(base_path=tmp_path)
+    manager.create_output_structure()
+    yield manager
+    manager.catalog.close()
+
+
+@pytest.fixture
+def results() -> dict:
+    """Simulation-like results with multi-dimensional joint arrays."""
+    rng = np.random.default_rng(0)
+    return {
+        "time": np.arange(500) * 1e-3,
+        "qpos": rng.standard_normal((500, 7)),
+        "contacts": rng.integers(0, 2, (500, 2, 3)).astype(np.int8),
+        "phase": np.array(["address"] * 250 + ["impact"] * 250),
+        "joint_names": ["hip", "spine"],
+        "model": {"name": "humanoid", "nv": 7},
+        "dt": 1e-3,
+    }
+
+
+def test_roundtrip_preserves_fields(tmp_path, results) -> None:
+    """Array fields keep dtype and shape; other values come back as stored."""
+    store = tmp_path / "run.arrays"
+    manifest = write_array_store(store, results, engine="mujoco")
+    assert manifest["fields"]["qpos"]["shape"] == [500, 7]
+    assert set(manifest["attributes"]) == {"model"}
+
+    loaded = read_array_store(store)
+    assert isinstance(loaded["qpos"], np.memmap)
+    for name in ("time", "qpos", "contacts", "phase", "joint_names"):
+        np.testing.assert_array_equal(loaded[name], results[name])
+        assert loaded[name].dtype == np.asarray(results[name]).dtype
+    assert loaded["model"] == {"name": "humanoid", "nv": 7}
+    assert loaded["dt"] == 1e-3
+
+    with pytest.raises(KeyError, match="missing"):
+        read_array_store(store, fields=["missing"])
+
+
+def test_selection_and_unserializable(tmp_path, results) -> None:
+    """Field and row selections apply to the mapped arrays; objects are rejected."""
+    store = tmp_path / "run.arrays"
+    write_array_store(store, results)
+
+    subset = read_array_store(store, fields=["qpos"], rows=slice(10, 20))
+    assert list(subset) == ["qpos"]
+    np.testing.assert_array_equal(subset["qpos"], results["qpos"][10:20])
+    picked = read_array_store(store, fields=["time"], rows=[3, 1])
+    np.testing.assert_array_equal(picked["time"], results["time"][[3, 1]])
+
+    with pytest.raises(TypeError):
+        write_array_store(tmp_path / "bad.arrays", {"obj": object()})
+    assert not (tmp_path / "bad.arrays").exists()
+    assert list(tmp_path.iterdir()) == [store]
+
+
+def test_default_format_is_catalogued(manager, results) -> None:
+    """Simulations save as array stores by default and are listed by the catalog."""
+    path = manager.save_simulation_results(results, "test_swing", engine="drake")
+    assert path.is_dir() and (path / ARRAY_MANIFEST).exists()
+
+    loaded = manager.load_simulation_results(path.name, engine="drake")
+    assert loaded["qpos"].shape == (500, 7)
+
+    (entry,) = manager.find_simulations(engine="drake")
+    assert entry.name == "test_swing.arrays"
+    assert entry.format == "arrays"
+    assert entry.num_rows == 500
+    assert entry.columns["qpos"] == "float64"
+
+    # A fresh catalog rebuilt from disk sees the store as a file, not an engine
+    manager.catalog.close()
+    manager.catalog.db_path.unlink()
+    rebuilt = OutputManager(base_path=manager.base_path)
+    (entry,) = rebuilt.find_simulations(engine="drake")
+    assert entry.name == "test_swing.arrays"
+    assert entry.size_bytes > results["qpos"].nbytes
+    rebuilt.catalog.close()
+
+
+def test_tabular_formats_flatten_fields(manager, results) -> None:
+    """CSV output spreads (N, k) fields over numbered columns."""
+    path = manager.save_simulation_results(
+        {"time": results["time"], "qpos": results["qpos"]},
+        "test_flat",
+        OutputFormat.CSV,
+    )
+    frame = pd.read_csv(path)
+    assert frame.columns.tolist() == ["time"] + [f"qpos_{k}" for k in range(7)]
+    np.testing.assert_allclose(frame["qpos_3"], results["qpos"][:, 3])
+
+
+def test_catalog_schema_matches_flattened_columns(manager, results) -> None:
+    """Tabular outputs are catalogued with the columns they hold on disk."""
+    data = {"time": results["time"], "qpos": results["qpos"]}
+    store = manager.save_simulation_results(data, "test_store")
+    for fmt in (OutputFormat.CSV, OutputFormat.PARQUET):
+        manager.save_simulation_results(data, "test_table", fmt)
+
+    found = manager.find_simulations(has_columns=["qpos_6"])
+    assert sorted(e.name for e in found) == ["test_table.csv", "test_table.parquet"]
+    for entry in found:
+        loaded = manager.load_simulation_results(entry.name, columns=["qpos_6"])
+        np.testing.assert_allclose(loaded["qpos_6"], results["qpos"][:, 6])
+    assert [e.name for e in manager.find_simulations(has_columns=["qpos"])] == [
+        store.name
+    ]
+
+    converted = manager.convert_simulation_results(
+        store.name, OutputFormat.ARRAYS, OutputFormat.CSV
+    )
+    entry = manager.catalog.get(converted)
+    assert entry is not None and "qpos_0" in entry.columns
+
+
+def test_load_infers_format(manager) -> None:
+    """Loads without a format follow the suffix; bare names prefer stores."""
+    data = {"time": [0.0, 0.1, 0.2], "speed": [1.0, 2.5, 4.0]}
+    manager.save_simulation_results(data, "test_run", OutputFormat.CSV)
+
+    by_suffix = manager.load_simulation_results("test_run.csv")
+    assert isinstance(by_suffix, pd.DataFrame)
+    legacy = manager.load_simulation_results("test_run")
+    assert isinstance(legacy, pd.DataFrame)
+
+    manager.save_simulation_results(data, "test_run")
+    store = manager.load_simulation_results("test_run")
+    np.testing.assert_allclose(store["speed"], data["speed"])
+
+
+@pytest.mark.parametrize("from_format", [OutputFormat.CSV, OutputFormat.JSON])
+def test_convert_existing_outputs(manager, from_format) -> None:
+    """Existing outputs convert to array stores, keeping catalog metadata."""
+    data = {"time": [0.0, 0.1, 0.2], "speed": [1.0, 2.5, 4.0]}
+    path = manager.save_simulation_results(
+        data, "test_legacy", from_format, metadata={"club": "driver"}
+    )
+
+    target = manager.convert_simulation_results(path.name, from_format)
+    assert target == path.with_suffix(".arrays")
+    assert path.exists()
+
+    loaded = manager.load_simulation_results(target.name)
+    np.testing.assert_allclose(loaded["speed"], data["speed"])
+    entry = manager.catalog.get(target)
+    assert entry is not None and entry.metadata == {"club": "driver"}
+    manifest = json.loads((target / ARRAY_MANIFEST).read_text())
+    assert manifest["metadata"] == {"club": "driver"}
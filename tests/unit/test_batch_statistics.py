@@ -0,0 +1,200 @@
+"""Unit tests for the vectorized multi-swing statistical analyzer."""
+
+import numpy as np
+import pytest
+from scipy.signal import savgol_filter
+
+from shared.python.statistical_analysis import (
+    SWING_PHASE_NAMES,
+    BatchStatisticalAnalyzer,
+    StatisticalAnalyzer,
+    _smooth_prefixes,
+)
+
+SEGMENTS = {"Pelvis": 0, "Thorax": 1, "Arm": 3, "Club": 9}
+
+
+def make_swing(rng: np.random.Generator, n: int) -> tuple[np.ndarray, ...]:
+    """Synthetic swing: slow backswing, speed spike at impact, noisy joints."""
+    t = np.arange(n) * 0.002
+    u = np.linspace(0.0, 1.0, n)
+    impact = rng.uniform(0.55, 0.85)
+    speed = (
+        5 * np.sin(2 * np.pi * u * 0.8) ** 2
+        + 30 * np.exp(-(((u - impact) / 0.05) ** 2))
+        + 0.1 * rng.standard_normal(n)
+    )
+    q = np.cumsum(rng.standard_normal((n, 6)), axis=0) * 0.01
+    v = rng.standard_normal((n, 5))
+    tau = rng.standard_normal((n, 4))
+    return t, q, v, tau, np.abs(speed)
+
+
+@pytest.fixture
+def swings() -> list[tuple[np.ndarray, ...]]:
+    """Swings of mixed length, including ones too short for phase detection."""
+    rng = np.random.default_rng(3)
+    lengths = [5, 9, 12, 19, 20, 33, *rng.integers(40, 600, 40)]
+    swings = [make_swing(rng, int(n)) for n in lengths]
+    # Early impacts exercise the short-window tempo path
+    for n, impact in [(30, 9), (30, 10), (40, 12)]:
+        t, q, v, tau, _ = make_swing(rng, n)
+        speed = np.linspace(0.0, 1.0, n)
+        speed[impact] = 5.0
+        swings.append((t, q, v, tau, speed))
+    return swings
+
+
+@pytest.fixture
+def batch(swings) -> BatchStatisticalAnalyzer:
+    """Batch analyzer over the ragged swings."""
+    return BatchStatisticalAnalyzer.from_ragged(*zip(*swings, strict=True))
+
+
+def test_smooth_prefixes_matches_savgol() -> None:
+    """Batched smoothing equals savgol_filter on every prefix."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((4, 50))
+    ends = np.array([11, 20, 37, 50])
+
+    smoothed = _smooth_prefixes(data, ends)
+    for k, end in enumerate(ends):
+        np.testing.assert_allclose(
+            smoothed[k, :end], savgol_filter(data[k, :end], 11, 3), atol=1e-12
+        )
+        assert np.all(np.isnan(smoothed[k, end:]))
+
+
+def test_summary_stats_match_single_swing(swings, batch) -> None:
+    """Per-swing statistics equal StatisticalAnalyzer.compute_summary_stats."""
+    stats = batch.compute_summary_stats(batch.joint_positions)
+    for k, (t, q, v, tau, speed) in enumerate(swings):
+        analyzer = StatisticalAnalyzer(t, q, v, tau, speed)
+        for j in range(q.shape[1]):
+            expected = analyzer.compute_summary_stats(q[:, j]).__dict__
+            for key, value in expected.items():
+                assert stats[key][k, j] == pytest.approx(value, abs=1e-12), key
+
+
+def test_tempo_and_phases_match_single_swing(swings, batch) -> None:
+    """Tempo and phase boundaries equal the single-swing heuristics."""
+    tempo = batch.compute_tempo()
+    phases = batch.detect_swing_phases()
+    assert phases.shape == (len(swings), len(SWING_PHASE_NAMES), 2)
+
+    for k, (t, q, v, tau, speed) in enumerate(swings):
+        analyzer = StatisticalAnalyzer(t, q, v, tau, speed)
+
+        expected_tempo = analyzer.compute_tempo()
+        if expected_tempo is None:
+            assert np.isnan(tempo["ratio"][k])
+        else:
+            got = [
+                tempo[key][k]
+                for key in ("backswing_duration", "downswing_duration", "ratio")
+            ]
+            np.testing.assert_allclose(got, expected_tempo, atol=1e-12)
+
+        expected_phases = analyzer.detect_swing_phases()
+        if len(expected_phases) == 1:
+            assert np.all(phases[k] == -1)
+        else:
+            assert [p.name for p in expected_phases] == list(SWING_PHASE_NAMES)
+            bounds = [(p.start_index, p.end_index) for p in expected_phases]
+            assert bounds == [tuple(row) for row in phases[k]]
+
+
+def test_kinematic_sequence_matches_single_swing(swings, batch) -> None:
+    """Peak order and efficiency equal analyze_kinematic_sequence."""
+    sequence = batch.analyze_kinematic_sequence(SEGMENTS)
+    assert sequence.segment_names == ["Pelvis", "Thorax", "Arm"]
+
+    for k, (t, q, v, tau, speed) in enumerate(swings):
+        info, efficiency = StatisticalAnalyzer(
+            t, q, v, tau, speed
+        ).analyze_kinematic_sequence(SEGMENTS)
+        assert sequence.efficiency[k] == pytest.approx(efficiency)
+        for item in info:
+            s = sequence.segment_names.index(item.segment_name)
+            assert sequence.peak_index[k, s] == item.peak_index
+            assert sequence.order_index[k, s] == item.order_index
+
+
+def test_summary_table(swings, batch) -> None:
+    """The session table has one row per swing with consistent columns."""
+    table = batch.generate_summary_table(
+        SEGMENTS, shoulder_joint_idx=1, hip_joint_idx=0
+    )
+    assert len(table) == len(swings)
+    assert table.index.name == "swing"
+
+    k = len(swings) - 4
+    t, q, v, tau, speed = swings[k]
+    analyzer = StatisticalAnalyzer(t, q, v, tau, speed)
+    report = analyzer.generate_comprehensive_report()
+    row = table.loc[k]
+    assert row["num_samples"] == len(t)
+    assert row["sample_rate"] == pytest.approx(report["sample_rate"])
+    assert row["club_head_speed_peak"] == pytest.approx(
+        report["club_head_speed"]["peak_value"]
+    )
+    assert row["tempo_ratio"] == pytest.approx(report["tempo"]["ratio"])
+    impact = next(p for p in report["phases"] if p["name"] == "Impact")
+    assert row["impact_start_time"] == pytest.approx(impact["start_time"])
+    assert row["x_factor_max"] == pytest.approx(analyzer.compute_x_factor(1, 0).max())
+
+    # Swings too short for phase detection have no phase timing
+    assert np.isnan(table.loc[0, "impact_start_time"])
+
+
+def test_joint_table(swings, batch) -> None:
+    """The joint table has one row per (swing, joint)."""
+    table = batch.generate_joint_table()
+    assert len(table) == 6 * len(swings)
+
+    t, q, v, tau, speed = swings[-1]
+    joints = StatisticalAnalyzer(t, q, v, tau, speed).generate_comprehensive_report()[
+        "joints"
+    ]
+    rows = table[table["swing"] == len(swings) - 1].set_index("joint")
+    assert rows.loc[2, "rom_deg"] == pytest.approx(
+        joints["joint_2"]["range_of_motion"]["rom_deg"]
+    )
+    assert rows.loc[3, "torque_max"] == pytest.approx(
+        joints["joint_3"]["torque_stats"]["max"]
+    )
+    # Joint 5 has a position but neither velocity nor torque
+    assert np.isnan(rows.loc[5, "velocity_max"])
+    assert np.isnan(rows.loc[5, "torque_max"])
+
+
+def test_padded_input_ignores_samples_past_length() -> None:
+    """Garbage beyond each swing's length does not leak into results."""
+    rng = np.random.default_rng(1)
+    t, q, v, tau, speed = make_swing(rng, 100)
+    padded = [np.concatenate([a, np.full_like(a[:20], 1e6)]) for a in (q, v, tau)]
+    times = np.concatenate([t, t[-1] + 0.002 * np.arange(1, 21)])
+    speed_padded = np.concatenate([speed, np.full(20, 1e6)])
+
+    batch = BatchStatisticalAnalyzer(
+        times[None],
+        padded[0][None],
+        padded[1][None],
+        padded[2][None],
+        lengths=[100],
+        club_head_speed=speed_padded[None],
+    )
+    peak = batch.find_club_head_speed_peak()
+    assert peak is not None
+    assert peak[0][0] == pytest.approx(speed.max())
+    assert batch.duration[0] == pytest.approx(t[-1] - t[0])
+
+
+def test_rejects_bad_lengths() -> None:
+    """Lengths must be within [1, T] and arrays must share (K, T)."""
+    times = np.zeros((2, 5))
+    joints = np.zeros((2, 5, 1))
+    with pytest.raises(ValueError, match="lengths"):
+        BatchStatisticalAnalyzer(times, joints, joints, joints, lengths=[5, 6])
+    with pytest.raises(ValueError, match="leading shape"):
+        BatchStatisticalAnalyzer(times, np.zeros((2, 4, 1)), joints, joints)
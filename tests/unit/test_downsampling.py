@@ -0,0 +1,152 @@
+"""Unit tests for screen-resolution-aware plot downsampling."""
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from shared.python.downsampling import (
+    DownsampleCache,
+    downsample,
+    lttb_indices,
+    minmax_indices,
+    pixel_width,
+    plot_downsampled,
+    stride_indices,
+)
+
+
+@pytest.fixture
+def long_signal() -> tuple[np.ndarray, np.ndarray]:
+    """200k samples of a noisy 1 kHz signal."""
+    rng = np.random.default_rng(0)
+    t = np.arange(200_000) * 1e-3
+    return t, np.sin(t) + 0.1 * rng.standard_normal(t.size)
+
+
+@pytest.fixture
+def axes():
+    """Axes on a headless Agg canvas."""
+    fig = Figure(figsize=(4, 3), dpi=100)
+    FigureCanvasAgg(fig)
+    return fig.add_subplot(111)
+
+
+def test_minmax_preserves_extrema(long_signal) -> None:
+    """Every bucket keeps its minimum and maximum, and the endpoints."""
+    _, y = long_signal
+    idx = minmax_indices(y, 300)
+
+    assert idx.size <= 2 * 300 + 2
+    assert np.all(np.diff(idx) > 0)
+    assert idx[0] == 0 and idx[-1] == y.size - 1
+    assert y[idx].min() == y.min()
+    assert y[idx].max() == y.max()
+
+
+def test_minmax_keeps_monotonic_order() -> None:
+    """Extrema are emitted in sample order rather than min-then-max."""
+    y = -np.linspace(0.0, 1.0, 10_000)
+    idx = minmax_indices(y, 50)
+    assert np.all(np.diff(y[idx]) <= 0.0)
+
+
+def test_minmax_merges_columns_and_skips_nan() -> None:
+    """2-D input shares one index set; NaN samples are not picked as extrema."""
+    values = np.zeros((1_000, 2))
+    values[123, 0] = 5.0
+    values[877, 1] = -5.0
+    values[510, 0] = np.nan
+
+    idx = minmax_indices(values, 20)
+    assert {123, 877} <= set(idx.tolist())
+    assert 510 not in idx
+
+
+def test_lttb_length_and_endpoints(long_signal) -> None:
+    """LTTB returns exactly n_out increasing indices including both ends."""
+    t, y = long_signal
+    idx = lttb_indices(t, y, 500)
+
+    assert idx.size == 500
+    assert idx[0] == 0 and idx[-1] == t.size - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_keeps_spike() -> None:
+    """An isolated spike forms the largest triangle in its bucket."""
+    t = np.arange(10_000, dtype=float)
+    y = np.zeros_like(t)
+    y[4_321] = 1.0
+    x_ds, y_ds = downsample(t, y, 100, method="lttb")
+    assert y_ds.max() == 1.0
+    assert 4_321.0 in x_ds
+
+
+def test_short_series_and_unknown_method() -> None:
+    """Series already below the budget pass through unchanged."""
+    t = np.arange(10.0)
+    x_ds, y_ds = downsample(t, t**2, 100)
+    np.testing.assert_array_equal(x_ds, t)
+    with pytest.raises(ValueError, match="Unknown downsampling method"):
+        downsample(t, t, 4, method="cubic")  # type: ignore[arg-type]
+
+
+def test_stride_indices_bounded() -> None:
+    """Parametric thinning stays within budget and keeps the last sample."""
+    idx = stride_indices(100_001, 1_000)
+    assert idx.size <= 1_000
+    assert idx[0] == 0 and idx[-1] == 100_000
+    np.testing.assert_array_equal(stride_indices(5, 1_000), np.arange(5))
+
+
+def test_cache_hits_and_evicts() -> None:
+    """Repeated keys hit the cache and the oldest entry is evicted."""
+    cache = DownsampleCache(maxsize=2)
+    calls = []
+
+    def compute() -> tuple[np.ndarray, np.ndarray]:
+        calls.append(1)
+        return np.zeros(1), np.zeros(1)
+
+    cache.get(("a",), compute)
+    cache.get(("a",), compute)
+    cache.get(("b",), compute)
+    cache.get(("c",), compute)
+
+    assert len(calls) == 3
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+
+
+def test_plot_downsampled_requeries_on_zoom(long_signal, axes) -> None:
+    """Zooming in re-reads the full data; zooming back out hits the cache."""
+    t, y = long_signal
+    cache = DownsampleCache()
+    line = plot_downsampled(axes, t, y, cache=cache)
+
+    width = pixel_width(axes)
+    assert line.get_xdata().size <= 2 * width + 2
+    assert line.get_ydata().max() == y.max()
+
+    axes.set_xlim(10.0, 10.2)
+    x_zoom = line.get_xdata()
+    np.testing.assert_allclose(np.diff(x_zoom), 1e-3)
+    assert x_zoom[0] <= 10.0 and x_zoom[-1] >= 10.2
+
+    axes.set_xlim(0.0, 100.0)
+    misses = cache.misses
+    axes.set_xlim(10.0, 10.2)
+    axes.set_xlim(0.0, 100.0)
+    assert cache.misses == misses
+    assert line.get_xdata().size <= 2 * width + 2
+
+    axes.figure.canvas.draw()
+
+
+def test_plot_downsampled_short_series_is_plain_line(axes) -> None:
+    """Short series are drawn as-is and keep ax.plot's format arguments."""
+    t = np.linspace(0.0, 1.0, 50)
+    line = plot_downsampled(axes, t, t, "r--", label="short")
+    np.testing.assert_array_equal(line.get_xdata(), t)
+    assert line.get_linestyle() == "--"
+    assert line.get_label() == "short"
@@ -0,0 +1,201 @@
+"""Unit tests for cached engine probes and lazy probing in EngineManager."""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from shared.python.engine_manager import EngineManager, EngineType  # noqa: E402
+from shared.python.engine_probes import (  # noqa: E402
+    DrakeProbe,
+    EngineProbe,
+    EngineProbeResult,
+    PendulumProbe,
+    ProbeCache,
+    ProbeStatus,
+)
+
+
+class CountingProbe(EngineProbe):
+    """Probe that records how often it actually runs."""
+
+    def __init__(self, suite_root: Path, status: ProbeStatus) -> None:
+        super().__init__("Counting", suite_root)
+        self.status = status
+        self.calls = 0
+
+    def watched_paths(self) -> list[Path]:
+        return [self.suite_root]
+
+    def probe(self) -> EngineProbeResult:
+        self.calls += 1
+        return EngineProbeResult(
+            engine_name=self.engine_name,
+            status=self.status,
+            version="1.0",
+            missing_dependencies=[],
+            diagnostic_message="ok",
+            details={"calls": self.calls},
+        )
+
+
+class PortProbe(CountingProbe):
+    """Probe whose result includes a transient environment check."""
+
+    def __init__(self, suite_root: Path) -> None:
+        super().__init__(suite_root, ProbeStatus.AVAILABLE)
+        self.port = 7000
+
+    def check_environment(self, result: EngineProbeResult) -> EngineProbeResult:
+        return EngineProbeResult(
+            engine_name=result.engine_name,
+            status=result.status,
+            version=result.version,
+            missing_dependencies=[],
+            diagnostic_message=f"{result.diagnostic_message}, port {self.port}",
+            details={**(result.details or {}), "port": self.port},
+        )
+
+
+def make_pendulum_tree(root: Path) -> None:
+    """Create the files the pendulum probe looks for."""
+    src_dir = root / "engines" / "pendulum_models" / "python" / "src"
+    src_dir.mkdir(parents=True)
+    for name in ("constants.py", "pendulum_solver.py"):
+        (src_dir / name).touch()
+
+
+class TestProbeCache:
+    """Test cases for the persistent probe cache."""
+
+    def test_result_round_trip(self):
+        """Results survive serialization."""
+        result = EngineProbeResult(
+            engine_name="MuJoCo",
+            status=ProbeStatus.MISSING_ASSETS,
+            version="3.2.3",
+            missing_dependencies=["model XML files"],
+            diagnostic_message="missing",
+            details={"engine_dir": "/tmp"},
+        )
+        assert EngineProbeResult.from_dict(result.to_dict()) == result
+
+    def test_warm_cache_skips_probe(self, tmp_path):
+        """A second cache instance reuses the persisted result."""
+        cache_file = tmp_path / "cache" / "engine_probes.json"
+        suite_root = tmp_path / "suite"
+        suite_root.mkdir()
+        probe = CountingProbe(suite_root, ProbeStatus.AVAILABLE)
+
+        first = ProbeCache(cache_file).run(probe)
+        second = ProbeCache(cache_file).run(probe)
+
+        assert probe.calls == 1
+        assert cache_file.exists()
+        assert second == first
+
+    def test_directory_change_invalidates(self, tmp_path):
+        """Adding files to a watched directory re-runs the probe."""
+        make_pendulum_tree(tmp_path)
+        cache = ProbeCache(tmp_path / "engine_probes.json")
+        probe = PendulumProbe(tmp_path)
+
+        key = probe.fingerprint()
+        assert cache.run(probe).is_available()
+        (probe.engine_dir / "new_model").mkdir()
+
+        assert probe.fingerprint() != key
+        assert cache.get_entry(probe.engine_name, probe.fingerprint()) is None
+
+    def test_refresh_and_transient_errors(self, tmp_path):
+        """Refresh bypasses the cache; configuration errors are not stored."""
+        cache = ProbeCache(tmp_path / "engine_probes.json")
+        probe = CountingProbe(tmp_path, ProbeStatus.AVAILABLE)
+        cache.run(probe)
+        cache.run(probe, refresh=True)
+        assert probe.calls == 2
+
+        blocked = CountingProbe(tmp_path / "other", ProbeStatus.CONFIGURATION_ERROR)
+        blocked.engine_name = "Blocked"
+        cache.run(blocked)
+        cache.run(blocked)
+        assert blocked.calls == 2
+
+    def test_environment_checks_are_not_cached(self, tmp_path):
+        """Only the installation result is stored; transient checks re-run."""
+        cache_file = tmp_path / "cache" / "engine_probes.json"
+        suite_root = tmp_path / "suite"
+        suite_root.mkdir()
+        probe = PortProbe(suite_root)
+
+        first = ProbeCache(cache_file).run(probe)
+        probe.port = 7003
+        second = ProbeCache(cache_file).run(probe)
+
+        assert probe.calls == 1
+        assert first.diagnostic_message == "ok, port 7000"
+        assert second.diagnostic_message == "ok, port 7003"
+        assert second.details == {"calls": 1, "port": 7003}
+        assert "port" not in cache_file.read_text(encoding="utf-8")
+
+    def test_drake_port_check_is_transient(self, tmp_path):
+        """Drake adds the meshcat port on top of an installation result."""
+        probe = DrakeProbe(tmp_path)
+        installed = EngineProbeResult(
+            engine_name="Drake",
+            status=ProbeStatus.AVAILABLE,
+            version="1.0",
+            missing_dependencies=[],
+            diagnostic_message="Drake 1.0 ready",
+            details={"engine_dir": str(tmp_path)},
+        )
+        missing = EngineProbeResult.from_dict(
+            {**installed.to_dict(), "status": ProbeStatus.NOT_INSTALLED.value}
+        )
+
+        result = probe.check_environment(installed)
+
+        assert probe.check_environment(missing) == missing
+        if result.is_available():
+            assert 7000 <= result.details["meshcat_port"] <= 7010
+            assert result.diagnostic_message.startswith("Drake 1.0 ready, meshcat")
+        else:
+            assert result.status == ProbeStatus.CONFIGURATION_ERROR
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """An unreadable cache file behaves like an empty cache."""
+        cache_file = tmp_path / "engine_probes.json"
+        cache_file.write_text("{not json", encoding="utf-8")
+        probe = CountingProbe(tmp_path, ProbeStatus.AVAILABLE)
+
+        assert ProbeCache(cache_file).run(probe).is_available()
+        assert probe.calls == 1
+
+
+class TestLazyProbing:
+    """Test cases for lazy probing in EngineManager."""
+
+    def test_construction_does_not_probe(self, tmp_path):
+        """No probe runs until a result is requested."""
+        manager = EngineManager(tmp_path, probe_cache=ProbeCache())
+        assert manager.probe_results == {}
+
+    def test_single_engine_probed_on_request(self, tmp_path):
+        """Requesting one engine only probes that engine."""
+        make_pendulum_tree(tmp_path)
+        manager = EngineManager(tmp_path, probe_cache=ProbeCache())
+
+        result = manager.get_probe_result(EngineType.PENDULUM)
+
+        assert result.is_available()
+        assert list(manager.probe_results) == [EngineType.PENDULUM]
+        assert EngineType.PENDULUM in manager.probe_timings
+
+    def test_probe_all_engines_uses_default_cache(self, tmp_path):
+        """All engines are probed and persisted under output/cache."""
+        manager = EngineManager(tmp_path)
+        results = manager.probe_all_engines()
+
+        assert list(results) == list(manager.probes)
+        assert (tmp_path / "output" / "cache" / "engine_probes.json").exists()
@@ -0,0 +1,107 @@
+"""Unit tests for the shared manipulability ellipsoid helpers."""
+
+import numpy as np
+import pytest
+
+from shared.python.manipulability import (
+    FORCE_RADIUS_LIMITS,
+    EllipsoidCache,
+    EllipsoidTrajectory,
+    core_matrix,
+    ellipsoid_from_core,
+    factor_mass_matrix,
+)
+
+
+@pytest.fixture
+def jacobian_and_mass() -> tuple[np.ndarray, np.ndarray]:
+    """Random 3 x 7 Jacobian and a positive definite mass matrix."""
+    rng = np.random.default_rng(3)
+    jacobian = rng.standard_normal((3, 7))
+    root = rng.standard_normal((7, 7))
+    return jacobian, root @ root.T + 7 * np.eye(7)
+
+
+def test_core_matrix_matches_explicit_inverse(jacobian_and_mass) -> None:
+    """The Cholesky solve reproduces J M^-1 J^T."""
+    jacobian, mass = jacobian_and_mass
+    expected = jacobian @ np.linalg.inv(mass) @ jacobian.T
+    np.testing.assert_allclose(core_matrix(jacobian, mass), expected, atol=1e-12)
+
+    factor = factor_mass_matrix(mass)
+    assert factor is not None
+    np.testing.assert_allclose(
+        core_matrix(jacobian, mass, factor), expected, atol=1e-12
+    )
+
+    # A singular mass matrix falls back to least squares
+    singular = mass.copy()
+    singular[:, 0] = singular[0, :] = 0.0
+    assert factor_mass_matrix(singular) is None
+    assert np.all(np.isfinite(core_matrix(jacobian, singular)))
+
+
+def test_ellipsoid_radii_and_transform(jacobian_and_mass) -> None:
+    """Force radii are the clipped reciprocals of the mobility radii."""
+    jacobian, mass = jacobian_and_mass
+    center = np.array([0.1, 0.2, 0.3])
+    ellipsoid = ellipsoid_from_core(core_matrix(jacobian, mass), center)
+
+    core = core_matrix(jacobian, mass)
+    np.testing.assert_allclose(
+        ellipsoid.axes @ np.diag(ellipsoid.eigenvalues) @ ellipsoid.axes.T,
+        core,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(ellipsoid.mobility_radii**2, ellipsoid.eigenvalues)
+    np.testing.assert_allclose(
+        ellipsoid.force_radii,
+        np.clip(1.0 / ellipsoid.mobility_radii, *FORCE_RADIUS_LIMITS),
+    )
+
+    transform = ellipsoid.transform(ellipsoid.mobility_radii)
+    np.testing.assert_allclose(transform[:3, 3], center)
+    np.testing.assert_allclose(
+        transform[:3, :3] @ transform[:3, :3].T, core, atol=1e-12
+    )
+
+
+def test_cache_respects_tolerance(jacobian_and_mass) -> None:
+    """Ellipsoids are reused only while q stays within tolerance."""
+    jacobian, mass = jacobian_and_mass
+    ellipsoid = ellipsoid_from_core(core_matrix(jacobian, mass), np.zeros(3))
+    cache = EllipsoidCache(tolerance=1e-6)
+    q = np.linspace(0.0, 1.0, 7)
+
+    assert cache.lookup("club", q) is None
+    cache.store("club", q, ellipsoid)
+    q[0] += 1.0  # The cache keeps its own copy
+    assert cache.lookup("club", q) is None
+    q[0] -= 1.0 - 5e-7
+    assert cache.lookup("club", q) is ellipsoid
+    assert cache.lookup("hand", q) is None
+    assert cache.lookup("club", q[:3]) is None
+
+    cache.clear()
+    assert cache.lookup("club", q) is None
+
+
+def test_trajectory_stacks_and_exports(jacobian_and_mass, tmp_path) -> None:
+    """Stacked core matrices give one ellipsoid per frame."""
+    jacobian, mass = jacobian_and_mass
+    cores = np.stack([core_matrix(jacobian * s, mass) for s in (1.0, 2.0, 3.0)])
+    centers = np.arange(9.0).reshape(3, 3)
+    stacked = ellipsoid_from_core(cores, centers)
+    trajectory = EllipsoidTrajectory(centers, stacked.axes, stacked.eigenvalues)
+
+    assert len(trajectory) == 3
+    single = ellipsoid_from_core(cores[2], centers[2])
+    np.testing.assert_allclose(trajectory[2].eigenvalues, single.eigenvalues)
+    np.testing.assert_allclose(
+        trajectory.mobility_radii[1], 2.0 * trajectory.mobility_radii[0]
+    )
+
+    path = trajectory.save(tmp_path / "ellipsoids.npz")
+    with np.load(path) as archive:
+        np.testing.assert_allclose(archive["eigenvalues"], trajectory.eigenvalues)
+        np.testing.assert_allclose(archive["force_radii"], trajectory.force_radii)
@@ -0,0 +1,142 @@
+"""Unit tests for the OutputManager simulation catalog and lazy loading."""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared.python.output_manager import OutputFormat, OutputManager
+
+
+@pytest.fixture
+def manager(tmp_path) -> OutputManager:
+    """OutputManager with its directory structure in a temporary directory."""
+    manager = OutputManager(base_path=tmp_path)
+    manager.create_output_structure()
+    yield manager
+    manager.catalog.close()
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    """Simulation-like table of 1000 rows."""
+    t = np.arange(1000) * 1e-3
+    return pd.DataFrame({"time": t, "q0": np.sin(t), "q1": np.cos(t), "step": 1})
+
+
+def test_save_records_schema(manager, frame) -> None:
+    """Saved results are catalogued with engine, format, shape and columns."""
+    manager.save_simulation_results(frame, "test_run", OutputFormat.CSV, "drake")
+    manager.save_simulation_results(
+        {"speed": [1.0, 2.0]}, "test_meta", OutputFormat.JSON, metadata={"club": 1}
+    )
+
+    (entry,) = manager.find_simulations(engine="drake")
+    assert entry.name == "test_run.csv"
+    assert entry.format == "csv"
+    assert entry.num_rows == 1000
+    assert entry.columns == {
+        "time": "float64",
+        "q0": "float64",
+        "q1": "float64",
+        "step": "int64",
+    }
+    assert entry.size_bytes == entry.path.stat().st_size
+
+    (json_entry,) = manager.find_simulations(format_type=OutputFormat.JSON)
+    assert json_entry.engine == "mujoco"
+    assert json_entry.metadata == {"club": 1}
+    assert json_entry.columns == {"speed": "float64"}
+
+    assert [e.name for e in manager.find_simulations(has_columns=["q0", "q1"])] == [
+        "test_run.csv"
+    ]
+    assert manager.find_simulations(has_columns=["q2"]) == []
+
+
+def test_foreign_files_are_picked_up(manager) -> None:
+    """Files written by other tools appear and disappear without a full rescan."""
+    sim_dir = manager.directories["simulations"]
+    (sim_dir / "pinocchio" / "external.csv").write_text("a\n1\n")
+    (sim_dir / "root_level.json").write_text("{}")
+    new_engine = sim_dir / "opensim"
+    new_engine.mkdir()
+    (new_engine / "run.parquet").touch()
+
+    assert manager.get_simulation_list() == [
+        "external.csv",
+        "root_level.json",
+        "run.parquet",
+    ]
+    (entry,) = manager.find_simulations(engine="opensim")
+    assert entry.format == "parquet" and entry.columns is None
+
+    (sim_dir / "pinocchio" / "external.csv").unlink()
+    assert manager.get_simulation_list("pinocchio") == []
+
+
+def test_cleanup_uses_catalog(manager, frame) -> None:
+    """Old catalogued simulations are archived and dropped from the index."""
+    old = manager.directories["simulations"] / "mujoco" / "old_run.csv"
+    old.write_text("a\n1\n")
+    ten_days_ago = time.time() - 10 * 86400
+    os.utime(old, (ten_days_ago, ten_days_ago))
+    manager.save_simulation_results(frame, "test_new", OutputFormat.CSV)
+
+    cutoff = datetime.now() - timedelta(days=5)
+    assert [e.name for e in manager.find_simulations(modified_before=cutoff)] == [
+        "old_run.csv"
+    ]
+
+    assert manager.cleanup_old_files(max_age_days=5) == 1
+    assert (
+        manager.base_path / "archive" / "simulations" / "mujoco" / "old_run.csv"
+    ).exists()
+    assert manager.get_simulation_list("mujoco") == ["test_new.csv"]
+
+
+def test_load_columns_and_rows_csv(manager, frame) -> None:
+    """CSV loads parse only the requested columns and row range."""
+    path = manager.save_simulation_results(frame, "test_lazy", OutputFormat.CSV)
+
+    subset = manager.load_simulation_results(
+        path.name, columns=["time", "q1"], rows=slice(100, 200, 10)
+    )
+    expected = frame.loc[100:199:10, ["time", "q1"]]
+    pd.testing.assert_frame_equal(subset, expected, check_index_type=False)
+
+    tail = manager.load_simulation_results(path.name, rows=[-1, -2])
+    assert tail.index.tolist() == [999, 998]
+    assert tail["time"].tolist() == frame["time"].iloc[[999, 998]].tolist()
+
+
+def test_load_subset_of_json(manager) -> None:
+    """Dict results are subset after loading when selection is requested."""
+    path = manager.save_simulation_results(
+        {"a": [1, 2, 3], "b": [4, 5, 6]}, "test_dict", OutputFormat.JSON
+    )
+    subset = manager.load_simulation_results(
+        path.name, OutputFormat.JSON, columns=["b"], rows=slice(1, None)
+    )
+    assert subset["b"].tolist() == [5, 6]
+    assert subset.index.tolist() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    ("format_type", "module"),
+    [(OutputFormat.PARQUET, "pyarrow"), (OutputFormat.HDF5, "tables")],
+)
+def test_load_columns_and_rows_columnar(manager, frame, format_type, module) -> None:
+    """Parquet and HDF5 read the requested columns and rows lazily."""
+    pytest.importorskip(module)
+    path = manager.save_simulation_results(frame, "test_columnar", format_type)
+
+    subset = manager.load_simulation_results(
+        path.name, format_type, columns=["q0"], rows=[5, 3, 900]
+    )
+    assert subset.columns.tolist() == ["q0"]
+    assert subset.index.tolist() == [5, 3, 900]
+    np.testing.assert_allclose(subset["q0"], frame["q0"].iloc[[5, 3, 900]])
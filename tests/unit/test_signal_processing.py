@@ -1,6 +1,7 @@
 """Unit tests for signal processing utilities."""
 
 import numpy as np
+import pytest
 
 from shared.python import signal_processing
 
@@ -65,3 +66,74 @@ def test_compute_spectral_arc_length_empty():
 def test_compute_spectral_arc_length_zero():
     """Test SAL with zero data."""
     assert signal_processing.compute_spectral_arc_length(np.zeros(100), 100.0) == 0.0
+
+
+def test_sliding_spectral_arc_length_matches_slices():
+    """Each sliding window scores the same as SAL of that slice."""
+    fs = 200.0
+    rng = np.random.default_rng(0)
+    data = np.sin(np.linspace(0, 3 * np.pi, 700)) + 0.05 * rng.standard_normal(700)
+
+    sal = signal_processing.compute_sliding_spectral_arc_length(
+        data, fs, window=100, step=3
+    )
+    starts = range(0, len(data) - 99, 3)
+    expected = [
+        signal_processing.compute_spectral_arc_length(data[i : i + 100], fs)
+        for i in starts
+    ]
+    np.testing.assert_allclose(sal, expected)
+    assert (
+        signal_processing.compute_sliding_spectral_arc_length(data[:50], fs, 100).size
+        == 0
+    )
+
+
+def test_streaming_spectral_arc_length():
+    """The streaming metric tracks SAL of the most recent window."""
+    fs = 100.0
+    rng = np.random.default_rng(1)
+    data = rng.standard_normal(250)
+    stream = signal_processing.StreamingSpectralArcLength(fs, window=64, hop=5)
+
+    for i, sample in enumerate(data, start=1):
+        value = stream.update(sample)
+        if i % 5 == 0 and i >= 64:
+            expected = signal_processing.compute_spectral_arc_length(
+                data[i - 64 : i], fs
+            )
+            assert value == pytest.approx(expected)
+    np.testing.assert_array_equal(stream.samples(), data[-64:])
+
+    with pytest.raises(ValueError, match="positive"):
+        signal_processing.StreamingSpectralArcLength(fs, window=0)
+
+
+def test_channel_batched_spectra_match_single_channel():
+    """(N, channels) inputs give each channel's single-signal result in one call."""
+    fs = 500.0
+    rng = np.random.default_rng(2)
+    data = np.cumsum(rng.standard_normal((800, 6)), axis=0)
+
+    freqs, psd = signal_processing.compute_psd(data, fs, axis=0)
+    f, t, sxx = signal_processing.compute_spectrogram(data, fs, nperseg=128, axis=0)
+    sal = signal_processing.compute_spectral_arc_length_channels(data, fs)
+    assert psd.shape == (len(freqs), 6)
+    assert sxx.shape == (len(f), 6, len(t))
+    assert sal.shape == (6,)
+
+    for k in range(6):
+        freqs_k, psd_k = signal_processing.compute_psd(data[:, k], fs)
+        np.testing.assert_allclose(freqs_k, freqs)
+        np.testing.assert_allclose(psd[:, k], psd_k)
+        _, _, sxx_k = signal_processing.compute_spectrogram(data[:, k], fs, nperseg=128)
+        np.testing.assert_allclose(sxx[:, k], sxx_k)
+        assert sal[k] == pytest.approx(
+            signal_processing.compute_spectral_arc_length(data[:, k], fs)
+        )
+
+
+def test_short_signal_segment_is_clipped():
+    """Segments longer than the signal shrink to the signal length."""
+    freqs, psd = signal_processing.compute_psd(np.sin(np.arange(100.0)), 100.0)
+    assert len(freqs) == len(psd) == 51
@@ -0,0 +1,106 @@
+"""Unit tests for cached analysis results in StatisticalAnalyzer."""
+
+import numpy as np
+import pytest
+
+from shared.python import statistical_analysis
+from shared.python.statistical_analysis import StatisticalAnalyzer
+
+
+@pytest.fixture
+def swing() -> dict[str, np.ndarray]:
+    """Recorded swing with a club head speed peak at 1.0 s."""
+    rng = np.random.default_rng(0)
+    n = 600
+    times = np.linspace(0.0, 1.5, n)
+    speed = 40 * np.exp(-(((times - 1.0) / 0.1) ** 2)) + 5 * np.sin(3 * times) ** 2
+    return {
+        "times": times,
+        "joint_positions": rng.standard_normal((n, 4)),
+        "joint_velocities": rng.standard_normal((n, 4)),
+        "joint_torques": rng.standard_normal((n, 3)),
+        "club_head_speed": speed,
+    }
+
+
+@pytest.fixture
+def savgol_calls(monkeypatch) -> list[int]:
+    """Count club head speed smoothing passes."""
+    calls: list[int] = []
+    savgol = statistical_analysis.savgol_filter
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return savgol(*args, **kwargs)
+
+    monkeypatch.setattr(statistical_analysis, "savgol_filter", counting)
+    return calls
+
+
+def test_report_is_computed_once(swing, savgol_calls) -> None:
+    """Repeated reports reuse every derived quantity."""
+    analyzer = StatisticalAnalyzer(**swing)
+    report = analyzer.generate_comprehensive_report()
+    calls = len(savgol_calls)
+
+    report["joints"].clear()
+    again = analyzer.generate_comprehensive_report()
+    assert len(savgol_calls) == calls
+    assert len(again["joints"]) == 4
+    assert analyzer.detect_swing_phases() is analyzer.detect_swing_phases()
+
+    phases = {p["name"] for p in again["phases"]}
+    assert set(again["phase_statistics"]) == phases
+    impact = again["phase_statistics"]["Impact"]
+    assert impact["max"] == pytest.approx(again["club_head_speed"]["peak_value"])
+
+
+def test_only_dependent_results_are_dropped(swing, savgol_calls) -> None:
+    """Replacing an array recomputes just what is derived from it."""
+    analyzer = StatisticalAnalyzer(**swing)
+    first = analyzer.generate_comprehensive_report()
+    phases = analyzer.detect_swing_phases()
+    calls = len(savgol_calls)
+
+    analyzer.joint_torques = swing["joint_torques"] * 2
+    report = analyzer.generate_comprehensive_report()
+    assert analyzer.detect_swing_phases() is phases
+    assert len(savgol_calls) == calls
+    assert report["joints"]["joint_0"]["torque_stats"]["max"] == pytest.approx(
+        2 * first["joints"]["joint_0"]["torque_stats"]["max"]
+    )
+
+    analyzer.club_head_speed = swing["club_head_speed"][::-1].copy()
+    assert analyzer.detect_swing_phases() is not phases
+    assert len(savgol_calls) > calls
+
+    # In-place edits need an explicit invalidation
+    analyzer.times[:] *= 2
+    assert analyzer.duration == pytest.approx(1.5)
+    analyzer.invalidate("times")
+    assert analyzer.duration == pytest.approx(3.0)
+
+
+class _Recorder:
+    """Minimal recorder with a version counter."""
+
+    def __init__(self, swing: dict[str, np.ndarray]) -> None:
+        self.swing = swing
+        self.version = 1
+
+    def get_time_series(self, field_name: str):
+        if field_name == "club_head_position":
+            return self.swing["times"], np.array([])
+        return self.swing["times"], self.swing[field_name]
+
+
+def test_for_recorder_follows_version(swing) -> None:
+    """Analyzers are reused until the recording changes."""
+    recorder = _Recorder(swing)
+    analyzer = StatisticalAnalyzer.for_recorder(recorder)
+    assert StatisticalAnalyzer.for_recorder(recorder) is analyzer
+    assert analyzer.club_head_position is None
+    assert analyzer.data_version == 1
+
+    recorder.version += 1
+    assert StatisticalAnalyzer.for_recorder(recorder) is not analyzer
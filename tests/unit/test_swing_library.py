@@ -0,0 +1,215 @@
+"""Unit tests for many-to-many swing comparison and banded DTW."""
+
+import numpy as np
+import pytest
+from scipy import interpolate
+
+from shared.python.comparative_analysis import (
+    ComparativeSwingAnalyzer,
+    SwingLibrary,
+    band_radius,
+    dtw_costs,
+    dtw_path,
+    lb_keogh,
+    resample_normalized,
+)
+
+
+class ArrayRecorder:
+    """Recorder serving fixed arrays for every field."""
+
+    def __init__(self, times: np.ndarray, values: np.ndarray) -> None:
+        self.times = times
+        self.values = values
+        self.calls = 0
+
+    def get_time_series(self, field_name: str) -> tuple[np.ndarray, np.ndarray]:
+        self.calls += 1
+        return self.times, self.values
+
+
+def make_swing(rng: np.random.Generator) -> ArrayRecorder:
+    """Two-joint swing with a random duration, length and tempo."""
+    n = int(rng.integers(80, 400))
+    times = np.sort(rng.uniform(0.0, rng.uniform(0.8, 2.0), n))
+    u = (times - times[0]) / (times[-1] - times[0])
+    warped = u ** rng.uniform(0.7, 1.4)
+    values = np.column_stack(
+        [
+            np.sin(2 * np.pi * warped) + 0.1 * rng.standard_normal(n),
+            np.exp(-(((warped - 0.6) / 0.1) ** 2)) + 0.1 * rng.standard_normal(n),
+        ]
+    )
+    return ArrayRecorder(times, values)
+
+
+def naive_dtw(a: np.ndarray, b: np.ndarray, radius: int) -> float:
+    """Textbook banded DTW with squared-error local cost."""
+    n = len(a)
+    acc = np.full((n + 1, n + 1), np.inf)
+    acc[0, 0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(max(1, i - radius), min(n, i + radius) + 1):
+            cost = float(np.sum((a[i - 1] - b[j - 1]) ** 2))
+            acc[i, j] = cost + min(acc[i - 1, j - 1], acc[i - 1, j], acc[i, j - 1])
+    return float(acc[n, n])
+
+
+@pytest.fixture
+def library() -> SwingLibrary:
+    """Library of 150 random reference swings."""
+    rng = np.random.default_rng(0)
+    library = SwingLibrary(num_points=60)
+    for r in range(150):
+        library.add(f"ref{r}", make_swing(rng))
+    return library
+
+
+def test_resample_matches_interp1d() -> None:
+    """Vectorized resampling equals scipy's linear interp1d column by column."""
+    rng = np.random.default_rng(1)
+    swing = make_swing(rng)
+    t_norm = (swing.times - swing.times[0]) / (swing.times[-1] - swing.times[0])
+    grid = np.linspace(0.0, 1.0, 77)
+
+    expected = interpolate.interp1d(t_norm, swing.values, axis=0)(grid)
+    np.testing.assert_allclose(
+        resample_normalized(swing.times, swing.values, 77), expected, atol=1e-12
+    )
+    with pytest.raises(ValueError, match="at least two samples"):
+        resample_normalized(swing.times[:1], swing.values[:1])
+
+
+def test_dtw_matches_naive_and_bounds() -> None:
+    """Batched DTW is exact, below Euclidean, and above LB_Keogh."""
+    rng = np.random.default_rng(2)
+    query = rng.standard_normal((40, 2))
+    refs = rng.standard_normal((6, 40, 2))
+
+    for radius in (0, 3, 39):
+        costs = dtw_costs(query, refs, radius)
+        expected = [naive_dtw(query, ref, radius) for ref in refs]
+        np.testing.assert_allclose(costs, expected, rtol=1e-10)
+        assert np.all(lb_keogh(query, refs, radius) <= costs + 1e-9)
+    np.testing.assert_allclose(
+        dtw_costs(query, refs, 0), ((refs - query) ** 2).sum(axis=(1, 2))
+    )
+
+    # Abandoned references come back as inf; the rest are unchanged
+    costs = dtw_costs(query, refs, 3)
+    limit = np.median(costs)
+    abandoned = dtw_costs(query, refs, 3, max_cost=limit)
+    assert np.all(np.isinf(abandoned[costs > limit]))
+    np.testing.assert_allclose(abandoned[costs <= limit], costs[costs <= limit])
+
+
+def test_dtw_path_recovers_shift() -> None:
+    """The warping path is monotone and its cost equals dtw_costs."""
+    u = np.linspace(0.0, 1.0, 50)
+    a = np.exp(-(((u - 0.4) / 0.08) ** 2))
+    b = np.exp(-(((u - 0.5) / 0.08) ** 2))
+
+    cost, path = dtw_path(a, b, 10)
+    assert tuple(path[0]) == (0, 0) and tuple(path[-1]) == (49, 49)
+    assert np.all(np.diff(path, axis=0) >= 0)
+    assert cost == pytest.approx(dtw_costs(a, b[None], 10)[0])
+    assert cost == pytest.approx(np.sum((a[path[:, 0]] - b[path[:, 1]]) ** 2))
+    assert cost < 0.05 * np.sum((a - b) ** 2)
+
+
+def test_pairwise_matches_align_signals(library: SwingLibrary) -> None:
+    """All-pairs RMS/correlation equal per-pair align_signals results."""
+    rng = np.random.default_rng(3)
+    swings = [make_swing(rng) for _ in range(5)]
+    single = SwingLibrary(num_points=60, joint_indices=[1])
+    for r, swing in enumerate(swings):
+        single.add(f"s{r}", swing)
+
+    rms, corr = single.pairwise()
+    for a in range(5):
+        for b in range(5):
+            aligned = ComparativeSwingAnalyzer(swings[a], swings[b]).align_signals(
+                "joint_velocities", num_points=60, joint_idx=1
+            )
+            assert aligned is not None
+            assert rms[a, b] == pytest.approx(aligned.rms_error, abs=1e-9)
+            assert corr[a, b] == pytest.approx(aligned.correlation, abs=1e-9)
+
+    rms_all, corr_all = library.pairwise()
+    rms_q, corr_q = library.compare(library.data[7])
+    np.testing.assert_allclose(rms_all[7], rms_q, atol=1e-9)
+    np.testing.assert_allclose(corr_all[7], corr_q, atol=1e-12)
+
+
+def test_nearest_dtw_matches_brute_force(library: SwingLibrary) -> None:
+    """Pruned DTW search returns the same neighbours as exhaustive DTW."""
+    rng = np.random.default_rng(4)
+    for _ in range(3):
+        query = make_swing(rng)
+        exhaustive = library.dtw_distances(query, band=0.1)
+        matches = library.nearest(query, k=5, method="dtw", band=0.1)
+
+        expected = np.argsort(exhaustive, kind="stable")[:5]
+        assert [m.index for m in matches] == expected.tolist()
+        np.testing.assert_allclose(
+            [m.distance for m in matches], exhaustive[expected], rtol=1e-10
+        )
+        assert [m.name for m in matches] == [f"ref{i}" for i in expected]
+
+
+def test_nearest_dtw_without_band_matches_linear(library: SwingLibrary) -> None:
+    """With band=0 the DTW cost equals the Euclidean bound it is pruned by."""
+    rng = np.random.default_rng(101)
+    for _ in range(5):
+        query = make_swing(rng)
+        linear = library.nearest(query, k=3)
+        warped = library.nearest(query, k=3, method="dtw", band=0.0)
+        assert [m.index for m in warped] == [m.index for m in linear]
+        np.testing.assert_allclose(
+            [m.distance for m in warped], [m.distance for m in linear], rtol=1e-12
+        )
+
+
+def test_nearest_linear_and_dtw_ordering(library: SwingLibrary) -> None:
+    """Linear matches sort by RMS; warped distances never exceed them."""
+    query = library.data[11] + 0.01
+    linear = library.nearest(query, k=3)
+    rms, _ = library.compare(query)
+    assert linear[0].name == "ref11"
+    assert [m.index for m in linear] == np.argsort(rms)[:3].tolist()
+
+    warped = library.nearest(query, k=3, method="dtw")
+    assert warped[0].name == "ref11"
+    assert warped[0].distance <= linear[0].distance + 1e-12
+    assert np.all(library.dtw_distances(query) <= rms + 1e-12)
+
+
+def test_library_validation() -> None:
+    """Names are unique and shapes must match the library."""
+    library = SwingLibrary(num_points=20)
+    with pytest.raises(ValueError, match="empty"):
+        library.nearest(np.zeros((20, 1)))
+    library.add_resampled("a", np.zeros(20))
+    assert "a" in library and len(library) == 1
+    with pytest.raises(ValueError, match="already exists"):
+        library.add_resampled("a", np.zeros(20))
+    with pytest.raises(ValueError, match="does not match"):
+        library.add_resampled("b", np.zeros((20, 2)))
+    with pytest.raises(ValueError, match="Unknown alignment method"):
+        library.nearest(np.zeros(20), method="cubic")  # type: ignore[arg-type]
+    assert band_radius(100, 0.1) == 10
+
+
+def test_analyzer_caches_resampling_and_warps() -> None:
+    """Repeated alignments reuse the resampled data; DTW absorbs tempo shifts."""
+    u = np.linspace(0.0, 1.0, 200)
+    rec_a = ArrayRecorder(u, np.exp(-(((u - 0.4) / 0.08) ** 2)))
+    rec_b = ArrayRecorder(2 * u, np.exp(-(((u - 0.5) / 0.08) ** 2)))
+    analyzer = ComparativeSwingAnalyzer(rec_a, rec_b)
+
+    linear = analyzer.align_signals("club_head_speed")
+    warped = analyzer.align_signals("club_head_speed", method="dtw", band=0.2)
+    assert rec_a.calls == 1 and rec_b.calls == 1
+    assert linear is not None and warped is not None
+    assert warped.rms_error < 0.25 * linear.rms_error
+    assert warped.correlation > linear.correlation
@@ -3,7 +3,7 @@
 import numpy as np
 import pytest
 
-from shared.python.swing_plane_analysis import SwingPlaneAnalyzer
+from shared.python.swing_plane_analysis import StreamingSwingPlane, SwingPlaneAnalyzer
 
 
 class TestSwingPlaneAnalyzer:
@@ -105,3 +105,56 @@ class TestSwingPlaneAnalyzer:
         points = np.array([[0, 0, 0], [1, 1, 1]])
         with pytest.raises(ValueError, match="At least 3 points"):
             analyzer.fit_plane(points)
+
+
+class TestStreamingSwingPlane:
+    """Test suite for StreamingSwingPlane."""
+
+    @pytest.fixture
+    def points(self) -> np.ndarray:
+        """Noisy circular swing arc on a tilted plane."""
+        rng = np.random.default_rng(0)
+        theta = np.linspace(0, 1.5 * np.pi, 400)
+        local = np.column_stack([np.cos(theta), np.sin(theta), np.zeros_like(theta)])
+        tilt = np.radians(55)
+        rotation = np.array(
+            [
+                [1, 0, 0],
+                [0, np.cos(tilt), -np.sin(tilt)],
+                [0, np.sin(tilt), np.cos(tilt)],
+            ]
+        )
+        return local @ rotation.T + [2.0, -1.0, 1.0] + rng.normal(0, 0.01, (400, 3))
+
+    def test_matches_batch_fit(self, points: np.ndarray) -> None:
+        """Sample-by-sample and block updates give the batch plane and RMSE."""
+        expected = SwingPlaneAnalyzer().analyze(points)
+
+        stream = StreamingSwingPlane()
+        for point in points:
+            stream.update(point)
+        blocks = StreamingSwingPlane()
+        for block in np.array_split(points, 7):
+            blocks.extend(block)
+
+        for metrics in (stream.metrics(), blocks.metrics()):
+            np.testing.assert_allclose(metrics.normal_vector, expected.normal_vector)
+            np.testing.assert_allclose(metrics.point_on_plane, expected.point_on_plane)
+            assert metrics.steepness_deg == pytest.approx(expected.steepness_deg)
+            assert metrics.direction_deg == pytest.approx(expected.direction_deg)
+            assert metrics.rmse == pytest.approx(expected.rmse)
+        assert stream.rmse == pytest.approx(expected.rmse)
+        assert stream.max_deviation >= expected.rmse
+
+    def test_insufficient_points(self) -> None:
+        """No plane until three samples have arrived."""
+        stream = StreamingSwingPlane()
+        assert stream.update([0.0, 0.0, 0.0]) is None
+        assert stream.rmse == 0.0
+        with pytest.raises(ValueError, match="At least 3 points"):
+            stream.metrics()
+
+        stream.update([1.0, 0.0, 0.0])
+        assert stream.update([0.0, 1.0, 0.0]) == pytest.approx(0.0)
+        stream.reset()
+        assert stream.count == 0